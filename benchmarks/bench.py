@@ -0,0 +1,242 @@
+"""
+Throughput benchmarks for every validator, form field and model field in localflavor.
+
+Each target is run over a valid and an invalid corpus from :mod:`benchmarks.corpora` and the time per call is
+reported in nanoseconds. To make the numbers comparable between machines, they are stored in the baseline relative to
+a fixed pure Python calibration workload.
+
+Usage::
+
+    python -m benchmarks.bench                       # compare with benchmarks/baseline.json
+    python -m benchmarks.bench --match IBAN --match br.
+    python -m benchmarks.bench --save                # record a new baseline
+
+The run fails when a target is slower than its baseline by more than the threshold.
+"""
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import sys
+import time
+import warnings
+
+import django
+from django.conf import settings
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_THRESHOLD = 1.5
+# Validators that can't be benchmarked offline.
+EXCLUDED = {'generic.vies.VIESValidator'}
+
+
+def setup():
+    if not settings.configured:
+        settings.configure(INSTALLED_APPS=['localflavor'], USE_I18N=True)
+    django.setup()
+
+
+def discover():
+    """Yields the name and an instance of every validator, form field and model field in localflavor."""
+    from django import forms
+    from django.db import models
+
+    import localflavor
+
+    with warnings.catch_warnings():
+        # Some flavors warn about backwards incompatible changes when they are imported.
+        warnings.simplefilter('ignore')
+        module_names = [module.name for module in pkgutil.walk_packages(localflavor.__path__, 'localflavor.')
+                        if module.name.rsplit('.', 1)[-1] in ('forms', 'models', 'validators')]
+        modules = [importlib.import_module(module_name) for module_name in module_names]
+
+    for module in modules:
+        for class_name, cls in sorted(vars(module).items()):
+            if not inspect.isclass(cls) or cls.__module__ != module.__name__ or class_name.startswith('_'):
+                continue
+            name = '%s.%s' % (module.__name__[len('localflavor.'):], class_name)
+            if name in EXCLUDED:
+                continue
+            if issubclass(cls, (forms.Field, models.Field)) or class_name.endswith('Validator'):
+                try:
+                    yield name, cls()
+                except TypeError:
+                    # Fields and validators with required arguments are skipped.
+                    continue
+
+
+def target_callable(target):
+    """Returns the function that validates a value with a target."""
+    from django import forms
+    from django.db import models
+
+    if isinstance(target, models.Field):
+        return lambda value: target.clean(value, None)
+    if isinstance(target, forms.Field):
+        return target.clean
+    return target
+
+
+def split_corpus(func, values):
+    """Splits values into the ones that are accepted and rejected, dropping values that raise other errors."""
+    from django.core.exceptions import ValidationError
+
+    valid, invalid = [], []
+    for value in values:
+        try:
+            func(value)
+        except ValidationError:
+            invalid.append(value)
+        except Exception:
+            continue
+        else:
+            valid.append(value)
+    return valid, invalid
+
+
+def _time_run(func, values, number):
+    from django.core.exceptions import ValidationError
+
+    start = time.perf_counter()
+    for _ in range(number):
+        for value in values:
+            try:
+                func(value)
+            except ValidationError:
+                pass
+    return time.perf_counter() - start
+
+
+def _number_for(func, values, min_time):
+    """Returns the number of passes over the values that takes at least ``min_time``."""
+    number = 1
+    while _time_run(func, values, number) < min_time:
+        number *= 2
+    return number
+
+
+def _calibration_workload(value):
+    total = 0
+    for number in range(100):
+        text = str(number * 7919)
+        total += sum(int(digit) for digit in text) % 11
+    return total
+
+
+CALIBRATION_CORPUS = [None]
+
+
+def time_per_call(func, values, min_time, repeat):
+    """
+    Returns the time per call in nanoseconds and in calibration units.
+
+    Each of the ``repeat`` runs times the target and the calibration workload right after each other, so changes in
+    the speed of the machine, like frequency scaling or noisy neighbours, affect both in the same way. The median of
+    the runs is returned.
+    """
+    number = _number_for(func, values, min_time)
+    calibration_number = _number_for(_calibration_workload, CALIBRATION_CORPUS, min_time)
+    runs = []
+    for _ in range(repeat):
+        calibration = _time_run(_calibration_workload, CALIBRATION_CORPUS, calibration_number) / calibration_number
+        nanoseconds = _time_run(func, values, number) * 1e9 / (number * len(values))
+        runs.append((nanoseconds / (calibration * 1e9), nanoseconds))
+    runs.sort()
+    units, nanoseconds = runs[len(runs) // 2]
+    return nanoseconds, units
+
+
+def run(patterns=(), min_time=0.02, repeat=5, out=sys.stdout):
+    """Benchmarks the targets and returns a dictionary of target names to their times per call in calibration units."""
+    from .corpora import candidates
+
+    results = {}
+    for name, target in discover():
+        if patterns and not any(pattern in name for pattern in patterns):
+            continue
+        func = target_callable(target)
+        valid, invalid = split_corpus(func, candidates(name, target))
+        result = {}
+        timings = {}
+        for corpus_name, corpus in (('valid', valid), ('invalid', invalid)):
+            if corpus:
+                timings[corpus_name], result[corpus_name] = time_per_call(func, corpus, min_time, repeat)
+        if result:
+            results[name] = result
+            print('%-60s %10s %10s' % (name, _format_ns(timings.get('valid')), _format_ns(timings.get('invalid'))),
+                  file=out)
+    return results
+
+
+def _format_ns(value):
+    return '-' if value is None else '%.0f ns' % value
+
+
+def compare(results, baseline, threshold):
+    """Returns a list of (name, corpus, ratio) for the targets that are slower than the baseline by the threshold."""
+    regressions = []
+    for name, result in sorted(results.items()):
+        for corpus_name, units in result.items():
+            expected = baseline['results'].get(name, {}).get(corpus_name)
+            if expected is None:
+                continue
+            ratio = units / expected
+            if ratio > threshold:
+                regressions.append((name, corpus_name, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--match', action='append', default=[],
+                        help='Only run targets whose name contains this string. Can be given several times.')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Path of the JSON baseline.')
+    parser.add_argument('--save', action='store_true', help='Write the results to the baseline instead of comparing.')
+    parser.add_argument('--threshold', type=float, default=None,
+                        help='Maximum allowed slowdown factor, defaults to the one in the baseline or %s.'
+                             % DEFAULT_THRESHOLD)
+    parser.add_argument('--min-time', type=float, default=0.02, help='Minimum duration of a timing run in seconds.')
+    parser.add_argument('--repeat', type=int, default=5, help='Number of timing runs per target and corpus.')
+    args = parser.parse_args(argv)
+
+    setup()
+    print('%-60s %10s %10s' % ('Target', 'Valid', 'Invalid'))
+    results = run(args.match, args.min_time, args.repeat)
+
+    if args.save:
+        baseline = {'threshold': args.threshold or DEFAULT_THRESHOLD, 'results': {}}
+        if args.match and os.path.exists(args.baseline):
+            # Only replace the results of the selected targets.
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)
+        baseline['results'].update({
+            name: {corpus_name: round(units, 6) for corpus_name, units in result.items()}
+            for name, result in results.items()
+        })
+        baseline['results'] = dict(sorted(baseline['results'].items()))
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(baseline, baseline_file, indent=2)
+            baseline_file.write('\n')
+        print('Saved %d results to %s.' % (len(results), args.baseline))
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print('No baseline found at %s, run with --save to create one.' % args.baseline)
+        return 0
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    threshold = args.threshold or baseline.get('threshold', DEFAULT_THRESHOLD)
+    regressions = compare(results, baseline, threshold)
+    for name, corpus_name, ratio in regressions:
+        print('REGRESSION: %s (%s) is %.2fx slower than the baseline.' % (name, corpus_name, ratio))
+    if regressions:
+        print('%d regressions beyond the threshold of %.2fx.' % (len(regressions), threshold))
+        return 1
+    print('No regressions beyond the threshold of %.2fx.' % threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Generated input corpora for the benchmarks.
+
+Every benchmark target gets a list of candidate values that is derived from the target itself: the choices of choice
+fields, values sampled from the regular expressions of regex based fields and validators, and values with valid check
+digits for the identifiers that are validated most often. The candidates are mixed with mutated and random values
+and split into a valid and an invalid corpus by running them through the target.
+
+The values are generated with a random generator seeded with the name of the target, so the corpora are the same on
+every run.
+"""
+import random
+import string
+
+from django.core.validators import RegexValidator
+from stdnum.iso7064 import mod_11_10
+
+from localflavor.br.validators import dv_maker
+from localflavor.generic.bban import BBAN_PATTERNS
+from localflavor.generic.checksums import iban_check_digits
+from localflavor.generic.countries.iso_3166 import ISO_3166_1_ALPHA2_COUNTRY_CODES
+from localflavor.generic.gtin import gtin_check_digit
+
+try:
+    from re import _parser as sre_parse
+except ImportError:  # Python < 3.11
+    import sre_parse
+
+PRINTABLE = string.ascii_letters + string.digits + ' -./'
+CATEGORIES = {
+    'CATEGORY_DIGIT': string.digits,
+    'CATEGORY_NOT_DIGIT': string.ascii_letters + ' -./',
+    'CATEGORY_SPACE': ' ',
+    'CATEGORY_NOT_SPACE': string.ascii_letters + string.digits,
+    'CATEGORY_WORD': string.ascii_letters + string.digits + '_',
+    'CATEGORY_NOT_WORD': ' -./',
+}
+# Upper bound for the number of repetitions of unbounded repeats like \d+.
+MAX_EXTRA_REPEATS = 4
+
+
+def _sample_in(items, rng):
+    allowed = []
+    negate = False
+    for op, arg in items:
+        op = str(op)
+        if op == 'NEGATE':
+            negate = True
+        elif op == 'LITERAL':
+            allowed.append(chr(arg))
+        elif op == 'RANGE':
+            allowed.extend(chr(code) for code in range(arg[0], arg[1] + 1))
+        elif op == 'CATEGORY':
+            allowed.extend(CATEGORIES.get(str(arg), ''))
+    if negate:
+        allowed = [char for char in PRINTABLE if char not in allowed]
+    return rng.choice(allowed) if allowed else ''
+
+
+def _sample(tokens, rng, out):
+    for op, arg in tokens:
+        op = str(op)
+        if op == 'LITERAL':
+            out.append(chr(arg))
+        elif op == 'NOT_LITERAL':
+            out.append(rng.choice([char for char in PRINTABLE if ord(char) != arg]))
+        elif op == 'ANY':
+            out.append(rng.choice(PRINTABLE))
+        elif op == 'IN':
+            out.append(_sample_in(arg, rng))
+        elif op == 'CATEGORY':
+            out.append(rng.choice(CATEGORIES.get(str(arg), PRINTABLE)))
+        elif op == 'BRANCH':
+            _sample(rng.choice(arg[1]), rng, out)
+        elif op == 'SUBPATTERN':
+            _sample(arg[-1], rng, out)
+        elif op == 'ATOMIC_GROUP':
+            _sample(arg, rng, out)
+        elif op in ('MAX_REPEAT', 'MIN_REPEAT', 'POSSESSIVE_REPEAT'):
+            low, high, sub_tokens = arg
+            for _ in range(rng.randint(low, min(high, low + MAX_EXTRA_REPEATS))):
+                _sample(sub_tokens, rng, out)
+        # Anchors, lookarounds and group references don't produce characters.
+
+
+def sample_regex(pattern, rng):
+    """Returns a random string that matches a regular expression in most cases."""
+    if not isinstance(pattern, str):
+        pattern = pattern.pattern
+    out = []
+    _sample(sre_parse.parse(pattern), rng, out)
+    return ''.join(out)
+
+
+def _random_digits(rng, length):
+    return ''.join(rng.choice(string.digits) for _ in range(length))
+
+
+def iban(rng):
+    country_code = rng.choice(sorted(BBAN_PATTERNS))
+    value = country_code + '00' + sample_regex(BBAN_PATTERNS[country_code], rng)
+    return country_code + iban_check_digits(value) + value[4:]
+
+
+def bic(rng):
+    value = ''.join(rng.choice(string.ascii_uppercase) for _ in range(4))
+    value += rng.choice(ISO_3166_1_ALPHA2_COUNTRY_CODES) + rng.choice('ABCDEFGH') + rng.choice('12ABCDEFGH')
+    return value + rng.choice(('', 'XXX', '001'))
+
+
+def ean(rng):
+    digits = _random_digits(rng, rng.choice((7, 11, 12, 13)))
+    return digits + gtin_check_digit(digits)
+
+
+def cpf(rng):
+    digits = _random_digits(rng, 9)
+    for weights in (range(10, 1, -1), range(11, 1, -1)):
+        digits += str(dv_maker(sum(weight * int(digit) for weight, digit in zip(weights, digits)) % 11))
+    return '%s.%s.%s-%s' % (digits[:3], digits[3:6], digits[6:9], digits[9:])
+
+
+def cnpj(rng):
+    digits = _random_digits(rng, 8) + '0001'
+    for weights in (list(range(5, 1, -1)) + list(range(9, 1, -1)), list(range(6, 1, -1)) + list(range(9, 1, -1))):
+        digits += str(dv_maker(sum(weight * int(digit) for weight, digit in zip(weights, digits)) % 11))
+    return '%s.%s.%s/%s-%s' % (digits[:2], digits[2:5], digits[5:8], digits[8:12], digits[12:])
+
+
+def bsn(rng):
+    while True:
+        digits = _random_digits(rng, 8)
+        check = sum(int(digit) * weight for digit, weight in zip(digits, range(9, 1, -1))) % 11
+        if check < 10:
+            return digits + str(check)
+
+
+def vatin(rng):
+    digits = str(rng.randint(1, 9)) + _random_digits(rng, 7)
+    return 'DE' + digits + mod_11_10.calc_check_digit(digits)
+
+
+#: Generators of valid values for the hot identifiers, selected by a substring of the name of the target class.
+GENERATORS = {
+    'IBAN': iban,
+    'BIC': bic,
+    'EAN': ean,
+    'CPF': cpf,
+    'CNPJ': cnpj,
+    'BSN': bsn,
+    'VATIN': vatin,
+}
+
+
+def _regexes(target):
+    if isinstance(target, RegexValidator):
+        yield target.regex
+    for validator in getattr(target, 'validators', ()):
+        if isinstance(validator, RegexValidator) and not validator.inverse_match:
+            yield validator.regex
+
+
+def _choices(target):
+    # Some form fields only set the choices of their widget.
+    choices = (getattr(target, 'flatchoices', None) or getattr(target, 'choices', None) or
+               getattr(getattr(target, 'widget', None), 'choices', None) or ())
+    for key, label in choices:
+        if isinstance(label, (list, tuple)):
+            # Option groups.
+            yield from (group_key for group_key, group_label in label)
+        else:
+            yield key
+
+
+def _mutate(value, rng):
+    if not value:
+        return rng.choice(PRINTABLE)
+    index = rng.randrange(len(value))
+    char = value[index]
+    replacement = rng.choice(string.digits if char.isdigit() else PRINTABLE)
+    return value[:index] + replacement + value[index + 1:]
+
+
+def _random_value(rng):
+    alphabet = rng.choice((string.digits, string.digits + ' -', PRINTABLE))
+    return ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 16)))
+
+
+def candidates(name, target, size=200):
+    """Returns ``size`` candidate values for a benchmark target."""
+    rng = random.Random(name)
+    class_name = name.rsplit('.', 1)[-1]
+    sources = [generator for key, generator in GENERATORS.items() if key in class_name.upper()]
+    sources.extend(lambda rng, regex=regex: sample_regex(regex, rng) for regex in _regexes(target))
+    choices = [str(key) for key in _choices(target) if key not in (None, '')]
+    if choices:
+        sources.append(lambda rng: rng.choice(choices))
+
+    values = []
+    if sources:
+        values = [rng.choice(sources)(rng) for _ in range(size // 2)]
+        values += [_mutate(rng.choice(values), rng) for _ in range(size // 4)]
+    values += [_random_value(rng) for _ in range(size - len(values))]
+    return values
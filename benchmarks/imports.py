@@ -0,0 +1,172 @@
+"""
+Import time and memory footprint of the forms and models modules of every flavor.
+
+Every module is imported in a fresh interpreter after Django itself has been imported, so only the cost of the flavor
+is measured. The wall time is measured in one interpreter and the memory in another, because tracing the allocations
+slows the import down. ``peak`` is the highest amount of memory allocated during the import and ``retained`` is what
+is still allocated afterwards.
+
+Usage::
+
+    python -m benchmarks.imports                     # compare with benchmarks/imports_baseline.json
+    python -m benchmarks.imports --match dk --match si
+    python -m benchmarks.imports --save              # record a new baseline
+
+The run fails when the peak or retained memory of a module grew beyond the threshold. Import times are too noisy to
+fail on by default, use ``--time-threshold`` to check them as well.
+"""
+import argparse
+import gc
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+import warnings
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'imports_baseline.json')
+DEFAULT_THRESHOLD = 1.2
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def module_names():
+    """Returns the names of the forms and models modules of every flavor."""
+    package_dir = os.path.join(ROOT, 'localflavor')
+    names = []
+    for package in sorted(os.listdir(package_dir)):
+        for module in ('forms', 'models'):
+            if os.path.exists(os.path.join(package_dir, package, module + '.py')):
+                names.append('localflavor.%s.%s' % (package, module))
+    return names
+
+
+def measure(module_name, mode):
+    """Imports a module in this interpreter and returns the measurements for ``mode``, 'time' or 'memory'."""
+    import django
+    from django.conf import settings
+
+    settings.configure(INSTALLED_APPS=['localflavor'], USE_I18N=True)
+    django.setup()
+    # Import what every flavor uses so it isn't attributed to the first module that imports it.
+    import django.db.models  # noqa: F401
+    import django.forms  # noqa: F401
+    import localflavor  # noqa: F401
+    import localflavor.results  # noqa: F401
+
+    warnings.simplefilter('ignore')
+    gc.collect()
+    if mode == 'time':
+        start = time.perf_counter()
+        importlib.import_module(module_name)
+        return {'time': time.perf_counter() - start}
+
+    import tracemalloc
+
+    tracemalloc.start()
+    importlib.import_module(module_name)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'peak': peak, 'retained': retained}
+
+
+def measure_in_subprocess(module_name):
+    result = {}
+    for mode in ('time', 'memory'):
+        output = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.imports', '--child', module_name, mode],
+            cwd=ROOT, check=True, stdout=subprocess.PIPE, universal_newlines=True,
+        ).stdout
+        result.update(json.loads(output))
+    return result
+
+
+def compare(results, baseline, threshold, time_threshold=None):
+    """Returns a list of (name, metric, ratio) for the modules that grew beyond the thresholds."""
+    thresholds = {'peak': threshold, 'retained': threshold}
+    if time_threshold:
+        thresholds['time'] = time_threshold
+    regressions = []
+    for name, result in sorted(results.items()):
+        for metric, metric_threshold in thresholds.items():
+            expected = baseline['results'].get(name, {}).get(metric)
+            if not expected:
+                continue
+            ratio = result[metric] / expected
+            if ratio > metric_threshold:
+                regressions.append((name, metric, ratio))
+    return regressions
+
+
+def _format_row(name, time_value, peak, retained):
+    return '%-40s %10s %12s %12s' % (name, time_value, peak, retained)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--match', action='append', default=[],
+                        help='Only measure modules whose name contains this string. Can be given several times.')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='Path of the JSON baseline.')
+    parser.add_argument('--save', action='store_true', help='Write the results to the baseline instead of comparing.')
+    parser.add_argument('--threshold', type=float, default=None,
+                        help='Maximum allowed growth factor of the memory, defaults to the one in the baseline or %s.'
+                             % DEFAULT_THRESHOLD)
+    parser.add_argument('--time-threshold', type=float, default=None,
+                        help='Maximum allowed slowdown factor of the import time.')
+    parser.add_argument('--sort', choices=('name', 'time', 'peak', 'retained'), default='name',
+                        help='Order of the report.')
+    parser.add_argument('--child', nargs=2, metavar=('MODULE', 'MODE'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        print(json.dumps(measure(*args.child)))
+        return 0
+
+    names = [name for name in module_names() if not args.match or any(pattern in name for pattern in args.match)]
+    results = {name[len('localflavor.'):]: measure_in_subprocess(name) for name in names}
+
+    print(_format_row('Module', 'Time', 'Peak', 'Retained'))
+    order = sorted(results, key=lambda name: name if args.sort == 'name' else -results[name][args.sort])
+    for name in order:
+        result = results[name]
+        print(_format_row(name, '%.1f ms' % (result['time'] * 1000), '%.1f KiB' % (result['peak'] / 1024),
+                          '%.1f KiB' % (result['retained'] / 1024)))
+    print(_format_row('Total', '%.1f ms' % (sum(result['time'] for result in results.values()) * 1000),
+                      '', '%.1f KiB' % (sum(result['retained'] for result in results.values()) / 1024)))
+
+    if args.save:
+        baseline = {'threshold': args.threshold or DEFAULT_THRESHOLD, 'results': {}}
+        if args.match and os.path.exists(args.baseline):
+            # Only replace the results of the selected modules.
+            with open(args.baseline) as baseline_file:
+                baseline = json.load(baseline_file)
+        baseline['results'].update({
+            name: {'time': round(result['time'], 6), 'peak': result['peak'], 'retained': result['retained']}
+            for name, result in results.items()
+        })
+        baseline['results'] = dict(sorted(baseline['results'].items()))
+        with open(args.baseline, 'w') as baseline_file:
+            json.dump(baseline, baseline_file, indent=2)
+            baseline_file.write('\n')
+        print('Saved %d results to %s.' % (len(results), args.baseline))
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print('No baseline found at %s, run with --save to create one.' % args.baseline)
+        return 0
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    threshold = args.threshold or baseline.get('threshold', DEFAULT_THRESHOLD)
+    regressions = compare(results, baseline, threshold, args.time_threshold)
+    for name, metric, ratio in regressions:
+        print('REGRESSION: %s %s is %.2fx the baseline.' % (name, metric, ratio))
+    if regressions:
+        print('%d regressions beyond the threshold.' % len(regressions))
+        return 1
+    print('No regressions beyond the threshold of %.2fx.' % threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,10 +2,11 @@
 
 import re
 
-from django.core.exceptions import ValidationError
 from django.forms.fields import CharField, Select, ChoiceField
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .ae_emirates import EMIRATE_CHOICES, EMIRATES_NORMALIZED
 from .validators import (
     PO_BOX_PREFIX_RE, UAEEmiratesIDValidator, UAEPostalCodeValidator, UAEPOBoxValidator,
@@ -13,7 +14,7 @@ from .validators import (
 )
 
 
-class UAEEmiratesIDField(CharField):
+class UAEEmiratesIDField(CheckFieldMixin, CharField):
     """
     A field for validating UAE Emirates ID numbers.
 
@@ -35,23 +36,19 @@ class UAEEmiratesIDField(CharField):
         super().__init__(**kwargs)
         self.validators.append(UAEEmiratesIDValidator())
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         # Remove any dashes or spaces and return clean 15-digit format
         clean_value = re.sub(r'[\s\-]', '', str(value))
 
         # Format as 784-YYYY-NNNNNNN-N for consistency
         if len(clean_value) == 15:
             formatted = f"{clean_value[:3]}-{clean_value[3:7]}-{clean_value[7:14]}-{clean_value[14]}"
-            return formatted
+            return CheckResult.valid(formatted)
 
-        return clean_value
+        return CheckResult.valid(clean_value)
 
 
-class UAEEmirateField(ChoiceField):
+class UAEEmirateField(CheckFieldMixin, ChoiceField):
     """
     A choice field that uses a list of UAE Emirates as its choices.
 
@@ -62,21 +59,16 @@ class UAEEmirateField(ChoiceField):
         kwargs.setdefault('choices', EMIRATE_CHOICES)
         super().__init__(**kwargs)
 
-    def clean(self, value):
+    def check(self, value):
         value = self.to_python(value)
         if value in self.empty_values:
-            return super().clean(value)
+            return super().check(value)
 
-        try:
-            normalized_value = EMIRATES_NORMALIZED[value.lower()]
-        except KeyError:
-            raise ValidationError(
-                self.error_messages['invalid_choice'],
-                code='invalid_choice',
-                params={'value': value},
-            )
+        normalized_value = EMIRATES_NORMALIZED.get(value.lower())
+        if normalized_value is None:
+            return self.invalid(value, 'invalid_choice', {'value': value})
 
-        return super().clean(normalized_value)
+        return super().check(normalized_value)
 
 
 class UAEEmirateSelect(Select):
@@ -90,7 +82,7 @@ class UAEEmirateSelect(Select):
         super().__init__(attrs, choices=EMIRATE_CHOICES)
 
 
-class UAEPostalCodeField(CharField):
+class UAEPostalCodeField(CheckFieldMixin, CharField):
     """
     A field for validating UAE postal codes.
 
@@ -109,20 +101,16 @@ class UAEPostalCodeField(CharField):
         super().__init__(**kwargs)
         self.validators.append(UAEPostalCodeValidator())
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return self.empty_value
-
+    def check_value(self, value):
         # Normalize to 00000 if needed
         clean_value = str(value).strip()
         if clean_value in ('00000', ''):
-            return clean_value
+            return CheckResult.valid(clean_value)
 
-        return value
+        return CheckResult.valid(value)
 
 
-class UAEPOBoxField(CharField):
+class UAEPOBoxField(CheckFieldMixin, CharField):
     """
     A field for validating UAE P.O. Box numbers.
 
@@ -139,11 +127,7 @@ class UAEPOBoxField(CharField):
         super().__init__(**kwargs)
         self.validators.append(UAEPOBoxValidator())
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         # Clean up the value
         clean_value = str(value).strip().upper()
 
@@ -152,12 +136,12 @@ class UAEPOBoxField(CharField):
 
         # Return just the number part
         if re.match(r'^\d{1,10}$', clean_value):
-            return clean_value
+            return CheckResult.valid(clean_value)
 
-        return value
+        return CheckResult.valid(value)
 
 
-class UAETaxRegistrationNumberField(CharField):
+class UAETaxRegistrationNumberField(CheckFieldMixin, CharField):
     """
     A field for validating UAE Tax Registration Numbers (TRN).
 
@@ -174,11 +158,7 @@ class UAETaxRegistrationNumberField(CharField):
         super().__init__(**kwargs)
         self.validators.append(UAETaxRegistrationNumberValidator())
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         # Remove any spaces or formatting
         clean_value = re.sub(r'\s', '', str(value))
-        return clean_value
+        return CheckResult.valid(clean_value)
@@ -2,15 +2,16 @@
 
 import re
 
-from django.core.exceptions import ValidationError
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckMixin, CheckResult
+
 PO_BOX_PREFIX_RE = r'^P\.?\s*O\.?\s*B(?:OX)?\.?\s*'
 
 
 @deconstructible
-class UAEEmiratesIDValidator:
+class UAEEmiratesIDValidator(CheckMixin):
     """
     Validator for UAE Emirates ID numbers.
 
@@ -31,21 +32,22 @@ class UAEEmiratesIDValidator:
         if code is not None:
             self.code = code
 
-    def __call__(self, value):
+    def check(self, value):
         """Validate UAE Emirates ID."""
         if not value:
-            return
+            return CheckResult.valid(value)
 
         # Remove any dashes or spaces
         clean_value = re.sub(r'[\s\-]', '', str(value))
 
         # Check if it's exactly 15 digits
         if not re.match(r'^\d{15}$', clean_value):
-            raise ValidationError(self.message, code=self.code)
+            return CheckResult.invalid(value, self.code, self.message)
 
         # Check if it starts with 784 (UAE country code)
         if not clean_value.startswith('784'):
-            raise ValidationError(self.message, code=self.code)
+            return CheckResult.invalid(value, self.code, self.message)
+        return CheckResult.valid(clean_value)
 
     def __eq__(self, other):
         return (
@@ -56,7 +58,7 @@ class UAEEmiratesIDValidator:
 
 
 @deconstructible
-class UAEPostalCodeValidator:
+class UAEPostalCodeValidator(CheckMixin):
     """
     Validator for UAE postal codes.
 
@@ -72,16 +74,17 @@ class UAEPostalCodeValidator:
         if code is not None:
             self.code = code
 
-    def __call__(self, value):
+    def check(self, value):
         """Validate UAE postal code."""
         if not value:
-            return
+            return CheckResult.valid(value)
 
         clean_value = str(value).strip()
 
         # UAE postal code should be 00000 or empty
         if clean_value and clean_value != '00000':
-            raise ValidationError(self.message, code=self.code)
+            return CheckResult.invalid(value, self.code, self.message)
+        return CheckResult.valid(clean_value)
 
     def __eq__(self, other):
         return (
@@ -92,7 +95,7 @@ class UAEPostalCodeValidator:
 
 
 @deconstructible
-class UAEPOBoxValidator:
+class UAEPOBoxValidator(CheckMixin):
     """
     Validator for UAE P.O. Box numbers.
 
@@ -108,10 +111,10 @@ class UAEPOBoxValidator:
         if code is not None:
             self.code = code
 
-    def __call__(self, value):
+    def check(self, value):
         """Validate P.O. Box number."""
         if not value:
-            return
+            return CheckResult.valid(value)
 
         clean_value = str(value).strip().upper()
 
@@ -120,7 +123,8 @@ class UAEPOBoxValidator:
 
         # Check if remaining value is numeric and reasonable length
         if not re.match(r'^\d{1,10}$', clean_value):
-            raise ValidationError(self.message, code=self.code)
+            return CheckResult.invalid(value, self.code, self.message)
+        return CheckResult.valid(clean_value)
 
     def __eq__(self, other):
         return (
@@ -131,7 +135,7 @@ class UAEPOBoxValidator:
 
 
 @deconstructible
-class UAETaxRegistrationNumberValidator:
+class UAETaxRegistrationNumberValidator(CheckMixin):
     """
     Validator for UAE Tax Registration Numbers (TRN).
 
@@ -147,13 +151,14 @@ class UAETaxRegistrationNumberValidator:
         if code is not None:
             self.code = code
 
-    def __call__(self, value):
+    def check(self, value):
         if not value:
-            return
+            return CheckResult.valid(value)
 
         clean_value = re.sub(r'\s', '', str(value))
         if not re.match(r'^\d{15}$', clean_value):
-            raise ValidationError(self.message, code=self.code)
+            return CheckResult.invalid(value, self.code, self.message)
+        return CheckResult.valid(clean_value)
 
     def __eq__(self, other):
         return (
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class LocalFlavorConfig(AppConfig):
+    name = 'localflavor'
+    verbose_name = 'Local Flavor'
+
+    def ready(self):
+        # The instrumentation imports every flavor, so it's only imported when it's used.
+        if getattr(settings, 'LOCALFLAVOR_INSTRUMENTATION', None):
+            from localflavor import instrumentation
+            instrumentation.configure()
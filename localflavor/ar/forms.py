@@ -1,12 +1,13 @@
 """AR-specific Form helpers."""
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 from stdnum.ar import cbu
 from stdnum.exceptions import InvalidChecksum, InvalidLength
 from stdnum.exceptions import ValidationError as StdnumValidationError
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .ar_provinces import PROVINCE_CHOICES
 
 
@@ -17,7 +18,7 @@ class ARProvinceSelect(Select):
         super().__init__(attrs, choices=PROVINCE_CHOICES)
 
 
-class ARPostalCodeField(RegexField):
+class ARPostalCodeField(CheckFieldMixin, RegexField):
     """
     A field that accepts a 'classic' NNNN Postal Code or a CPA.
 
@@ -37,18 +38,15 @@ class ARPostalCodeField(RegexField):
             max_length=max_length, min_length=min_length, **kwargs
         )
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         if len(value) not in (4, 8):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if len(value) == 8:
-            return '%s%s%s' % (value[0].upper(), value[1:5], value[5:].upper())
-        return value
+            return CheckResult.valid('%s%s%s' % (value[0].upper(), value[1:5], value[5:].upper()))
+        return CheckResult.valid(value)
 
 
-class ARDNIField(CharField):
+class ARDNIField(CheckFieldMixin, CharField):
     """A field that validates 'Documento Nacional de Identidad' (DNI) numbers."""
 
     default_error_messages = {
@@ -59,22 +57,19 @@ class ARDNIField(CharField):
     def __init__(self, max_length=10, min_length=7, **kwargs):
         super().__init__(max_length=max_length, min_length=min_length, **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """Value can be a string either in the [X]X.XXX.XXX or [X]XXXXXXX formats."""
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         if not value.isdigit():
             value = value.replace('.', '')
         if not value.isdigit():
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if len(value) not in (7, 8):
-            raise ValidationError(self.error_messages['max_digits'], code='max_digits')
+            return self.invalid(value, 'max_digits')
 
-        return value
+        return CheckResult.valid(value)
 
 
-class ARCUITField(RegexField):
+class ARCUITField(CheckFieldMixin, RegexField):
     """
     This field validates a CUIT (Código Único de Identificación Tributaria).
 
@@ -100,17 +95,14 @@ class ARCUITField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^\d{2}-?\d{8}-?\d$', **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """Value can be either a string in the format XX-XXXXXXXX-X or an 11-digit number."""
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         value, cd = self._canon(value)
         if not value[:2] in ['27', '20', '30', '23', '24', '33', '34']:
-            raise ValidationError(self.error_messages['legal_type'], code='legal_type')
+            return self.invalid(value, 'legal_type')
         if self._calc_cd(value) != cd:
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
-        return self._format(value, cd)
+            return self.invalid(value, 'checksum')
+        return CheckResult.valid(self._format(value, cd))
 
     def _canon(self, cuit):
         cuit = cuit.replace('-', '')
@@ -135,7 +127,7 @@ class ARCUITField(RegexField):
         return '%s-%s-%s' % (cuit[:2], cuit[2:], check_digit)
 
 
-class ARCBUField(CharField):
+class ARCBUField(CheckFieldMixin, CharField):
     """
     This field validates a CBU (Clave Bancaria Uniforme).
 
@@ -156,16 +148,13 @@ class ARCBUField(CharField):
         'checksum': _('Invalid CBU.'),
     }
 
-    def clean(self, value):
+    def check_value(self, value):
         """Value must be a 22 digits long number."""
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         try:
-            return cbu.validate(value)
+            return CheckResult.valid(cbu.validate(value))
         except InvalidLength:
-            raise ValidationError(self.error_messages['max_length'], code='max_length')
+            return self.invalid(value, 'max_length')
         except InvalidChecksum:
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
+            return self.invalid(value, 'checksum')
         except StdnumValidationError:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
@@ -1,15 +1,17 @@
 """AT-specific Form helpers."""
 import re
 
-from django.forms import CharField, RegexField, Select, ValidationError
+from django.forms import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .at_states import STATE_CHOICES
 
 re_ssn = re.compile(r'^\d{4} \d{6}')
 
 
-class ATZipCodeField(RegexField):
+class ATZipCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input is an Austrian postcode.
 
@@ -31,7 +33,7 @@ class ATStateSelect(Select):
         super().__init__(attrs, choices=STATE_CHOICES)
 
 
-class ATSocialSecurityNumberField(CharField):
+class ATSocialSecurityNumberField(CheckFieldMixin, CharField):
     """
     Austrian Social Security numbers are composed of a 4 digits and 6 digits field.
 
@@ -49,20 +51,17 @@ class ATSocialSecurityNumberField(CharField):
         'invalid': _('Enter a valid Austrian Social Security Number in XXXX XXXXXX format.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         if not re_ssn.search(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         sqnr, date = value.split(" ")
         sqnr, check = (sqnr[:3], (sqnr[3]))
         if int(sqnr) < 100:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         res = (int(sqnr[0]) * 3 + int(sqnr[1]) * 7 + int(sqnr[2]) * 9 +
                int(date[0]) * 5 + int(date[1]) * 8 + int(date[2]) * 4 +
                int(date[3]) * 2 + int(date[4]) * 1 + int(date[5]) * 6)
         res = res % 11
         if res != int(check):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return '%s%s %s' % (sqnr, check, date)
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid('%s%s %s' % (sqnr, check, date))
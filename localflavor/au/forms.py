@@ -3,11 +3,13 @@
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .au_states import STATE_CHOICES
 from .validators import AUBusinessNumberFieldValidator, AUCompanyNumberFieldValidator, AUTaxFileNumberFieldValidator
 
 
-class AUPostCodeField(RegexField):
+class AUPostCodeField(CheckFieldMixin, RegexField):
     """
     Australian post code field.
 
@@ -30,7 +32,7 @@ class AUStateSelect(Select):
         super().__init__(attrs, choices=STATE_CHOICES)
 
 
-class AUBusinessNumberField(CharField):
+class AUBusinessNumberField(CheckFieldMixin, CharField):
     """
     A form field that validates input as an Australian Business Number (ABN).
 
@@ -55,7 +57,7 @@ class AUBusinessNumberField(CharField):
         return '{} {} {} {}'.format(spaceless[:2], spaceless[2:5], spaceless[5:8], spaceless[8:])
 
 
-class AUCompanyNumberField(CharField):
+class AUCompanyNumberField(CheckFieldMixin, CharField):
     """
     A form field that validates input as an Australian Company Number (ACN).
 
@@ -79,7 +81,7 @@ class AUCompanyNumberField(CharField):
         return '{} {} {}'.format(spaceless[:3], spaceless[3:6], spaceless[6:])
 
 
-class AUTaxFileNumberField(CharField):
+class AUTaxFileNumberField(CheckFieldMixin, CharField):
     """
     A form field that validates input as an Australian Tax File Number (TFN).
 
@@ -1,9 +1,10 @@
-from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckResult, RegexCheckMixin
 
-class AUBusinessNumberFieldValidator(RegexValidator):
+
+class AUBusinessNumberFieldValidator(RegexCheckMixin, RegexValidator):
     """
     Validation for Australian Business Numbers.
 
@@ -41,13 +42,14 @@ class AUBusinessNumberFieldValidator(RegexValidator):
         # 5. If the remainder is zero, then it's a valid ABN.
         return remainder == 0
 
-    def __call__(self, value):
-        super().__call__(value)
-        if not self._is_valid(value):
-            raise ValidationError(self.error_message, code='invalid')
+    def check(self, value):
+        result = self.check_regex(value)
+        if result and not self._is_valid(value):
+            return CheckResult.invalid(value, 'invalid', self.error_message)
+        return result
 
 
-class AUCompanyNumberFieldValidator(RegexValidator):
+class AUCompanyNumberFieldValidator(RegexCheckMixin, RegexValidator):
     """
     Validation for Australian Company Numbers.
 
@@ -83,13 +85,14 @@ class AUCompanyNumberFieldValidator(RegexValidator):
         # 5. Check against the last digit
         return check == digits[8]
 
-    def __call__(self, value):
-        super().__call__(value)
-        if not self._is_valid(value):
-            raise ValidationError(self.error_message, code='invalid')
+    def check(self, value):
+        result = self.check_regex(value)
+        if result and not self._is_valid(value):
+            return CheckResult.invalid(value, 'invalid', self.error_message)
+        return result
 
 
-class AUTaxFileNumberFieldValidator(RegexValidator):
+class AUTaxFileNumberFieldValidator(RegexCheckMixin, RegexValidator):
     """
     Validation for Australian Tax File Numbers.
 
@@ -130,8 +133,9 @@ class AUTaxFileNumberFieldValidator(RegexValidator):
         # 4. If the remainder is zero, then it's a valid TFN.
         return remainder == 0
 
-    def __call__(self, value):
+    def check(self, value):
         value = value.replace(' ', '')
-        super().__call__(value)
-        if not self._is_valid(value):
-            raise ValidationError(self.error_message, code='invalid')
+        result = self.check_regex(value)
+        if result and not self._is_valid(value):
+            return CheckResult.invalid(value, 'invalid', self.error_message)
+        return result
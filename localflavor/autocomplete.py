@@ -0,0 +1,186 @@
+"""
+Autocompletion for long lists of choices.
+
+Select widgets with thousands of choices, like :class:`~localflavor.dk.forms.DKMunicipalitySelect` or
+:class:`~localflavor.si.forms.SIPostalCodeSelect`, render every option on every page. :class:`AutocompleteSelect`
+only renders the selected options and lets the user search the other ones with :class:`AutocompleteView`, which
+returns the best matches from a :class:`ChoiceIndex` as JSON.
+
+The search ignores case and accents, so "kobenhavn" finds "København", and matches the beginning of the label, of
+any word in the label and of the code.
+
+Example:
+
+.. code-block:: python
+
+    # urls.py
+    from localflavor.autocomplete import AutocompleteView, ChoiceIndex
+    from localflavor.dk.dk_municipalities import DK_MUNICIPALITIES
+
+    urlpatterns = [
+        path('autocomplete/dk-municipalities/',
+             AutocompleteView.as_view(index=ChoiceIndex(DK_MUNICIPALITIES)),
+             name='dk-municipalities-autocomplete'),
+    ]
+
+    # forms.py
+    from localflavor.autocomplete import AutocompleteSelect
+    from localflavor.dk.dk_municipalities import DK_MUNICIPALITIES
+
+    class AddressForm(forms.Form):
+        municipality = forms.ChoiceField(
+            choices=DK_MUNICIPALITIES,
+            widget=AutocompleteSelect(reverse_lazy('dk-municipalities-autocomplete')),
+        )
+
+The widget needs ``'localflavor'`` in :setting:`INSTALLED_APPS` for its script and the form media has to be included
+in the page.
+
+.. versionadded:: 5.1
+"""
+import unicodedata
+from bisect import bisect_left
+
+from django.forms.widgets import Select
+from django.http import JsonResponse
+from django.utils.translation import get_language
+from django.views.generic import View
+
+#: Letters that don't decompose into a base letter and an accent.
+_FOLDED_LETTERS = str.maketrans({
+    'æ': 'ae', 'ð': 'd', 'đ': 'd', 'ħ': 'h', 'ı': 'i', 'ł': 'l', 'œ': 'oe', 'ø': 'o', 'þ': 'th',
+})
+_WORD_SEPARATORS = frozenset(' -/.,(')
+
+
+def fold(text):
+    """Returns the text in lower case without accents, for comparisons that ignore both."""
+    text = unicodedata.normalize('NFKD', str(text).casefold()).translate(_FOLDED_LETTERS)
+    return ''.join(char for char in text if not unicodedata.combining(char))
+
+
+def _flatten(choices):
+    for code, label in choices:
+        if isinstance(label, (list, tuple)):
+            yield from label
+        else:
+            yield code, label
+
+
+class ChoiceIndex:
+    """
+    A prefix index over choices for autocompletion.
+
+    The labels are translated in the active language, so an index is built for every language on its first search.
+    ``choices`` can be a callable that returns the choices. The keys are kept sorted, so the matches of a prefix are
+    found with a binary search.
+    """
+
+    #: The ranks of the keys, matches of the beginning of the label are shown first.
+    LABEL, WORD, CODE = range(3)
+
+    def __init__(self, choices):
+        self.choices = choices
+        self._indexes = {}
+
+    def _build(self):
+        choices = self.choices() if callable(self.choices) else self.choices
+        rows = []
+        folded_labels = []
+        entries = []
+        for code, label in _flatten(choices):
+            if code in (None, ''):
+                continue
+            row = len(rows)
+            label = str(label)
+            rows.append((code, label))
+            folded = fold(label)
+            folded_labels.append(folded)
+            entries.append((folded, self.LABEL, row))
+            for position in range(1, len(folded)):
+                if folded[position - 1] in _WORD_SEPARATORS and folded[position] not in _WORD_SEPARATORS:
+                    entries.append((folded[position:], self.WORD, row))
+            entries.append((fold(code), self.CODE, row))
+        entries.sort()
+        return [entry[0] for entry in entries], entries, rows, folded_labels
+
+    def _get_index(self):
+        language = get_language()
+        index = self._indexes.get(language)
+        if index is None:
+            index = self._indexes[language] = self._build()
+        return index
+
+    def search(self, query, limit=10):
+        """Returns up to ``limit`` ``(code, label)`` choices that match the query, best matches first."""
+        query = fold(query).strip()
+        if not query:
+            return []
+        keys, entries, rows, folded_labels = self._get_index()
+        ranks = {}
+        for position in range(bisect_left(keys, query), len(keys)):
+            if not keys[position].startswith(query):
+                break
+            key, rank, row = entries[position]
+            if rank < ranks.get(row, len(entries)):
+                ranks[row] = rank
+        best = sorted(ranks, key=lambda row: (ranks[row], folded_labels[row], row))
+        return [rows[row] for row in best[:limit]]
+
+
+class AutocompleteSelect(Select):
+    """
+    A select widget that only renders the selected options and searches the other choices with an
+    :class:`AutocompleteView` at ``url``.
+
+    Without JavaScript only the selected options can be chosen.
+    """
+
+    def __init__(self, url, attrs=None, choices=(), limit=10, min_length=1):
+        super().__init__(attrs, choices)
+        self.url = url
+        self.limit = limit
+        self.min_length = min_length
+
+    class Media:
+        js = ('localflavor/js/autocomplete.js',)
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        attrs.update({
+            'data-autocomplete-url': str(self.url),
+            'data-autocomplete-limit': self.limit,
+            'data-autocomplete-min-length': self.min_length,
+        })
+        return attrs
+
+    def optgroups(self, name, value, attrs=None):
+        selected = {str(item) for item in value if item not in (None, '')}
+        options = []
+        if not self.allow_multiple_selected:
+            options.append(self.create_option(name, '', '', not selected, 0, attrs=attrs))
+        for code, label in _flatten(self.choices):
+            if str(code) in selected:
+                options.append(self.create_option(name, code, label, True, len(options), attrs=attrs))
+        return [(None, options, 0)]
+
+
+class AutocompleteView(View):
+    """
+    Returns the choices of ``index`` that match the ``q`` parameter as JSON.
+
+    The response has a ``results`` list of objects with the ``value`` and the ``label`` of the choices. The number of
+    results is the ``limit`` parameter of the request, capped to ``max_limit``.
+    """
+
+    index = None
+    limit = 10
+    max_limit = 50
+
+    def get(self, request, *args, **kwargs):
+        try:
+            limit = max(1, min(int(request.GET.get('limit', self.limit)), self.max_limit))
+        except ValueError:
+            limit = self.limit
+        results = self.index.search(request.GET.get('q', ''), limit)
+        return JsonResponse({'results': [{'value': code, 'label': label} for code, label in results]})
@@ -3,11 +3,13 @@
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .be_provinces import PROVINCE_CHOICES
 from .be_regions import REGION_CHOICES
 
 
-class BEPostalCodeField(RegexField):
+class BEPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input as a belgium postal code.
 
@@ -1,12 +1,13 @@
-from django.core.exceptions import ValidationError
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckMixin, CheckResult
+
 from .utils import get_egn_birth_date
 
 
 @deconstructible
-class EGNValidator:
+class EGNValidator(CheckMixin):
     """
     Check Bulgarian unique citizenship number (EGN) for validity.
 
@@ -29,13 +30,14 @@ class EGNValidator:
         except ValueError:
             return None
 
-    def __call__(self, egn):
+    def check(self, egn):
         if not (len(egn) == 10 and self._check_checksum(egn) and self._check_valid_date(egn)):
-            raise ValidationError(_("The EGN is not valid"), code='invalid')
+            return CheckResult.invalid(egn, 'invalid', _("The EGN is not valid"))
+        return CheckResult.valid(egn)
 
 
 @deconstructible
-class EIKValidator:
+class EIKValidator(CheckMixin):
     """
     Check Bulgarian EIK/BULSTAT codes for validity.
 
@@ -44,17 +46,18 @@ class EIKValidator:
     """
     error_message = _('EIK/BULSTAT is not valid')
 
-    def __call__(self, value):
+    def check(self, value):
         try:
-            value = list(map(int, value))
+            digits = list(map(int, value))
         except ValueError:
-            raise ValidationError(self.error_message, code='invalid')
+            return CheckResult.invalid(value, 'invalid', self.error_message)
 
-        if not (len(value) in [9, 13] and self._check_eik_base(value)):
-            raise ValidationError(self.error_message, code='invalid')
+        if not (len(digits) in [9, 13] and self._check_eik_base(digits)):
+            return CheckResult.invalid(value, 'invalid', self.error_message)
 
-        if len(value) == 13 and not self._check_eik_extra(value):
-            raise ValidationError(self.error_message, code='invalid')
+        if len(digits) == 13 and not self._check_eik_extra(digits):
+            return CheckResult.invalid(value, 'invalid', self.error_message)
+        return CheckResult.valid(value)
 
     def _get_checksum(self, weights, digits):
         checksum = sum(weight * digit for weight, digit in zip(weights, digits))
@@ -3,11 +3,12 @@
 import re
 
 from django.core.validators import EMPTY_VALUES
-from django.forms import ValidationError
 from django.forms.fields import CharField, Select
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .br_states import STATE_CHOICES
 from .validators import BRCNPJValidator, BRCPFValidator, BRPostalCodeValidator
 
@@ -16,7 +17,7 @@ process_digits_re = re.compile(
 )
 
 
-class BRZipCodeField(CharField):
+class BRZipCodeField(CheckFieldMixin, CharField):
     """
     A form field that validates input as a Brazilian zip code, with the format 00000-000.
 
@@ -37,7 +38,7 @@ class BRStateSelect(Select):
         super().__init__(attrs, choices=STATE_CHOICES)
 
 
-class BRStateChoiceField(CharField):
+class BRStateChoiceField(CheckFieldMixin, CharField):
     """A choice field that uses a list of Brazilian states as its choices."""
 
     widget = Select
@@ -49,17 +50,14 @@ class BRStateChoiceField(CharField):
         super().__init__(**kwargs)
         self.widget.choices = STATE_CHOICES
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         valid_values = {force_str(entry[0]) for entry in self.widget.choices}
         if value not in valid_values:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return value
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(value)
 
 
-class BRCPFField(CharField):
+class BRCPFField(CheckFieldMixin, CharField):
     """
     A form field that validates a CPF number or a CPF string.
 
@@ -83,7 +81,7 @@ class BRCPFField(CharField):
         self.validators.append(BRCPFValidator())
 
 
-class BRCNPJField(CharField):
+class BRCNPJField(CheckFieldMixin, CharField):
     """
     A form field that validates input as `Brazilian CNPJ`_.
 
@@ -119,7 +117,7 @@ def mod_97_base10(value):
     return 98 - ((value * 100 % 97) % 97)
 
 
-class BRProcessoField(CharField):
+class BRProcessoField(CheckFieldMixin, CharField):
     """
     A form field that validates a Legal Process(Processo) number or a Legal Process string.
 
@@ -135,25 +133,21 @@ class BRProcessoField(CharField):
     def __init__(self, max_length=25, min_length=20, **kwargs):
         super().__init__(max_length=max_length, min_length=min_length, **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """Value can be either a string in the format NNNNNNN-DD.AAAA.J.TR.OOOO or an 20-digit number."""
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
         orig_value = value[:]
         if not value.isdigit():
             process_number = process_digits_re.search(value)
             if process_number:
                 value = ''.join(process_number.groups())
             else:
-                raise ValidationError(self.error_messages['invalid'], code='invalid')
+                return self.invalid(value, 'invalid')
 
         orig_dv = value[7:9]
 
         value_without_digits = int(value[0:7] + value[9:])
 
         if str(mod_97_base10(value_without_digits)).zfill(2) != orig_dv:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return orig_value
+        return CheckResult.valid(orig_value)
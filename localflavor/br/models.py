@@ -1,6 +1,10 @@
 from django.db.models.fields import CharField
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.constraints import FormatCheckMixin
+from localflavor.normalized import NormalizedLookupMixin
+from localflavor.storage import IntegerStorageMixin
+
 from . import validators
 from .br_states import STATE_CHOICES
 from . import forms
@@ -27,16 +31,22 @@ class BRStateField(CharField):
         return name, path, args, kwargs
 
 
-class BRCPFField(CharField):
+class BRCPFField(IntegerStorageMixin, NormalizedLookupMixin, CharField):
     """
     A model field for the brazilian document named of CPF (Cadastro de Pessoa Física)
 
     Forms represent it as a :class:`~localflavor.br.forms.BRCPFField` field.
 
     .. versionadded:: 2.2
+    .. versionchanged:: 5.1
+
+        Added ``db_integer_storage``, see :mod:`localflavor.storage`.
+        Added ``db_normalized_index`` and the ``normalized`` lookup, see :mod:`localflavor.normalized`.
     """
 
     description = _("CPF Document")
+    digits_format = 'ddd.ddd.ddd-dd'
+    normalize_separators = ' .-'
 
     default_error_messages = {
         'invalid': _("Invalid CPF number."),
@@ -55,16 +65,22 @@ class BRCPFField(CharField):
 
 
 
-class BRCNPJField(CharField):
+class BRCNPJField(IntegerStorageMixin, NormalizedLookupMixin, CharField):
     """
     A model field for the brazilian document named of CNPJ (Cadastro Nacional de Pessoa Jurídica)
 
     Forms represent it as a :class:`~localflavor.br.forms.BRCNPJField` field.
 
     .. versionadded:: 2.2
+    .. versionchanged:: 5.1
+
+        Added ``db_integer_storage``, see :mod:`localflavor.storage`.
+        Added ``db_normalized_index`` and the ``normalized`` lookup, see :mod:`localflavor.normalized`.
     """
 
     description = _("CNPJ Document")
+    digits_format = 'dd.ddd.ddd/dddd-dd'
+    normalize_separators = ' ./-'
 
     def __init__(self, *args, **kwargs):
         kwargs['max_length'] = 18
@@ -76,16 +92,20 @@ class BRCNPJField(CharField):
         defaults.update(kwargs)
         return super().formfield(**defaults)
 
-class BRPostalCodeField(CharField):
+class BRPostalCodeField(FormatCheckMixin, CharField):
     """
     A model field for the brazilian zip code
 
     Forms represent it as a :class:`~localflavor.br.forms.BRZipCOdeField` field.
 
     .. versionadded:: 2.2
+    .. versionchanged:: 5.1
+
+        Added ``db_format_check``, see :mod:`localflavor.constraints`.
     """
 
     description = _("Postal Code")
+    format_patterns = ('[0-9]' * 5 + '-' + '[0-9]' * 3,)
 
     def __init__(self, *args, **kwargs):
         kwargs['max_length'] = 9
@@ -1,9 +1,10 @@
 import re
 
-from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckResult, RegexCheckMixin
+
 postal_code_re = re.compile(r'^\d{5}-\d{3}$')
 cnpj_digits_re = re.compile(r'^(\d{2})[.-]?(\d{3})[.-]?(\d{3})/(\d{4})-(\d{2})$')
 cpf_digits_re = re.compile(r'^(\d{3})\.(\d{3})\.(\d{3})-(\d{2})$')
@@ -15,7 +16,7 @@ def dv_maker(v):
     return 0
 
 
-class BRPostalCodeValidator(RegexValidator):
+class BRPostalCodeValidator(RegexCheckMixin, RegexValidator):
     """
     A validator for Brazilian Postal Codes (CEP).
 
@@ -27,7 +28,7 @@ class BRPostalCodeValidator(RegexValidator):
         super().__init__(postal_code_re, *args, **kwargs)
 
 
-class BRCNPJValidator(RegexValidator):
+class BRCNPJValidator(RegexCheckMixin, RegexValidator):
     """
     Validator for brazilian CNPJ.
 
@@ -42,7 +43,8 @@ class BRCNPJValidator(RegexValidator):
             **kwargs
         )
 
-    def __call__(self, value):
+    def check(self, value):
+        orig_value = value
         orig_dv = value[-2:]
 
         if not value.isdigit():
@@ -50,10 +52,10 @@ class BRCNPJValidator(RegexValidator):
             if cnpj:
                 value = ''.join(cnpj.groups())
             else:
-                raise ValidationError(self.message, code='invalid')
+                return CheckResult.invalid(orig_value, 'invalid', self.message)
 
         if len(value) != 14:
-            raise ValidationError(self.message, code='max_digits')
+            return CheckResult.invalid(orig_value, 'max_digits', self.message)
 
         new_1dv = sum([i * int(value[idx]) for idx, i in enumerate(list(range(5, 1, -1)) + list(range(9, 1, -1)))])
         new_1dv = dv_maker(new_1dv % 11)
@@ -62,10 +64,11 @@ class BRCNPJValidator(RegexValidator):
         new_2dv = dv_maker(new_2dv % 11)
         value = value[:-1] + str(new_2dv)
         if value[-2:] != orig_dv:
-            raise ValidationError(self.message, code='invalid')
+            return CheckResult.invalid(orig_value, 'invalid', self.message)
+        return CheckResult.valid(value)
 
 
-class BRCPFValidator(RegexValidator):
+class BRCPFValidator(RegexCheckMixin, RegexValidator):
     """
     Validator for brazilian CPF.
 
@@ -80,16 +83,17 @@ class BRCPFValidator(RegexValidator):
             **kwargs
         )
 
-    def __call__(self, value):
+    def check(self, value):
+        orig_value = value
         if not value.isdigit():
             cpf = cpf_digits_re.search(value)
             if cpf:
                 value = ''.join(cpf.groups())
             else:
-                raise ValidationError(self.message, code='invalid')
+                return CheckResult.invalid(orig_value, 'invalid', self.message)
 
         if len(value) != 11:
-            raise ValidationError(self.message, code='max_digits')
+            return CheckResult.invalid(orig_value, 'max_digits', self.message)
 
         orig_dv = value[-2:]
         new_1dv = sum([i * int(value[idx])
@@ -100,7 +104,6 @@ class BRCPFValidator(RegexValidator):
                        for idx, i in enumerate(range(11, 1, -1))])
         new_2dv = dv_maker(new_2dv % 11)
         value = value[:-1] + str(new_2dv)
-        if value[-2:] != orig_dv:
-            raise ValidationError(self.message, code='invalid')
-        if value.count(value[0]) == 11:
-            raise ValidationError(self.message, code='invalid')
+        if value[-2:] != orig_dv or value.count(value[0]) == 11:
+            return CheckResult.invalid(orig_value, 'invalid', self.message)
+        return CheckResult.valid(value)
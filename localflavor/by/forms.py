@@ -1,6 +1,8 @@
 from django import forms
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .by_regions import BY_REGIONS_CHOICES
 
 
@@ -44,7 +46,7 @@ class BYRegionSelect(forms.Select):
         super().__init__(attrs, choices=BY_REGIONS_CHOICES)
 
 
-class BYPassNumberField(BaseKwargsUpdatedField, UpperValueMixin, forms.RegexField):
+class BYPassNumberField(CheckFieldMixin, BaseKwargsUpdatedField, UpperValueMixin, forms.RegexField):
     """
     A form field that validates its input is a pass number in a right format.
 
@@ -64,7 +66,7 @@ class BYPassNumberField(BaseKwargsUpdatedField, UpperValueMixin, forms.RegexFiel
     }
 
 
-class BYPassIdNumberField(BaseKwargsUpdatedField, UpperValueMixin, forms.RegexField):
+class BYPassIdNumberField(CheckFieldMixin, BaseKwargsUpdatedField, UpperValueMixin, forms.RegexField):
     """
     A form field that validates its input is a ID number in a right format.
 
@@ -85,7 +87,7 @@ class BYPassIdNumberField(BaseKwargsUpdatedField, UpperValueMixin, forms.RegexFi
     }
 
 
-class BYPostalCodeField(BaseKwargsUpdatedField, forms.RegexField):
+class BYPostalCodeField(CheckFieldMixin, BaseKwargsUpdatedField, forms.RegexField):
     """
     A form field that validates its input is a valid Postal code (6 digits).
 
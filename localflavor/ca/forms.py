@@ -3,15 +3,16 @@
 import re
 
 from django.core.exceptions import ImproperlyConfigured
-from django.forms import ValidationError
 from django.forms.fields import CharField, Select
 from django.utils.translation import gettext_lazy as _
 from stdnum import luhn
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 sin_re = re.compile(r"^(\d{3})-(\d{3})-(\d{3})$")
 
 
-class CAPostalCodeField(CharField):
+class CAPostalCodeField(CheckFieldMixin, CharField):
     """
     Canadian postal code form field.
 
@@ -28,18 +29,15 @@ class CAPostalCodeField(CharField):
     postcode_regex = re.compile(
         r'^([ABCEGHJKLMNPRSTVXY]\d[ABCEGHJKLMNPRSTVWXYZ]) *(\d[ABCEGHJKLMNPRSTVWXYZ]\d)$')
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         postcode = value.upper().strip()
         m = self.postcode_regex.match(postcode)
         if not m:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return "%s %s" % (m.group(1), m.group(2))
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid("%s %s" % (m.group(1), m.group(2)))
 
 
-class CAProvinceField(CharField):
+class CAProvinceField(CheckFieldMixin, CharField):
     """
     A form field that validates its input is a Canadian province name or abbreviation.
 
@@ -51,17 +49,14 @@ class CAProvinceField(CharField):
         'invalid': _('Enter a Canadian province or territory.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         try:
             # Load data in memory only when it is required, see also #17275
             from .ca_provinces import PROVINCES_NORMALIZED
-            return PROVINCES_NORMALIZED[value.lower()]
+            return CheckResult.valid(PROVINCES_NORMALIZED[value.lower()])
         except KeyError:
             pass
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+        return self.invalid(value, 'invalid')
 
 
 class CAProvinceSelect(Select):
@@ -73,7 +68,7 @@ class CAProvinceSelect(Select):
         super().__init__(attrs, choices=PROVINCE_CHOICES)
 
 
-class CASocialInsuranceNumberField(CharField):
+class CASocialInsuranceNumberField(CheckFieldMixin, CharField):
     """
     A Canadian Social Insurance Number (SIN).
 
@@ -91,14 +86,10 @@ class CASocialInsuranceNumberField(CharField):
             'Enter a valid Canadian Social Insurance number in XXX-XXX-XXX format.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = re.match(sin_re, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         number = '%s-%s-%s' % (match.group(1), match.group(2), match.group(3))
         check_number = '%s%s%s' % (
@@ -106,5 +97,5 @@ class CASocialInsuranceNumberField(CharField):
             match.group(2),
             match.group(3))
         if not luhn.is_valid(check_number):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return number
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(number)
@@ -3,12 +3,12 @@
 import re
 
 from django.core.exceptions import ImproperlyConfigured
-from django.core.validators import RegexValidator
 from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
 from ..generic import validators
+from ..results import CheckFieldMixin, CheckResult, RegexCheckValidator
 from .ch_states import STATE_CHOICES
 
 zip_re = re.compile(r'^[1-9]\d{3}$')
@@ -16,7 +16,7 @@ id_re = re.compile(r'^(?P<idnumber>\w{8})(?P<pos9>(\d{1}|<))(?P<checksum>\d{1})$
 ssn_re = re.compile(r'^756.\d{4}\.\d{4}\.\d{2}$')
 
 
-class CHZipCodeField(RegexField):
+class CHZipCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as a Swiss zip code.
 
@@ -41,7 +41,7 @@ class CHStateSelect(Select):
         super().__init__(attrs, choices=STATE_CHOICES)
 
 
-class CHIdentityCardNumberField(CharField):
+class CHIdentityCardNumberField(CheckFieldMixin, CharField):
     """
     A Swiss identity card number.
 
@@ -86,29 +86,25 @@ class CHIdentityCardNumberField(CharField):
 
         return str(calculated_checksum)[-1] == given_checksum
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = re.match(id_re, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         result = match.groupdict()
         idnumber, pos9, checksum = result['idnumber'], result['pos9'], result['checksum']
 
         if idnumber in ('00000000', 'A0000000'):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         all_digits = "%s%s%s" % (idnumber, pos9, checksum)
         if not self.has_valid_checksum(all_digits):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return '%s%s%s' % (idnumber, pos9, checksum)
+        return CheckResult.valid('%s%s%s' % (idnumber, pos9, checksum))
 
 
-class CHSocialSecurityNumberField(CharField):
+class CHSocialSecurityNumberField(CheckFieldMixin, CharField):
     """
     A Swiss Social Security number (also known as the new AHV Number).
 
@@ -127,13 +123,14 @@ class CHSocialSecurityNumberField(CharField):
         'invalid': _('Enter a valid Swiss Social Security number in 756.XXXX.XXXX.XX format.'),
     }
     default_validators = [
-        RegexValidator(regex=ssn_re),
+        RegexCheckValidator(regex=ssn_re),
         validators.EANValidator(strip_nondigits=True),
     ]
 
-    def run_validators(self, value):
-        try:
-            super().run_validators(value)
-        except ValidationError as errs:
-            # Deduplicate error messages, if any
-            raise ValidationError(list(set(errs.messages)), code='invalid')
+    def check_validators(self, value):
+        result = super().check_validators(value)
+        if result is None:
+            return result
+        # Deduplicate error messages, if any
+        error = ValidationError(list(set(result.error.messages)), code='invalid')
+        return CheckResult(False, value, 'invalid', error.messages[0], error=error)
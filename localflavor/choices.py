@@ -0,0 +1,236 @@
+"""
+Compact tables of choices for the large geographic data modules.
+
+A tuple of ``(code, gettext_lazy(label))`` pairs keeps a lazy translation proxy alive for every row, which makes up
+most of the memory used by modules like the Danish postal codes. :class:`ChoiceTable` stores the codes and the
+untranslated labels packed into a few strings and arrays instead, and only builds the pairs when the table is
+iterated or indexed. The labels of translated tables are still lazy, so the table can be used for ``choices`` like the
+tuples it replaces.
+
+The labels of translated tables are marked with ``gettext_noop`` so they are still picked up by ``makemessages``:
+
+.. code-block:: python
+
+    from django.utils.translation import gettext_noop as _
+
+    from localflavor.choices import ChoiceTable
+
+    POSTALCODES = ChoiceTable((
+        ('0800', _('Høje Taastrup')),
+        ('0877', _('København C')),
+    ))
+
+.. versionadded:: 5.1
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+from django.utils.translation import gettext_lazy
+
+try:
+    from django.utils.choices import BaseChoiceIterator
+except ImportError:  # Django < 5.0
+    BaseChoiceIterator = object
+
+_SEPARATOR = '\x00'
+
+
+def _pack(strings):
+    """Returns the strings joined into one and the offsets of their boundaries."""
+    offsets = array('I', [0])
+    for string in strings:
+        offsets.append(offsets[-1] + len(string) + 1)
+    return _SEPARATOR.join(strings), offsets
+
+
+def _pack_codes(codes):
+    if codes and all(type(code) is int for code in codes):
+        return array('q', codes), None
+    return _pack(codes)
+
+
+class ChoiceTable(Sequence, BaseChoiceIterator):
+    """
+    A read only sequence of ``(code, label)`` choices that stores its rows packed.
+
+    ``choices`` is an iterable of ``(code, label)`` pairs or of ``(group label, pairs)`` option groups. The codes must
+    be all strings or all integers. When ``translate`` is true the labels, including the ones of the groups, are
+    returned as lazy translations.
+
+    The pairs are built again on every iteration and aren't kept, so a table that has been rendered doesn't use more
+    memory than the tuple it replaces. Fields that validate against a large table should look the codes up with
+    :meth:`PostalCodeDirectory.has_code` instead of scanning the choices. Adding a table to a list or a tuple returns
+    a list or a tuple. On Django 5.0 and later form fields and widgets keep the table as it is instead of copying it
+    into a list.
+    """
+
+    __slots__ = ('_codes', '_code_offsets', '_labels', '_label_offsets', '_groups', '_group_stops', 'translate')
+
+    def __init__(self, choices, translate=True):
+        codes = []
+        labels = []
+        groups = []
+        group_stops = array('I')
+        for code, label in choices:
+            is_group = isinstance(label, (list, tuple))
+            if codes and is_group != bool(groups):
+                raise ValueError('Choices can not mix option groups and options.')
+            if is_group:
+                groups.append(code)
+                for group_code, group_label in label:
+                    codes.append(group_code)
+                    labels.append(group_label)
+                group_stops.append(len(codes))
+            else:
+                codes.append(code)
+                labels.append(label)
+        self._codes, self._code_offsets = _pack_codes(codes)
+        self._labels, self._label_offsets = _pack(labels)
+        self._groups = tuple(groups) or None
+        self._group_stops = group_stops if groups else None
+        self.translate = translate
+
+    def _code(self, index):
+        if self._code_offsets is None:
+            return self._codes[index]
+        return self._codes[self._code_offsets[index]:self._code_offsets[index + 1] - 1]
+
+    def _label(self, label):
+        return gettext_lazy(label) if self.translate and label else label
+
+    def _row(self, index):
+        label = self._labels[self._label_offsets[index]:self._label_offsets[index + 1] - 1]
+        return self._code(index), self._label(label)
+
+    def _group(self, index):
+        start = self._group_stops[index - 1] if index else 0
+        rows = tuple(self._row(row) for row in range(start, self._group_stops[index]))
+        return self._label(self._groups[index]), rows
+
+    def _count(self):
+        return len(self._label_offsets) - 1
+
+    def __len__(self):
+        return len(self._groups) if self._groups else self._count()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('choice table index out of range')
+        return self._group(index) if self._groups else self._row(index)
+
+    def __iter__(self):
+        if self._groups:
+            return map(self._group, range(len(self)))
+        if not self._count():
+            return iter(())
+        # Splitting the packed strings is much faster than slicing every row out of them.
+        labels = self._labels.split(_SEPARATOR)
+        return zip(self.codes(), map(self._label, labels) if self.translate else labels)
+
+    def __eq__(self, other):
+        if isinstance(other, (ChoiceTable, list, tuple)):
+            return len(self) == len(other) and all(map(_equal_rows, self, other))
+        return NotImplemented
+
+    def __add__(self, other):
+        if isinstance(other, list):
+            return list(self) + other
+        if isinstance(other, (ChoiceTable, tuple)):
+            return tuple(self) + tuple(other)
+        return NotImplemented
+
+    def __radd__(self, other):
+        if isinstance(other, list):
+            return other + list(self)
+        if isinstance(other, tuple):
+            return other + tuple(self)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return '<%s: %d choices>' % (self.__class__.__name__, self._count())
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return self.__class__, (list(self.untranslated()), self.translate)
+
+    def untranslated(self):
+        """Returns an iterator over the choices with the labels as they are stored instead of lazy translations."""
+        if not self.translate:
+            return iter(self)
+        untranslated = ChoiceTable.__new__(ChoiceTable)
+        for name in ChoiceTable.__slots__:
+            setattr(untranslated, name, getattr(self, name))
+        untranslated.translate = False
+        return iter(untranslated)
+
+    def codes(self):
+        """Returns an iterator over the codes of all rows, without building the labels."""
+        if self._code_offsets is None:
+            return iter(self._codes)
+        return iter(self._codes.split(_SEPARATOR) if self._count() else ())
+
+
+def _equal_rows(row, other):
+    """Returns whether two rows are equal, comparing the options of groups as tuples."""
+    code, label = other
+    if isinstance(label, (list, tuple)):
+        other = code, tuple(map(tuple, label))
+    return row == tuple(other)
+
+
+class PostalCodeDirectory(ChoiceTable):
+    """
+    A :class:`ChoiceTable` of postal codes and their localities with constant time lookups by code.
+
+    The lookups accept the codes as strings even when the table stores integers. The index is built on the first
+    lookup. When a code occurs more than once, like Danish postal codes that are shared by several streets, the first
+    locality is returned.
+    """
+
+    __slots__ = ('_index', '_order', '_sorted_codes')
+
+    def __init__(self, choices, translate=True):
+        super().__init__(choices, translate)
+        self._index = None
+        self._order = None
+        self._sorted_codes = None
+
+    def _get_index(self):
+        if self._index is None:
+            index = {}
+            for row, code in enumerate(self.codes()):
+                index.setdefault(str(code), row)
+            self._index = index
+        return self._index
+
+    def has_code(self, code):
+        """Returns whether the postal code is in the directory."""
+        return str(code) in self._get_index()
+
+    def locality(self, code, default=None):
+        """Returns the locality of a postal code or ``default`` when it isn't in the directory."""
+        row = self._get_index().get(str(code))
+        return default if row is None else self._row(row)[1]
+
+    def with_prefix(self, prefix):
+        """Returns the ``(code, locality)`` pairs whose code starts with ``prefix`` ordered by code."""
+        if self._order is None:
+            codes = [str(code) for code in self.codes()]
+            order = sorted(range(len(codes)), key=codes.__getitem__)
+            self._sorted_codes = [codes[row] for row in order]
+            self._order = array('I', order)
+        start = bisect_left(self._sorted_codes, prefix)
+        stop = bisect_right(self._sorted_codes, prefix + '\U0010ffff', start)
+        return [self._row(row) for row in self._order[start:stop]]
@@ -1,10 +1,11 @@
 """Chile specific form helpers."""
 
-from django.forms import ValidationError
 from django.forms.fields import RegexField, Select
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .cl_regions import REGION_CHOICES
 
 
@@ -15,7 +16,7 @@ class CLRegionSelect(Select):
         super().__init__(attrs, choices=REGION_CHOICES)
 
 
-class CLRutField(RegexField):
+class CLRutField(CheckFieldMixin, RegexField):
     """
     Chilean "Rol Unico Tributario" (RUT) field.
 
@@ -42,16 +43,13 @@ class CLRutField(RegexField):
             # the real world.
             super().__init__(r'^[\d\.]{1,11}-?[\dkK]$', **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """Check and clean the Chilean RUT."""
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         rut, verificador = self._canonify(value)
         if self._algorithm(rut) == verificador:
-            return self._format(rut, verificador)
+            return CheckResult.valid(self._format(rut, verificador))
         else:
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
+            return self.invalid(value, 'checksum')
 
     def _algorithm(self, rut):
         """Takes RUT in pure canonical form, calculates the verifier digit."""
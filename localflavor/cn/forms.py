@@ -2,10 +2,11 @@
 
 import re
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .cn_provinces import CN_PROVINCE_CHOICES
 
 __all__ = (
@@ -64,7 +65,7 @@ class CNProvinceSelect(Select):
         super().__init__(attrs, choices=CN_PROVINCE_CHOICES)
 
 
-class CNPostCodeField(RegexField):
+class CNPostCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as postal codes in mainland China.
 
@@ -79,7 +80,7 @@ class CNPostCodeField(RegexField):
         super().__init__(POST_CODE_RE, **kwargs)
 
 
-class CNIDCardField(CharField):
+class CNIDCardField(CheckFieldMixin, CharField):
     """
     A form field that validates input as a Resident Identity Card (PRC) number.
 
@@ -104,26 +105,22 @@ class CNIDCardField(CharField):
     def __init__(self, max_length=18, min_length=15, **kwargs):
         super().__init__(max_length=max_length, min_length=min_length, **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """Check whether the input is a valid ID Card Number."""
-        # Check the length of the ID card number.
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         # Check whether this ID card number has valid format
         if not re.match(ID_CARD_RE, value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         # Check the birthday of the ID card number.
         if not self.has_valid_birthday(value):
-            raise ValidationError(self.error_messages['birthday'], code='birthday' )
+            return self.invalid(value, 'birthday')
         # Check the location of the ID card number.
         if not self.has_valid_location(value):
-            raise ValidationError(self.error_messages['location'], code='location')
+            return self.invalid(value, 'location')
         # Check the checksum of the ID card number.
         value = value.upper()
         if not self.has_valid_checksum(value):
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
-        return '%s' % value
+            return self.invalid(value, 'checksum')
+        return CheckResult.valid('%s' % value)
 
     def has_valid_birthday(self, value):
         """This method grabs the date of birth from the ID card number and test whether it is a valid date."""
@@ -1,9 +1,10 @@
 """Colombian-specific form helpers."""
 
-from django.forms import ValidationError
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .co_departments import DEPARTMENT_CHOICES
 
 
@@ -14,7 +15,7 @@ class CODepartmentSelect(Select):
         super().__init__(attrs, choices=DEPARTMENT_CHOICES)
 
 
-class CONITField(RegexField):
+class CONITField(CheckFieldMixin, RegexField):
     """
     This field validates a NIT (NUmero de IdentificaciOn Tributaria). A
     NIT is of the form XXXXXXXXXX-V. The last digit is a check digit. This
@@ -33,18 +34,15 @@ class CONITField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^\d{5,12}-?\d$', **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """
         Value can be either a string in the format XXXXXXXXXX-Y or
         XXXXXXXXXXY.
         """
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         value, cd = self._canon(value)
         if self._calc_cd(value) != cd:
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
-        return self._format(value, cd)
+            return self.invalid(value, 'checksum')
+        return CheckResult.valid(self._format(value, cd))
 
     def _canon(self, nit):
         nit = nit.replace('-', '')
@@ -0,0 +1,303 @@
+"""
+Validating whole columns of identifiers at once.
+
+Calling a validator for every value of a column with millions of identifiers spends most of the time in the
+interpreter. The checkers in this module validate a whole column at once: with NumPy installed, the values are turned
+into a matrix of code points and the formats and the weighted sum checksums of all values are computed with vectorized
+array operations. Without NumPy the values are checked one by one with the validators.
+
+A checker takes a list, a NumPy array, a pandas ``Series`` or a pyarrow array and returns a :class:`ColumnResult`
+with a boolean array of the valid values and an array of the error codes, which are the codes of the validator or form
+field the checker is based on and ``None`` for valid values. Missing values (``None``, NaN or NA) get the code
+``'required'``. Other values that aren't strings are converted with ``str()``.
+
+Values with characters other than printable ASCII, like non-ASCII digits or surrounding whitespace, are rare in
+practice and checked one by one with the validators, so the results are always the same as the ones of the
+validators.
+
+Example:
+
+.. code-block:: python
+
+    from localflavor import columnar
+
+    result = columnar.br_cpf(df['cpf'])
+    df['cpf_valid'] = result.valid
+    df['cpf_error'] = result.codes
+
+NumPy is installed with the ``columnar`` extra::
+
+    pip install django-localflavor[columnar]
+
+.. versionadded:: 5.1
+"""
+from collections import namedtuple
+
+from localflavor.au.validators import (AUBusinessNumberFieldValidator, AUCompanyNumberFieldValidator,
+                                       AUTaxFileNumberFieldValidator)
+from localflavor.br.validators import BRCNPJValidator, BRCPFValidator
+from localflavor.nl.validators import NLBSNFieldValidator
+from localflavor.pl.forms import PLNIPField, PLPESELField
+from localflavor.results import check
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+ColumnResult = namedtuple('ColumnResult', 'valid codes')
+ColumnResult.__doc__ = """
+The result of checking a column: ``valid`` is a boolean array and ``codes`` an array with the error code of every
+value, ``None`` for valid values. Both are NumPy arrays if NumPy is installed and lists otherwise.
+"""
+
+# Code points of printable ASCII characters without the space.
+_PRINTABLE_MIN, _PRINTABLE_MAX = 33, 126
+_ZERO = ord('0')
+
+
+def _is_missing(value):
+    if value is None:
+        return True
+    try:
+        # NaN and pandas' NA aren't equal to themselves.
+        return bool(value != value)
+    except TypeError:
+        return True
+
+
+def _to_list(values):
+    if hasattr(values, 'to_pylist'):
+        return values.to_pylist()
+    if hasattr(values, 'tolist'):
+        return values.tolist()
+    return list(values)
+
+
+def _as_strings(values):
+    return [None if _is_missing(value) else value if isinstance(value, str) else str(value)
+            for value in _to_list(values)]
+
+
+class _Columns:
+    """The values of a column as a matrix of code points, with helpers to match fixed formats."""
+
+    def __init__(self, strings, lengths, width):
+        self.lengths = lengths
+        self.codepoints = np.array(strings, dtype='U%d' % width).view(np.uint32).reshape(len(strings), width)
+        self.inside = np.arange(width) < lengths[:, None]
+        self.is_digit = (self.codepoints >= _ZERO) & (self.codepoints <= _ZERO + 9)
+        self.all_digits = (self.is_digit | ~self.inside).all(axis=1) & (lengths > 0)
+
+    def match(self, template):
+        """Returns the rows that match a template of ``d`` for digits and other characters for themselves."""
+        matches = self.lengths == len(template)
+        for position, char in enumerate(template):
+            if char == 'd':
+                matches &= self.is_digit[:, position]
+            else:
+                matches &= self.codepoints[:, position] == ord(char)
+        return matches
+
+    def digits(self, *templates):
+        """
+        Returns the rows that match one of the templates and a matrix of the digits of the rows. All templates must
+        have the same number of digits.
+        """
+        matches = np.zeros(len(self.lengths), dtype=bool)
+        digits = None
+        for template in templates:
+            template_matches = self.match(template)
+            positions = [position for position, char in enumerate(template) if char == 'd']
+            template_digits = self.codepoints[:, positions].astype(np.int64) - _ZERO
+            if digits is None:
+                digits = template_digits
+            else:
+                digits = np.where(template_matches[:, None], template_digits, digits)
+            matches |= template_matches
+        return matches, digits
+
+
+class ColumnChecker:
+    """
+    Checks columns of values with a vectorized ``kernel`` and ``validator`` for the values the kernel can't check.
+
+    ``kernel`` is called with the values as a matrix of code points and returns the boolean array of valid values and
+    the array of error codes. ``width`` is the maximum length of a value that can be valid. ``empty_code`` is the error
+    code of empty strings if it isn't left to the kernel.
+    """
+
+    def __init__(self, validator, kernel, width, empty_code=None):
+        self.validator = validator
+        self.kernel = kernel
+        self.width = width
+        self.empty_code = empty_code
+
+    def __call__(self, values):
+        if np is None:
+            return self.check_python(values)
+        return self.check_numpy(values)
+
+    def _check_value(self, value):
+        if value is None:
+            return False, 'required'
+        result = check(self.validator, value)
+        return result.ok, result.code
+
+    def check_python(self, values):
+        """Checks the values one by one with the validator."""
+        results = [self._check_value(value) for value in _as_strings(values)]
+        return ColumnResult([ok for ok, code in results], [code for ok, code in results])
+
+    def check_numpy(self, values):
+        """Checks the values with the vectorized kernel."""
+        strings = _as_strings(values)
+        size = len(strings)
+        missing = np.fromiter((value is None for value in strings), dtype=bool, count=size)
+        strings = ['' if value is None else value for value in strings]
+        lengths = np.fromiter(map(len, strings), dtype=np.int64, count=size)
+        columns = _Columns(strings, lengths, self.width)
+
+        valid, codes = self.kernel(columns)
+        codes = np.asarray(codes, dtype=object)
+        codes[missing] = 'required'
+        valid = valid & ~missing
+        if self.empty_code:
+            empty = (lengths == 0) & ~missing
+            codes[empty] = self.empty_code
+            valid &= ~empty
+
+        # Leave the values the kernel can't see completely or that may be normalized by the validator to it.
+        unusual = (columns.codepoints < _PRINTABLE_MIN) | (columns.codepoints > _PRINTABLE_MAX)
+        fallback = ((lengths > self.width) | (unusual & columns.inside).any(axis=1)) & ~missing
+        for row in np.flatnonzero(fallback):
+            valid[row], codes[row] = self._check_value(strings[row])
+        return ColumnResult(valid, codes)
+
+
+def _mod11_check_digit(total):
+    remainder = total % 11
+    return np.where(remainder >= 2, 11 - remainder, 0)
+
+
+def _cpf_kernel(columns):
+    codes = np.full(len(columns.lengths), 'invalid', dtype=object)
+    codes[columns.all_digits & (columns.lengths != 11)] = 'max_digits'
+    rows, digits = columns.digits('d' * 11, 'ddd.ddd.ddd-dd')
+    first = _mod11_check_digit(digits[:, :9] @ np.arange(10, 1, -1))
+    second = _mod11_check_digit(digits[:, :9] @ np.arange(11, 2, -1) + 2 * first)
+    valid = (rows & (first == digits[:, 9]) & (second == digits[:, 10]) &
+             ~(digits == digits[:, :1]).all(axis=1))
+    codes[valid] = None
+    return valid, codes
+
+
+_CNPJ_FORMATS = tuple('dd%sddd%sddd/dddd-dd' % (first, second)
+                      for first in ('', '.', '-') for second in ('', '.', '-'))
+
+
+def _cnpj_kernel(columns):
+    codes = np.full(len(columns.lengths), 'invalid', dtype=object)
+    codes[columns.all_digits & (columns.lengths != 14)] = 'max_digits'
+    rows, digits = columns.digits('d' * 14, *_CNPJ_FORMATS)
+    weights = np.array([6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+    first = _mod11_check_digit(digits[:, :12] @ weights[1:])
+    second = _mod11_check_digit(digits[:, :12] @ weights[:12] + 2 * first)
+    valid = rows & (first == digits[:, 12]) & (second == digits[:, 13])
+    codes[valid] = None
+    return valid, codes
+
+
+def _weighted_kernel(template, weights, is_valid, checksum_code='invalid'):
+    """
+    Returns a kernel for values that match a template and whose digits weighted by ``weights`` sum up to a total for
+    which ``is_valid(total, digits)`` is true.
+    """
+    weights = np.array(weights)
+
+    def kernel(columns):
+        rows, digits = columns.digits(template)
+        codes = np.where(rows, checksum_code, 'invalid').astype(object)
+        valid = rows & is_valid(digits @ weights, digits)
+        codes[valid] = None
+        return valid, codes
+
+    return kernel
+
+
+def _tfn_kernel(columns):
+    eight = _weighted_kernel('d' * 8, [10, 7, 8, 4, 6, 3, 5, 1], lambda total, digits: total % 11 == 0)(columns)
+    nine = _weighted_kernel('d' * 9, [1, 4, 3, 7, 5, 8, 6, 9, 10], lambda total, digits: total % 11 == 0)(columns)
+    is_nine = columns.lengths == 9
+    return np.where(is_nine, nine[0], eight[0]), np.where(is_nine, nine[1], eight[1])
+
+
+def _pesel_birth_date_ok(digits):
+    year = digits[:, 0] * 10 + digits[:, 1]
+    month = digits[:, 2] * 10 + digits[:, 3]
+    day = digits[:, 4] * 10 + digits[:, 5]
+    # The century is encoded in the month: 1800 for 81-92, 1900 for 1-12, 2000 for 21-32 and so on.
+    offset = (month - 1) // 20 * 20
+    in_range = (month - offset >= 1) & (month - offset <= 12)
+    century = np.array([1900, 2000, 2100, 2200, 1800])[np.clip(offset // 20, 0, 4)]
+    year = year + century
+    month = month - offset
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])[np.where(in_range, month, 0)]
+    days = days + (leap & (month == 2) & in_range)
+    return in_range & (day >= 1) & (day <= days)
+
+
+def _pesel_kernel(columns):
+    rows, digits = columns.digits('d' * 11)
+    checksum_ok = digits @ np.array([1, 3, 7, 9, 1, 3, 7, 9, 1, 3, 1]) % 10 == 0
+    birth_date_ok = _pesel_birth_date_ok(digits)
+    codes = np.full(len(columns.lengths), 'invalid', dtype=object)
+    codes[rows & ~checksum_ok] = 'checksum'
+    codes[rows & checksum_ok & ~birth_date_ok] = 'birthdate'
+    valid = rows & checksum_ok & birth_date_ok
+    codes[valid] = None
+    return valid, codes
+
+
+def _nip_kernel(columns):
+    rows, digits = columns.digits('d' * 10, 'ddd-ddd-dd-dd', 'ddd-dd-dd-ddd')
+    codes = np.where(rows, 'checksum', 'invalid').astype(object)
+    valid = rows & (digits[:, :9] @ np.array([6, 5, 7, 2, 3, 4, 5, 6, 7]) % 11 == digits[:, 9])
+    codes[valid] = None
+    return valid, codes
+
+
+#: Brazilian CPF numbers, like :class:`~localflavor.br.validators.BRCPFValidator`.
+br_cpf = ColumnChecker(BRCPFValidator(), _cpf_kernel, width=14)
+
+#: Brazilian CNPJ numbers, like :class:`~localflavor.br.validators.BRCNPJValidator`.
+br_cnpj = ColumnChecker(BRCNPJValidator(), _cnpj_kernel, width=18)
+
+#: Australian Business Numbers, like :class:`~localflavor.au.validators.AUBusinessNumberFieldValidator`.
+au_abn = ColumnChecker(AUBusinessNumberFieldValidator(), _weighted_kernel(
+    'd' * 11, [10, 1, 3, 5, 7, 9, 11, 13, 15, 17, 19],
+    # The first digit is reduced by one before it's weighted.
+    lambda total, digits: (total - 10) % 89 == 0,
+), width=11)
+
+#: Australian Company Numbers, like :class:`~localflavor.au.validators.AUCompanyNumberFieldValidator`.
+au_acn = ColumnChecker(AUCompanyNumberFieldValidator(), _weighted_kernel(
+    'd' * 9, [8, 7, 6, 5, 4, 3, 2, 1, 0],
+    lambda total, digits: (10 - total % 10) % 10 == digits[:, 8],
+), width=9)
+
+#: Australian Tax File Numbers, like :class:`~localflavor.au.validators.AUTaxFileNumberFieldValidator`.
+au_tfn = ColumnChecker(AUTaxFileNumberFieldValidator(), _tfn_kernel, width=9)
+
+#: Dutch citizen service numbers (BSN), like :class:`~localflavor.nl.validators.NLBSNFieldValidator`.
+nl_bsn = ColumnChecker(NLBSNFieldValidator(), _weighted_kernel(
+    'd' * 9, [9, 8, 7, 6, 5, 4, 3, 2, -1],
+    lambda total, digits: (total % 11 == 0) & digits.any(axis=1),
+), width=9)
+
+#: Polish national identification numbers (PESEL), like :class:`~localflavor.pl.forms.PLPESELField`.
+pl_pesel = ColumnChecker(PLPESELField(), _pesel_kernel, width=11, empty_code='required')
+
+#: Polish tax numbers (NIP), like :class:`~localflavor.pl.forms.PLNIPField`.
+pl_nip = ColumnChecker(PLNIPField(), _nip_kernel, width=13, empty_code='required')
@@ -0,0 +1,109 @@
+"""
+Database check constraints for the formats of model fields.
+
+Model fields like :class:`~localflavor.us.models.USZipCodeField` only validate their values in Python, so values that
+are saved with ``bulk_create()``, ``update()`` or raw SQL are never validated. With ``db_format_check=True`` these
+fields add a ``CheckConstraint`` for their format to the model, which makes the database reject values in any other
+format. The constraint is created by the migrations like any other constraint of the model:
+
+.. code-block:: python
+
+    class Address(models.Model):
+        zip_code = USZipCodeField(db_format_check=True)
+
+The formats are checked with ``GLOB`` on SQLite and with the regular expression operator of the database on the other
+backends. Empty values are accepted by fields with ``blank=True`` and ``NULL`` by fields with ``null=True``.
+
+.. versionadded:: 5.1
+"""
+import re
+
+import django
+from django.db.models import CheckConstraint, Lookup, Q
+from django.db.models.lookups import Regex
+
+# A pattern is made of literal characters and character classes like "[0-9]", as understood by SQLite's GLOB.
+_PATTERN_TOKEN_RE = re.compile(r'\[[^\]]+\]|.', re.DOTALL)
+
+
+def patterns_to_regex(patterns):
+    """Returns a regular expression that matches the same values as any of the patterns."""
+    alternatives = []
+    for pattern in patterns:
+        alternatives.append(''.join(token if len(token) > 1 else re.escape(token)
+                                    for token in _PATTERN_TOKEN_RE.findall(pattern)))
+    return '^(%s)$' % '|'.join(alternatives)
+
+
+def add_to_meta(model, option, item):
+    """
+    Adds a constraint or an index to the ``constraints`` or ``indexes`` of a concrete model, unless it has one with the
+    same name already.
+    """
+    # The historical models of migrations get their constraints and indexes from the migrations instead.
+    if model._meta.abstract or model.__module__ == '__fake__':
+        return
+    items = getattr(model._meta, option)
+    if all(existing.name != item.name for existing in items):
+        setattr(model._meta, option, [*items, item])
+        # The migrations only pick up the constraints and indexes of models that declare some in their Meta.
+        model._meta.original_attrs[option] = getattr(model._meta, option)
+
+
+class MatchesFormat(Lookup):
+    """
+    A lookup that matches values against a tuple of patterns.
+
+    The patterns consist of literal characters and character classes, like ``'[0-9][0-9][0-9][0-9][A-Z][A-Z]'``, which
+    SQLite's ``GLOB`` and the regular expressions of the other databases understand the same way.
+    """
+
+    lookup_name = 'matches_format'
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        return compiler.compile(Regex(self.lhs, patterns_to_regex(self.rhs)))
+
+    def as_sqlite(self, compiler, connection):
+        lhs_sql, lhs_params = self.process_lhs(compiler, connection)
+        sql = ' OR '.join('%s GLOB %%s' % lhs_sql for pattern in self.rhs)
+        return '(%s)' % sql, [param for pattern in self.rhs for param in (*lhs_params, pattern)]
+
+
+class FormatCheckMixin:
+    """
+    A mixin for model fields that can add a check constraint for their format with ``db_format_check=True``.
+
+    Subclasses set ``format_patterns`` to the patterns that valid values match, see :class:`MatchesFormat`.
+    """
+
+    format_patterns = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.register_lookup(MatchesFormat)
+
+    def __init__(self, *args, db_format_check=False, **kwargs):
+        self.db_format_check = db_format_check
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.db_format_check:
+            kwargs['db_format_check'] = True
+        return name, path, args, kwargs
+
+    def format_constraint(self, model):
+        """Returns the check constraint for the format of the values of this field in ``model``."""
+        condition = Q(**{'%s__matches_format' % self.name: tuple(self.format_patterns)})
+        if self.blank:
+            condition |= Q(**{self.name: ''})
+        name = '%s_%s_%s_format' % (model._meta.app_label, model._meta.model_name, self.name)
+        if django.VERSION >= (5, 1):
+            return CheckConstraint(condition=condition, name=name)
+        return CheckConstraint(check=condition, name=name)
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        if self.db_format_check:
+            add_to_meta(cls, 'constraints', self.format_constraint(cls))
@@ -1,12 +1,14 @@
-from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.exceptions import ImproperlyConfigured
 from django.forms import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .choices import PROVINCE_CHOICES, PROVINCE_NORMALIZED, REGION_CHOICES, REGION_NORMALIZED
 from .validators import CUIdentityCardNumberBirthdayValidator
 
 
-class CURegionField(CharField):
+class CURegionField(CheckFieldMixin, CharField):
     """
     A form field for a Cuban region.
     The input is validated against a dictionary which includes names and abbreviations.
@@ -20,15 +22,12 @@ class CURegionField(CharField):
         'invalid': _('Enter a Cuban region.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         try:
-            return REGION_NORMALIZED[value.lower()]
+            return CheckResult.valid(REGION_NORMALIZED[value.lower()])
         except KeyError:
             pass
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+        return self.invalid(value, 'invalid')
 
 
 class CURegionSelect(Select):
@@ -42,7 +41,7 @@ class CURegionSelect(Select):
         super().__init__(attrs, choices=REGION_CHOICES)
 
 
-class CUProvinceField(CharField):
+class CUProvinceField(CheckFieldMixin, CharField):
     """
     A form field for a Cuban province.
     The input is validated against a dictionary which includes names and abbreviations.
@@ -56,15 +55,12 @@ class CUProvinceField(CharField):
         'invalid': _('Enter a Cuban province.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         try:
-            return PROVINCE_NORMALIZED[value.lower()]
+            return CheckResult.valid(PROVINCE_NORMALIZED[value.lower()])
         except KeyError:
             pass
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+        return self.invalid(value, 'invalid')
 
 
 class CUProvinceSelect(Select):
@@ -78,7 +74,7 @@ class CUProvinceSelect(Select):
         super().__init__(attrs, choices=PROVINCE_CHOICES)
 
 
-class CUPostalCodeField(RegexField):
+class CUPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field for a Cuban postal Code.
 
@@ -103,7 +99,7 @@ class CUPostalCodeField(RegexField):
         return value.strip()
 
 
-class CUIdentityCardNumberField(RegexField):
+class CUIdentityCardNumberField(CheckFieldMixin, RegexField):
     """
     A form field for a Cuban identity card number.
 
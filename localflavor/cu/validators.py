@@ -1,10 +1,11 @@
 import datetime
 
-from django.core.exceptions import ValidationError
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckMixin, CheckResult
 
-class CUIdentityCardNumberBirthdayValidator:
+
+class CUIdentityCardNumberBirthdayValidator(CheckMixin):
     """
     Validator for the Cuban identity card number birthday.
 
@@ -21,8 +22,9 @@ class CUIdentityCardNumberBirthdayValidator:
         if code is not None:
             self.code = code
 
-    def __call__(self, value):
+    def check(self, value):
         try:
             datetime.datetime.strptime(value[:6], '%y%m%d')
         except ValueError:
-            raise ValidationError(self.message, code=self.code)
+            return CheckResult.invalid(value, self.code, self.message)
+        return CheckResult.valid(value)
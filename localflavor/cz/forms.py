@@ -3,10 +3,11 @@
 import re
 
 from django.core.exceptions import ImproperlyConfigured
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .cz_regions import REGION_CHOICES
 
 birth_number = re.compile(r'^(?P<birth>\d{6})/?(?P<id>\d{3,4})$')
@@ -20,7 +21,7 @@ class CZRegionSelect(Select):
         super().__init__(attrs, choices=REGION_CHOICES)
 
 
-class CZPostalCodeField(RegexField):
+class CZPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input as Czech postal code.
 
@@ -34,19 +35,16 @@ class CZPostalCodeField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^\d{5}$|^\d{3} \d{2}$', **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """
         Validates the input and returns a string that contains only numbers.
 
         Returns an empty string for empty values.
         """
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-        return value.replace(' ', '')
+        return CheckResult.valid(value.replace(' ', ''))
 
 
-class CZBirthNumberField(CharField):
+class CZBirthNumberField(CheckFieldMixin, CharField):
     """Czech birth number form field."""
 
     default_error_messages = {
@@ -54,21 +52,16 @@ class CZBirthNumberField(CharField):
         'invalid': _('Enter a valid birth number.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = re.match(birth_number, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid_format'], code='invalid_format')
+            return self.invalid(value, 'invalid_format')
 
         birth, id = match.groupdict()['birth'], match.groupdict()['id']
 
         # Three digits for verification number were used until 1. january 1954
         if len(id) == 3 and int(birth[:2]) < 54:
-            return '%s' % value
+            return CheckResult.valid('%s' % value)
 
         # Birth number is in format YYMMDD. Females have month value raised by 50.
         # In case that all possible number are already used (for given date),
@@ -76,11 +69,11 @@ class CZBirthNumberField(CharField):
         month = int(birth[2:4])
         if (not 1 <= month <= 12) and (not 21 <= month <= 32) and \
                 (not 51 <= month <= 62) and (not 71 <= month <= 82):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         day = int(birth[4:6])
         if not (1 <= day <= 31):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # Fourth digit has been added since 1. January 1954.
         # It is modulo of dividing birth number and verification number by 11.
@@ -91,27 +84,22 @@ class CZBirthNumberField(CharField):
         modulo = int(birth + id[:3]) % 11
 
         if (modulo == int(id[-1])) or (modulo == 10 and id[-1] == '0'):
-            return '%s' % value
+            return CheckResult.valid('%s' % value)
         else:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
 
-class CZICNumberField(CharField):
+class CZICNumberField(CheckFieldMixin, CharField):
     """Czech IC number form field."""
 
     default_error_messages = {
         'invalid': _('Enter a valid IC number.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = re.match(ic_number, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         number, check = match.groupdict()[
             'number'], int(match.groupdict()['check'])
@@ -132,6 +120,6 @@ class CZICNumberField(CharField):
         if (not remainder % 10 and check == 1) or \
             (remainder == 1 and check == 0) or \
                 (check == (11 - remainder)):
-            return '%s' % value
+            return CheckResult.valid('%s' % value)
 
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+        return self.invalid(value, 'invalid')
@@ -3,10 +3,11 @@
 import re
 
 from django.core.exceptions import ImproperlyConfigured
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .de_states import STATE_CHOICES
 
 ID_RE = re.compile(r"^(?P<residence>\d{10})(?P<origin>\w{1,3})"
@@ -14,7 +15,7 @@ ID_RE = re.compile(r"^(?P<residence>\d{10})(?P<origin>\w{1,3})"
                    r"[-\ ]?(?P<checksum>\d{1})$")
 
 
-class DEZipCodeField(RegexField):
+class DEZipCodeField(CheckFieldMixin, RegexField):
     """A form field that validates input as a German zip code.
 
     Valid zip codes consist of five digits.
@@ -35,7 +36,7 @@ class DEStateSelect(Select):
         super().__init__(attrs, choices=STATE_CHOICES)
 
 
-class DEIdentityCardNumberField(CharField):
+class DEIdentityCardNumberField(CheckFieldMixin, CharField):
     """A German identity card number.
 
     Checks the following rules to determine whether the number is valid:
@@ -70,13 +71,10 @@ class DEIdentityCardNumberField(CharField):
 
         return str(calculated_checksum)[-1] == given_checksum
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         match = re.match(ID_RE, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         id_parts = match.groupdict()
         residence = id_parts['residence']
@@ -88,17 +86,17 @@ class DEIdentityCardNumberField(CharField):
         if (residence == '0000000000' or
                 birthday == '0000000' or
                 validity == '0000000'):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         all_digits = "%s%s%s%s" % (residence, birthday, validity, checksum)
         if (not self.has_valid_checksum(residence) or
                 not self.has_valid_checksum(birthday) or
                 not self.has_valid_checksum(validity) or
                 not self.has_valid_checksum(all_digits)):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return '%s%s-%s-%s-%s' % (residence,
-                                  origin,
-                                  birthday,
-                                  validity,
-                                  checksum)
+        return CheckResult.valid('%s%s-%s-%s-%s' % (residence,
+                                                    origin,
+                                                    birthday,
+                                                    validity,
+                                                    checksum))
@@ -1,9 +1,11 @@
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import gettext_noop as _
+
+from localflavor.choices import PostalCodeDirectory
 
 #: A list of Danish postal codes as `choices` in a formfield.
 # Data compiled from the official database of postal codes by PostNord, available to download at
 # https://www.postnord.dk/kundeservice/kundeservice-erhverv/om-postnumre/postnummerkort-postnummerfiler
-DK_POSTALCODES = (
+DK_POSTALCODES = PostalCodeDirectory((
     ('0555', _('Scanning')),
     ('0783', _('Facility')),
     ('0800', _('Høje Taastrup')),
@@ -1468,4 +1470,4 @@ DK_POSTALCODES = (
     ('950', _('Porkeri')),
     ('960', _('Hov')),
     ('970', _('Sumba'))
-)
+))
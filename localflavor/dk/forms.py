@@ -4,16 +4,18 @@ from django.core.exceptions import ValidationError
 from django.forms import fields, widgets
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .dk_municipalities import DK_MUNICIPALITIES
 from .dk_postalcodes import DK_POSTALCODES
 
 
 def postal_code_validator(value):
-    if value not in [entry[0] for entry in DK_POSTALCODES]:
+    if not DK_POSTALCODES.has_code(value):
         raise ValidationError(_('Enter a postal code in the format XXXX.'), code='invalid')
 
 
-class DKPostalCodeField(fields.CharField):
+class DKPostalCodeField(CheckFieldMixin, fields.CharField):
     """An Input widget that uses a list of Danish postal codes as valid input."""
 
     default_validators = [postal_code_validator]
@@ -2,10 +2,11 @@ import re
 from datetime import date
 
 from django.core.exceptions import ImproperlyConfigured
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .ee_counties import COUNTY_CHOICES
 
 idcode = re.compile(r'^([1-6])(\d\d)(\d\d)(\d\d)(?:\d{3})(\d)$')
@@ -13,7 +14,7 @@ zipcode = re.compile(r'^[1-9]\d{4}$')
 bregcode = re.compile(r'^[1-9]\d{7}$')
 
 
-class EEZipCodeField(RegexField):
+class EEZipCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as a Estonian zip code.
 
@@ -35,7 +36,7 @@ class EECountySelect(Select):
         super().__init__(attrs, choices=COUNTY_CHOICES)
 
 
-class EEPersonalIdentificationCode(CharField):
+class EEPersonalIdentificationCode(CheckFieldMixin, CharField):
     """A form field that validates input as an Estonian personal identification code.
 
     See: https://www.riigiteataja.ee/akt/106032012004
@@ -61,19 +62,15 @@ class EEPersonalIdentificationCode(CharField):
 
         return check % 10
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = re.match(idcode, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid_format'], code='invalid_format')
+            return self.invalid(value, 'invalid_format')
 
         century, year, month, day, check = map(int, match.groups())
 
         if check != self.ee_checksum(value[:10]):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # Century digit also encodes gender:
         # 1 - male born in 18xx
@@ -84,12 +81,12 @@ class EEPersonalIdentificationCode(CharField):
         try:
             date(year, month, day)
         except ValueError:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value
+        return CheckResult.valid(value)
 
 
-class EEBusinessRegistryCode(CharField):
+class EEBusinessRegistryCode(CheckFieldMixin, CharField):
     """A form field that validates input as an Estonian business registration code.
 
     .. versionadded:: 1.2
@@ -100,18 +97,14 @@ class EEBusinessRegistryCode(CharField):
         'invalid': _('Enter a valid Estonian business registry code.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = re.match(bregcode, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid_format'], code='invalid_format')
+            return self.invalid(value, 'invalid_format')
 
         check = int(value[7])
 
         if check != EEPersonalIdentificationCode.ee_checksum(value[:7]):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value
+        return CheckResult.valid(value)
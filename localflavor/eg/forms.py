@@ -2,14 +2,15 @@
 import textwrap
 from datetime import date
 
-from django.forms import ValidationError
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .choices import GOVERNORATE_CHOICES
 
 
-class EGNationalIDNumberField(RegexField):
+class EGNationalIDNumberField(CheckFieldMixin, RegexField):
     """
     Egypt ID numbers are 14 digits, second to seventh digits represents the person's birthdate.
 
@@ -29,18 +30,14 @@ class EGNationalIDNumberField(RegexField):
     def __init__(self, max_length=14, min_length=14, **kwargs):
         super().__init__(r'\d{14}', max_length=max_length, min_length=min_length, **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         century = value[0]
         year, month, day = textwrap.wrap(value[1:7], 2)  # pylint: disable=unbalanced-tuple-unpacking
         governorate_code = value[7:9]
 
         # is valid century?
         if century not in ('2', '3'):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # Complete year (19XX, 20XX)
         if int(century) == 3:
@@ -51,15 +48,15 @@ class EGNationalIDNumberField(RegexField):
         try:
             date(int(year), int(month), int(day))
         except ValueError:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # is valid governorate code?
         governorate_codes = ('01', '02', '03', '04', '11', '12', '13', '14', '15', '16', '17', '18', '19', '21', '22',
                              '23', '24', '25', '26', '27', '28', '29', '31', '32', '33', '34', '35', '88')
         if governorate_code not in governorate_codes:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value
+        return CheckResult.valid(value)
 
 
 class EGGovernorateSelect(Select):
@@ -2,15 +2,17 @@
 
 import re
 
-from django.forms import ValidationError
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+from localflavor.widgets import CachedOptionsMixin
+
 from .es_provinces import PROVINCE_CHOICES
 from .es_regions import REGION_CHOICES
 
 
-class ESPostalCodeField(RegexField):
+class ESPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input as a spanish postal code.
 
@@ -26,7 +28,7 @@ class ESPostalCodeField(RegexField):
         super().__init__(r'^(0[1-9]|[1-4][0-9]|5[0-2])\d{3}$', **kwargs)
 
 
-class ESIdentityCardNumberField(RegexField):
+class ESIdentityCardNumberField(CheckFieldMixin, RegexField):
     """
     Spanish NIF/NIE/CIF (Fiscal Identification Number) code.
 
@@ -79,11 +81,7 @@ class ESIdentityCardNumberField(RegexField):
 
         super().__init__(id_card_re, **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         value = value.upper().replace(' ', '').replace('-', '')
         m = re.match(self.id_card_pattern %
                      (self.cif_types + self.nie_types,
@@ -94,32 +92,32 @@ class ESIdentityCardNumberField(RegexField):
         if not letter1 and letter2:
             # NIF
             if letter2 == self.nif_get_checksum(number):
-                return value
+                return CheckResult.valid(value)
             else:
-                raise ValidationError(self.error_messages['invalid_nif'], code='invalid_nif')
+                return self.invalid(value, 'invalid_nif')
         elif letter1 in self.nie_types and letter2:
             # NIE
             if letter2 == self.nif_get_checksum(str(self.nie_types.index(letter1)) + number):
-                return value
+                return CheckResult.valid(value)
             else:
-                raise ValidationError(self.error_messages['invalid_nie'], code='invalid_nie')
+                return self.invalid(value, 'invalid_nie')
         elif not self.only_nif and letter1 in self.cif_types and len(number) in [7, 8]:
             # CIF
             if not letter2:
                 number, letter2 = number[:-1], int(number[-1])
             checksum = cif_get_checksum(number)
             if letter2 in (checksum, self.cif_control[checksum]):
-                return value
+                return CheckResult.valid(value)
             else:
-                raise ValidationError(self.error_messages['invalid_cif'], code='invalid_cif')
+                return self.invalid(value, 'invalid_cif')
         else:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
     def nif_get_checksum(self, d):
         return self.nif_control[int(d) % 23]
 
 
-class ESCCCField(RegexField):
+class ESCCCField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input as a Spanish bank account or CCC (Codigo Cuenta Cliente).
 
@@ -148,16 +146,13 @@ class ESCCCField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^\d{4}[ -]?\d{4}[ -]?\d{2}[ -]?\d{10}$', **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         m = re.match(r'^(\d{4})[ -]?(\d{4})[ -]?(\d{2})[ -]?(\d{10})$', value)
         entity, office, checksum, account = m.groups()
         if get_checksum('00' + entity + office) + get_checksum(account) == checksum:
-            return value
+            return CheckResult.valid(value)
         else:
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
+            return self.invalid(value, 'checksum')
 
 
 def get_checksum(d):
@@ -166,14 +161,14 @@ def get_checksum(d):
     return str(11 - sum(digits) % 11).replace('10', '1').replace('11', '0')
 
 
-class ESRegionSelect(Select):
+class ESRegionSelect(CachedOptionsMixin, Select):
     """A Select widget that uses a list of spanish regions as its choices."""
 
     def __init__(self, attrs=None):
         super().__init__(attrs, choices=REGION_CHOICES)
 
 
-class ESProvinceSelect(Select):
+class ESProvinceSelect(CachedOptionsMixin, Select):
     """A Select widget that uses a list of spanish provinces as its choices."""
 
     def __init__(self, attrs=None):
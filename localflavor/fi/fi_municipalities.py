@@ -1,5 +1,7 @@
+from localflavor.choices import ChoiceTable
+
 #: An alphabetical list of Finnish municipalities for use as `choices` in a formfield.
-MUNICIPALITY_CHOICES = (
+MUNICIPALITY_CHOICES = ChoiceTable((
     ('akaa', "Akaa"),
     ('alajarvi', "Alajärvi"),
     ('alavieska', "Alavieska"),
@@ -342,4 +344,4 @@ MUNICIPALITY_CHOICES = (
     ('ypaja', "Ypäjä"),
     ('ahtari', "Ähtäri"),
     ('aanekoski', "Äänekoski")
-)
+), translate=False)
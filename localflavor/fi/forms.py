@@ -2,14 +2,16 @@
 
 import re
 
-from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.exceptions import ImproperlyConfigured
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .fi_municipalities import MUNICIPALITY_CHOICES
 
 
-class FIZipCodeField(RegexField):
+class FIZipCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as a Finnish zip code.
 
@@ -31,18 +33,14 @@ class FIMunicipalitySelect(Select):
         super().__init__(attrs, choices=MUNICIPALITY_CHOICES)
 
 
-class FISocialSecurityNumber(CharField):
+class FISocialSecurityNumber(CheckFieldMixin, CharField):
     """A form field that validates input as a Finnish social security number."""
 
     default_error_messages = {
         'invalid': _('Enter a valid Finnish social security number.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         checkmarks = "0123456789ABCDEFHJKLMNPRSTUVWXY"
         result = re.match(r"""^
             (?P<date>([0-2]\d|3[01])
@@ -52,9 +50,9 @@ class FISocialSecurityNumber(CharField):
             (?P<serial>(\d{3}))
             (?P<checksum>[%s])$""" % checkmarks, value, re.VERBOSE | re.IGNORECASE)
         if not result:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         gd = result.groupdict()
         checksum = int(gd['date'] + gd['serial'])
         if checkmarks[checksum % len(checkmarks)] == gd['checksum'].upper():
-            return '%s' % value.upper()
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return CheckResult.valid('%s' % value.upper())
+        return self.invalid(value, 'invalid')
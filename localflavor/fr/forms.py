@@ -2,11 +2,13 @@
 import re
 from datetime import date
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 from stdnum import luhn
 
+from localflavor.results import CheckFieldMixin, CheckResult
+from localflavor.widgets import CachedOptionsMixin
+
 from .fr_department import DEPARTMENT_CHOICES_PER_REGION
 from .fr_region import REGION_2016_CHOICES, REGION_CHOICES
 
@@ -16,7 +18,7 @@ nin_re = re.compile(
     r'(?P<control_key>\d{2})$')
 
 
-class FRZipCodeField(RegexField):
+class FRZipCodeField(CheckFieldMixin, RegexField):
     """
     Validate local French zip code.
 
@@ -34,7 +36,7 @@ class FRZipCodeField(RegexField):
         super().__init__(r'^\d{5}$', **kwargs)
 
 
-class FRDepartmentSelect(Select):
+class FRDepartmentSelect(CachedOptionsMixin, Select):
     """A Select widget that uses a list of FR departments as its choices."""
 
     def __init__(self, attrs=None):
@@ -45,7 +47,7 @@ class FRDepartmentSelect(Select):
         super().__init__(attrs, choices=choices)
 
 
-class FRRegionSelect(Select):
+class FRRegionSelect(CachedOptionsMixin, Select):
     """A Select widget that uses a list of FR Regions as its choices."""
 
     def __init__(self, attrs=None):
@@ -56,7 +58,7 @@ class FRRegionSelect(Select):
         super().__init__(attrs, choices=choices)
 
 
-class FRRegion2016Select(Select):
+class FRRegion2016Select(CachedOptionsMixin, Select):
     """
     A Select widget that uses a list of France's New Regions as its choices.
     """
@@ -68,7 +70,7 @@ class FRRegion2016Select(Select):
         super().__init__(attrs, choices=choices)
 
 
-class FRDepartmentField(CharField):
+class FRDepartmentField(CheckFieldMixin, CharField):
     """A Select Field that uses a FRDepartmentSelect widget."""
 
     widget = FRDepartmentSelect
@@ -78,7 +80,7 @@ class FRDepartmentField(CharField):
         super().__init__(**kwargs)
 
 
-class FRRegionField(CharField):
+class FRRegionField(CheckFieldMixin, CharField):
     """A Select Field that uses a FRRegionSelect widget."""
 
     widget = FRRegionSelect
@@ -88,7 +90,7 @@ class FRRegionField(CharField):
         super().__init__(**kwargs)
 
 
-class FRNationalIdentificationNumber(CharField):
+class FRNationalIdentificationNumber(CheckFieldMixin, CharField):
     """
     Validates input as a French National Identification number.
 
@@ -105,16 +107,12 @@ class FRNationalIdentificationNumber(CharField):
         'invalid': _('Enter a valid French National Identification number.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         value = value.replace(' ', '').replace('-', '')
 
         match = nin_re.match(value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # Extract all parts of social number
         gender = match.group('gender')
@@ -128,63 +126,62 @@ class FRNationalIdentificationNumber(CharField):
         # Get current year
         current_year = int(str(date.today().year)[2:])
 
-        commune_of_origin, department_of_origin = self._clean_department_and_commune(commune_of_origin, current_year,
-                                                                                     department_of_origin,
-                                                                                     year_of_birth)
+        if not self._check_department_and_commune(commune_of_origin, current_year, department_of_origin,
+                                                  year_of_birth):
+            return self.invalid(value, 'invalid')
 
         if person_unique_number == '000':
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         if control_key > 97:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         control_number = int(gender + year_of_birth + month_of_birth +
                              department_of_origin.replace('A', '0').replace('B', '0') +
                              commune_of_origin + person_unique_number)
         if (97 - control_number % 97) == control_key:
-            return value
+            return CheckResult.valid(value)
         else:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-    def _clean_department_and_commune(self, commune_of_origin, current_year, department_of_origin, year_of_birth):
+    def _check_department_and_commune(self, commune_of_origin, current_year, department_of_origin, year_of_birth):
         if department_of_origin in ['20', '2A', '2B']:
-            self._check_corsica(commune_of_origin, current_year, department_of_origin, year_of_birth)
+            return self._check_corsica(commune_of_origin, current_year, department_of_origin, year_of_birth)
         elif department_of_origin in ['97', '98']:
-            self._check_overseas(commune_of_origin, current_year, department_of_origin, year_of_birth)
+            return self._check_overseas(commune_of_origin, current_year, department_of_origin, year_of_birth)
         elif department_of_origin == '99':
-            self._check_foreign_countries(commune_of_origin, current_year, department_of_origin, year_of_birth)
-        return commune_of_origin, department_of_origin
+            return self._check_foreign_countries(commune_of_origin, current_year, department_of_origin, year_of_birth)
+        return True
 
     def _check_corsica(self, commune_of_origin, current_year, department_of_origin, year_of_birth):
         """Departments number 20, 2A and 2B represent Corsica"""
         # For people born before 1976, Corsica number was 20
         if current_year < int(year_of_birth) < 76 and department_of_origin != '20':
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return False
         # For people born from 1976, Corsica dep number is either 2A or 2B
         if (int(year_of_birth) > 75 and department_of_origin not in ['2A', '2B']):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return False
+        return True
 
     def _check_overseas(self, commune_of_origin, current_year, department_of_origin, year_of_birth):
         """Overseas department numbers starts with 97 or 98 and are 3 digits long"""
         overseas_department_of_origin = department_of_origin + commune_of_origin[:1]
         overseas_commune_of_origin = commune_of_origin[1:]
         if department_of_origin == '97' and int(overseas_department_of_origin) not in range(971, 978):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return False
         elif department_of_origin == '98' and int(overseas_department_of_origin) not in range(984, 989):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        if int(overseas_commune_of_origin) < 1 or int(overseas_commune_of_origin) > 90:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return False
+        return 1 <= int(overseas_commune_of_origin) <= 90
 
     def _check_foreign_countries(self, commune_of_origin, current_year, department_of_origin, year_of_birth):
         """
         The department_of_origin '99' is reserved for people born in a foreign country.
         In this case, commune_of_origin is the INSEE country code, must be [001-990]
         """
-        if int(commune_of_origin) < 1 or int(commune_of_origin) > 990:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+        return 1 <= int(commune_of_origin) <= 990
 
 
-class FRSIRENField(CharField):
+class FRSIRENField(CheckFieldMixin, CharField):
     """
     SIREN stands for "Système d'identification du répertoire des entreprises".
 
@@ -213,14 +210,10 @@ class FRSIRENField(CharField):
         value = value.replace(' ', '').replace('-', '')
         return ' '.join((value[:3], value[3:6], value[6:]))
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         if not self.r_valid.match(value) or not luhn.is_valid(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return value
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(value)
 
     def to_python(self, value):
         value = super().to_python(value)
@@ -229,7 +222,7 @@ class FRSIRENField(CharField):
         return value
 
 
-class FRSIRETField(CharField):
+class FRSIRETField(CheckFieldMixin, CharField):
     """
     SIRET stands for "Système d'identification du répertoire des établissements".
 
@@ -252,15 +245,11 @@ class FRSIRETField(CharField):
         kwargs["max_length"] = 17
         super().__init__(**kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         if not self.r_valid.match(value) or not luhn.is_valid(value[:9]) or \
             (value.startswith("356000000") and sum(int(x) for x in value) % 5 != 0):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return value
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(value)
 
     def prepare_value(self, value):
         if value is None:
@@ -275,7 +264,7 @@ class FRSIRETField(CharField):
         return value
 
 
-class FRRNAField(CharField):
+class FRRNAField(CheckFieldMixin, CharField):
     """
     RNA Stands for "Répertoire National des Associations"
 
@@ -290,14 +279,9 @@ class FRRNAField(CharField):
 
     regex = re.compile(r'^W\d{9}$')
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return self.empty_value
-
+    def check_value(self, value):
         value = value.replace(' ', '').replace('-', '').replace('.', '')
 
         if not self.regex.match(value):
-            raise ValidationError(self.error_messages['invalid'], code=['invalid'])
-        return value
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(value)
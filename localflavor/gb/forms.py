@@ -2,14 +2,15 @@
 
 import re
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .gb_regions import GB_NATIONS_CHOICES, GB_REGION_CHOICES
 
 
-class GBPostcodeField(CharField):
+class GBPostcodeField(CheckFieldMixin, CharField):
     """
     A form field that validates its input is a UK postcode.
 
@@ -27,16 +28,13 @@ class GBPostcodeField(CharField):
     postcode_regex = re.compile(r'^(GIR 0AA|%s %s)$' % (outcode_pattern, incode_pattern))
     space_regex = re.compile(r' *(%s)$' % incode_pattern)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         postcode = value.upper()
         # Put a single space before the incode (second part).
         postcode = self.space_regex.sub(r' \1', postcode)
         if not self.postcode_regex.search(postcode):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return postcode
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(postcode)
 
 
 class GBCountySelect(Select):
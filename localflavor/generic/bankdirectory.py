@@ -0,0 +1,277 @@
+"""
+An offline directory of national bank codes for deriving and cross-checking BICs.
+
+The directory is compiled from a CSV file that you supply, for example an export of the bank code list published by
+a national bank, into a compact binary index. The index is memory-mapped and searched with a binary search, which
+keeps lookups at O(log n) and lets the operating system share the pages between all processes that open the same
+file.
+
+The CSV file must have a header row with the columns ``country_code``, ``bank_code``, ``bic`` and ``name``. Other
+columns are ignored.
+
+Example:
+
+.. code-block:: python
+
+    from localflavor.generic.bankdirectory import compile_bank_directory, get_bank_directory
+
+    compile_bank_directory('banks.csv', 'banks.idx')
+
+    directory = get_bank_directory('banks.idx')
+    directory.bic_for_iban('DE89370400440532013000')
+
+.. versionadded:: 5.1
+"""
+import bisect
+import codecs
+import csv
+import mmap
+import struct
+from collections import namedtuple
+from functools import lru_cache
+
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+from .validators import BICValidator, IBANParts
+
+#: Maximum length of a national bank code in the index.
+BANK_CODE_MAX_LENGTH = 12
+
+_HEADER = struct.Struct('<8sI')
+_MAGIC = b'LFBKDIR1'
+# Country code and bank code (the search key), BIC, offset and length of the institution name.
+_RECORD = struct.Struct('<%ds11sIH' % (2 + BANK_CODE_MAX_LENGTH))
+_KEY_LENGTH = 2 + BANK_CODE_MAX_LENGTH
+# Record numbers sorted by BIC.
+_BIC_INDEX = struct.Struct('<I')
+
+BankDirectoryEntry = namedtuple('BankDirectoryEntry', 'country_code bank_code bic name')
+BankDirectoryEntry.__doc__ = 'A bank of the bank directory.'
+
+
+def _make_key(country_code, bank_code):
+    return (country_code + bank_code.ljust(BANK_CODE_MAX_LENGTH)).encode('ascii', 'replace')
+
+
+def _undecodable_line(csv_path, encoding):
+    """Returns the number of the first line of a file that can't be decoded, which the text reader doesn't know."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    number = 0
+    with open(csv_path, 'rb') as csv_file:
+        for number, line in enumerate(csv_file, 1):
+            try:
+                decoder.decode(line)
+            except UnicodeDecodeError:
+                break
+    return number
+
+
+def compile_bank_directory(csv_path, index_path, encoding='utf-8', **csv_kwargs):
+    """
+    Compiles a CSV bank directory into a binary index file that can be opened with :class:`BankDirectory`.
+
+    Extra keyword arguments, such as ``delimiter``, are passed to :class:`csv.DictReader`. Returns the number of
+    entries written to the index.
+
+    Every row must have an ASCII country and bank code and a valid BIC. A ``ValueError`` with the line number is raised
+    for invalid rows and for lines that can't be decoded with ``encoding``.
+    """
+    bic_validator = BICValidator()
+    entries = []
+    with open(csv_path, newline='', encoding=encoding) as csv_file:
+        reader = csv.DictReader(csv_file, **csv_kwargs)
+        try:
+            for row in reader:
+                country_code = row['country_code'].strip().upper()
+                bank_code = row['bank_code'].strip().upper().replace(' ', '')
+                bic = row['bic'].strip().upper().replace(' ', '')
+                if (len(country_code) != 2 or not bank_code or len(bank_code) > BANK_CODE_MAX_LENGTH or
+                        not (country_code + bank_code).isascii()):
+                    raise ValueError('Invalid bank directory row on line %d of %s: %r' % (reader.line_num, csv_path,
+                                                                                          row))
+                result = bic_validator.check(bic)
+                if not result:
+                    raise ValueError('Invalid BIC %r on line %d of %s: %s' % (bic, reader.line_num, csv_path,
+                                                                              result.message))
+                if len(bic) == 8:
+                    bic += 'XXX'
+                entries.append((_make_key(country_code, bank_code), bic.encode('ascii'),
+                                row['name'].strip().encode('utf-8')))
+        except UnicodeDecodeError as e:
+            line_number = _undecodable_line(csv_path, encoding)
+            raise ValueError('Line %d of %s is not valid %s.' % (line_number, csv_path, encoding)) from e
+    entries.sort(key=lambda entry: entry[0])
+
+    names = bytearray()
+    records = []
+    for key, bic, name in entries:
+        records.append(_RECORD.pack(key, bic, len(names), len(name)))
+        names += name
+    bic_order = sorted(range(len(entries)), key=lambda index: entries[index][1])
+
+    with open(index_path, 'wb') as index_file:
+        index_file.write(_HEADER.pack(_MAGIC, len(records)))
+        index_file.writelines(records)
+        index_file.writelines(_BIC_INDEX.pack(index) for index in bic_order)
+        index_file.write(names)
+    return len(records)
+
+
+class _Keys:
+    """A read-only sequence of the search keys in the index, for use with :mod:`bisect`."""
+
+    def __init__(self, buffer, count):
+        self.buffer = buffer
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        offset = _HEADER.size + index * _RECORD.size
+        return self.buffer[offset:offset + _KEY_LENGTH]
+
+
+class _BICKeys(_Keys):
+    """A read-only sequence of the 8 character BICs in BIC order, for use with :mod:`bisect`."""
+
+    def record(self, index):
+        """Returns the number of the record at a position in BIC order."""
+        offset = _HEADER.size + self.count * _RECORD.size + index * _BIC_INDEX.size
+        return _BIC_INDEX.unpack_from(self.buffer, offset)[0]
+
+    def __getitem__(self, index):
+        offset = _HEADER.size + self.record(index) * _RECORD.size + _KEY_LENGTH
+        return self.buffer[offset:offset + 8]
+
+
+class BankDirectory:
+    """
+    A memory-mapped bank directory index created by :func:`compile_bank_directory`.
+
+    Use :func:`get_bank_directory` to share a single instance per index file within a process.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        with open(index_path, 'rb') as index_file:
+            self._buffer = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = _HEADER.unpack_from(self._buffer)
+        if magic != _MAGIC:
+            self._buffer.close()
+            raise ValueError('%s is not a bank directory index.' % index_path)
+        self._names_offset = _HEADER.size + self._count * (_RECORD.size + _BIC_INDEX.size)
+        self._keys = _Keys(self._buffer, self._count)
+        self._bic_keys = _BICKeys(self._buffer, self._count)
+        self._countries = None
+
+    def __len__(self):
+        return self._count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._buffer.close()
+
+    def _entry(self, index):
+        key, bic, name_offset, name_length = _RECORD.unpack_from(self._buffer, _HEADER.size + index * _RECORD.size)
+        name_offset += self._names_offset
+        key = key.decode('ascii')
+        return BankDirectoryEntry(key[:2], key[2:].rstrip(), bic.decode('ascii'),
+                                  self._buffer[name_offset:name_offset + name_length].decode('utf-8'))
+
+    @property
+    def countries(self):
+        """The set of country codes that have entries in the directory."""
+        if self._countries is None:
+            countries = set()
+            index = 0
+            # Skip from country to country instead of reading every record.
+            while index < self._count:
+                country_code = self._keys[index][:2]
+                countries.add(country_code.decode('ascii'))
+                index = bisect.bisect_left(self._keys, country_code + b'\xff', index)
+            self._countries = frozenset(countries)
+        return self._countries
+
+    def lookup(self, country_code, bank_code):
+        """Returns the list of entries for a national bank code, which is empty if the bank code is unknown."""
+        if len(bank_code) > BANK_CODE_MAX_LENGTH:
+            return []
+        key = _make_key(country_code, bank_code)
+        index = bisect.bisect_left(self._keys, key)
+        entries = []
+        while index < self._count and self._keys[index] == key:
+            entries.append(self._entry(index))
+            index += 1
+        return entries
+
+    def lookup_bic(self, bic):
+        """Returns the list of entries of the institution of a BIC, compared on its first 8 characters."""
+        key = bic[:8].encode('ascii', 'replace')
+        index = bisect.bisect_left(self._bic_keys, key)
+        entries = []
+        while index < self._count and self._bic_keys[index] == key:
+            entries.append(self._entry(self._bic_keys.record(index)))
+            index += 1
+        return entries
+
+    def lookup_iban(self, value):
+        """Returns the list of entries for the bank of a normalized IBAN."""
+        parts = IBANParts.from_iban(value)
+        if parts.bank_code is None:
+            return []
+        return self.lookup(parts.country_code, parts.bank_code)
+
+    def bic_for_iban(self, value):
+        """Returns the BIC for the bank of a normalized IBAN or ``None`` when the bank is unknown."""
+        entries = self.lookup_iban(value)
+        return entries[0].bic if entries else None
+
+
+@lru_cache(maxsize=None)
+def get_bank_directory(index_path):
+    """Returns a :class:`BankDirectory` for an index file that is opened once per process."""
+    return BankDirectory(index_path)
+
+
+def validate_iban_bank(iban, bank_directory):
+    """
+    Validates that the bank of a normalized IBAN is in the bank directory.
+
+    IBANs of countries that are not in the directory, or without a known bank identifier position, are not checked.
+    """
+    parts = IBANParts.from_iban(iban)
+    if parts.bank_code is None or parts.country_code not in bank_directory.countries:
+        return []
+    entries = bank_directory.lookup(parts.country_code, parts.bank_code)
+    if not entries:
+        raise ValidationError(_('The bank of this IBAN is unknown.'), code='unknown_bank')
+    return entries
+
+
+def validate_bic_bank(bic, bank_directory):
+    """
+    Validates that the institution of a BIC is in the bank directory.
+
+    BICs of countries that are not in the directory are not checked.
+    """
+    if bic[4:6] in bank_directory.countries and not bank_directory.lookup_bic(bic):
+        raise ValidationError(_('This BIC is unknown.'), code='unknown_bic')
+
+
+def validate_iban_bic(iban, bic, bank_directory):
+    """
+    Validates that a normalized IBAN and BIC belong to the same bank according to the bank directory.
+
+    The BICs are compared on their first 8 characters, so a BIC with a different branch code of the same institution
+    is accepted. IBANs of countries that are not in the directory are not checked.
+    """
+    entries = validate_iban_bank(iban, bank_directory)
+    if entries and all(entry.bic[:8] != bic[:8] for entry in entries):
+        raise ValidationError(_('The BIC does not match the bank of the IBAN.'), code='bic_mismatch')
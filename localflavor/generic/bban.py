@@ -0,0 +1,311 @@
+import re
+
+from stdnum import luhn, numdb
+
+# Structure of the Basic Bank Account Number (BBAN) part of an IBAN per country, using the notation of the IBAN
+# Registry: every element is a length followed by "!" (fixed length) and a character type where n = digits,
+# a = upper case letters and c = upper case letters and digits.
+#
+# The formats are taken from version 101 of the IBAN Registry document, see the IBAN_COUNTRY_CODE_LENGTH dictionary in
+# localflavor.generic.validators for details.
+
+IBAN_BBAN_FORMATS = {
+    'AD': '4!n4!n12!c',
+    'AE': '3!n16!n',
+    'AL': '8!n16!c',
+    'AT': '5!n11!n',
+    'AZ': '4!a20!c',
+    'BA': '3!n3!n8!n2!n',
+    'BE': '3!n7!n2!n',
+    'BG': '4!a4!n2!n8!c',
+    'BH': '4!a14!c',
+    'BI': '5!n5!n11!n2!n',
+    'BR': '8!n5!n10!n1!a1!c',
+    'BY': '4!c4!n16!c',
+    'CH': '5!n12!c',
+    'CR': '4!n14!n',
+    'CY': '3!n5!n16!c',
+    'CZ': '4!n16!n',
+    'DE': '8!n10!n',
+    'DJ': '5!n5!n11!n2!n',
+    'DK': '4!n9!n1!n',
+    'DO': '4!c20!n',
+    'EE': '2!n14!n',
+    'EG': '4!n4!n17!n',
+    'ES': '4!n4!n1!n1!n10!n',
+    'FI': '3!n11!n',
+    'FK': '2!a12!n',
+    'FO': '4!n9!n1!n',
+    'FR': '5!n5!n11!c2!n',
+    'GB': '4!a6!n8!n',
+    'GE': '2!a16!n',
+    'GI': '4!a15!c',
+    'GL': '4!n9!n1!n',
+    'GR': '3!n4!n16!c',
+    'GT': '4!c20!c',
+    'HN': '4!a20!n',
+    'HR': '7!n10!n',
+    'HU': '3!n4!n1!n15!n1!n',
+    'IE': '4!a6!n8!n',
+    'IL': '3!n3!n13!n',
+    'IQ': '4!a3!n12!n',
+    'IS': '4!n2!n6!n10!n',
+    'IT': '1!a5!n5!n12!c',
+    'JO': '4!a4!n18!c',
+    'KW': '4!a22!c',
+    'KZ': '3!n13!c',
+    'LB': '4!n20!c',
+    'LC': '4!a24!c',
+    'LI': '5!n12!c',
+    'LT': '5!n11!n',
+    'LU': '3!n13!c',
+    'LV': '4!a13!c',
+    'LY': '3!n3!n15!n',
+    'MC': '5!n5!n11!c2!n',
+    'MD': '2!c18!c',
+    'ME': '3!n13!n2!n',
+    'MK': '3!n10!c2!n',
+    'MN': '4!n12!n',
+    'MR': '5!n5!n11!n2!n',
+    'MT': '4!a5!n18!c',
+    'MU': '4!a2!n2!n12!n3!n3!a',
+    'NI': '4!a20!n',
+    'NL': '4!a10!n',
+    'NO': '4!n6!n1!n',
+    'OM': '3!n16!c',
+    'PK': '4!a16!c',
+    'PL': '8!n16!n',
+    'PS': '4!a21!c',
+    'PT': '4!n4!n11!n2!n',
+    'QA': '4!a21!c',
+    'RO': '4!a16!c',
+    'RS': '3!n13!n2!n',
+    'RU': '9!n5!n15!c',
+    'SA': '2!n18!c',
+    'SC': '4!a2!n2!n16!n3!a',
+    'SD': '2!n12!n',
+    'SE': '3!n16!n1!n',
+    'SI': '5!n8!n2!n',
+    'SK': '4!n6!n10!n',
+    'SM': '1!a5!n5!n12!c',
+    'SO': '4!n3!n12!n',
+    'ST': '4!n4!n11!n2!n',
+    'SV': '4!a20!n',
+    'TL': '3!n14!n2!n',
+    'TN': '2!n3!n13!n2!n',
+    'TR': '5!n1!n16!c',
+    'UA': '6!n19!c',
+    'VA': '3!n15!n',
+    'VG': '4!a16!n',
+    'XK': '4!n10!n2!n',
+    'YE': '4!a4!n18!c',
+}
+
+# BBAN formats for the additional countries catalogued by Nordea. These are not part of the IBAN Registry so the
+# formats are kept permissive where the published examples differ.
+
+NORDEA_BBAN_FORMATS = {
+    'AO': '21!n',
+    'BJ': '2!c22!n',
+    'BF': '2!c21!n',
+    'CI': '2!c22!n',
+    'CG': '23!n',
+    'CM': '23!n',
+    'CV': '21!n',
+    'DZ': '20!n',
+    'GA': '23!n',
+    'IR': '22!n',
+    'MG': '23!n',
+    'ML': '2!c22!n',
+    'MZ': '21!n',
+    'SN': '2!c22!n',
+}
+
+# Position of the bank and branch identifiers in the BBAN as a tuple of the offset of the bank identifier, the length
+# of the bank identifier and the length of the branch identifier that directly follows it. A branch identifier length
+# of 0 means the country has no separate branch identifier. The characters before the bank identifier are a national
+# check character, like the CIN of Italy and San Marino.
+
+IBAN_BBAN_IDENTIFIERS = {
+    'AD': (0, 4, 4),
+    'AE': (0, 3, 0),
+    'AL': (0, 3, 4),
+    'AT': (0, 5, 0),
+    'AZ': (0, 4, 0),
+    'BA': (0, 3, 3),
+    'BE': (0, 3, 0),
+    'BG': (0, 4, 4),
+    'BH': (0, 4, 0),
+    'BI': (0, 5, 5),
+    'BR': (0, 8, 5),
+    'BY': (0, 4, 0),
+    'CH': (0, 5, 0),
+    'CR': (0, 4, 0),
+    'CY': (0, 3, 5),
+    'CZ': (0, 4, 0),
+    'DE': (0, 8, 0),
+    'DJ': (0, 5, 5),
+    'DK': (0, 4, 0),
+    'DO': (0, 4, 0),
+    'EE': (0, 2, 0),
+    'EG': (0, 4, 4),
+    'ES': (0, 4, 4),
+    'FI': (0, 3, 0),
+    'FK': (0, 2, 0),
+    'FO': (0, 4, 0),
+    'FR': (0, 5, 5),
+    'GB': (0, 4, 6),
+    'GE': (0, 2, 0),
+    'GI': (0, 4, 0),
+    'GL': (0, 4, 0),
+    'GR': (0, 3, 4),
+    'GT': (0, 4, 0),
+    'HN': (0, 4, 0),
+    'HR': (0, 7, 0),
+    'HU': (0, 3, 4),
+    'IE': (0, 4, 6),
+    'IL': (0, 3, 3),
+    'IQ': (0, 4, 3),
+    'IS': (0, 2, 2),
+    'IT': (1, 5, 5),
+    'JO': (0, 4, 4),
+    'KW': (0, 4, 0),
+    'KZ': (0, 3, 0),
+    'LB': (0, 4, 0),
+    'LC': (0, 4, 0),
+    'LI': (0, 5, 0),
+    'LT': (0, 5, 0),
+    'LU': (0, 3, 0),
+    'LV': (0, 4, 0),
+    'LY': (0, 3, 3),
+    'MC': (0, 5, 5),
+    'MD': (0, 2, 0),
+    'ME': (0, 3, 0),
+    'MK': (0, 3, 0),
+    'MN': (0, 4, 0),
+    'MR': (0, 5, 5),
+    'MT': (0, 4, 5),
+    'MU': (0, 6, 2),
+    'NI': (0, 4, 0),
+    'NL': (0, 4, 0),
+    'NO': (0, 4, 0),
+    'OM': (0, 3, 0),
+    'PK': (0, 4, 0),
+    'PL': (0, 8, 0),
+    'PS': (0, 4, 0),
+    'PT': (0, 4, 4),
+    'QA': (0, 4, 0),
+    'RO': (0, 4, 0),
+    'RS': (0, 3, 0),
+    'RU': (0, 9, 5),
+    'SA': (0, 2, 0),
+    'SC': (0, 6, 2),
+    'SD': (0, 2, 0),
+    'SE': (0, 3, 0),
+    'SI': (0, 5, 0),
+    'SK': (0, 4, 0),
+    'SM': (1, 5, 5),
+    'SO': (0, 4, 3),
+    'ST': (0, 4, 4),
+    'SV': (0, 4, 0),
+    'TL': (0, 3, 0),
+    'TN': (0, 2, 3),
+    'TR': (0, 5, 0),
+    'UA': (0, 6, 0),
+    'VA': (0, 3, 0),
+    'VG': (0, 4, 0),
+    'XK': (0, 2, 2),
+    'YE': (0, 4, 4),
+}
+
+# Bank and branch identifiers for the Nordea extensions. Algeria and Iran are left out as their layout is not known.
+
+NORDEA_BBAN_IDENTIFIERS = {
+    'AO': (0, 4, 4),
+    'BJ': (0, 5, 5),
+    'BF': (0, 5, 5),
+    'CI': (0, 5, 5),
+    'CG': (0, 5, 5),
+    'CM': (0, 5, 5),
+    'CV': (0, 4, 4),
+    'GA': (0, 5, 5),
+    'MG': (0, 5, 5),
+    'ML': (0, 5, 5),
+    'MZ': (0, 4, 4),
+    'SN': (0, 5, 5),
+}
+
+_BBAN_ELEMENT_RE = re.compile(r'([1-9][0-9]*)!([nac])')
+_BBAN_CHARACTER_CLASSES = {'n': '[0-9]', 'a': '[A-Z]', 'c': '[A-Z0-9]'}
+
+
+def bban_format_to_regex(bban_format):
+    """Converts a BBAN format in IBAN Registry notation to a regular expression string."""
+    return _BBAN_ELEMENT_RE.sub(
+        lambda match: '%s{%s}' % (_BBAN_CHARACTER_CLASSES[match.group(2)], match.group(1)),
+        bban_format,
+    )
+
+
+BBAN_PATTERNS = {country_code: re.compile(bban_format_to_regex(bban_format))
+                 for country_code, bban_format in {**IBAN_BBAN_FORMATS, **NORDEA_BBAN_FORMATS}.items()}
+"""Map of country codes to the compiled BBAN regular expressions."""
+
+BBAN_IDENTIFIERS = {**IBAN_BBAN_IDENTIFIERS, **NORDEA_BBAN_IDENTIFIERS}
+"""Map of country codes to the bank and branch identifier positions in the BBAN."""
+
+
+def _be_bban_is_valid(bban):
+    """Belgian account numbers end with the remainder of the first ten digits modulo 97 (97 instead of 0)."""
+    if bban[-2:] != '%02d' % (int(bban[:-2]) % 97 or 97):
+        return False
+    # The bank code must be known.
+    return bool(numdb.get('be/banks').info(bban[:3])[0][1])
+
+
+def _es_check_digit(digits):
+    """Calculates a single Código Cuenta Cliente check digit."""
+    check = sum(int(digit) * 2 ** i for i, digit in enumerate(digits)) % 11
+    return str(check if check < 2 else 11 - check)
+
+
+def _es_bban_is_valid(bban):
+    """The Spanish Código Cuenta Cliente has check digits over the bank and branch codes and over the account."""
+    return bban[8:10] == _es_check_digit('00' + bban[:8]) + _es_check_digit(bban[10:])
+
+
+def _me_bban_is_valid(bban):
+    """The Montenegrin BBAN is a valid number according to ISO 7064 MOD 97-10."""
+    return int(bban) % 97 == 1
+
+
+def _no_bban_is_valid(bban):
+    """Norwegian account numbers use a weighted modulo 11 check digit, or Luhn for old postgiro accounts."""
+    if bban.startswith('0000'):
+        return luhn.is_valid(bban[4:])
+    weights = (6, 7, 8, 9, 4, 5, 6, 7, 8, 9)
+    return str(sum(weight * int(digit) for weight, digit in zip(weights, bban)) % 11) == bban[-1]
+
+
+BBAN_CHECKS = {
+    'BE': _be_bban_is_valid,
+    'ES': _es_bban_is_valid,
+    'ME': _me_bban_is_valid,
+    'NO': _no_bban_is_valid,
+}
+"""Map of country codes to functions that verify the national check digits of a structurally valid BBAN."""
+
+
+def is_valid_bban(country_code, bban):
+    """
+    Checks the structure, and for some countries the national check digits, of a BBAN.
+
+    The BBAN must be normalized (upper case without separators). False is returned for unknown countries.
+
+    .. versionadded:: 5.1
+    """
+    pattern = BBAN_PATTERNS.get(country_code)
+    if pattern is None or not pattern.fullmatch(bban):
+        return False
+    check = BBAN_CHECKS.get(country_code)
+    return check is None or check(bban)
@@ -0,0 +1,59 @@
+import string
+
+#: Maps every character allowed in an IBAN to its numeric value and the factor the running remainder has to be
+#: multiplied with to make room for it. Digits keep their value and take up one decimal place, letters are expanded
+#: to two digits where A = 10, B = 11, ..., Z = 35.
+IBAN_CHARACTER_TABLE = {char: (int(char), 10) for char in string.digits}
+IBAN_CHARACTER_TABLE.update({char: (index + 10, 100) for index, char in enumerate(string.ascii_uppercase)})
+
+
+def _iban_remainder(value, check_digits):
+    """
+    Folds the rearranged IBAN (BBAN, country code, check digits) into its remainder modulo 97.
+
+    A ValueError with the offending character is raised for characters that are not allowed in an IBAN.
+    """
+    table = IBAN_CHARACTER_TABLE
+    remainder = 0
+    for part in (value[4:], value[:2], check_digits):
+        for char in part:
+            try:
+                number, multiplier = table[char]
+            except KeyError:
+                raise ValueError(char) from None
+            remainder = (remainder * multiplier + number) % 97
+    return remainder
+
+
+def iban_mod97(value):
+    """
+    Returns the ISO 7064 MOD 97-10 remainder of a normalized IBAN.
+
+    The check digits of a valid IBAN make the remainder equal to 1.
+
+    .. versionadded:: 5.1
+    """
+    return _iban_remainder(value, value[2:4])
+
+
+def iban_check_digits(value):
+    """
+    Computes the two check digits for a normalized IBAN.
+
+    The check digits already present in the value are ignored.
+
+    .. versionadded:: 5.1
+    """
+    return '%02d' % (98 - _iban_remainder(value, '00'))
+
+
+def repair_iban_check_digits(value):
+    """
+    Returns the normalized IBAN with its check digits replaced by the correct ones.
+
+    This is useful to suggest a correction when the check digits were mistyped. The returned value is only a valid
+    IBAN if the rest of it is correct.
+
+    .. versionadded:: 5.1
+    """
+    return value[:2] + iban_check_digits(value) + value[4:]
@@ -0,0 +1,98 @@
+from collections import namedtuple
+
+Country = namedtuple('Country', 'alpha2 alpha3 numeric')
+Country.__doc__ = 'The ISO 3166-1 alpha-2, alpha-3 and numeric codes of a country.'
+
+
+class CountryRegistry:
+    """
+    Constant time lookups of ISO 3166-1 country codes.
+
+    The lookup tables are built from :data:`~localflavor.generic.countries.iso_3166.ISO_3166_1_COUNTRY_CODES` the first
+    time they are used. Membership tests (``'NL' in countries``) check alpha-2 codes.
+
+    Example:
+
+    .. code-block:: python
+
+        from localflavor.generic.countries.registry import countries
+
+        countries.is_alpha3('NLD')           # True
+        countries.get('528').alpha2          # 'NL'
+        countries.alpha2_to_alpha3('NL')     # 'NLD'
+
+    .. versionadded:: 5.1
+    """
+
+    def __init__(self):
+        self._by_alpha2 = None
+        self._by_alpha3 = None
+        self._by_numeric = None
+
+    def _load(self):
+        from .iso_3166 import ISO_3166_1_COUNTRY_CODES
+
+        countries = [Country(*codes) for codes in ISO_3166_1_COUNTRY_CODES]
+        self._by_alpha3 = {country.alpha3: country for country in countries}
+        self._by_numeric = {country.numeric: country for country in countries if country.numeric is not None}
+        # Set last as it's used to check whether the tables are loaded.
+        self._by_alpha2 = {country.alpha2: country for country in countries}
+
+    @property
+    def by_alpha2(self):
+        """Dictionary of alpha-2 codes to :class:`Country`."""
+        if self._by_alpha2 is None:
+            self._load()
+        return self._by_alpha2
+
+    @property
+    def by_alpha3(self):
+        """Dictionary of alpha-3 codes to :class:`Country`."""
+        if self._by_alpha2 is None:
+            self._load()
+        return self._by_alpha3
+
+    @property
+    def by_numeric(self):
+        """Dictionary of numeric codes, as three digit strings, to :class:`Country`."""
+        if self._by_alpha2 is None:
+            self._load()
+        return self._by_numeric
+
+    def __contains__(self, alpha2):
+        return alpha2 in self.by_alpha2
+
+    def __iter__(self):
+        return iter(self.by_alpha2.values())
+
+    def __len__(self):
+        return len(self.by_alpha2)
+
+    def is_alpha2(self, code):
+        return code in self.by_alpha2
+
+    def is_alpha3(self, code):
+        return code in self.by_alpha3
+
+    def is_numeric(self, code):
+        return code in self.by_numeric
+
+    def get(self, code):
+        """Returns the :class:`Country` for an alpha-2, alpha-3 or numeric code or ``None`` if it's unknown."""
+        return self.by_alpha2.get(code) or self._by_alpha3.get(code) or self._by_numeric.get(code)
+
+    def alpha2_to_alpha3(self, alpha2):
+        return self.by_alpha2[alpha2].alpha3
+
+    def alpha2_to_numeric(self, alpha2):
+        return self.by_alpha2[alpha2].numeric
+
+    def alpha3_to_alpha2(self, alpha3):
+        return self.by_alpha3[alpha3].alpha2
+
+    def numeric_to_alpha2(self, numeric):
+        return self.by_numeric[numeric].alpha2
+
+
+#: The shared :class:`CountryRegistry` instance.
+countries = CountryRegistry()
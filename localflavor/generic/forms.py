@@ -1,5 +1,9 @@
 from django import forms
+from django.core.exceptions import ValidationError
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
+from .bankdirectory import validate_bic_bank, validate_iban_bank
 from .validators import IBAN_COUNTRY_CODE_LENGTH, BICValidator, IBANValidator
 
 DEFAULT_DATE_INPUT_FORMATS = (
@@ -48,7 +52,7 @@ class SplitDateTimeField(forms.SplitDateTimeField):
                          input_time_formats=input_time_formats, **kwargs)
 
 
-class IBANFormField(forms.CharField):
+class IBANFormField(CheckFieldMixin, forms.CharField):
     """
     An IBAN consists of up to 34 alphanumeric characters.
 
@@ -74,13 +78,23 @@ class IBANFormField(forms.CharField):
 
     https://en.wikipedia.org/wiki/International_Bank_Account_Number
 
+    The bank of the IBAN can be checked against an offline bank directory by passing a
+    :class:`~localflavor.generic.bankdirectory.BankDirectory` as the `bank_directory` argument. To check that an IBAN
+    and a BIC in the same form belong to the same bank, call
+    :func:`~localflavor.generic.bankdirectory.validate_iban_bic` from the ``clean()`` method of the form.
+
     .. versionadded:: 1.1
+
+    .. versionchanged:: 5.1
+
+        The `bank_directory` argument was added.
     """
 
-    def __init__(self, use_nordea_extensions=False, include_countries=None, **kwargs):
+    def __init__(self, use_nordea_extensions=False, include_countries=None, bank_directory=None, **kwargs):
         # The IBANValidator handles the length check, so we don't need to use the form min and max length validators.
         kwargs.pop("max_length", None)
         self.default_validators = [IBANValidator(use_nordea_extensions, include_countries)]
+        self.bank_directory = bank_directory
         super().__init__(**kwargs)
 
         # We still need to use max_length=42 in the <input ...> instead of max_length=34 (from the model) to
@@ -93,6 +107,15 @@ class IBANFormField(forms.CharField):
             return value
         return value.upper().replace(' ', '').replace('-', '')
 
+    def check_value(self, value):
+        # The bank is only looked up for IBANs that passed the validators.
+        if self.bank_directory is not None:
+            try:
+                validate_iban_bank(value, self.bank_directory)
+            except ValidationError as e:
+                return CheckResult.from_error(value, e)
+        return CheckResult.valid(value)
+
     def prepare_value(self, value):
         """The display format for IBAN has a space every 4 characters."""
         if value is None:
@@ -102,7 +125,7 @@ class IBANFormField(forms.CharField):
         return ' '.join(value[i:i + grouping] for i in range(0, len(value), grouping))
 
 
-class BICFormField(forms.CharField):
+class BICFormField(CheckFieldMixin, forms.CharField):
     """
     A BIC consists of 8 (BIC8) or 11 (BIC11) alphanumeric characters.
 
@@ -110,13 +133,21 @@ class BICFormField(forms.CharField):
 
     https://en.wikipedia.org/wiki/ISO_9362
 
+    The institution of the BIC can be checked against an offline bank directory by passing a
+    :class:`~localflavor.generic.bankdirectory.BankDirectory` as the `bank_directory` argument.
+
     .. versionadded:: 1.1
+
+    .. versionchanged:: 5.1
+
+        The `bank_directory` argument was added.
     """
 
     default_validators = [BICValidator()]
 
-    def __init__(self, **kwargs):
+    def __init__(self, bank_directory=None, **kwargs):
         kwargs.setdefault('max_length', 11)
+        self.bank_directory = bank_directory
         super().__init__(**kwargs)
 
     def to_python(self, value):
@@ -127,6 +158,15 @@ class BICFormField(forms.CharField):
             return value
         return value.upper().replace(" ", "")
 
+    def check_value(self, value):
+        # The institution is only looked up for BICs that passed the validators.
+        if self.bank_directory is not None:
+            try:
+                validate_bic_bank(value, self.bank_directory)
+            except ValidationError as e:
+                return CheckResult.from_error(value, e)
+        return CheckResult.valid(value)
+
     def prepare_value(self, value):
         # BIC is always written in upper case.
         value = super().prepare_value(value)
@@ -0,0 +1,240 @@
+"""
+Validation of Global Trade Item Numbers (EAN-8, UPC-A, EAN-13 and GTIN-14).
+
+Example:
+
+.. code-block:: python
+
+    from localflavor.generic.gtin import gs1_prefix, is_valid_gtin
+
+    is_valid_gtin('4006381333931')            # True
+    gs1_prefix('4006381333931').name          # 'GS1 Germany'
+
+.. versionadded:: 5.1
+"""
+import bisect
+from collections import namedtuple
+
+#: The lengths of the GTIN formats: EAN-8, UPC-A (GTIN-12), EAN-13 (GTIN-13) and GTIN-14.
+GTIN_LENGTHS = frozenset((8, 12, 13, 14))
+
+# Maps the ASCII digits to their values so the check digit can be computed on a bytes object.
+_DIGIT_VALUES = bytes(range(256)).translate(bytes.maketrans(b'0123456789', bytes(range(10))))
+# The check digit for a weighted sum modulo 10.
+_CHECK_DIGITS = '0987654321'
+
+
+class _NonDigitFilter(dict):
+    """
+    A :meth:`str.translate` table that deletes every character that is not a digit.
+
+    The decision for a character is made once and stored in the table, so translating a value only does dictionary
+    lookups after the first few calls.
+    """
+
+    def __missing__(self, ordinal):
+        self[ordinal] = ordinal if chr(ordinal).isdecimal() else None
+        return self[ordinal]
+
+
+_NON_DIGITS = _NonDigitFilter()
+
+
+def strip_nondigits(value):
+    """Removes every character that is not a digit from a value."""
+    return value.translate(_NON_DIGITS)
+
+
+def compact_gtin(value):
+    """Removes spaces and dashes from a GTIN."""
+    return value.replace(' ', '').replace('-', '').strip()
+
+
+def gtin_check_digit(digits):
+    """Returns the check digit for the digits of a GTIN without the check digit."""
+    data = digits.encode('ascii').translate(_DIGIT_VALUES)
+    # The weights alternate between 3 and 1 starting with 3 for the digit next to the check digit.
+    return _CHECK_DIGITS[(3 * sum(data[-1::-2]) + sum(data[-2::-2])) % 10]
+
+
+def is_valid_gtin(value):
+    """Checks the length, the characters and the check digit of a compacted EAN-8, UPC-A, EAN-13 or GTIN-14."""
+    if len(value) not in GTIN_LENGTHS or not value.isascii() or not value.isdigit():
+        return False
+    data = value.encode('ascii').translate(_DIGIT_VALUES)
+    # Adding the check digit to the weighted sum gives a multiple of 10 for a valid GTIN.
+    return (3 * sum(data[-2::-2]) + sum(data[-3::-2]) + data[-1]) % 10 == 0
+
+
+GS1Prefix = namedtuple('GS1Prefix', 'start end country_code name')
+GS1Prefix.__doc__ = """
+A range of GS1 prefixes and the GS1 member organisation that issues company prefixes from it.
+
+``country_code`` is the ISO 3166-1 alpha-2 code of the member organisation and ``None`` for ranges that are not
+assigned to a country, such as restricted distribution numbers and the ISBN and ISSN ranges.
+"""
+
+#: The ranges of three digit GS1 prefixes, sorted by their first prefix.
+GS1_PREFIXES = tuple(GS1Prefix(*prefix) for prefix in (
+    ('000', '019', 'US', 'GS1 US'),
+    ('020', '029', None, 'Restricted distribution'),
+    ('030', '039', 'US', 'GS1 US'),
+    ('040', '049', None, 'Restricted distribution'),
+    ('050', '059', 'US', 'GS1 US'),
+    ('060', '139', 'US', 'GS1 US'),
+    ('200', '299', None, 'Restricted distribution'),
+    ('300', '379', 'FR', 'GS1 France'),
+    ('380', '380', 'BG', 'GS1 Bulgaria'),
+    ('383', '383', 'SI', 'GS1 Slovenia'),
+    ('385', '385', 'HR', 'GS1 Croatia'),
+    ('387', '387', 'BA', 'GS1 Bosnia and Herzegovina'),
+    ('389', '389', 'ME', 'GS1 Montenegro'),
+    ('390', '390', 'XK', 'GS1 Kosovo'),
+    ('400', '440', 'DE', 'GS1 Germany'),
+    ('450', '459', 'JP', 'GS1 Japan'),
+    ('460', '469', 'RU', 'GS1 Russia'),
+    ('470', '470', 'KG', 'GS1 Kyrgyzstan'),
+    ('471', '471', 'TW', 'GS1 Taiwan'),
+    ('474', '474', 'EE', 'GS1 Estonia'),
+    ('475', '475', 'LV', 'GS1 Latvia'),
+    ('476', '476', 'AZ', 'GS1 Azerbaijan'),
+    ('477', '477', 'LT', 'GS1 Lithuania'),
+    ('478', '478', 'UZ', 'GS1 Uzbekistan'),
+    ('479', '479', 'LK', 'GS1 Sri Lanka'),
+    ('480', '480', 'PH', 'GS1 Philippines'),
+    ('481', '481', 'BY', 'GS1 Belarus'),
+    ('482', '482', 'UA', 'GS1 Ukraine'),
+    ('483', '483', 'TM', 'GS1 Turkmenistan'),
+    ('484', '484', 'MD', 'GS1 Moldova'),
+    ('485', '485', 'AM', 'GS1 Armenia'),
+    ('486', '486', 'GE', 'GS1 Georgia'),
+    ('487', '487', 'KZ', 'GS1 Kazakhstan'),
+    ('488', '488', 'TJ', 'GS1 Tajikistan'),
+    ('489', '489', 'HK', 'GS1 Hong Kong, China'),
+    ('490', '499', 'JP', 'GS1 Japan'),
+    ('500', '509', 'GB', 'GS1 UK'),
+    ('520', '521', 'GR', 'GS1 Association Greece'),
+    ('528', '528', 'LB', 'GS1 Lebanon'),
+    ('529', '529', 'CY', 'GS1 Cyprus'),
+    ('530', '530', 'AL', 'GS1 Albania'),
+    ('531', '531', 'MK', 'GS1 North Macedonia'),
+    ('535', '535', 'MT', 'GS1 Malta'),
+    ('539', '539', 'IE', 'GS1 Ireland'),
+    ('540', '549', 'BE', 'GS1 Belgium & Luxembourg'),
+    ('560', '560', 'PT', 'GS1 Portugal'),
+    ('569', '569', 'IS', 'GS1 Iceland'),
+    ('570', '579', 'DK', 'GS1 Denmark'),
+    ('590', '590', 'PL', 'GS1 Poland'),
+    ('594', '594', 'RO', 'GS1 Romania'),
+    ('599', '599', 'HU', 'GS1 Hungary'),
+    ('600', '601', 'ZA', 'GS1 South Africa'),
+    ('603', '603', 'GH', 'GS1 Ghana'),
+    ('604', '604', 'SN', 'GS1 Senegal'),
+    ('605', '605', 'UG', 'GS1 Uganda'),
+    ('606', '606', 'AO', 'GS1 Angola'),
+    ('608', '608', 'BH', 'GS1 Bahrain'),
+    ('609', '609', 'MU', 'GS1 Mauritius'),
+    ('611', '611', 'MA', 'GS1 Morocco'),
+    ('613', '613', 'DZ', 'GS1 Algeria'),
+    ('615', '615', 'NG', 'GS1 Nigeria'),
+    ('616', '616', 'KE', 'GS1 Kenya'),
+    ('617', '617', 'CM', 'GS1 Cameroon'),
+    ('618', '618', 'CI', "GS1 Côte d'Ivoire"),
+    ('619', '619', 'TN', 'GS1 Tunisia'),
+    ('620', '620', 'TZ', 'GS1 Tanzania'),
+    ('621', '621', 'SY', 'GS1 Syria'),
+    ('622', '622', 'EG', 'GS1 Egypt'),
+    ('623', '623', 'BN', 'GS1 Brunei'),
+    ('624', '624', 'LY', 'GS1 Libya'),
+    ('625', '625', 'JO', 'GS1 Jordan'),
+    ('626', '626', 'IR', 'GS1 Iran'),
+    ('627', '627', 'KW', 'GS1 Kuwait'),
+    ('628', '628', 'SA', 'GS1 Saudi Arabia'),
+    ('629', '629', 'AE', 'GS1 Emirates'),
+    ('630', '630', 'QA', 'GS1 Qatar'),
+    ('631', '631', 'NA', 'GS1 Namibia'),
+    ('640', '649', 'FI', 'GS1 Finland'),
+    ('690', '699', 'CN', 'GS1 China'),
+    ('700', '709', 'NO', 'GS1 Norway'),
+    ('729', '729', 'IL', 'GS1 Israel'),
+    ('730', '739', 'SE', 'GS1 Sweden'),
+    ('740', '740', 'GT', 'GS1 Guatemala'),
+    ('741', '741', 'SV', 'GS1 El Salvador'),
+    ('742', '742', 'HN', 'GS1 Honduras'),
+    ('743', '743', 'NI', 'GS1 Nicaragua'),
+    ('744', '744', 'CR', 'GS1 Costa Rica'),
+    ('745', '745', 'PA', 'GS1 Panama'),
+    ('746', '746', 'DO', 'GS1 Dominican Republic'),
+    ('750', '750', 'MX', 'GS1 Mexico'),
+    ('754', '755', 'CA', 'GS1 Canada'),
+    ('759', '759', 'VE', 'GS1 Venezuela'),
+    ('760', '769', 'CH', 'GS1 Switzerland'),
+    ('770', '771', 'CO', 'GS1 Colombia'),
+    ('773', '773', 'UY', 'GS1 Uruguay'),
+    ('775', '775', 'PE', 'GS1 Peru'),
+    ('777', '777', 'BO', 'GS1 Bolivia'),
+    ('778', '779', 'AR', 'GS1 Argentina'),
+    ('780', '780', 'CL', 'GS1 Chile'),
+    ('784', '784', 'PY', 'GS1 Paraguay'),
+    ('786', '786', 'EC', 'GS1 Ecuador'),
+    ('789', '790', 'BR', 'GS1 Brasil'),
+    ('800', '839', 'IT', 'GS1 Italy'),
+    ('840', '849', 'ES', 'GS1 Spain'),
+    ('850', '850', 'CU', 'GS1 Cuba'),
+    ('858', '858', 'SK', 'GS1 Slovakia'),
+    ('859', '859', 'CZ', 'GS1 Czech Republic'),
+    ('860', '860', 'RS', 'GS1 Serbia'),
+    ('865', '865', 'MN', 'GS1 Mongolia'),
+    ('867', '867', 'KP', 'GS1 North Korea'),
+    ('868', '869', 'TR', 'GS1 Turkey'),
+    ('870', '879', 'NL', 'GS1 Netherlands'),
+    ('880', '881', 'KR', 'GS1 Korea'),
+    ('883', '883', 'MM', 'GS1 Myanmar'),
+    ('884', '884', 'KH', 'GS1 Cambodia'),
+    ('885', '885', 'TH', 'GS1 Thailand'),
+    ('888', '888', 'SG', 'GS1 Singapore'),
+    ('890', '890', 'IN', 'GS1 India'),
+    ('893', '893', 'VN', 'GS1 Vietnam'),
+    ('896', '896', 'PK', 'GS1 Pakistan'),
+    ('899', '899', 'ID', 'GS1 Indonesia'),
+    ('900', '919', 'AT', 'GS1 Austria'),
+    ('930', '939', 'AU', 'GS1 Australia'),
+    ('940', '949', 'NZ', 'GS1 New Zealand'),
+    ('950', '950', None, 'GS1 Global Office'),
+    ('951', '951', None, 'GS1 Global Office (EPC General Manager Numbers)'),
+    ('955', '955', 'MY', 'GS1 Malaysia'),
+    ('958', '958', 'MO', 'GS1 Macau, China'),
+    ('960', '969', None, 'GS1 Global Office (GTIN-8)'),
+    ('977', '977', None, 'Serial publications (ISSN)'),
+    ('978', '979', None, 'Bookland (ISBN)'),
+    ('980', '980', None, 'Refund receipts'),
+    ('981', '984', None, 'Coupons (common currency)'),
+    ('990', '999', None, 'Coupons'),
+))
+
+_GS1_PREFIX_STARTS = [prefix.start for prefix in GS1_PREFIXES]
+
+#: EAN-8 numbers starting with 0 are restricted circulation numbers, like the ones starting with 2.
+GS1_8_RESTRICTED = GS1Prefix('000', '099', None, 'Restricted distribution')
+
+
+def gs1_prefix(value):
+    """
+    Returns the :class:`GS1Prefix` range of a valid, compacted GTIN or ``None`` for an unassigned prefix.
+
+    UPC-A numbers are looked up as EAN-13 numbers with a leading zero and the indicator digit of GTIN-14 numbers is
+    ignored.
+    """
+    length = len(value)
+    if length == 8 and value[0] == '0':
+        return GS1_8_RESTRICTED
+    if length == 12:
+        prefix = '0' + value[:2]
+    elif length == 14:
+        prefix = value[1:4]
+    else:
+        prefix = value[:3]
+    index = bisect.bisect_right(_GS1_PREFIX_STARTS, prefix) - 1
+    if index >= 0 and prefix <= GS1_PREFIXES[index].end:
+        return GS1_PREFIXES[index]
+    return None
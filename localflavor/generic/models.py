@@ -1,11 +1,13 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.normalized import NormalizedLookupMixin
+
 from .forms import BICFormField, IBANFormField
 from .validators import BICValidator, IBANValidator
 
 
-class IBANField(models.CharField):
+class IBANField(NormalizedLookupMixin, models.CharField):
     """
     An IBAN consists of up to 34 alphanumeric characters.
 
@@ -32,9 +34,13 @@ class IBANField(models.CharField):
     https://en.wikipedia.org/wiki/International_Bank_Account_Number
 
     .. versionadded:: 1.1
+    .. versionchanged:: 5.1
+
+        Added ``db_normalized_index`` and the ``normalized`` lookup, see :mod:`localflavor.normalized`.
     """
 
     description = _('An International Bank Account Number')
+    normalize_separators = ' -'
 
     def __init__(self, *args, **kwargs):
         kwargs.setdefault('max_length', 34)
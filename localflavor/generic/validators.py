@@ -1,12 +1,17 @@
 import re
-import string
+from collections import namedtuple
 
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
-from stdnum import ean, iban
 
-from .countries.iso_3166 import ISO_3166_1_ALPHA2_COUNTRY_CODES
+from localflavor.results import CheckMixin, CheckResult
+
+from .bban import BBAN_IDENTIFIERS, is_valid_bban
+from .checksums import iban_check_digits
+from .countries.registry import countries
+from .gtin import compact_gtin, is_valid_gtin, strip_nondigits
+from .vatin import vatin_check_digits_are_valid
 
 # Dictionary of ISO country code to IBAN length.
 #
@@ -141,10 +146,54 @@ NORDEA_COUNTRY_CODE_LENGTH = {'AO': 25,  # Angola
                               'SN': 28}  # Senegal
 
 
+class IBANParts(namedtuple('IBANParts', 'country_code check_digits bank_code branch_code account_number '
+                                        'national_check', defaults=(None,))):
+    """
+    The components of a normalized IBAN.
+
+    ``bank_code`` and ``branch_code`` are ``None`` when the country doesn't have them or their position is unknown. The
+    account number is the remainder of the BBAN after the bank and branch identifiers, which includes national check
+    digits at the end for some countries, like the French RIB key. ``national_check`` is the national check character
+    that precedes the bank identifier, like the CIN of Italy and San Marino, and ``None`` for the other countries.
+
+    .. versionadded:: 5.1
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_iban(cls, value):
+        """Splits a normalized IBAN into its components without validating it."""
+        bban = value[4:]
+        identifiers = BBAN_IDENTIFIERS.get(value[:2])
+        if identifiers is None:
+            return cls(value[:2], value[2:4], None, None, bban)
+        bank_start, bank_length, branch_length = identifiers
+        branch_start = bank_start + bank_length
+        account_start = branch_start + branch_length
+        return cls(
+            value[:2],
+            value[2:4],
+            bban[bank_start:branch_start],
+            bban[branch_start:account_start] if branch_length else None,
+            bban[account_start:],
+            bban[:bank_start] or None,
+        )
+
+
 @deconstructible
-class IBANValidator:
+class IBANValidator(CheckMixin):
     """A validator for International Bank Account Numbers (IBAN - ISO 13616-1:2007)."""
 
+    messages = {
+        'bad_country': _('%(country_code)s is not a valid country code for IBAN.'),
+        'bad_length': _('%(country_code)s IBANs must contain %(number)s characters.'),
+        'not_allowed': _('%(country_code)s IBANs are not allowed in this field.'),
+        'bad_character': _('%(character)s is not a valid character for IBAN.'),
+        'bad_checksum': _('Not a valid IBAN.'),
+        'bad_bban': _('Not a valid IBAN.'),
+    }
+
     def __init__(self, use_nordea_extensions=False, include_countries=None):
         self.use_nordea_extensions = use_nordea_extensions
         self.include_countries = include_countries
@@ -153,6 +202,8 @@ class IBANValidator:
         if self.use_nordea_extensions:
             self.validation_countries.update(NORDEA_COUNTRY_CODE_LENGTH)
 
+        # A set makes the membership test in _check constant time.
+        self._include_countries = frozenset(self.include_countries) if self.include_countries else None
         if self.include_countries:
             for country_code in self.include_countries:
                 if country_code not in self.validation_countries:
@@ -171,73 +222,155 @@ class IBANValidator:
 
         Original checksum in input value is ignored.
         """
-        # 1. Move the two initial characters to the end of the string, replacing checksum for '00'
-        value = value[4:] + value[:2] + '00'
-
-        # 2. Replace each letter in the string with two digits, thereby expanding the string, where
-        #    A = 10, B = 11, ..., Z = 35.
-        value_digits = ''
-        for x in value:
-            if '0' <= x <= '9':
-                value_digits += x
-            elif 'A' <= x <= 'Z':
-                value_digits += str(ord(x) - 55)
+        try:
+            return iban_check_digits(value)
+        except ValueError as e:
+            raise ValidationError(
+                _('%(character)s is not a valid character for IBAN.'),
+                code='invalid',
+                params={'character': e.args[0]})
+
+    @staticmethod
+    def _normalize(value):
+        """Strips spaces and dashes from an IBAN and converts it to upper case."""
+        return value.upper().replace(' ', '').replace('-', '')
+
+    def _check(self, value):
+        """
+        Checks a normalized IBAN value without raising ``ValidationError``.
+
+        Returns a tuple of a result code and the message parameters for that code.
+        """
+        # Check that the total IBAN length is correct as per the country. If not, the IBAN is invalid.
+        country_code = value[:2]
+        length = self.validation_countries.get(country_code)
+        if length is None:
+            return 'bad_country', {'country_code': country_code}
+        if length != len(value):
+            return 'bad_length', {'country_code': country_code, 'number': length}
+        if self._include_countries and country_code not in self._include_countries:
+            return 'not_allowed', {'country_code': country_code}
+
+        try:
+            check_digits = iban_check_digits(value)
+        except ValueError as e:
+            return 'bad_character', {'character': e.args[0]}
+        if check_digits != value[2:4]:
+            return 'bad_checksum', None
+
+        # Check the country specific structure of the BBAN, and the national check digits where they are known.
+        if not is_valid_bban(country_code, value[4:]):
+            return 'bad_bban', None
+
+        return 'ok', None
+
+    def validate_many(self, values):
+        """
+        Validates an iterable of IBAN values and yields a result code for each of them.
+
+        No ``ValidationError`` is constructed for invalid values which makes this considerably faster than calling the
+        validator in a loop when a large share of the input is invalid.
+
+        The result code is ``'ok'`` for a valid IBAN and one of ``'bad_country'``, ``'bad_length'``,
+        ``'not_allowed'``, ``'bad_character'``, ``'bad_checksum'`` or ``'bad_bban'`` otherwise. ``None`` values are
+        considered valid, as they are when calling the validator.
+
+        .. versionadded:: 5.1
+        """
+        normalize = self._normalize
+        check = self._check
+        for value in values:
+            if value is None:
+                yield 'ok'
             else:
-                raise ValidationError(
-                    _('%(character)s is not a valid character for IBAN.'),
-                    code='invalid',
-                    params={'character': x})
+                yield check(normalize(value))[0]
+
+    def parse(self, value):
+        """
+        Validates an IBAN and returns its components as :class:`IBANParts`.
+
+        A ``ValidationError`` is raised for invalid values, just like when calling the validator.
+
+        .. versionadded:: 5.1
+        """
+        value = self._normalize(value)
+        code, params = self._check(value)
+        if code != 'ok':
+            raise ValidationError(self.messages[code], code='invalid', params=params)
+        return IBANParts.from_iban(value)
 
-        # 3. The remainder of the number above when divided by 97 is then subtracted from 98.
-        return '%02d' % (98 - int(value_digits) % 97)
+    def parse_many(self, values):
+        """
+        Validates an iterable of IBAN values and yields a tuple of a result code and :class:`IBANParts` for each.
+
+        The result codes are the same as the ones of :meth:`validate_many`. The parts are ``None`` for invalid and
+        ``None`` values.
 
-    def __call__(self, value):
+        .. versionadded:: 5.1
+        """
+        normalize = self._normalize
+        check = self._check
+        from_iban = IBANParts.from_iban
+        for value in values:
+            if value is None:
+                yield 'ok', None
+                continue
+            value = normalize(value)
+            code = check(value)[0]
+            yield code, from_iban(value) if code == 'ok' else None
+
+    def check(self, value):
         """
         Validates the IBAN value using the official IBAN validation algorithm.
 
+        The value of the :class:`~localflavor.results.CheckResult` is the IBAN without spaces and dashes in upper case.
+        The code of an invalid IBAN is one of the result codes of :meth:`validate_many`, the ``ValidationError``
+        raised by calling the validator has the code ``'invalid'``.
+
         https://en.wikipedia.org/wiki/International_Bank_Account_Number#Validating_the_IBAN
         """
         if value is None:
-            return
+            return CheckResult.valid(value)
 
-        value = value.upper().replace(' ', '').replace('-', '')
+        normalized = self._normalize(value)
+        code, params = self._check(normalized)
+        if code != 'ok':
+            return CheckResult.invalid(value, code, self.messages[code], params, error_code='invalid')
+        return CheckResult.valid(normalized)
 
-        # Check that the total IBAN length is correct as per the country. If not, the IBAN is invalid.
-        country_code = value[:2]
-        if country_code in self.validation_countries:
 
-            if self.validation_countries[country_code] != len(value):
-                raise ValidationError(
-                    _('%(country_code)s IBANs must contain %(number)s characters.'),
-                    code='invalid',
-                    params={'country_code': country_code, 'number': self.validation_countries[country_code]},
-                )
+BIC_RE = re.compile(r'([A-Z]{4})([A-Z]{2})([A-Z02-9][A-NP-Z0-9])([A-Z0-9]{3})?')
+"""
+Regular expression for the structure of a BIC with groups for the institution, country, location and branch codes.
 
-        else:
-            raise ValidationError(
-                _('%(country_code)s is not a valid country code for IBAN.'),
-                code='invalid',
-                params={'country_code': country_code},
-            )
-        if self.include_countries and country_code not in self.include_countries:
-            raise ValidationError(
-                _('%(country_code)s IBANs are not allowed in this field.'),
-                code='invalid',
-                params={'country_code': country_code},
-            )
+The country code still has to be checked against ISO 3166-1.
+"""
+
+
+class BICParts(namedtuple('BICParts', 'institution_code country_code location_code branch_code')):
+    """
+    The components of a BIC.
+
+    ``branch_code`` is ``None`` for 8 character BICs.
 
-        if self.iban_checksum(value) != value[2:4]:
-            raise ValidationError(_('Not a valid IBAN.'), code='invalid')
+    .. versionadded:: 5.1
+    """
+
+    __slots__ = ()
+
+    @property
+    def is_test(self):
+        """Test and training BICs have a 0 as the second character of the location code."""
+        return self.location_code[1] == '0'
 
-        # stdnum.iban checks the BBAN as well so we do a final check. stdnum doesn't include the Nordea extensions which
-        # is why we only run the stdnum check for regular IBANs.
-        # Care needs to be taken to keep supporting the Nordea IBANs when we replace more of this code with stdnum.iban.
-        if country_code not in NORDEA_COUNTRY_CODE_LENGTH and not iban.is_valid(value):
-            raise ValidationError(_('Not a valid IBAN.'), code='invalid')
+    @property
+    def is_primary_office(self):
+        """A BIC without a branch code or with the branch code XXX identifies the primary office."""
+        return self.branch_code is None or self.branch_code == 'XXX'
 
 
 @deconstructible
-class BICValidator:
+class BICValidator(CheckMixin):
     """
     A validator for SWIFT Business Identifier Codes (ISO 9362:2009).
 
@@ -246,55 +379,73 @@ class BICValidator:
     https://en.wikipedia.org/wiki/ISO_9362#Structure
     """
 
+    messages = {
+        'length': _('BIC codes have either 8 or 11 characters.'),
+        'characters': _('BIC codes only contain alphabet letters and digits.'),
+        'institution_code': _('%(institution_code)s is not a valid institution code.'),
+        'country_code': _('%(country_code)s is not a valid country code.'),
+        'location_code': _('%(location_code)s is not a valid location code.'),
+    }
+
     def __eq__(self, other):
         # There is no outside modification of properties so this should always be true by default.
         return True
 
-    def __call__(self, value):
-        if value is None:
-            return
-
-        value = value.upper()
-
+    @staticmethod
+    def _diagnose(value):
+        """Returns the message key and parameters of the first rule an invalid upper case BIC breaks."""
         # Length is 8 or 11.
-        bic_length = len(value)
-        if bic_length not in (8, 11):
-            raise ValidationError(_('BIC codes have either 8 or 11 characters.'), code='invalid')
+        if len(value) not in (8, 11):
+            return 'length', None
 
         # BIC is alphanumeric
-        if any(char not in string.ascii_uppercase + string.digits for char in value):
-            raise ValidationError(_('BIC codes only contain alphabet letters and digits.'), code='invalid')
+        if not (value.isascii() and value.isalnum()):
+            return 'characters', None
 
         # First 4 letters are A - Z.
         institution_code = value[:4]
-        if any(char not in string.ascii_uppercase for char in institution_code):
-            raise ValidationError(
-                _('%(institution_code)s is not a valid institution code.'),
-                code='invalid',
-                params={'institution_code': institution_code},
-            )
+        if not institution_code.isalpha():
+            return 'institution_code', {'institution_code': institution_code}
 
         # Letters 5 and 6 consist of an ISO 3166-1 alpha-2 country code.
         country_code = value[4:6]
-        if country_code not in ISO_3166_1_ALPHA2_COUNTRY_CODES:
-            raise ValidationError(
-                _('%(country_code)s is not a valid country code.'),
-                code='invalid',
-                params={'country_code': country_code},
-            )
+        if country_code not in countries:
+            return 'country_code', {'country_code': country_code}
 
         # Letters 7 and 8 are a "location" code. As per ISO20022 Payments
         # Maintenance 2009 document, they may only be from the charset [A-Z2-9][A-NP-Z0-9]
-        if value[6] == '1' or value[7] == 'O':
-            raise ValidationError(
-                _('%(location_code)s is not a valid location code.'),
-                code='invalid',
-                params={'location_code': value[6:8]},
-            )
+        return 'location_code', {'location_code': value[6:8]}
+
+    def parse(self, value):
+        """
+        Validates a BIC and returns its components as :class:`BICParts`.
+
+        The structure is checked with a single precompiled regular expression. A ``ValidationError`` is raised for
+        invalid values, just like when calling the validator.
+
+        .. versionadded:: 5.1
+        """
+        value = value.upper()
+        match = BIC_RE.fullmatch(value)
+        if match is None or match.group(2) not in countries:
+            key, params = self._diagnose(value)
+            raise ValidationError(self.messages[key], code='invalid', params=params)
+        return BICParts(*match.groups())
+
+    def check(self, value):
+        if value is None:
+            return CheckResult.valid(value)
+
+        value = value.upper()
+        match = BIC_RE.fullmatch(value)
+        if match is None or match.group(2) not in countries:
+            key, params = self._diagnose(value)
+            return CheckResult.invalid(value, 'invalid', self.messages[key], params)
+        return CheckResult.valid(value)
 
 
 @deconstructible
-class EANValidator:
+class EANValidator(CheckMixin):
     """
     A generic validator for EAN like codes with the last digit being the checksum.
 
@@ -312,13 +463,13 @@ class EANValidator:
         return ((not hasattr(self, 'message') or self.message == other.message) and
                 self.strip_nondigits == other.strip_nondigits)
 
-    def __call__(self, value):
+    def check(self, value):
         if value is None:
-            return
-        if self.strip_nondigits:
-            value = re.compile(r'[^\d]+').sub('', value)
-        if not ean.is_valid(value):
-            raise ValidationError(self.message, code='invalid')
+            return CheckResult.valid(value)
+        compacted = compact_gtin(strip_nondigits(value) if self.strip_nondigits else value)
+        if not is_valid_gtin(compacted):
+            return CheckResult.invalid(value, 'invalid', self.message)
+        return CheckResult.valid(compacted)
 
 
 VATIN_PATTERN_MAP = {
@@ -350,6 +501,7 @@ VATIN_PATTERN_MAP = {
     'SE': r'^SE\d{10}01$',
     'SI': r'^SI\d{8}$',
     'SK': r'^SK\d{10}$',
+    'XI': r'^(XI(GD|HA)\d{3}|XI\d{9}|XI\d{12})$',
 }
 """
 Map of country codes and regular expressions.
@@ -357,6 +509,9 @@ Map of country codes and regular expressions.
 See https://en.wikipedia.org/wiki/VAT_identification_number
 """
 
+VATIN_PATTERNS = {country_code: re.compile(pattern) for country_code, pattern in VATIN_PATTERN_MAP.items()}
+"""Map of country codes and the compiled regular expressions of :data:`VATIN_PATTERN_MAP`."""
+
 VATIN_COUNTRY_CODE_LENGTH = 2
 """
 Length of the country code prefix of a VAT identification number.
@@ -367,11 +522,12 @@ ISO 639-1.
 
 
 @deconstructible
-class VATINValidator:
+class VATINValidator(CheckMixin):
     """
     A validator for VAT identification numbers.
 
-    Currently only supports European VIES VAT identification numbers.
+    Currently only supports European VIES VAT identification numbers. Besides the format, the check digits are
+    validated for every country.
 
     See See https://en.wikipedia.org/wiki/VAT_identification_number
     """
@@ -380,23 +536,50 @@ class VATINValidator:
         'vatin': _('%(vatin)s is not a valid VAT identification number.'),
     }
 
-    def __call__(self, value):
+    def _check(self, value):
+        """Returns the result code for a VAT identification number without raising ``ValidationError``."""
         country_code, number = self.clean(value)
-        try:
-            match = re.match(VATIN_PATTERN_MAP[country_code], value)
-            if not match:
-                raise ValidationError(
-                    self.messages['vatin'],
-                    code='vatin',
-                    params={'vatin': value}
-                )
-
-        except KeyError:
-            raise ValidationError(
+        pattern = VATIN_PATTERNS.get(country_code)
+        if pattern is None:
+            return 'country_code'
+        if not pattern.fullmatch(value):
+            return 'vatin'
+        if not vatin_check_digits_are_valid(country_code, number):
+            return 'checksum'
+        return 'ok'
+
+    def validate_many(self, values):
+        """
+        Validates an iterable of VAT identification numbers and yields a result code for each of them.
+
+        The result code is ``'ok'`` for a valid number, ``'country_code'`` for an unsupported country,
+        ``'vatin'`` for a number that doesn't match the format of the country and ``'checksum'`` for a number with
+        invalid check digits. No ``ValidationError`` is constructed for invalid values.
+
+        .. versionadded:: 5.1
+        """
+        check = self._check
+        for value in values:
+            yield check(value)
+
+    def check(self, value):
+        """
+        Checks a VAT identification number.
+
+        The code of an invalid number is one of the result codes of :meth:`validate_many`. The ``ValidationError``
+        raised by calling the validator has the code ``'vatin'`` for invalid check digits, like for a wrong format.
+        """
+        code = self._check(value)
+        if code == 'country_code':
+            return CheckResult.invalid(
+                value,
+                'country_code',
                 self.messages['country_code'],
-                code='country_code',
-                params={'country_code': country_code}
+                {'country_code': value[:VATIN_COUNTRY_CODE_LENGTH]}
             )
+        if code != 'ok':
+            return CheckResult.invalid(value, code, self.messages['vatin'], {'vatin': value}, error_code='vatin')
+        return CheckResult.valid(value)
 
     def clean(self, value):
         """Return tuple of country code and number."""
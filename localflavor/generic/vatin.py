@@ -0,0 +1,351 @@
+"""
+Check digit algorithms for the VAT identification numbers of the VIES member states.
+
+Each check function receives the number without its two letter country prefix, after it matched the format in
+:data:`~localflavor.generic.validators.VATIN_PATTERN_MAP`, and returns whether its check digits are correct.
+
+.. versionadded:: 5.1
+"""
+import datetime
+
+from .checksums import IBAN_CHARACTER_TABLE
+
+# Sum of the digits of twice a digit, as used by the Luhn algorithm.
+_LUHN_DOUBLED = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+
+
+def _luhn_checksum(digits):
+    """Returns the Luhn checksum of a digit string, which is 0 for a valid number."""
+    total = 0
+    double = False
+    for digit in reversed(digits):
+        total += _LUHN_DOUBLED[int(digit)] if double else int(digit)
+        double = not double
+    return total % 10
+
+
+def _weighted_sum(weights, digits):
+    return sum(weight * int(digit) for weight, digit in zip(weights, digits))
+
+
+def _mod_11_10_is_valid(digits):
+    """ISO 7064 MOD 11,10 which is used in Germany and Croatia."""
+    product = 10
+    for digit in digits[:-1]:
+        product = (((product + int(digit)) % 10 or 10) * 2) % 11
+    return (11 - product) % 10 == int(digits[-1])
+
+
+def _is_date(year, month, day):
+    try:
+        datetime.date(year, month, day)
+    except ValueError:
+        return False
+    return True
+
+
+def _at(number):
+    # The U prefix is followed by a number that is checked with a variant of the Luhn algorithm.
+    return (6 - _luhn_checksum(number[1:8])) % 10 == int(number[8])
+
+
+def _be(number):
+    if len(number) == 9:
+        # The old format had 9 digits.
+        number = '0' + number
+    return number[0] in '01' and int(number) > 0 and (int(number[:8]) + int(number[8:])) % 97 == 0
+
+
+def _bg_egn_is_valid(number):
+    """Bulgarian personal number with a birth date."""
+    year, month, day = int(number[0:2]) + 1900, int(number[2:4]), int(number[4:6])
+    if month > 40:
+        year, month = year + 100, month - 40
+    elif month > 20:
+        year, month = year - 100, month - 20
+    check = _weighted_sum((2, 4, 8, 5, 10, 9, 7, 3, 6), number) % 11 % 10
+    return _is_date(year, month, day) and check == int(number[9])
+
+
+def _bg(number):
+    if len(number) == 9:
+        # Legal entities.
+        check = sum((i + 1) * int(digit) for i, digit in enumerate(number[:8])) % 11
+        if check == 10:
+            check = sum((i + 3) * int(digit) for i, digit in enumerate(number[:8])) % 11
+        return check % 10 == int(number[8])
+    # Physical persons, foreigners and others.
+    return (
+        _bg_egn_is_valid(number) or
+        _weighted_sum((21, 19, 17, 13, 11, 9, 7, 3, 1), number) % 10 == int(number[9]) or
+        (11 - _weighted_sum((4, 3, 2, 7, 6, 5, 4, 3, 2), number)) % 11 == int(number[9])
+    )
+
+
+# Values of the digits at even positions of a Cypriot VAT number.
+_CY_EVEN_VALUES = (1, 0, 5, 7, 9, 13, 15, 17, 19, 21)
+
+
+def _cy(number):
+    if number.startswith('12'):
+        return False
+    total = sum(_CY_EVEN_VALUES[int(digit)] for digit in number[0:8:2]) + sum(int(digit) for digit in number[1:8:2])
+    return chr(ord('A') + total % 26) == number[8]
+
+
+def _cz_birth_number_is_valid(number):
+    """Czech and Slovak birth numbers (rodné číslo)."""
+    year, month, day = 1900 + int(number[0:2]), int(number[2:4]) % 50 % 20, int(number[4:6])
+    if len(number) == 9:
+        # 9 digit numbers were used until 1954 and have no check digit.
+        if year >= 1980:
+            year -= 100
+        return year <= 1953 and _is_date(year, month, day)
+    if year < 1954:
+        year += 100
+    return _is_date(year, month, day) and int(number[:9]) % 11 % 10 == int(number[9])
+
+
+def _cz(number):
+    if len(number) == 8:
+        # Legal entities.
+        check = (11 - sum((8 - i) * int(digit) for i, digit in enumerate(number[:7]))) % 11
+        return number[0] != '9' and (check or 1) % 10 == int(number[7])
+    if len(number) == 9 and number[0] == '6':
+        # Individuals without a birth number.
+        check = sum((8 - i) * int(digit) for i, digit in enumerate(number[1:8])) % 11
+        return (8 - (10 - check) % 11) % 10 == int(number[8])
+    return _cz_birth_number_is_valid(number)
+
+
+def _de(number):
+    return number[0] != '0' and _mod_11_10_is_valid(number)
+
+
+def _dk(number):
+    return number[0] != '0' and _weighted_sum((2, 7, 6, 5, 4, 3, 2, 1), number) % 11 == 0
+
+
+def _ee(number):
+    return _weighted_sum((3, 7, 1, 3, 7, 1, 3, 7, 1), number) % 10 == 0
+
+
+def _el(number):
+    total = 0
+    for digit in number[:8]:
+        total = total * 2 + int(digit)
+    return total * 2 % 11 % 10 == int(number[8])
+
+
+_ES_DNI_LETTERS = 'TRWAGMYFPDXBNJZSQVHLCKE'
+
+
+def _es(number):
+    first, digits, check = number[0], number[1:8], number[8]
+    if first.isdigit():
+        # Spanish nationals (DNI).
+        return _ES_DNI_LETTERS[int(number[:8]) % 23] == check
+    if first in 'KLM':
+        # Spanish nationals without a DNI, these use the DNI algorithm without the first letter.
+        return _ES_DNI_LETTERS[int(digits) % 23] == check
+    if first in 'XYZ':
+        # Foreigners (NIE).
+        return _ES_DNI_LETTERS[int(str('XYZ'.index(first)) + digits) % 23] == check
+    if first in 'ABCDEFGHJNPQRSUVW':
+        # Legal entities (CIF), which may have a numeric or alphabetic check digit.
+        check_digit = (10 - _luhn_checksum(digits + '0')) % 10
+        return check in (str(check_digit), 'JABCDEFGHI'[check_digit])
+    return False
+
+
+def _fi(number):
+    return _weighted_sum((7, 9, 10, 5, 8, 4, 2, 1), number) % 11 == 0
+
+
+# Alphabet of the check characters of French VAT numbers.
+_FR_ALPHABET = '0123456789ABCDEFGHJKLMNPQRSTUVWXYZ'
+
+
+def _fr(number):
+    key, siren = number[:2], number[2:]
+    # Numbers from Monaco are valid VAT numbers but not a valid SIREN.
+    if siren[:3] != '000' and _luhn_checksum(siren) != 0:
+        return False
+    if key.isdigit():
+        return int(key) == int(siren + '12') % 97
+    if key[0].isdigit():
+        check = _FR_ALPHABET.index(key[0]) * 24 + _FR_ALPHABET.index(key[1]) - 10
+    else:
+        check = _FR_ALPHABET.index(key[0]) * 34 + _FR_ALPHABET.index(key[1]) - 100
+    return (int(siren) + 1 + check // 11) % 11 == check % 11
+
+
+def _gb(number):
+    if number[:2] == 'GD':
+        # Government departments.
+        return int(number[2:]) < 500
+    if number[:2] == 'HA':
+        # Health authorities.
+        return int(number[2:]) >= 500
+    # Standard numbers and branch traders, which have 3 additional digits.
+    check = _weighted_sum((8, 7, 6, 5, 4, 3, 2, 10, 1), number[:9]) % 97
+    # Numbers from 100 onwards may use the newer modulus 9755 scheme.
+    return check == 0 or (int(number[:3]) >= 100 and check in (42, 55))
+
+
+def _hr(number):
+    return _mod_11_10_is_valid(number)
+
+
+def _hu(number):
+    return _weighted_sum((9, 7, 3, 1, 9, 7, 3, 1), number) % 10 == 0
+
+
+_IE_ALPHABET = 'WABCDEFGHIJKLMNOPQRSTUV'
+
+
+def _ie_check_character(digits, suffix):
+    return _IE_ALPHABET[(sum((8 - i) * int(digit) for i, digit in enumerate(digits)) +
+                         9 * _IE_ALPHABET.index(suffix)) % 23]
+
+
+def _ie(number):
+    if any(char not in _IE_ALPHABET for char in number[8:]):
+        return False
+    if number[:7].isdigit():
+        # Current format, seven digits followed by one or two letters.
+        return _ie_check_character(number[:7], number[8:]) == number[7]
+    # Old format where the second character is a letter or symbol.
+    return _ie_check_character('0' + number[2:7] + number[0], '') == number[7]
+
+
+def _it(number):
+    office = number[7:10]
+    return (
+        int(number[:7]) > 0 and
+        ('001' <= office <= '100' or office in ('120', '121', '888', '999')) and
+        _luhn_checksum(number) == 0
+    )
+
+
+def _lt(number):
+    # Legal entities have 9 digits, temporary tax payers and natural persons 12.
+    if number[-2] != '1':
+        return False
+    digits = number[:-1]
+    check = sum((1 + i % 9) * int(digit) for i, digit in enumerate(digits)) % 11
+    if check == 10:
+        check = sum((1 + (i + 2) % 9) * int(digit) for i, digit in enumerate(digits)) % 11
+    return check % 10 == int(number[-1])
+
+
+def _lu(number):
+    return int(number[:6]) % 89 == int(number[6:])
+
+
+def _lv(number):
+    if number[0] > '3':
+        # Legal entities.
+        return _weighted_sum((9, 1, 4, 8, 3, 10, 2, 5, 7, 6, 1), number) % 11 == 3
+    # Natural persons, the number starts with a birth date unless it starts with 32.
+    if not number.startswith('32'):
+        year = int(number[4:6]) + 1800 + int(number[6]) * 100
+        if not _is_date(year, int(number[2:4]), int(number[0:2])):
+            return False
+    return (1 + _weighted_sum((10, 5, 8, 4, 2, 1, 6, 3, 7, 9), number)) % 11 % 10 == int(number[10])
+
+
+def _mt(number):
+    return number[0] != '0' and _weighted_sum((3, 4, 6, 7, 8, 9, 10, 1), number) % 37 == 0
+
+
+def _nl(number):
+    digits = number[:9]
+    if int(digits) == 0 or int(number[10:]) == 0:
+        return False
+    # Either the number passes the "elfproef" of the BSN, or the MOD 97-10 check for the numbers of sole
+    # proprietorships issued since 2020.
+    if (_weighted_sum((9, 8, 7, 6, 5, 4, 3, 2), digits) - int(digits[8])) % 11 == 0:
+        return True
+    remainder = 0
+    for char in 'NL' + number:
+        value, multiplier = IBAN_CHARACTER_TABLE[char]
+        remainder = (remainder * multiplier + value) % 97
+    return remainder == 1
+
+
+def _pl(number):
+    return _weighted_sum((6, 5, 7, 2, 3, 4, 5, 6, 7, -1), number) % 11 == 0
+
+
+def _pt(number):
+    return number[0] != '0' and (11 - _weighted_sum((9, 8, 7, 6, 5, 4, 3, 2), number)) % 11 % 10 == int(number[8])
+
+
+def _ro(number):
+    if number[0] == '0':
+        return False
+    digits = number[:-1].zfill(9)
+    return 10 * _weighted_sum((7, 5, 3, 2, 1, 7, 5, 3, 2), digits) % 11 % 10 == int(number[-1])
+
+
+def _se(number):
+    # The organisation number followed by 01.
+    return _luhn_checksum(number[:10]) == 0
+
+
+def _si(number):
+    if number[0] == '0':
+        return False
+    check = 11 - sum((8 - i) * int(digit) for i, digit in enumerate(number[:7])) % 11
+    return str(0 if check == 10 else check) == number[7]
+
+
+def _sk(number):
+    if _cz_birth_number_is_valid(number):
+        return True
+    return number[0] != '0' and number[2] in '234789' and int(number) % 11 == 0
+
+
+VATIN_CHECKS = {
+    'AT': _at,
+    'BE': _be,
+    'BG': _bg,
+    'CY': _cy,
+    'CZ': _cz,
+    'DE': _de,
+    'DK': _dk,
+    'EE': _ee,
+    'EL': _el,
+    'ES': _es,
+    'FI': _fi,
+    'FR': _fr,
+    'GB': _gb,
+    'HR': _hr,
+    'HU': _hu,
+    'IE': _ie,
+    'IT': _it,
+    'LT': _lt,
+    'LU': _lu,
+    'LV': _lv,
+    'MT': _mt,
+    'NL': _nl,
+    'PL': _pl,
+    'PT': _pt,
+    'RO': _ro,
+    'SE': _se,
+    'SI': _si,
+    'SK': _sk,
+    'XI': _gb,
+}
+"""Map of country codes to the check digit algorithm of the VAT identification numbers of that country."""
+
+
+def vatin_check_digits_are_valid(country_code, number):
+    """
+    Checks the check digits of a VAT identification number without its country prefix.
+
+    The number must match the format of the country. Countries without a known algorithm are considered valid.
+    """
+    check = VATIN_CHECKS.get(country_code)
+    return check is None or check(number)
@@ -0,0 +1,330 @@
+"""
+Online verification of VAT identification numbers with the VAT Information Exchange System (VIES).
+
+:class:`~localflavor.generic.validators.VATINValidator` only checks the format and check digits of a number. The
+client in this module asks the VIES service of the European Commission whether a number is actually registered.
+
+The client keeps persistent connections to the service, caches answers for a configurable time and sends a single
+request when the same number is checked by several threads or coroutines at the same time.
+
+Example:
+
+.. code-block:: python
+
+    from django.core.cache import caches
+    from localflavor.generic.vies import VIESClient, VIESValidator
+
+    client = VIESClient(cache=caches['default'], cache_timeout=24 * 60 * 60)
+    client.check('DE284754038').valid
+
+    # In an async view.
+    result = await client.acheck('DE284754038')
+    result = await VIESValidator(client).acheck('DE284754038')
+
+    # As a model or form field validator.
+    vatin = forms.CharField(validators=[VIESValidator(client)])
+
+.. versionadded:: 5.1
+"""
+import asyncio
+import http.client
+import json
+import queue
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+from django.utils.deconstruct import deconstructible
+from django.utils.translation import gettext_lazy as _
+
+from localflavor.results import CheckMixin, CheckResult
+
+from .validators import VATINValidator
+
+#: URL of the REST API of the VIES service.
+VIES_URL = 'https://ec.europa.eu/taxation_customs/vies/rest-api'
+
+VIESResult = namedtuple('VIESResult', 'vatin valid name address request_date')
+VIESResult.__doc__ = 'The answer of the VIES service for a VAT identification number.'
+
+
+class VIESError(Exception):
+    """Raised when the VIES service can't answer, for example because the service of a member state is down."""
+
+
+def normalize_vatin(value):
+    """Strips separators from a VAT identification number and converts it to upper case."""
+    return value.upper().replace(' ', '').replace('-', '').replace('.', '')
+
+
+class TTLCache:
+    """
+    A small thread-safe in-memory cache with expiring entries.
+
+    It implements the ``get()`` and ``set()`` methods of the Django cache API that :class:`VIESClient` uses, so any
+    Django cache can be used in its place.
+    """
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[0] < time.monotonic():
+                del self._data[key]
+                return default
+            return entry[1]
+
+    def set(self, key, value, timeout=None):
+        with self._lock:
+            if len(self._data) >= self.max_entries:
+                # Drop expired entries first and the oldest ones if that isn't enough.
+                now = time.monotonic()
+                for old_key in [k for k, (expires, _value) in self._data.items() if expires < now]:
+                    del self._data[old_key]
+                while len(self._data) >= self.max_entries:
+                    del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + (timeout if timeout is not None else 300), value)
+
+
+# The errors of sending a request on a persistent connection that the server has closed in the meantime.
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+
+class _ConnectionPool:
+    """
+    A pool of persistent HTTP connections to a single host.
+
+    Requests that fail because the server closed an idle connection are sent again once on a new connection.
+    """
+
+    def __init__(self, url, max_connections, timeout):
+        parts = urlsplit(url)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.host = parts.netloc
+        self.path = parts.path.rstrip('/')
+        self.timeout = timeout
+        self._idle = queue.LifoQueue(maxsize=max_connections)
+
+    def _send(self, connection, method, path, body, headers):
+        try:
+            connection.request(method, self.path + path, body=body, headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+        except Exception:
+            connection.close()
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            try:
+                self._idle.put_nowait(connection)
+            except queue.Full:
+                connection.close()
+        return response.status, data
+
+    def request(self, method, path, body, headers):
+        try:
+            connection = self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            try:
+                return self._send(connection, method, path, body, headers)
+            except _STALE_CONNECTION_ERRORS:
+                # The server closed the idle connection, send the request again on a new one.
+                pass
+        return self._send(self.connection_class(self.host, timeout=self.timeout), method, path, body, headers)
+
+    def close(self):
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+class _Pending:
+    """A lookup that is in progress, which other threads that check the same number wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception = None
+
+
+class VIESClient:
+    """
+    A client for the VIES service.
+
+    ``cache`` is any object with the ``get()`` and ``set()`` methods of the Django cache API, such as
+    ``django.core.cache.caches['default']``. An in-memory :class:`TTLCache` is used by default. Only definitive
+    answers are cached, errors of the service are not.
+    """
+
+    cache_key_prefix = 'localflavor.vies.'
+
+    def __init__(self, url=VIES_URL, cache=None, cache_timeout=24 * 60 * 60, timeout=10, max_connections=4):
+        self.url = url
+        self.cache = cache if cache is not None else TTLCache()
+        self.cache_timeout = cache_timeout
+        self._pool = _ConnectionPool(url, max_connections, timeout)
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._async_pending = {}
+
+    def close(self):
+        """Closes the idle connections to the service."""
+        self._pool.close()
+
+    def _fetch(self, vatin):
+        """Asks the service about a normalized VAT identification number."""
+        body = json.dumps({'countryCode': vatin[:2], 'vatNumber': vatin[2:]})
+        try:
+            status, data = self._pool.request('POST', '/check-vat-number', body,
+                                              {'Content-Type': 'application/json', 'Accept': 'application/json'})
+        except (OSError, http.client.HTTPException) as e:
+            raise VIESError('The VIES service could not be reached: %s' % e) from e
+        try:
+            payload = json.loads(data.decode('utf-8'))
+        except ValueError:
+            payload = {}
+        if status != 200 or 'valid' not in payload:
+            # Errors like MS_UNAVAILABLE are reported in actionSucceed/errorWrappers by the REST API.
+            errors = [wrapper.get('error') for wrapper in payload.get('errorWrappers') or ()]
+            raise VIESError('The VIES service returned an error: %s' % (', '.join(filter(None, errors)) or status))
+        # Member states that don't disclose the name or address return '---'.
+        name, address = (None if payload.get(field) in (None, '', '---') else payload[field]
+                         for field in ('name', 'address'))
+        return VIESResult(vatin, bool(payload['valid']), name, address, payload.get('requestDate'))
+
+    def _fetch_and_cache(self, vatin):
+        result = self._fetch(vatin)
+        self.cache.set(self.cache_key_prefix + vatin, tuple(result), self.cache_timeout)
+        return result
+
+    def _cached(self, vatin):
+        cached = self.cache.get(self.cache_key_prefix + vatin)
+        return VIESResult(*cached) if cached is not None else None
+
+    def check(self, value):
+        """Returns the :class:`VIESResult` for a VAT identification number or raises :class:`VIESError`."""
+        vatin = normalize_vatin(value)
+        result = self._cached(vatin)
+        if result is not None:
+            return result
+
+        with self._pending_lock:
+            pending = self._pending.get(vatin)
+            owner = pending is None
+            if owner:
+                pending = self._pending[vatin] = _Pending()
+
+        if not owner:
+            pending.done.wait()
+            if pending.exception is not None:
+                raise pending.exception
+            return pending.result
+
+        try:
+            pending.result = self._fetch_and_cache(vatin)
+            return pending.result
+        except VIESError as e:
+            pending.exception = e
+            raise
+        finally:
+            with self._pending_lock:
+                del self._pending[vatin]
+            pending.done.set()
+
+    async def acheck(self, value):
+        """
+        Returns the :class:`VIESResult` for a VAT identification number or raises :class:`VIESError`.
+
+        The request itself is sent from a worker thread so it doesn't block the event loop.
+        """
+        vatin = normalize_vatin(value)
+        result = self._cached(vatin)
+        if result is not None:
+            return result
+
+        loop = asyncio.get_running_loop()
+        key = (loop, vatin)
+        future = self._async_pending.get(key)
+        if future is None:
+            future = self._async_pending[key] = loop.run_in_executor(None, self.check, vatin)
+            future.add_done_callback(lambda _future: self._async_pending.pop(key, None))
+        # Shield the shared lookup so cancelling one waiter doesn't cancel it for the others.
+        return await asyncio.shield(future)
+
+    async def acheck_many(self, values):
+        """Checks several VAT identification numbers concurrently and returns their results in order."""
+        return await asyncio.gather(*(self.acheck(value) for value in values))
+
+
+_default_client = None
+
+
+def get_default_client():
+    """Returns a process wide :class:`VIESClient` with the default settings."""
+    global _default_client
+    if _default_client is None:
+        _default_client = VIESClient()
+    return _default_client
+
+
+@deconstructible
+class VIESValidator(CheckMixin):
+    """
+    Validates that a VAT identification number is registered in VIES.
+
+    The format and check digits are validated with :class:`~localflavor.generic.validators.VATINValidator` before
+    the service is asked.
+    """
+
+    messages = {
+        'not_registered': _('%(vatin)s is not a registered VAT identification number.'),
+        'unavailable': _('The VAT identification number could not be verified, please try again later.'),
+    }
+    io_bound = True
+
+    def __init__(self, client=None):
+        self.client = client
+
+    def __eq__(self, other):
+        return isinstance(other, VIESValidator) and self.client is other.client
+
+    def _result(self, value, vies_result):
+        if vies_result is None:
+            return CheckResult.invalid(value, 'unavailable', self.messages['unavailable'])
+        if not vies_result.valid:
+            return CheckResult.invalid(value, 'not_registered', self.messages['not_registered'], {'vatin': value})
+        return CheckResult.valid(value)
+
+    def check(self, value):
+        result = VATINValidator().check(value)
+        if not result:
+            return result
+        client = self.client or get_default_client()
+        try:
+            vies_result = client.check(value)
+        except VIESError:
+            vies_result = None
+        return self._result(value, vies_result)
+
+    async def acheck(self, value):
+        result = VATINValidator().check(value)
+        if not result:
+            return result
+        client = self.client or get_default_client()
+        try:
+            vies_result = await client.acheck(value)
+        except VIESError:
+            vies_result = None
+        return self._result(value, vies_result)
@@ -7,8 +7,10 @@ from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 from stdnum import luhn
 
+from localflavor.results import CheckFieldMixin, CheckResult
 
-class GRPostalCodeField(RegexField):
+
+class GRPostalCodeField(CheckFieldMixin, RegexField):
     """
     Greek Postal code field.
 
@@ -23,7 +25,7 @@ class GRPostalCodeField(RegexField):
         super().__init__(r'^[12345678]\d{4}$', **kwargs)
 
 
-class GRTaxNumberCodeField(CharField):
+class GRTaxNumberCodeField(CheckFieldMixin, CharField):
     """
     Greek tax number field.
 
@@ -39,18 +41,14 @@ class GRTaxNumberCodeField(CharField):
         self.allow_test_value = allow_test_value
         super().__init__(**kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         val = re.sub(r'[\-\s\(\)]', '', value)
         if len(val) < 9:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if not all(char.isdigit() for char in val):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if not self.allow_test_value and val == '000000000':
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         digits = list(map(int, val))
         digits1 = digits[:-1]
         digits1.reverse()
@@ -59,11 +57,11 @@ class GRTaxNumberCodeField(CharField):
         if mod == 10:
             mod = 0
         if mod != check:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return val
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(val)
 
 
-class GRSocialSecurityNumberCodeField(RegexField):
+class GRSocialSecurityNumberCodeField(CheckFieldMixin, RegexField):
     """
     Greek social security number (AMKA) field.
 
@@ -85,20 +83,20 @@ class GRSocialSecurityNumberCodeField(RegexField):
         except ValueError:
             raise ValidationError(self.error_messages['invalid'], code='invalid')
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         val = re.sub(r'[\-\s]', '', force_str(value))
         if not val or len(val) < 11:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if self.allow_test_value and val == '00000000000':
-            return val
+            return CheckResult.valid(val)
         if not all(char.isdigit() for char in val):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        self.check_date(val)
+        try:
+            self.check_date(val)
+        except ValidationError as e:
+            return CheckResult.from_error(value, e)
         if not luhn.is_valid(val):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return val
+        return CheckResult.valid(val)
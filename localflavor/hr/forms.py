@@ -3,11 +3,12 @@ import datetime
 import re
 
 from django.core.exceptions import ImproperlyConfigured
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 from stdnum import luhn
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .hr_choices import HR_COUNTY_CHOICES, HR_LICENSE_PLATE_PREFIX_CHOICES
 
 jmbg_re = re.compile(r'^(?P<dd>\d{2})(?P<mm>\d{2})(?P<yyy>\d{3})' +
@@ -34,7 +35,7 @@ class HRLicensePlatePrefixSelect(Select):
         super().__init__(attrs, choices=HR_LICENSE_PLATE_PREFIX_CHOICES)
 
 
-class HRJMBGField(CharField):
+class HRJMBGField(CheckFieldMixin, CharField):
     """
     Unique Master Citizen Number (JMBG) field.
 
@@ -55,14 +56,10 @@ class HRJMBGField(CharField):
         'date': _('Error in date segment'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         matches = jmbg_re.search(value)
         if matches is None:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # Make sure the date part is correct.
         dd = int(matches.group('dd'))
@@ -71,7 +68,7 @@ class HRJMBGField(CharField):
         try:
             datetime.date(yyy, mm, dd)
         except ValueError:
-            raise ValidationError(self.error_messages['date'], code='date')
+            return self.invalid(value, 'date')
 
         # Validate checksum.
         k = matches.group('k')
@@ -80,16 +77,16 @@ class HRJMBGField(CharField):
             checksum += i * (int(value[j]) + int(value[13 - i]))
         m = 11 - checksum % 11
         if m == 10:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if m == 11 and k != '0':
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if not str(m) == k:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return '%s' % (value, )
+        return CheckResult.valid('%s' % (value, ))
 
 
-class HROIBField(RegexField):
+class HROIBField(CheckFieldMixin, RegexField):
     """
     Personal Identification Number of Croatia (OIB) field.
 
@@ -106,15 +103,11 @@ class HROIBField(RegexField):
             **kwargs
         )
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
-        return '%s' % (value, )
+    def check_value(self, value):
+        return CheckResult.valid('%s' % (value, ))
 
 
-class HRLicensePlateField(CharField):
+class HRLicensePlateField(CheckFieldMixin, CharField):
     """
     Vehicle license plate of Croatia field.
 
@@ -136,31 +129,27 @@ class HRLicensePlateField(CharField):
         'number': _('Number part cannot be zero'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         value = re.sub(r'[\s\-]+', '', value).upper()
 
         matches = plate_re.search(value)
         if matches is None:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # Make sure the prefix is in the list of known codes.
         prefix = matches.group('prefix')
         if prefix not in [choice[0] for choice in HR_LICENSE_PLATE_PREFIX_CHOICES]:
-            raise ValidationError(self.error_messages['area'], code='area')
+            return self.invalid(value, 'area')
 
         # Make sure the number portion is not zero.
         number = matches.group('number')
         if int(number) == 0:
-            raise ValidationError(self.error_messages['number'], code='number')
+            return self.invalid(value, 'number')
 
-        return '%s %s-%s' % (prefix, number, matches.group('suffix'))
+        return CheckResult.valid('%s %s-%s' % (prefix, number, matches.group('suffix')))
 
 
-class HRPostalCodeField(CharField):
+class HRPostalCodeField(CheckFieldMixin, CharField):
     """
     Postal code of Croatia field.
 
@@ -173,22 +162,18 @@ class HRPostalCodeField(CharField):
         'invalid': _('Enter a valid 5 digit postal code'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         if not postal_code_re.search(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # Make sure the number is in valid range.
         if not 9999 < int(value) < 60000:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return '%s' % value
+        return CheckResult.valid('%s' % value)
 
 
-class HRJMBAGField(CharField):
+class HRJMBAGField(CheckFieldMixin, CharField):
     """
     Unique Master Academic Citizen Number of Croatia (JMBAG) field.
 
@@ -202,23 +187,19 @@ class HRJMBAGField(CharField):
         'copy': _('Card issue number cannot be zero'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         value = re.sub(r'[\-\s]', '', value)
 
         matches = jmbag_re.search(value)
         if matches is None:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # Make sure the issue number is not zero.
         if matches.group('copy') == '0':
-            raise ValidationError(self.error_messages['copy'], code='copy')
+            return self.invalid(value, 'copy')
 
         # Validate checksum using Luhn algorithm.
         if not luhn.is_valid(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return '%s' % value
+        return CheckResult.valid('%s' % value)
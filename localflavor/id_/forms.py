@@ -8,6 +8,8 @@ from django.forms import ValidationError
 from django.forms.fields import CharField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 postcode_re = re.compile(r'^[1-9]\d{4}$')
 plate_re = re.compile(r'^(?P<prefix>[A-Z]{1,2}) ' +
                       r'(?P<number>\d{1,5})( (?P<suffix>([A-Z]{1,3}|[1-9][0-9]{,2})))?$')
@@ -16,7 +18,7 @@ nik_re = re.compile(r'^\d{16}$')
 WOMAN_IDENTIFIER = 40
 
 
-class IDPostCodeField(CharField):
+class IDPostCodeField(CheckFieldMixin, CharField):
     """
     An Indonesian post code field.
 
@@ -27,22 +29,18 @@ class IDPostCodeField(CharField):
         'invalid': _('Enter a valid post code'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         if not postcode_re.search(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         if int(value) < 10110:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # 1xxx0
         if value[0] == '1' and value[4] != '0':
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return '%s' % (value,)
+        return CheckResult.valid('%s' % (value,))
 
 
 class IDProvinceSelect(Select):
@@ -67,7 +65,7 @@ class IDLicensePlatePrefixSelect(Select):
         super().__init__(attrs, choices=LICENSE_PLATE_PREFIX_CHOICES)
 
 
-class IDLicensePlateField(CharField):
+class IDLicensePlateField(CheckFieldMixin, CharField):
     """
     An Indonesian vehicle license plate field.
 
@@ -81,26 +79,25 @@ class IDLicensePlateField(CharField):
     }
     foreign_vehicles_prefixes = ('CD', 'CC')
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         plate_number = re.sub(r'\s+', ' ', value).upper()
 
-        number, prefix, suffix = self._validate_regex_match(plate_number)
-        self._validate_prefix(prefix)
-        self._validate_jakarta(prefix, suffix)
-        self._validate_ri(prefix, suffix)
-        self._validate_number(number)
-
-        # CD, CC and B 12345 12
-        if len(number) == 5 or prefix in self.foreign_vehicles_prefixes:
-            self._validate_numeric_suffix(suffix)
-            self._validate_known_codes_range(number, prefix, suffix)
-        else:
-            self._validate_non_numeric_suffix(suffix)
-        return plate_number
+        try:
+            number, prefix, suffix = self._validate_regex_match(plate_number)
+            self._validate_prefix(prefix)
+            self._validate_jakarta(prefix, suffix)
+            self._validate_ri(prefix, suffix)
+            self._validate_number(number)
+
+            # CD, CC and B 12345 12
+            if len(number) == 5 or prefix in self.foreign_vehicles_prefixes:
+                self._validate_numeric_suffix(suffix)
+                self._validate_known_codes_range(number, prefix, suffix)
+            else:
+                self._validate_non_numeric_suffix(suffix)
+        except ValidationError as e:
+            return CheckResult.from_error(value, e)
+        return CheckResult.valid(plate_number)
 
     def _validate_regex_match(self, plate_number):
         matches = plate_re.search(plate_number)
@@ -152,7 +149,7 @@ class IDLicensePlateField(CharField):
             raise ValidationError(self.error_messages['invalid'], code='invalid')
 
 
-class IDNationalIdentityNumberField(CharField):
+class IDNationalIdentityNumberField(CheckFieldMixin, CharField):
     """
     An Indonesian national identity number (NIK/KTP#) field.
 
@@ -166,18 +163,14 @@ class IDNationalIdentityNumberField(CharField):
         'invalid': _('Enter a valid NIK/KTP number'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         # This replacement effectively means the value is always stripped.
         value = re.sub(r'[\s.]', '', value)
         if not nik_re.search(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         if int(value) == 0:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         year = int(value[10:12])
         month = int(value[8:10])
@@ -189,14 +182,14 @@ class IDNationalIdentityNumberField(CharField):
         current_year = time.localtime().tm_year
         if year < int(str(current_year)[-2:]):
             if not IDNationalIdentityNumberField._valid_nik_date(2000 + int(year), month, day):
-                raise ValidationError(self.error_messages['invalid'], code='invalid')
+                return self.invalid(value, 'invalid')
         elif not IDNationalIdentityNumberField._valid_nik_date(1900 + int(year), month, day):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         if value[:6] == '000000' or value[12:] == '0000':
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return '%s.%s.%s.%s' % (value[:2], value[2:6], value[6:12], value[12:])
+        return CheckResult.valid('%s.%s.%s.%s' % (value[:2], value[2:6], value[6:12], value[12:]))
 
     @staticmethod
     def _valid_nik_date(year, month, day):
@@ -3,6 +3,8 @@
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .ie_counties import IE_COUNTY_CHOICES
 
 
@@ -13,7 +15,7 @@ class IECountySelect(Select):
         super().__init__(attrs, choices=IE_COUNTY_CHOICES)
 
 
-class EircodeField(RegexField):
+class EircodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input is a valid Eircode (Irish postcode).
 
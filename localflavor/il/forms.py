@@ -1,15 +1,17 @@
 """Israeli-specific form helpers."""
 import re
 
-from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.exceptions import ImproperlyConfigured
 from django.forms.fields import CharField, RegexField
 from django.utils.translation import gettext_lazy as _
 from stdnum import luhn
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 id_number_re = re.compile(r'^(?P<number>\d{1,8})-?(?P<check>\d)$')
 
 
-class ILPostalCodeField(RegexField):
+class ILPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input as an Israeli postal code.
 
@@ -23,13 +25,13 @@ class ILPostalCodeField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^\d{5}$|^\d{7}$', **kwargs)
 
-    def clean(self, value):
+    def check(self, value):
         if value not in self.empty_values:
             value = value.replace(' ', '')
-        return super().clean(value)
+        return super().check(value)
 
 
-class ILIDNumberField(CharField):
+class ILIDNumberField(CheckFieldMixin, CharField):
     """
     A form field that validates its input as an Israeli identification number.
 
@@ -51,17 +53,12 @@ class ILIDNumberField(CharField):
         'invalid': _('Enter a valid ID number.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = id_number_re.match(value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         value = match.group('number') + match.group('check')
         if not luhn.is_valid(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return value
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(value)
@@ -3,16 +3,17 @@
 import re
 
 from django.core.exceptions import ImproperlyConfigured
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .in_states import STATE_CHOICES, STATES_NORMALIZED
 
 aadhaar_re = re.compile(r"^(?P<part1>\d{4})[-\ ]?(?P<part2>\d{4})[-\ ]?(?P<part3>\d{4})$")
 
 
-class INZipCodeField(RegexField):
+class INZipCodeField(CheckFieldMixin, RegexField):
     """A form field that validates input as an Indian zip code, with the format XXXXXXX."""
 
     default_error_messages = {
@@ -22,16 +23,13 @@ class INZipCodeField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^\d{3}\s?\d{3}$', **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         # Convert to "NNNNNN" if "NNN NNN" given
         value = re.sub(r'^(\d{3})\s(\d{3})$', r'\1\2', value)
-        return value
+        return CheckResult.valid(value)
 
 
-class INStateField(CharField):
+class INStateField(CheckFieldMixin, CharField):
     """
     A form field that validates its input is a Indian state name or abbreviation.
 
@@ -49,20 +47,16 @@ class INStateField(CharField):
         'invalid': _('Enter an Indian state or territory.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         value = value.lower()
         try:
-            return STATES_NORMALIZED[value.lower()]
+            return CheckResult.valid(STATES_NORMALIZED[value.lower()])
         except KeyError:
             pass
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+        return self.invalid(value, 'invalid')
 
 
-class INAadhaarNumberField(CharField):
+class INAadhaarNumberField(CheckFieldMixin, CharField):
     """
     A form field for Aadhaar number issued by Unique Identification Authority of India (UIDAI).
 
@@ -87,21 +81,17 @@ class INAadhaarNumberField(CharField):
                      'XXXX-XXXX-XXXX format.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = re.match(aadhaar_re, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         part1, part2, part3 = match.groupdict()['part1'], match.groupdict()['part2'], match.groupdict()['part3']
 
         # all the parts can't be zero
         if part1 == '0000' and part2 == '0000' and part3 == '0000':
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return '%s %s %s' % (part1, part2, part3)
+        return CheckResult.valid('%s %s %s' % (part1, part2, part3))
 
 
 class INStateSelect(Select):
@@ -123,7 +113,7 @@ class INStateSelect(Select):
         super().__init__(attrs, choices=STATE_CHOICES)
 
 
-class INPANCardNumberFormField(RegexField):
+class INPANCardNumberFormField(CheckFieldMixin, RegexField):
     """
     A form field that accepts Indian Permanent account number(PAN) Card Number.
 
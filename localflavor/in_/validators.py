@@ -1,8 +1,10 @@
 from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import RegexCheckMixin
 
-class INPANCardNumberValidator(RegexValidator):
+
+class INPANCardNumberValidator(RegexCheckMixin, RegexValidator):
     """
     A validator for Indian Permanent Account Number(PAN) Card field.
     """
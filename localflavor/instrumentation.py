@@ -0,0 +1,230 @@
+"""
+Measuring how often the validators run, how long they take and why they fail.
+
+With the ``LOCALFLAVOR_INSTRUMENTATION`` setting, the form fields, model fields and validators of every flavor and of
+:mod:`localflavor.generic` report every call of their ``clean()``, ``__call__()`` and ``check()`` methods to a backend,
+with the duration of the call and the error code of invalid values:
+
+.. code-block:: python
+
+    LOCALFLAVOR_INSTRUMENTATION = 'localflavor.instrumentation.PrometheusBackend'
+
+:class:`PrometheusBackend` exports the calls as Prometheus metrics with ``prometheus_client``, which is installed with
+the ``prometheus`` extra, and :class:`InMemoryBackend` keeps them in memory for tests. Other backends implement
+:meth:`Backend.record`.
+
+The methods are only wrapped when the setting is set, so there is no overhead at all without it. With it, every flavor
+is imported when Django starts. The calls are reported for the class of the instance, like
+``'localflavor.br.forms.BRCPFField'``, and include the time of the calls they make to other instrumented classes, like
+the validators of a form field, which are reported as well. Calls of an instance to its own methods, like
+``__call__()`` calling ``check()``, are reported once.
+
+.. versionadded:: 5.1
+"""
+import contextvars
+import functools
+import importlib
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from localflavor import registry
+from localflavor.results import CheckResult
+
+try:
+    import prometheus_client
+except ImportError:  # pragma: no cover
+    prometheus_client = None
+
+#: The methods that are instrumented for each role of :data:`localflavor.registry.ROLES`.
+METHODS = {
+    'form_field': ('clean', 'check'),
+    'model_field': ('clean',),
+    'validator': ('__call__', 'check'),
+}
+
+
+class Backend:
+    """The base class of the backends that receive the calls of the instrumented methods."""
+
+    def record(self, validator, duration, code):
+        """
+        Records a call of ``validator``, the dotted path of a class, that took ``duration`` seconds.
+
+        ``code`` is the error code of an invalid value and ``None`` for a valid one.
+        """
+        raise NotImplementedError('subclasses of Backend must provide a record() method')
+
+
+class InMemoryBackend(Backend):
+    """
+    A backend that keeps the calls in memory, for tests.
+
+    :attr:`calls` counts the calls of every validator, :attr:`failures` the calls of every validator and error code
+    that failed and :attr:`durations` has the list of durations of every validator.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.calls = Counter()
+        self.failures = Counter()
+        self.durations = defaultdict(list)
+
+    def record(self, validator, duration, code):
+        self.calls[validator] += 1
+        self.durations[validator].append(duration)
+        if code is not None:
+            self.failures[validator, code] += 1
+
+
+class PrometheusBackend(Backend):
+    """
+    A backend that exports the calls as Prometheus metrics in ``registry``, the default registry of
+    ``prometheus_client`` if it's not given.
+
+    The metrics are the ``localflavor_validator_calls_total`` and ``localflavor_validator_failures_total`` counters and
+    the ``localflavor_validator_duration_seconds`` histogram, labeled with the ``validator`` and the ``code`` of the
+    failures. They are exposed like any other metrics of the registry, for example with
+    ``prometheus_client.start_http_server()``.
+    """
+
+    #: The buckets of the histogram in seconds, most validators take a few microseconds.
+    buckets = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.1, 1.0)
+
+    # The metrics of every registry, since they can only be registered once.
+    _metrics = {}
+
+    def __init__(self, registry=None):
+        if prometheus_client is None:
+            raise ImproperlyConfigured('PrometheusBackend requires prometheus_client, install django-localflavor with '
+                                       'the prometheus extra.')
+        registry = registry or prometheus_client.REGISTRY
+        if registry not in self._metrics:
+            self._metrics[registry] = (
+                prometheus_client.Counter('localflavor_validator_calls', 'Calls of localflavor validators.',
+                                          ['validator'], registry=registry),
+                prometheus_client.Counter('localflavor_validator_failures',
+                                          'Calls of localflavor validators with invalid values.',
+                                          ['validator', 'code'], registry=registry),
+                prometheus_client.Histogram('localflavor_validator_duration_seconds',
+                                            'Duration of the calls of localflavor validators.',
+                                            ['validator'], buckets=self.buckets, registry=registry),
+            )
+        self.calls, self.failures, self.durations = self._metrics[registry]
+
+    def record(self, validator, duration, code):
+        self.calls.labels(validator).inc()
+        self.durations.labels(validator).observe(duration)
+        if code is not None:
+            self.failures.labels(validator, code).inc()
+
+
+#: The backend the calls are reported to, ``None`` when the methods aren't instrumented.
+backend = None
+
+# The original attributes of the instrumented classes, None for inherited ones.
+_originals = {}
+# The instance whose call is being reported, so calls to its own methods aren't reported again.
+_reporting = contextvars.ContextVar('localflavor_instrumentation_reporting', default=None)
+
+
+def _label(cls):
+    return '%s.%s' % (cls.__module__, cls.__qualname__)
+
+
+def _error_code(error):
+    if hasattr(error, 'error_dict'):
+        error = next(iter(error.error_dict.values()))[0]
+    return error.error_list[0].code or 'invalid'
+
+
+def _instrument(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _reporting.get() is self:
+            return method(self, *args, **kwargs)
+        token = _reporting.set(self)
+        start = time.perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        except ValidationError as error:
+            backend.record(_label(type(self)), time.perf_counter() - start, _error_code(error))
+            raise
+        finally:
+            _reporting.reset(token)
+        code = None
+        if isinstance(result, CheckResult) and not result.ok:
+            code = result.code or 'invalid'
+        backend.record(_label(type(self)), time.perf_counter() - start, code)
+        return result
+
+    return wrapper
+
+
+def _classes():
+    """Yields the instrumented classes with their role."""
+    for country in registry.countries():
+        for entry in registry.entries(country):
+            for role in METHODS:
+                cls = getattr(entry, role)
+                if cls is not None:
+                    yield cls, role
+    for module_name in ('forms', 'models', 'validators'):
+        module = importlib.import_module('localflavor.generic.%s' % module_name)
+        for cls in vars(module).values():
+            if isinstance(cls, type) and cls.__module__ == module.__name__:
+                role = registry._role(cls)
+                if role is not None:
+                    yield cls, role
+
+
+def install(new_backend):
+    """Reports the calls of the methods of every flavor to ``new_backend``, instead of the current backend if any."""
+    global backend
+    if backend is None:
+        # Look up every method before wrapping any, so the methods that are inherited from another instrumented
+        # class aren't wrapped twice.
+        methods = {
+            (cls, name): getattr(cls, name)
+            for cls, role in _classes()
+            for name in METHODS[role]
+            if hasattr(cls, name)
+        }
+        for (cls, name), method in methods.items():
+            _originals[cls, name] = cls.__dict__.get(name)
+            setattr(cls, name, _instrument(method))
+    backend = new_backend
+
+
+def uninstall():
+    """Restores the methods of every flavor."""
+    global backend
+    for (cls, name), original in _originals.items():
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+    _originals.clear()
+    backend = None
+
+
+def configure():
+    """Installs the backend of the ``LOCALFLAVOR_INSTRUMENTATION`` setting, or uninstalls it if it's not set."""
+    path = getattr(settings, 'LOCALFLAVOR_INSTRUMENTATION', None)
+    if path:
+        install(import_string(path)())
+    elif backend is not None:
+        uninstall()
+
+
+@receiver(setting_changed)
+def _setting_changed(setting, **kwargs):
+    if setting == 'LOCALFLAVOR_INSTRUMENTATION':
+        configure()
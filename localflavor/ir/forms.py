@@ -1,10 +1,12 @@
 """Iranian-specific form helpers."""
 import re
 
-from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.exceptions import ImproperlyConfigured
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .ir_provinces import PROVINCE_CHOICES
 
 
@@ -19,7 +21,7 @@ class IRProvinceSelect(Select):
         super().__init__(attrs, choices=PROVINCE_CHOICES)
 
 
-class IRPostalCodeField(RegexField):
+class IRPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input as an Iran postal code.
 
@@ -42,13 +44,13 @@ class IRPostalCodeField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'\b(?!(\d)\1{3})[13-9]{4}[1346-9][013-9]{5}\b$', **kwargs)
 
-    def clean(self, value):
+    def check(self, value):
         if value not in self.empty_values:
             value = value.replace(' ', '')
-        return super().clean(value)
+        return super().check(value)
 
 
-class IRIDNumberField(CharField):
+class IRIDNumberField(CheckFieldMixin, CharField):
     """
     A form field that validates its input as an Iranian identification number.
 
@@ -68,20 +70,15 @@ class IRIDNumberField(CharField):
         'invalid': _('Enter a valid ID number.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = self.id_number_re.match(value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         check = int(value[9])
         s = sum([int(value[x]) * (10 - x) for x in range(9)]) % 11
 
         if (2 > s == check) or (s >= 2 and check + s == 11):
-            return value
+            return CheckResult.valid(value)
         else:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
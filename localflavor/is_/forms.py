@@ -1,14 +1,15 @@
 """Iceland specific form helpers."""
-from django.forms import ValidationError
 from django.forms.fields import RegexField
 from django.forms.widgets import Select
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .is_postalcodes import IS_POSTALCODES
 
 
-class ISIdNumberField(RegexField):
+class ISIdNumberField(CheckFieldMixin, RegexField):
     """
     Icelandic identification number (kennitala).
 
@@ -26,17 +27,12 @@ class ISIdNumberField(RegexField):
             **kwargs
         )
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         value = self._canonify(value)
         if self._validate(value):
-            return self._format(value)
+            return CheckResult.valid(self._format(value))
         else:
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
+            return self.invalid(value, 'checksum')
 
     def _canonify(self, value):
         """Returns the value as only digits."""
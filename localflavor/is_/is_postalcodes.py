@@ -1,7 +1,9 @@
+from localflavor.choices import PostalCodeDirectory
+
 #: A list of Icelandic postal codes
 # Data compiled from official database of postal codes by Postur.is, available at
 # https://www.postur.is/en/about-us/post-offices/post-codes/data-files/
-IS_POSTALCODES = (
+IS_POSTALCODES = PostalCodeDirectory((
     ('101', '101 Reykjavík'),
     ('102', '102 Reykjavík'),
     ('103', '103 Reykjavík'),
@@ -195,4 +197,4 @@ IS_POSTALCODES = (
     ('881', '881 Kirkjubæjarklaustri'),
     ('900', '900 Vestmannaeyjum'),
     ('902', '902 Vestmannaeyjum'),
-)
+), translate=False)
@@ -1,16 +1,17 @@
 """IT-specific Form helpers."""
 import re
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .it_province import PROVINCE_CHOICES
 from .it_region import REGION_CHOICES, REGION_PROVINCE_CHOICES
 from .util import ssn_validation, vat_number_validation
 
 
-class ITZipCodeField(RegexField):
+class ITZipCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as an Italian zip code.
 
@@ -46,7 +47,7 @@ class ITProvinceSelect(Select):
         super().__init__(attrs, choices=PROVINCE_CHOICES)
 
 
-class ITSocialSecurityNumberField(RegexField):
+class ITSocialSecurityNumberField(CheckFieldMixin, RegexField):
     """
     A form field that validates Italian Tax code (codice fiscale) for both persons and entities.
 
@@ -70,37 +71,31 @@ class ITSocialSecurityNumberField(RegexField):
             r'^\w{3}\s*\w{3}\s*\w{5}\s*\w{5}$|\d{10}', **kwargs
         )
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         value = re.sub(r'\s', '', value).upper()
         # Entities SSN are numeric-only
         if value.isdigit():
             try:
-                return vat_number_validation(value)
+                return CheckResult.valid(vat_number_validation(value))
             except ValueError:
-                raise ValidationError(self.error_messages['invalid'], code='invalid')
+                return self.invalid(value, 'invalid')
         # Person SSN
         else:
             try:
-                return ssn_validation(value)
+                return CheckResult.valid(ssn_validation(value))
             except (ValueError, IndexError):
-                raise ValidationError(self.error_messages['invalid'], code='invalid')
+                return self.invalid(value, 'invalid')
 
 
-class ITVatNumberField(CharField):
+class ITVatNumberField(CheckFieldMixin, CharField):
     """A form field that validates Italian VAT numbers (partita IVA)."""
 
     default_error_messages = {
         'invalid': _('Enter a valid VAT number.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         try:
-            return vat_number_validation(value)
+            return CheckResult.valid(vat_number_validation(value))
         except ValueError:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
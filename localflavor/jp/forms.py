@@ -3,10 +3,13 @@
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+from localflavor.widgets import CachedOptionsMixin
+
 from .jp_prefectures import JP_PREFECTURE_CODES, JP_PREFECTURES
 
 
-class JPPostalCodeField(RegexField):
+class JPPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input is a Japanese postcode.
 
@@ -20,24 +23,21 @@ class JPPostalCodeField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^\d{3}-\d{4}$|^\d{7}$', **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """
         Validates the input and returns a string that contains only numbers.
         """
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-        return value.replace('-', '')
+        return CheckResult.valid(value.replace('-', ''))
 
 
-class JPPrefectureSelect(Select):
+class JPPrefectureSelect(CachedOptionsMixin, Select):
     """A Select widget that uses a list of Japanese prefectures as its choices."""
 
     def __init__(self, attrs=None):
         super().__init__(attrs, choices=JP_PREFECTURES)
 
 
-class JPPrefectureCodeSelect(Select):
+class JPPrefectureCodeSelect(CachedOptionsMixin, Select):
     """
     A Select widget for Japanese prefecture codes.
 
@@ -2,11 +2,11 @@
 import re
 import warnings
 
-from django.forms import ValidationError
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
 from localflavor.deprecation import RemovedInLocalflavor60Warning
+from localflavor.results import CheckFieldMixin, CheckResult
 
 from .kw_areas import AREA_CHOICES
 from .kw_governorates import GOVERNORATE_CHOICES
@@ -32,7 +32,7 @@ def is_valid_kw_civilid_checksum(value):
     return is_valid_civil_id(value)
 
 
-class KWCivilIDNumberField(RegexField):
+class KWCivilIDNumberField(CheckFieldMixin, RegexField):
     """
     Kuwaiti Civil ID numbers are 12 digits, second to seventh digits represents the person's birthdate.
 
@@ -53,15 +53,11 @@ class KWCivilIDNumberField(RegexField):
             **kwargs
         )
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         if not is_valid_civil_id(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value
+        return CheckResult.valid(value)
 
 
 class KWGovernorateSelect(Select):
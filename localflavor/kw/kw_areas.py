@@ -1,8 +1,10 @@
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import gettext_noop as _
+
+from localflavor.choices import ChoiceTable
 
 # areas are divided into governorates
 
-AREA_CHOICES = \
+AREA_CHOICES = ChoiceTable(
     (
         (_('Kuwait City'),
          (
@@ -146,3 +148,4 @@ AREA_CHOICES = \
             )
         ),
     )
+)
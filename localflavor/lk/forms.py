@@ -3,11 +3,13 @@
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .lk_provinces import PROVINCES
 from .lk_districts import DISTRICTS
 
 
-class LKPostalCodeFormField(RegexField):
+class LKPostalCodeFormField(CheckFieldMixin, RegexField):
     """
         A form field that accepts Sri Lanka postal code.
         Format : NNNNN
@@ -6,12 +6,15 @@ from django.core.validators import RegexValidator
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.constraints import FormatCheckMixin
+from localflavor.results import RegexCheckMixin
+
 from .forms import LKPostalCodeFormField
 from .lk_districts import DISTRICTS
 from .lk_provinces import PROVINCES
 
 
-class LKPostalCodeValidator(RegexValidator):
+class LKPostalCodeValidator(RegexCheckMixin, RegexValidator):
     """
     A validator for Sri Lanka Postal Codes.
     """
@@ -23,15 +26,19 @@ class LKPostalCodeValidator(RegexValidator):
         super().__init__(re.compile(r'^[0-9]{5}$'), *args, **kwargs)
 
 
-class LKPostalCodeField(models.CharField):
+class LKPostalCodeField(FormatCheckMixin, models.CharField):
     """
     A model field that accepts Sri Lanka postal codes.
     Format: NNNNN
     Source: https://en.wikipedia.org/wiki/Postal_codes_in_Sri_Lanka
 
     .. versionadded:: 5.0
+    .. versionchanged:: 5.1
+
+        Added ``db_format_check``, see :mod:`localflavor.constraints`.
     """
     description = _("Postal Code")
+    format_patterns = ('[0-9]' * 5,)
 
     def __init__(self, *args, **kwargs):
         kwargs['max_length'] = 5
@@ -1,10 +1,12 @@
 import re
 from datetime import date
 
-from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.exceptions import ImproperlyConfigured
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .lt_choices import COUNTY_CHOICES, MUNICIPALITY_CHOICES
 
 postalcode = re.compile(r'^(LT\s?-\s?)?(?P<code>\d{5})$', re.IGNORECASE)
@@ -24,7 +26,7 @@ class LTMunicipalitySelect(Select):
         super().__init__(attrs, choices=MUNICIPALITY_CHOICES)
 
 
-class LTIDCodeField(RegexField):
+class LTIDCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates as Lithuanian ID Code.
 
@@ -43,18 +45,13 @@ class LTIDCodeField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^\d{11}$', **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         if not self.valid_date(value):
-            raise ValidationError(self.error_messages['date'], code='date')
+            return self.invalid(value, 'date')
 
         if not self.valid_checksum(value):
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
-        return value
+            return self.invalid(value, 'checksum')
+        return CheckResult.valid(value)
 
     def valid_checksum(self, value):
         first_sum = 0
@@ -86,7 +83,7 @@ class LTIDCodeField(RegexField):
             return False
 
 
-class LTPostalCodeField(CharField):
+class LTPostalCodeField(CheckFieldMixin, CharField):
     """
     A form field that validates and normalizes Lithuanian postal codes.
 
@@ -99,13 +96,9 @@ class LTPostalCodeField(CharField):
         'invalid': _('Enter a postal code in the format XXXXX or LT-XXXXX.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = re.match(postalcode, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return 'LT-' + match.group('code')
+        return CheckResult.valid('LT-' + match.group('code'))
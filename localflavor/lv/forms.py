@@ -1,17 +1,18 @@
 import re
 from datetime import date
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .lv_choices import MUNICIPALITY_CHOICES
 
 zipcode = re.compile(r'^(LV\s?-\s?)?(?P<code>[1-5]\d{3})$', re.IGNORECASE)
 idcode = re.compile(r'^(\d\d)(\d\d)(\d\d)-([0-2])(?:\d{3})(\d)$')
 
 
-class LVPostalCodeField(CharField):
+class LVPostalCodeField(CheckFieldMixin, CharField):
     """
     A form field that validates and normalizes Latvian postal codes.
 
@@ -24,16 +25,12 @@ class LVPostalCodeField(CharField):
         'invalid': _('Enter a postal code in the format XXXX or LV-XXXX.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = re.match(zipcode, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return 'LV-' + match.group('code')
+        return CheckResult.valid('LV-' + match.group('code'))
 
 
 class LVMunicipalitySelect(Select):
@@ -43,7 +40,7 @@ class LVMunicipalitySelect(Select):
         super().__init__(attrs, choices=MUNICIPALITY_CHOICES)
 
 
-class LVPersonalCodeField(CharField):
+class LVPersonalCodeField(CheckFieldMixin, CharField):
     """A form field that validates input as a Latvian personal code."""
 
     default_error_messages = {
@@ -59,24 +56,20 @@ class LVPersonalCodeField(CharField):
         check = sum(mult * int(c) for mult, c in zip(multipliers, value))
         return ((1 - check) % 11) % 10
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = re.match(idcode, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid_format'], code='invalid_format')
+            return self.invalid(value, 'invalid_format')
 
         day, month, year, century, check = map(int, match.groups())
 
         if check != self.lv_checksum(value[0:6] + value[7:11]):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         year += 1800 + 100 * century
         try:
             date(year, month, day)
         except ValueError:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value
+        return CheckResult.valid(value)
@@ -2,11 +2,13 @@
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .ma_provinces import PROVINCE_CHOICES_PER_REGION
 from .ma_regions import REGION_CHOICES
 
 
-class MAPostalCodeField(RegexField):
+class MAPostalCodeField(CheckFieldMixin, RegexField):
     """
     Validate local Moroccan postal code.
 
@@ -48,7 +50,7 @@ class MARegionSelect(Select):
         super().__init__(attrs, choices=choices)
 
 
-class MAProvinceField(CharField):
+class MAProvinceField(CheckFieldMixin, CharField):
     """
     A Select Field that uses a MAProvinceSelect widget.
 
@@ -62,7 +64,7 @@ class MAProvinceField(CharField):
         super().__init__(**kwargs)
 
 
-class MARegionField(CharField):
+class MARegionField(CheckFieldMixin, CharField):
     """
     A Select Field that uses a MARegionSelect widget.
 
@@ -76,7 +78,7 @@ class MARegionField(CharField):
         super().__init__(**kwargs)
 
 
-class MACinNumberField(RegexField):
+class MACinNumberField(CheckFieldMixin, RegexField):
     """
         CIN number: (Numéro de la Carte D'Identité Nationale) The CIN represents the ID of a Moroccan citizen.
 
@@ -0,0 +1,242 @@
+"""
+Re-validates the values stored in localflavor model fields.
+
+Values that were valid when they were saved can become invalid when validation rules tighten. This command finds every
+model field of localflavor in the installed apps, streams the rows of their tables in primary key order, validates the
+values in a pool of worker processes and writes the invalid values to a CSV or JSON Lines report.
+
+With ``--checkpoint`` the primary key of the last audited row of every model is stored in a JSON file after every
+chunk, and a new run with the same checkpoint file continues where the previous one stopped and appends to the
+report.
+
+Usage::
+
+    django-admin localflavor_audit --output invalid.csv
+    django-admin localflavor_audit shop.Customer --workers 16 --chunk-size 10000 \\
+        --checkpoint audit.json --output invalid.jsonl
+
+The values are validated with the model field and its form field, because many localflavor model fields leave the
+validation of the format to their form field.
+
+.. versionadded:: 5.1
+"""
+import csv
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import django
+from django.apps import apps
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from localflavor.results import CheckResult
+
+REPORT_FIELDS = ('model', 'field', 'pk', 'value', 'code', 'message')
+
+
+def localflavor_fields(model):
+    """Returns the concrete fields of a model that are defined by localflavor."""
+    # Fields inherited from concrete parents are audited with the parent.
+    return [field for field in model._meta.local_concrete_fields
+            if type(field).__module__.startswith('localflavor.') and not field.primary_key]
+
+
+@lru_cache(maxsize=None)
+def _get_fields(model_label, field_names):
+    """Returns the model fields and their form fields, which validate the format for many localflavor fields."""
+    model = apps.get_model(model_label)
+    fields = [model._meta.get_field(name) for name in field_names]
+    return [(field, field.formfield()) for field in fields]
+
+
+def _init_worker():
+    if not apps.ready:
+        # Worker processes that are spawned instead of forked start without Django.
+        django.setup()
+
+
+def audit_rows(model_label, field_names, rows):
+    """
+    Validates rows of ``(pk, value, ...)`` with the fields of a model and returns the invalid values as dictionaries
+    with the keys in ``REPORT_FIELDS``.
+    """
+    fields = _get_fields(model_label, tuple(field_names))
+    offenders = []
+    for row in rows:
+        for (field, form_field), value in zip(fields, row[1:]):
+            try:
+                field.clean(value, None)
+                if form_field is not None:
+                    form_field.clean(value)
+            except ValidationError as e:
+                result = CheckResult.from_error(value, e)
+                offenders.append({
+                    'model': model_label,
+                    'field': field.name,
+                    'pk': row[0],
+                    'value': value,
+                    'code': result.code,
+                    'message': result.message,
+                })
+    return offenders
+
+
+class _ReportWriter:
+
+    def __init__(self, stream, report_format):
+        self.stream = stream
+        self.report_format = report_format
+        if report_format == 'csv':
+            self.writer = csv.DictWriter(stream, REPORT_FIELDS)
+
+    def write_header(self):
+        if self.report_format == 'csv':
+            self.writer.writeheader()
+
+    def write(self, offenders):
+        for offender in offenders:
+            if self.report_format == 'csv':
+                self.writer.writerow(offender)
+            else:
+                self.stream.write(json.dumps(offender, default=str) + '\n')
+        self.stream.flush()
+
+
+class Command(BaseCommand):
+    help = 'Validates the values stored in localflavor model fields and reports the invalid ones.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models', nargs='*', metavar='app_label[.ModelName]',
+            help='Only audit these apps or models. Defaults to all models with localflavor fields.',
+        )
+        parser.add_argument('--output', '-o', default='-', help='Path of the report, defaults to stdout.')
+        parser.add_argument(
+            '--format', choices=('csv', 'jsonl'), dest='report_format',
+            help='Format of the report. Defaults to the extension of the output or CSV.',
+        )
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Number of rows validated at a time.')
+        parser.add_argument(
+            '--workers', type=int, default=os.cpu_count(),
+            help='Number of worker processes. 0 validates in this process. Defaults to the number of CPUs.',
+        )
+        parser.add_argument('--checkpoint', help='JSON file to store the progress in and to resume from.')
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS, help='The database to audit.')
+        parser.add_argument('--no-count', action='store_false', dest='count',
+                            help="Don't count the rows of every table for the progress output.")
+
+    def handle(self, *args, **options):
+        models = self.get_models(options['models'])
+        report_format = options['report_format'] or ('jsonl' if options['output'].endswith('.jsonl') else 'csv')
+        checkpoint_path = options['checkpoint']
+        checkpoint = {}
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            with open(checkpoint_path) as checkpoint_file:
+                checkpoint = json.load(checkpoint_file)
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1.')
+
+        if options['output'] == '-':
+            resume = False
+            stream = self.stdout
+            progress = self.stderr
+        else:
+            resume = bool(checkpoint) and os.path.exists(options['output'])
+            stream = open(options['output'], 'a' if resume else 'w', newline='')
+            progress = self.stdout
+        report = _ReportWriter(stream, report_format)
+        if not resume:
+            report.write_header()
+
+        executor = None
+        if options['workers'] > 0:
+            executor = ProcessPoolExecutor(options['workers'], initializer=_init_worker)
+        try:
+            total = 0
+            for model, fields in models:
+                total += self.audit_model(model, fields, report, executor, checkpoint, checkpoint_path, progress,
+                                          options)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if stream is not self.stdout:
+                stream.close()
+        progress.write('Found %d invalid values.' % total)
+
+    def get_models(self, labels):
+        """Returns ``(model, fields)`` for the models with localflavor fields, limited to the given labels."""
+        selected = []
+        for model in apps.get_models():
+            fields = localflavor_fields(model)
+            if not fields or model._meta.proxy:
+                continue
+            if labels and model._meta.app_label not in labels and model._meta.label not in labels:
+                continue
+            selected.append((model, fields))
+        if labels and not selected:
+            raise CommandError('No models with localflavor fields match %s.' % ', '.join(labels))
+        return selected
+
+    def audit_model(self, model, fields, report, executor, checkpoint, checkpoint_path, progress, options):
+        label = model._meta.label
+        queryset = model._default_manager.using(options['database']).order_by('pk')
+        if label in checkpoint:
+            queryset = queryset.filter(pk__gt=checkpoint[label])
+        rows = queryset.values_list('pk', *(field.attname for field in fields))
+        count = rows.count() if options['count'] else None
+        field_names = [field.name for field in fields]
+
+        def submit(chunk):
+            if executor is None:
+                return None, chunk, audit_rows(label, field_names, chunk)
+            return executor.submit(audit_rows, label, field_names, chunk), chunk, None
+
+        # Chunks are validated in parallel but reported in order, so the checkpoint always marks a point up to which
+        # every row was audited.
+        pending = deque()
+        max_pending = 2 * (options['workers'] or 1)
+        audited = offenders = 0
+        start = time.monotonic()
+
+        def finish():
+            nonlocal audited, offenders
+            future, chunk, result = pending.popleft()
+            if future is not None:
+                result = future.result()
+            report.write(result)
+            audited += len(chunk)
+            offenders += len(result)
+            if checkpoint_path:
+                checkpoint[label] = chunk[-1][0]
+                self.save_checkpoint(checkpoint_path, checkpoint)
+            elapsed = time.monotonic() - start
+            progress.write('%s: %d%s rows audited, %d invalid, %.0f rows/s' % (
+                label, audited, '/%d' % count if count is not None else '', offenders,
+                audited / elapsed if elapsed else 0,
+            ))
+
+        chunk = []
+        for row in rows.iterator(chunk_size=options['chunk_size']):
+            chunk.append(row)
+            if len(chunk) == options['chunk_size']:
+                pending.append(submit(chunk))
+                chunk = []
+                while len(pending) >= max_pending:
+                    finish()
+        if chunk:
+            pending.append(submit(chunk))
+        while pending:
+            finish()
+        return offenders
+
+    def save_checkpoint(self, path, checkpoint):
+        # Replace the file atomically so an interrupted write can't corrupt the checkpoint.
+        temporary_path = path + '.tmp'
+        with open(temporary_path, 'w') as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file, default=str)
+        os.replace(temporary_path, path)
@@ -0,0 +1,1210 @@
+"""The classes of every flavor for :mod:`localflavor.registry`."""
+# Generated with `invoke update-registry`, don't edit.
+
+MANIFEST = {
+    'ae': {
+        'emirate': {
+            'kind': 'region',
+            'form_field': 'localflavor.ae.forms.UAEEmirateField',
+            'model_field': 'localflavor.ae.models.UAEEmirateField',
+            'widget': 'localflavor.ae.forms.UAEEmirateSelect',
+        },
+        'emirates_id': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ae.forms.UAEEmiratesIDField',
+            'model_field': 'localflavor.ae.models.UAEEmiratesIDField',
+            'validator': 'localflavor.ae.validators.UAEEmiratesIDValidator',
+        },
+        'po_box': {
+            'kind': None,
+            'form_field': 'localflavor.ae.forms.UAEPOBoxField',
+            'model_field': 'localflavor.ae.models.UAEPOBoxField',
+            'validator': 'localflavor.ae.validators.UAEPOBoxValidator',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ae.forms.UAEPostalCodeField',
+            'model_field': 'localflavor.ae.models.UAEPostalCodeField',
+            'validator': 'localflavor.ae.validators.UAEPostalCodeValidator',
+        },
+        'tax_registration_number': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.ae.forms.UAETaxRegistrationNumberField',
+            'model_field': 'localflavor.ae.models.UAETaxRegistrationNumberField',
+            'validator': 'localflavor.ae.validators.UAETaxRegistrationNumberValidator',
+        },
+    },
+    'ar': {
+        'cbu': {
+            'kind': 'bank_account',
+            'form_field': 'localflavor.ar.forms.ARCBUField',
+        },
+        'cuit': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.ar.forms.ARCUITField',
+        },
+        'dni': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ar.forms.ARDNIField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ar.forms.ARPostalCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.ar.forms.ARProvinceSelect',
+        },
+    },
+    'at': {
+        'social_security_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.at.forms.ATSocialSecurityNumberField',
+        },
+        'state': {
+            'kind': 'region',
+            'widget': 'localflavor.at.forms.ATStateSelect',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.at.forms.ATZipCodeField',
+        },
+    },
+    'au': {
+        'business_number': {
+            'kind': 'business_id',
+            'form_field': 'localflavor.au.forms.AUBusinessNumberField',
+            'model_field': 'localflavor.au.models.AUBusinessNumberField',
+            'validator': 'localflavor.au.validators.AUBusinessNumberFieldValidator',
+        },
+        'company_number': {
+            'kind': 'business_id',
+            'form_field': 'localflavor.au.forms.AUCompanyNumberField',
+            'model_field': 'localflavor.au.models.AUCompanyNumberField',
+            'validator': 'localflavor.au.validators.AUCompanyNumberFieldValidator',
+        },
+        'post_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.au.forms.AUPostCodeField',
+            'model_field': 'localflavor.au.models.AUPostCodeField',
+        },
+        'state': {
+            'kind': 'region',
+            'model_field': 'localflavor.au.models.AUStateField',
+            'widget': 'localflavor.au.forms.AUStateSelect',
+        },
+        'tax_file_number': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.au.forms.AUTaxFileNumberField',
+            'model_field': 'localflavor.au.models.AUTaxFileNumberField',
+            'validator': 'localflavor.au.validators.AUTaxFileNumberFieldValidator',
+        },
+    },
+    'be': {
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.be.forms.BEPostalCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.be.forms.BEProvinceSelect',
+        },
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.be.forms.BERegionSelect',
+        },
+    },
+    'bg': {
+        'egn': {
+            'kind': 'national_id',
+            'model_field': 'localflavor.bg.models.BGEGNField',
+            'validator': 'localflavor.bg.validators.EGNValidator',
+        },
+        'eik': {
+            'kind': 'business_id',
+            'model_field': 'localflavor.bg.models.BGEIKField',
+            'validator': 'localflavor.bg.validators.EIKValidator',
+        },
+    },
+    'br': {
+        'cnpj': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.br.forms.BRCNPJField',
+            'model_field': 'localflavor.br.models.BRCNPJField',
+            'validator': 'localflavor.br.validators.BRCNPJValidator',
+        },
+        'cpf': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.br.forms.BRCPFField',
+            'model_field': 'localflavor.br.models.BRCPFField',
+            'validator': 'localflavor.br.validators.BRCPFValidator',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.br.forms.BRZipCodeField',
+            'model_field': 'localflavor.br.models.BRPostalCodeField',
+            'validator': 'localflavor.br.validators.BRPostalCodeValidator',
+            'aliases': ('zip_code',),
+        },
+        'processo': {
+            'kind': None,
+            'form_field': 'localflavor.br.forms.BRProcessoField',
+        },
+        'state': {
+            'kind': 'region',
+            'form_field': 'localflavor.br.forms.BRStateChoiceField',
+            'model_field': 'localflavor.br.models.BRStateField',
+            'widget': 'localflavor.br.forms.BRStateSelect',
+        },
+    },
+    'by': {
+        'pass_id_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.by.forms.BYPassIdNumberField',
+            'model_field': 'localflavor.by.models.BYPassIdNumberField',
+        },
+        'pass_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.by.forms.BYPassNumberField',
+            'model_field': 'localflavor.by.models.BYPassNumberField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.by.forms.BYPostalCodeField',
+            'model_field': 'localflavor.by.models.BYPostalCodeField',
+        },
+        'region': {
+            'kind': 'region',
+            'model_field': 'localflavor.by.models.BYRegionField',
+            'widget': 'localflavor.by.forms.BYRegionSelect',
+        },
+    },
+    'ca': {
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ca.forms.CAPostalCodeField',
+            'model_field': 'localflavor.ca.models.CAPostalCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'form_field': 'localflavor.ca.forms.CAProvinceField',
+            'model_field': 'localflavor.ca.models.CAProvinceField',
+            'widget': 'localflavor.ca.forms.CAProvinceSelect',
+        },
+        'social_insurance_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ca.forms.CASocialInsuranceNumberField',
+            'model_field': 'localflavor.ca.models.CASocialInsuranceNumberField',
+        },
+    },
+    'ch': {
+        'identity_card_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ch.forms.CHIdentityCardNumberField',
+        },
+        'social_security_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ch.forms.CHSocialSecurityNumberField',
+        },
+        'state': {
+            'kind': 'region',
+            'widget': 'localflavor.ch.forms.CHStateSelect',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ch.forms.CHZipCodeField',
+        },
+    },
+    'cl': {
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.cl.forms.CLRegionSelect',
+        },
+        'rut': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.cl.forms.CLRutField',
+        },
+    },
+    'cn': {
+        'id_card': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.cn.forms.CNIDCardField',
+        },
+        'post_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.cn.forms.CNPostCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.cn.forms.CNProvinceSelect',
+        },
+    },
+    'co': {
+        'department': {
+            'kind': 'region',
+            'widget': 'localflavor.co.forms.CODepartmentSelect',
+        },
+        'nit': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.co.forms.CONITField',
+        },
+    },
+    'cu': {
+        'identity_card_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.cu.forms.CUIdentityCardNumberField',
+            'model_field': 'localflavor.cu.models.CUIdentityCardNumberField',
+        },
+        'identity_card_number_birthday': {
+            'kind': 'national_id',
+            'validator': 'localflavor.cu.validators.CUIdentityCardNumberBirthdayValidator',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.cu.forms.CUPostalCodeField',
+            'model_field': 'localflavor.cu.models.CUPostalCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'form_field': 'localflavor.cu.forms.CUProvinceField',
+            'model_field': 'localflavor.cu.models.CUProvinceField',
+            'widget': 'localflavor.cu.forms.CUProvinceSelect',
+        },
+        'region': {
+            'kind': 'region',
+            'form_field': 'localflavor.cu.forms.CURegionField',
+            'model_field': 'localflavor.cu.models.CURegionField',
+            'widget': 'localflavor.cu.forms.CURegionSelect',
+        },
+    },
+    'cz': {
+        'birth_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.cz.forms.CZBirthNumberField',
+        },
+        'ic_number': {
+            'kind': 'business_id',
+            'form_field': 'localflavor.cz.forms.CZICNumberField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.cz.forms.CZPostalCodeField',
+        },
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.cz.forms.CZRegionSelect',
+        },
+    },
+    'de': {
+        'identity_card_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.de.forms.DEIdentityCardNumberField',
+        },
+        'state': {
+            'kind': 'region',
+            'widget': 'localflavor.de.forms.DEStateSelect',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.de.forms.DEZipCodeField',
+        },
+    },
+    'dk': {
+        'municipality': {
+            'kind': 'region',
+            'widget': 'localflavor.dk.forms.DKMunicipalitySelect',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.dk.forms.DKPostalCodeField',
+        },
+    },
+    'ec': {
+        'province': {
+            'kind': 'region',
+            'model_field': 'localflavor.ec.models.ECProvinceField',
+            'widget': 'localflavor.ec.forms.ECProvinceSelect',
+        },
+    },
+    'ee': {
+        'business_registry_code': {
+            'kind': 'business_id',
+            'form_field': 'localflavor.ee.forms.EEBusinessRegistryCode',
+        },
+        'county': {
+            'kind': 'region',
+            'widget': 'localflavor.ee.forms.EECountySelect',
+        },
+        'personal_identification_code': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ee.forms.EEPersonalIdentificationCode',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ee.forms.EEZipCodeField',
+        },
+    },
+    'eg': {
+        'governorate': {
+            'kind': 'region',
+            'widget': 'localflavor.eg.forms.EGGovernorateSelect',
+        },
+        'national_id_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.eg.forms.EGNationalIDNumberField',
+        },
+    },
+    'es': {
+        'ccc': {
+            'kind': 'bank_account',
+            'form_field': 'localflavor.es.forms.ESCCCField',
+        },
+        'identity_card_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.es.forms.ESIdentityCardNumberField',
+            'model_field': 'localflavor.es.models.ESIdentityCardNumberField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.es.forms.ESPostalCodeField',
+            'model_field': 'localflavor.es.models.ESPostalCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.es.forms.ESProvinceSelect',
+        },
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.es.forms.ESRegionSelect',
+        },
+    },
+    'fi': {
+        'municipality': {
+            'kind': 'region',
+            'widget': 'localflavor.fi.forms.FIMunicipalitySelect',
+        },
+        'social_security_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.fi.forms.FISocialSecurityNumber',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.fi.forms.FIZipCodeField',
+        },
+    },
+    'fr': {
+        'department': {
+            'kind': 'region',
+            'form_field': 'localflavor.fr.forms.FRDepartmentField',
+            'widget': 'localflavor.fr.forms.FRDepartmentSelect',
+        },
+        'national_identification_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.fr.forms.FRNationalIdentificationNumber',
+        },
+        'region': {
+            'kind': 'region',
+            'form_field': 'localflavor.fr.forms.FRRegionField',
+            'widget': 'localflavor.fr.forms.FRRegionSelect',
+        },
+        'region2016': {
+            'kind': 'region',
+            'widget': 'localflavor.fr.forms.FRRegion2016Select',
+        },
+        'rna': {
+            'kind': 'business_id',
+            'form_field': 'localflavor.fr.forms.FRRNAField',
+            'model_field': 'localflavor.fr.models.FRRNAField',
+        },
+        'siren': {
+            'kind': 'business_id',
+            'form_field': 'localflavor.fr.forms.FRSIRENField',
+            'model_field': 'localflavor.fr.models.FRSIRENField',
+        },
+        'siret': {
+            'kind': 'business_id',
+            'form_field': 'localflavor.fr.forms.FRSIRETField',
+            'model_field': 'localflavor.fr.models.FRSIRETField',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.fr.forms.FRZipCodeField',
+        },
+    },
+    'gb': {
+        'county': {
+            'kind': 'region',
+            'widget': 'localflavor.gb.forms.GBCountySelect',
+        },
+        'nation': {
+            'kind': 'region',
+            'widget': 'localflavor.gb.forms.GBNationSelect',
+        },
+        'postcode': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.gb.forms.GBPostcodeField',
+        },
+    },
+    'gh': {
+        'region': {
+            'kind': 'region',
+            'model_field': 'localflavor.gh.models.GHRegionField',
+            'widget': 'localflavor.gh.forms.GHRegionSelect',
+        },
+    },
+    'gr': {
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.gr.forms.GRPostalCodeField',
+        },
+        'social_security_number_code': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.gr.forms.GRSocialSecurityNumberCodeField',
+        },
+        'tax_number_code': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.gr.forms.GRTaxNumberCodeField',
+        },
+    },
+    'hr': {
+        'county': {
+            'kind': 'region',
+            'widget': 'localflavor.hr.forms.HRCountySelect',
+        },
+        'jmbag': {
+            'kind': None,
+            'form_field': 'localflavor.hr.forms.HRJMBAGField',
+        },
+        'jmbg': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.hr.forms.HRJMBGField',
+        },
+        'license_plate': {
+            'kind': 'license_plate',
+            'form_field': 'localflavor.hr.forms.HRLicensePlateField',
+        },
+        'license_plate_prefix': {
+            'kind': 'license_plate',
+            'widget': 'localflavor.hr.forms.HRLicensePlatePrefixSelect',
+        },
+        'oib': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.hr.forms.HROIBField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.hr.forms.HRPostalCodeField',
+        },
+    },
+    'hu': {
+        'county': {
+            'kind': 'region',
+            'widget': 'localflavor.hu.forms.HUCountySelect',
+        },
+    },
+    'id': {
+        'license_plate': {
+            'kind': 'license_plate',
+            'form_field': 'localflavor.id_.forms.IDLicensePlateField',
+        },
+        'license_plate_prefix': {
+            'kind': 'license_plate',
+            'widget': 'localflavor.id_.forms.IDLicensePlatePrefixSelect',
+        },
+        'national_identity_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.id_.forms.IDNationalIdentityNumberField',
+        },
+        'post_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.id_.forms.IDPostCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.id_.forms.IDProvinceSelect',
+        },
+    },
+    'ie': {
+        'county': {
+            'kind': 'region',
+            'widget': 'localflavor.ie.forms.IECountySelect',
+        },
+        'eircode': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ie.forms.EircodeField',
+        },
+    },
+    'il': {
+        'id_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.il.forms.ILIDNumberField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.il.forms.ILPostalCodeField',
+        },
+    },
+    'in': {
+        'aadhaar_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.in_.forms.INAadhaarNumberField',
+        },
+        'pan_card_number': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.in_.forms.INPANCardNumberFormField',
+            'model_field': 'localflavor.in_.models.INPANCardNumberField',
+            'validator': 'localflavor.in_.validators.INPANCardNumberValidator',
+        },
+        'state': {
+            'kind': 'region',
+            'form_field': 'localflavor.in_.forms.INStateField',
+            'model_field': 'localflavor.in_.models.INStateField',
+            'widget': 'localflavor.in_.forms.INStateSelect',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.in_.forms.INZipCodeField',
+        },
+    },
+    'ir': {
+        'id_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ir.forms.IRIDNumberField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ir.forms.IRPostalCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.ir.forms.IRProvinceSelect',
+        },
+    },
+    'is': {
+        'id_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.is_.forms.ISIdNumberField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'widget': 'localflavor.is_.forms.ISPostalCodeSelect',
+        },
+    },
+    'it': {
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.it.forms.ITProvinceSelect',
+        },
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.it.forms.ITRegionSelect',
+        },
+        'region_province': {
+            'kind': 'region',
+            'widget': 'localflavor.it.forms.ITRegionProvinceSelect',
+        },
+        'social_security_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.it.forms.ITSocialSecurityNumberField',
+        },
+        'vat_number': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.it.forms.ITVatNumberField',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.it.forms.ITZipCodeField',
+        },
+    },
+    'jp': {
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.jp.forms.JPPostalCodeField',
+        },
+        'prefecture': {
+            'kind': 'region',
+            'widget': 'localflavor.jp.forms.JPPrefectureSelect',
+        },
+        'prefecture_code': {
+            'kind': 'region',
+            'widget': 'localflavor.jp.forms.JPPrefectureCodeSelect',
+        },
+    },
+    'kw': {
+        'area': {
+            'kind': 'region',
+            'widget': 'localflavor.kw.forms.KWAreaSelect',
+        },
+        'civil_id_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.kw.forms.KWCivilIDNumberField',
+        },
+        'governorate': {
+            'kind': 'region',
+            'widget': 'localflavor.kw.forms.KWGovernorateSelect',
+        },
+    },
+    'lk': {
+        'district': {
+            'kind': 'region',
+            'model_field': 'localflavor.lk.models.LKDistrictField',
+            'widget': 'localflavor.lk.forms.LKDistrictSelect',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.lk.forms.LKPostalCodeFormField',
+            'model_field': 'localflavor.lk.models.LKPostalCodeField',
+            'validator': 'localflavor.lk.models.LKPostalCodeValidator',
+        },
+        'province': {
+            'kind': 'region',
+            'model_field': 'localflavor.lk.models.LKProvinceField',
+            'widget': 'localflavor.lk.forms.LKProvinceSelect',
+        },
+    },
+    'lt': {
+        'county': {
+            'kind': 'region',
+            'widget': 'localflavor.lt.forms.LTCountySelect',
+        },
+        'id_code': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.lt.forms.LTIDCodeField',
+        },
+        'municipality': {
+            'kind': 'region',
+            'widget': 'localflavor.lt.forms.LTMunicipalitySelect',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.lt.forms.LTPostalCodeField',
+        },
+    },
+    'lv': {
+        'municipality': {
+            'kind': 'region',
+            'widget': 'localflavor.lv.forms.LVMunicipalitySelect',
+        },
+        'personal_code': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.lv.forms.LVPersonalCodeField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.lv.forms.LVPostalCodeField',
+        },
+    },
+    'ma': {
+        'cin_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ma.forms.MACinNumberField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ma.forms.MAPostalCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'form_field': 'localflavor.ma.forms.MAProvinceField',
+            'widget': 'localflavor.ma.forms.MAProvinceSelect',
+        },
+        'region': {
+            'kind': 'region',
+            'form_field': 'localflavor.ma.forms.MARegionField',
+            'widget': 'localflavor.ma.forms.MARegionSelect',
+        },
+    },
+    'md': {
+        'company_type': {
+            'kind': None,
+            'model_field': 'localflavor.md.models.MDCompanyTypeField',
+        },
+        'company_types': {
+            'kind': None,
+            'widget': 'localflavor.md.forms.MDCompanyTypesSelect',
+        },
+        'idno': {
+            'kind': 'business_id',
+            'form_field': 'localflavor.md.forms.MDIDNOField',
+            'model_field': 'localflavor.md.models.MDIDNOField',
+            'validator': 'localflavor.md.validators.MDIDNOFieldValidator',
+        },
+        'license_plate': {
+            'kind': 'license_plate',
+            'form_field': 'localflavor.md.forms.MDLicensePlateField',
+            'model_field': 'localflavor.md.models.MDLicensePlateField',
+            'validator': 'localflavor.md.validators.MDLicensePlateValidator',
+        },
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.md.forms.MDRegionSelect',
+        },
+    },
+    'mk': {
+        'identity_card_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.mk.forms.MKIdentityCardNumberField',
+            'model_field': 'localflavor.mk.models.MKIdentityCardNumberField',
+        },
+        'municipality': {
+            'kind': 'region',
+            'model_field': 'localflavor.mk.models.MKMunicipalityField',
+            'widget': 'localflavor.mk.forms.MKMunicipalitySelect',
+        },
+        'umcn': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.mk.forms.UMCNField',
+            'model_field': 'localflavor.mk.models.UMCNField',
+        },
+    },
+    'mt': {
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.mt.forms.MTPostalCodeField',
+        },
+    },
+    'mx': {
+        'clabe': {
+            'kind': 'bank_account',
+            'form_field': 'localflavor.mx.forms.MXCLABEField',
+            'model_field': 'localflavor.mx.models.MXCLABEField',
+        },
+        'curp': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.mx.forms.MXCURPField',
+            'model_field': 'localflavor.mx.models.MXCURPField',
+        },
+        'rfc': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.mx.forms.MXRFCField',
+            'model_field': 'localflavor.mx.models.MXRFCField',
+        },
+        'social_security_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.mx.forms.MXSocialSecurityNumberField',
+            'model_field': 'localflavor.mx.models.MXSocialSecurityNumberField',
+        },
+        'state': {
+            'kind': 'region',
+            'model_field': 'localflavor.mx.models.MXStateField',
+            'widget': 'localflavor.mx.forms.MXStateSelect',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.mx.forms.MXZipCodeField',
+            'model_field': 'localflavor.mx.models.MXZipCodeField',
+        },
+    },
+    'my': {
+        'my_kad': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.my.forms.MyKadFormField',
+        },
+    },
+    'nl': {
+        'bsn': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.nl.forms.NLBSNFormField',
+            'model_field': 'localflavor.nl.models.NLBSNField',
+            'validator': 'localflavor.nl.validators.NLBSNFieldValidator',
+        },
+        'license_plate': {
+            'kind': 'license_plate',
+            'form_field': 'localflavor.nl.forms.NLLicensePlateFormField',
+            'model_field': 'localflavor.nl.models.NLLicensePlateField',
+            'validator': 'localflavor.nl.validators.NLLicensePlateFieldValidator',
+        },
+        'province': {
+            'kind': 'region',
+            'model_field': 'localflavor.nl.models.NLProvinceField',
+            'widget': 'localflavor.nl.forms.NLProvinceSelect',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.nl.forms.NLZipCodeField',
+            'model_field': 'localflavor.nl.models.NLZipCodeField',
+            'validator': 'localflavor.nl.validators.NLZipCodeFieldValidator',
+        },
+    },
+    'no': {
+        'bank_account_number': {
+            'kind': 'bank_account',
+            'form_field': 'localflavor.no.forms.NOBankAccountNumber',
+        },
+        'municipality': {
+            'kind': 'region',
+            'widget': 'localflavor.no.forms.NOMunicipalitySelect',
+        },
+        'social_security_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.no.forms.NOSocialSecurityNumber',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.no.forms.NOZipCodeField',
+        },
+    },
+    'np': {
+        'district': {
+            'kind': 'region',
+            'model_field': 'localflavor.np.models.NPDistrictField',
+            'widget': 'localflavor.np.forms.NPDistrictSelect',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.np.forms.NPPostalCodeFormField',
+            'model_field': 'localflavor.np.models.NPPostalCodeField',
+            'validator': 'localflavor.np.models.NPPostalCodeValidator',
+        },
+        'province': {
+            'kind': 'region',
+            'model_field': 'localflavor.np.models.NPProvinceField',
+            'widget': 'localflavor.np.forms.NPProvinceSelect',
+        },
+        'zone': {
+            'kind': 'region',
+            'model_field': 'localflavor.np.models.NPZoneField',
+            'widget': 'localflavor.np.forms.NPZoneSelect',
+        },
+    },
+    'nz': {
+        'bank_account_number': {
+            'kind': 'bank_account',
+            'form_field': 'localflavor.nz.forms.NZBankAccountNumberField',
+        },
+        'north_island_council': {
+            'kind': 'region',
+            'widget': 'localflavor.nz.forms.NZNorthIslandCouncilSelect',
+        },
+        'post_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.nz.forms.NZPostCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.nz.forms.NZProvinceSelect',
+        },
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.nz.forms.NZRegionSelect',
+        },
+        'south_island_council': {
+            'kind': 'region',
+            'widget': 'localflavor.nz.forms.NZSouthIslandCouncilSelect',
+        },
+    },
+    'pe': {
+        'dni': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.pe.forms.PEDNIField',
+        },
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.pe.forms.PERegionSelect',
+        },
+        'ruc': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.pe.forms.PERUCField',
+        },
+    },
+    'pk': {
+        'post_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.pk.forms.PKPostCodeField',
+            'model_field': 'localflavor.pk.models.PKPostCodeField',
+        },
+        'state': {
+            'kind': 'region',
+            'model_field': 'localflavor.pk.models.PKStateField',
+            'widget': 'localflavor.pk.forms.PKStateSelect',
+        },
+    },
+    'pl': {
+        'county': {
+            'kind': 'region',
+            'widget': 'localflavor.pl.forms.PLCountySelect',
+        },
+        'national_id_card_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.pl.forms.PLNationalIDCardNumberField',
+        },
+        'nip': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.pl.forms.PLNIPField',
+        },
+        'pesel': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.pl.forms.PLPESELField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.pl.forms.PLPostalCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.pl.forms.PLProvinceSelect',
+        },
+        'regon': {
+            'kind': 'business_id',
+            'form_field': 'localflavor.pl.forms.PLREGONField',
+        },
+    },
+    'pt': {
+        'citizen_card_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.pt.forms.PTCitizenCardNumberField',
+        },
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.pt.forms.PTRegionSelect',
+        },
+        'social_security_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.pt.forms.PTSocialSecurityNumberField',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.pt.forms.PTZipCodeField',
+        },
+    },
+    'py': {
+        'department': {
+            'kind': 'region',
+            'widget': 'localflavor.py_.forms.PyDepartmentSelect',
+        },
+        'numbered_department': {
+            'kind': 'region',
+            'widget': 'localflavor.py_.forms.PyNumberedDepartmentSelect',
+        },
+    },
+    'qa': {
+        'municipality': {
+            'kind': 'region',
+            'form_field': 'localflavor.qa.forms.QAMunicipalityField',
+            'model_field': 'localflavor.qa.models.QAMunicipalityField',
+        },
+        'national_id': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.qa.forms.QANationalIDNumberField',
+            'model_field': 'localflavor.qa.models.QANationalIDField',
+            'validator': 'localflavor.qa.validators.QANationalIDValidator',
+            'aliases': ('national_id_number',),
+        },
+    },
+    'ro': {
+        'cif': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.ro.forms.ROCIFField',
+        },
+        'cnp': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ro.forms.ROCNPField',
+        },
+        'county': {
+            'kind': 'region',
+            'form_field': 'localflavor.ro.forms.ROCountyField',
+            'widget': 'localflavor.ro.forms.ROCountySelect',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ro.forms.ROPostalCodeField',
+        },
+    },
+    'ru': {
+        'alien_passport_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ru.forms.RUAlienPassportNumberField',
+        },
+        'county': {
+            'kind': 'region',
+            'widget': 'localflavor.ru.forms.RUCountySelect',
+        },
+        'passport_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.ru.forms.RUPassportNumberField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ru.forms.RUPostalCodeField',
+        },
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.ru.forms.RURegionSelect',
+        },
+    },
+    'se': {
+        'county': {
+            'kind': 'region',
+            'widget': 'localflavor.se.forms.SECountySelect',
+        },
+        'organisation_number': {
+            'kind': 'business_id',
+            'form_field': 'localflavor.se.forms.SEOrganisationNumberField',
+        },
+        'personal_identity_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.se.forms.SEPersonalIdentityNumberField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.se.forms.SEPostalCodeField',
+        },
+    },
+    'sg': {
+        'nricfin': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.sg.forms.SGNRICFINField',
+        },
+        'post_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.sg.forms.SGPostCodeField',
+        },
+    },
+    'si': {
+        'emso': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.si.forms.SIEMSOField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.si.forms.SIPostalCodeField',
+            'widget': 'localflavor.si.forms.SIPostalCodeSelect',
+        },
+        'tax_number': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.si.forms.SITaxNumberField',
+        },
+    },
+    'sk': {
+        'district': {
+            'kind': 'region',
+            'widget': 'localflavor.sk.forms.SKDistrictSelect',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.sk.forms.SKPostalCodeField',
+        },
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.sk.forms.SKRegionSelect',
+        },
+    },
+    'tn': {
+        'governorate': {
+            'kind': 'region',
+            'widget': 'localflavor.tn.forms.TNGovernorateSelect',
+        },
+    },
+    'tr': {
+        'identification_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.tr.forms.TRIdentificationNumberField',
+        },
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.tr.forms.TRPostalCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.tr.forms.TRProvinceSelect',
+        },
+    },
+    'tw': {
+        'administrative_division': {
+            'kind': 'region',
+            'widget': 'localflavor.tw.forms.TWAdministrativeDivisionSelect',
+        },
+    },
+    'ua': {
+        'postal_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.ua.forms.UAPostalCodeField',
+            'model_field': 'localflavor.ua.models.UAPostalCodeField',
+        },
+        'region': {
+            'kind': 'region',
+            'model_field': 'localflavor.ua.models.UARegionField',
+            'widget': 'localflavor.ua.forms.UARegionSelect',
+        },
+        'vat_number': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.ua.forms.UAVatNumberField',
+            'model_field': 'localflavor.ua.models.UAVatNumberField',
+        },
+    },
+    'us': {
+        'adoption_taxpayer_identification_number': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.us.forms.USAdoptionTaxpayerIdentificationNumberField',
+            'model_field': 'localflavor.us.models.USAdoptionTaxpayerIdentificationNumberField',
+        },
+        'individual_taxpayer_identification_number': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.us.forms.USIndividualTaxpayerIdentificationNumberField',
+            'model_field': 'localflavor.us.models.USIndividualTaxpayerIdentificationNumberField',
+        },
+        'postal_code': {
+            'kind': 'region',
+            'model_field': 'localflavor.us.models.USPostalCodeField',
+        },
+        'ps': {
+            'kind': 'region',
+            'widget': 'localflavor.us.forms.USPSSelect',
+        },
+        'social_security_number': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.us.forms.USSocialSecurityNumberField',
+            'model_field': 'localflavor.us.models.USSocialSecurityNumberField',
+        },
+        'state': {
+            'kind': 'region',
+            'form_field': 'localflavor.us.forms.USStateField',
+            'model_field': 'localflavor.us.models.USStateField',
+            'widget': 'localflavor.us.forms.USStateSelect',
+        },
+        'taxpayer_identification_number': {
+            'kind': 'tax_id',
+            'form_field': 'localflavor.us.forms.USTaxpayerIdentificationNumberField',
+            'model_field': 'localflavor.us.models.USTaxpayerIdentificationNumberField',
+        },
+        'zip_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.us.forms.USZipCodeField',
+            'model_field': 'localflavor.us.models.USZipCodeField',
+        },
+    },
+    'uy': {
+        'ci': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.uy.forms.UYCIField',
+        },
+        'department': {
+            'kind': 'region',
+            'widget': 'localflavor.uy.forms.UYDepartmentSelect',
+        },
+    },
+    've': {
+        'region': {
+            'kind': 'region',
+            'widget': 'localflavor.ve.forms.VERegionSelect',
+        },
+        'state': {
+            'kind': 'region',
+            'widget': 'localflavor.ve.forms.VEStateSelect',
+        },
+    },
+    'za': {
+        'id': {
+            'kind': 'national_id',
+            'form_field': 'localflavor.za.forms.ZAIDField',
+        },
+        'post_code': {
+            'kind': 'postal_code',
+            'form_field': 'localflavor.za.forms.ZAPostCodeField',
+        },
+        'province': {
+            'kind': 'region',
+            'widget': 'localflavor.za.forms.ZAProvinceSelect',
+        },
+    },
+}
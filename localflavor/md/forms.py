@@ -1,10 +1,12 @@
 from django import forms
 
+from localflavor.results import CheckFieldMixin
+
 from .choices import COMPANY_TYPES_CHOICES, REGION_CHOICES_2002_2015
 from .validators import MDIDNOFieldValidator, MDLicensePlateValidator
 
 
-class MDIDNOField(forms.CharField):
+class MDIDNOField(CheckFieldMixin, forms.CharField):
     """
     A form field for the Moldavian company identification number (IDNO).
 
@@ -18,7 +20,7 @@ class MDIDNOField(forms.CharField):
         super().__init__(**kwargs)
 
 
-class MDLicensePlateField(forms.CharField):
+class MDLicensePlateField(CheckFieldMixin, forms.CharField):
     """
     A form field for the Moldavian license plate number.
 
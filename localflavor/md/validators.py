@@ -1,14 +1,15 @@
 import re
 
-from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckResult, RegexCheckMixin
+
 from .choices import (LICENSE_PLATE_DIPLOMATIC, LICENSE_PLATE_GOVERNMENT_TYPE, LICENSE_PLATE_POLICE,
                       REGION_CHOICES_2002_2015)
 
 
-class MDIDNOFieldValidator(RegexValidator):
+class MDIDNOFieldValidator(RegexCheckMixin, RegexValidator):
     """
     Validation for Moldavian IDNO.
 
@@ -20,7 +21,7 @@ class MDIDNOFieldValidator(RegexValidator):
     message = error_message
 
 
-class MDLicensePlateValidator(RegexValidator):
+class MDLicensePlateValidator(RegexCheckMixin, RegexValidator):
     """
     Validation for `Moldavian License Plates`_.
 
@@ -32,10 +33,11 @@ class MDLicensePlateValidator(RegexValidator):
     regex = r'^\d{13}$'
     message = error_message
 
-    def __call__(self, value):
+    def check(self, value):
         value = value.upper()
         if not self._is_valid(value):
-            raise ValidationError(self.error_message, code='invalid')
+            return CheckResult.invalid(value, 'invalid', self.error_message)
+        return CheckResult.valid(value)
 
     def _is_valid(self, value):
         return any([
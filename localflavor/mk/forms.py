@@ -1,13 +1,14 @@
 import datetime
 
-from django.forms import ValidationError
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .mk_choices import MK_MUNICIPALITIES
 
 
-class MKIdentityCardNumberField(RegexField):
+class MKIdentityCardNumberField(CheckFieldMixin, RegexField):
     """
     A Macedonian ID card number.
 
@@ -37,7 +38,7 @@ class MKMunicipalitySelect(Select):
         super().__init__(attrs, choices=MK_MUNICIPALITIES)
 
 
-class UMCNField(RegexField):
+class UMCNField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as a unique master citizen number.
 
@@ -64,18 +65,13 @@ class UMCNField(RegexField):
         kwargs['max_length'] = 13
         super().__init__(r'^\d{13}$', **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         if not self._validate_date_part(value):
-            raise ValidationError(self.error_messages['date'], code='date')
+            return self.invalid(value, 'date')
         if self._validate_checksum(value):
-            return value
+            return CheckResult.valid(value)
         else:
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
+            return self.invalid(value, 'checksum')
 
     def _validate_checksum(self, value):
         a, b, c, d, e, f, g, h, i, j, k, l, checksum = [int(digit) for digit in value]
@@ -2,8 +2,10 @@
 from django.forms.fields import RegexField
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
 
-class MTPostalCodeField(RegexField):
+
+class MTPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input as a Maltese postal code.
 
@@ -1,10 +1,11 @@
 """Mexican-specific form helpers."""
 import re
 
-from django.forms import ValidationError
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .mx_states import STATE_CHOICES
 
 DATE_RE = r'\d{2}((01|03|05|07|08|10|12)(0[1-9]|[12]\d|3[01])|02(0[1-9]|[12]\d)|(04|06|09|11)(0[1-9]|[12]\d|30))'
@@ -46,7 +47,7 @@ class MXStateSelect(Select):
         super().__init__(attrs, choices=STATE_CHOICES)
 
 
-class MXZipCodeField(RegexField):
+class MXZipCodeField(CheckFieldMixin, RegexField):
     """
     A form field that accepts a Mexican Zip Code.
 
@@ -63,7 +64,7 @@ class MXZipCodeField(RegexField):
         super().__init__(zip_code_re, **kwargs)
 
 
-class MXRFCField(RegexField):
+class MXRFCField(CheckFieldMixin, RegexField):
     """
     A form field that validates a Mexican *Registro Federal de Contribuyentes*.
 
@@ -108,17 +109,14 @@ class MXRFCField(RegexField):
                             re.IGNORECASE)
         super().__init__(rfc_re, min_length=min_length, max_length=max_length, **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         value = value.upper()
         if self._has_homoclave(value):
             if not value[-1] == self._checksum(value[:-1]):
-                raise ValidationError(self.error_messages['invalid_checksum'], code='invalid_checksum')
+                return self.invalid(value, 'invalid_checksum')
         if self._has_inconvenient_word(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return value
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(value)
 
     def _has_homoclave(self, rfc):
         """
@@ -158,7 +156,7 @@ class MXRFCField(RegexField):
         return first_four in RFC_INCONVENIENT_WORDS
 
 
-class MXCLABEField(RegexField):
+class MXCLABEField(CheckFieldMixin, RegexField):
     """
     This field validates a CLABE (Clave Bancaria Estandarizada).
 
@@ -190,19 +188,16 @@ class MXCLABEField(RegexField):
 
         return verification_digit == (10 - sum_remainder) % 10
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         if not value.isdigit():
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if not self._checksum(value):
-            raise ValidationError(self.error_messages['invalid_checksum'], code='invalid_checksum')
+            return self.invalid(value, 'invalid_checksum')
 
-        return value
+        return CheckResult.valid(value)
 
 
-class MXCURPField(RegexField):
+class MXCURPField(CheckFieldMixin, RegexField):
     """
     A field that validates a Mexican Clave Única de Registro de Población.
 
@@ -241,16 +236,13 @@ class MXCURPField(RegexField):
         curp_re = re.compile(curp_re, re.IGNORECASE)
         super().__init__(curp_re, min_length=min_length, max_length=max_length, **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         value = value.upper()
         if value[-1] != self._checksum(value[:-1]):
-            raise ValidationError(self.error_messages['invalid_checksum'], code='invalid_checksum')
+            return self.invalid(value, 'invalid_checksum')
         if self._has_inconvenient_word(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return value
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(value)
 
     def _checksum(self, value):
         chars = '0123456789ABCDEFGHIJKLMN&OPQRSTUVWXYZ'
@@ -267,7 +259,7 @@ class MXCURPField(RegexField):
         return first_four in CURP_INCONVENIENT_WORDS
 
 
-class MXSocialSecurityNumberField(RegexField):
+class MXSocialSecurityNumberField(CheckFieldMixin, RegexField):
     """
     A field that validates a Mexican Social Security Number.
 
@@ -299,13 +291,10 @@ class MXSocialSecurityNumberField(RegexField):
         ssn_re = re.compile(ssn_re)
         super().__init__(ssn_re, min_length=min_length, max_length=max_length, **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         if value[-1] != self.__checksum(value[:-1]):
-            raise ValidationError(self.error_messages['invalid_checksum'], code='invalid_checksum')
-        return value
+            return self.invalid(value, 'invalid_checksum')
+        return CheckResult.valid(value)
 
     def __checksum(self, value):
         multipliers = [1 if i % 2 == 0 else 2 for i in range(10)]
@@ -1,6 +1,9 @@
 from django.db.models import CharField
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.constraints import FormatCheckMixin
+from localflavor.storage import IntegerStorageMixin
+
 from .forms import MXCLABEField as MXCLABEFormField
 from .forms import MXCURPField as MXCURPFormField
 from .forms import MXRFCField as MXRFCFormField
@@ -25,10 +28,17 @@ class MXStateField(CharField):
         return name, path, args, kwargs
 
 
-class MXZipCodeField(CharField):
-    """A model field that forms represent as a forms.MXZipCodeField field and stores the five-digit Mexican zip code."""
+class MXZipCodeField(FormatCheckMixin, CharField):
+    """
+    A model field that forms represent as a forms.MXZipCodeField field and stores the five-digit Mexican zip code.
+
+    .. versionchanged:: 5.1
+
+        Added ``db_format_check``, see :mod:`localflavor.constraints`.
+    """
 
     description = _("Mexico zip code")
+    format_patterns = ('0[1-9]' + '[0-9]' * 3, '1[0-6]' + '[0-9]' * 3, '[2-9]' + '[0-9]' * 4)
 
     def __init__(self, *args, **kwargs):
         kwargs['max_length'] = 5
@@ -89,14 +99,19 @@ class MXCURPField(CharField):
         return super().formfield(**defaults)
 
 
-class MXSocialSecurityNumberField(CharField):
+class MXSocialSecurityNumberField(IntegerStorageMixin, CharField):
     """
     A model field that forms represent as a forms.MXSocialSecurityNumberField field.
 
     It stores the value of a valid Mexican Social Security Number.
+
+    .. versionchanged:: 5.1
+
+        Added ``db_integer_storage``, see :mod:`localflavor.storage`.
     """
 
     description = _("Mexican Social Security Number")
+    digits_format = 'ddddddddddd'
 
     def __init__(self, *args, **kwargs):
         kwargs['max_length'] = 11
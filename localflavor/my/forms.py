@@ -1,10 +1,11 @@
-from django.forms import ValidationError
 from django.forms.fields import CharField
 from django.utils.translation import gettext_lazy as _
 from stdnum.my import nric
 
+from localflavor.results import CheckFieldMixin, CheckResult
 
-class MyKadFormField(CharField):
+
+class MyKadFormField(CheckFieldMixin, CharField):
     """
     A form field that validates input as a Malaysia MyKad number.
 
@@ -18,15 +19,10 @@ class MyKadFormField(CharField):
         'invalid': _('Invalid MyKad number.')
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         if nric.is_valid(value):
-            return value
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return CheckResult.valid(value)
+        return self.invalid(value, 'invalid')
 
     def to_python(self, value):
         value = super().to_python(value)
@@ -4,23 +4,25 @@ import re
 
 from django import forms
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .nl_provinces import PROVINCE_CHOICES
 from .validators import NLBSNFieldValidator, NLLicensePlateFieldValidator, NLZipCodeFieldValidator
 
 
-class NLZipCodeField(forms.CharField):
+class NLZipCodeField(CheckFieldMixin, forms.CharField):
     """A Dutch zip code field."""
 
     default_validators = [NLZipCodeFieldValidator()]
 
-    def clean(self, value):
+    def check(self, value):
         if isinstance(value, str):
             value = value.upper().replace(' ', '')
 
             if len(value) == 6:
                 value = '%s %s' % (value[:4], value[4:])
 
-        return super().clean(value)
+        return super().check(value)
 
 
 class NLProvinceSelect(forms.Select):
@@ -30,7 +32,7 @@ class NLProvinceSelect(forms.Select):
         super().__init__(attrs, choices=PROVINCE_CHOICES)
 
 
-class NLBSNFormField(forms.CharField):
+class NLBSNFormField(CheckFieldMixin, forms.CharField):
     """
     A Dutch social security number (BSN) field.
 
@@ -48,7 +50,7 @@ class NLBSNFormField(forms.CharField):
         super().__init__(**kwargs)
 
 
-class NLLicensePlateFormField(forms.CharField):
+class NLLicensePlateFormField(CheckFieldMixin, forms.CharField):
     """
     A Dutch license plate field.
 
@@ -86,12 +88,10 @@ class NLLicensePlateFormField(forms.CharField):
         kwargs['max_length'] = 8
         super().__init__(**kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value:
-            value = value.upper().replace('-', '')
-            for sidecode, regex in self.SANITIZE_REGEXS.items():
-                match = regex.match(value)
-                if match:
-                    return '-'.join(match.groups())
-        return value
+    def check_value(self, value):
+        value = value.upper().replace('-', '')
+        for sidecode, regex in self.SANITIZE_REGEXS.items():
+            match = regex.match(value)
+            if match:
+                return CheckResult.valid('-'.join(match.groups()))
+        return CheckResult.valid(value)
@@ -1,21 +1,28 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.constraints import FormatCheckMixin
+from localflavor.storage import IntegerStorageMixin
+
 from . import forms
 from .nl_provinces import PROVINCE_CHOICES
 from .validators import NLBSNFieldValidator, NLLicensePlateFieldValidator, NLZipCodeFieldValidator
 
 
-class NLZipCodeField(models.CharField):
+class NLZipCodeField(FormatCheckMixin, models.CharField):
     """
     A Dutch zip code model field.
 
     This model field uses :class:`validators.NLZipCodeFieldValidator` for validation.
 
     .. versionadded:: 1.3
+    .. versionchanged:: 5.1
+
+        Added ``db_format_check``, see :mod:`localflavor.constraints`.
     """
 
     description = _('Dutch zipcode')
+    format_patterns = ('[1-9][0-9][0-9][0-9] [A-Z][A-Z]', '[1-9][0-9][0-9][0-9][A-Z][A-Z]')
 
     validators = [NLZipCodeFieldValidator()]
 
@@ -59,16 +66,20 @@ class NLProvinceField(models.CharField):
         return name, path, args, kwargs
 
 
-class NLBSNField(models.CharField):
+class NLBSNField(IntegerStorageMixin, models.CharField):
     """
     A Dutch social security number (BSN).
 
     This model field uses :class:`validators.NLBSNFieldValidator` for validation.
 
     .. versionadded:: 1.6
+    .. versionchanged:: 5.1
+
+        Added ``db_integer_storage``, see :mod:`localflavor.storage`.
     """
 
     description = _('Dutch social security number (BSN)')
+    digits_format = 'ddddddddd'
 
     validators = [NLBSNFieldValidator()]
 
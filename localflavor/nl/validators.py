@@ -1,9 +1,10 @@
-from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckResult, RegexCheckMixin
 
-class NLZipCodeFieldValidator(RegexValidator):
+
+class NLZipCodeFieldValidator(RegexCheckMixin, RegexValidator):
     """
     Validation for Dutch zip codes.
 
@@ -15,14 +16,15 @@ class NLZipCodeFieldValidator(RegexValidator):
     def __init__(self):
         super().__init__(regex=r'^\d{4} ?[A-Z]{2}$', message=self.error_message)
 
-    def __call__(self, value):
-        super().__call__(value)
+    def check(self, value):
+        result = self.check_regex(value)
 
-        if int(value[:4]) < 1000:
-            raise ValidationError(self.error_message, code='invalid')
+        if result and int(value[:4]) < 1000:
+            return CheckResult.invalid(value, 'invalid', self.error_message)
+        return result
 
 
-class NLBSNFieldValidator(RegexValidator):
+class NLBSNFieldValidator(RegexCheckMixin, RegexValidator):
     """
     Validation for Dutch social security numbers (BSN).
 
@@ -42,17 +44,17 @@ class NLBSNFieldValidator(RegexValidator):
 
         return checksum % 11 == 0
 
-    def __call__(self, value):
-        super().__call__(value)
-
-        if int(value) == 0:
-            raise ValidationError(self.error_message, code='invalid')
+    def check(self, value):
+        result = self.check_regex(value)
+        if not result:
+            return result
 
-        if not self.bsn_checksum_ok(value):
-            raise ValidationError(self.error_message, code='invalid')
+        if int(value) == 0 or not self.bsn_checksum_ok(value):
+            return CheckResult.invalid(value, 'invalid', self.error_message)
+        return result
 
 
-class NLLicensePlateFieldValidator(RegexValidator):
+class NLLicensePlateFieldValidator(RegexCheckMixin, RegexValidator):
     """
     Validation for Dutch license plates.
 
@@ -7,10 +7,12 @@ from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .no_municipalities import MUNICIPALITY_CHOICES
 
 
-class NOZipCodeField(RegexField):
+class NOZipCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as a Norwegian zip code.
 
@@ -32,22 +34,21 @@ class NOMunicipalitySelect(Select):
         super().__init__(attrs, choices=MUNICIPALITY_CHOICES)
 
 
-class NOSocialSecurityNumber(CharField):
+class NOSocialSecurityNumber(CheckFieldMixin, CharField):
     """Algorithm is documented at http://no.wikipedia.org/wiki/Personnummer."""
 
     default_error_messages = {
         'invalid': _('Enter a valid Norwegian social security number.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         if not re.match(r'^\d{11}$', value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        self.birthday = self._get_birthday(value)
+        try:
+            self.birthday = self._get_birthday(value)
+        except ValidationError as e:
+            return CheckResult.from_error(value, e)
         self.gender = self._get_gender(value)
 
         digits = map(int, list(value))
@@ -58,11 +59,11 @@ class NOSocialSecurityNumber(CharField):
             return sum([(a * b) for (a, b) in zip(aval, bval)])
 
         if multiply_reduce(digits, weight_1) % 11 != 0:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if multiply_reduce(digits, weight_2) % 11 != 0:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value
+        return CheckResult.valid(value)
 
     def _get_gender(self, value):
         sexnum = int(value[8])
@@ -92,7 +93,7 @@ class NOSocialSecurityNumber(CharField):
         return birthday
 
 
-class NOBankAccountNumber(CharField):
+class NOBankAccountNumber(CheckFieldMixin, CharField):
     """
     A form field for Norwegian bank account numbers.
 
@@ -117,19 +118,14 @@ class NOBankAccountNumber(CharField):
         'invalid_length': _('Invalid length. Norwegian bank account numbers are 11 digits long.'),
     }
 
-    def validate(self, value):
-        super().validate(value)
-
-        if value in self.empty_values:
-            # It's alright to be empty.
-            return
-        elif not value.isdigit():
+    def check_value(self, value):
+        if not value.isdigit():
             # You must only contain decimals.
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         elif len(value) != 11:
             # They only have one length: the number is 10!
             # That being said, you always store them with the check digit included, so 11.
-            raise ValidationError(self.error_messages['invalid_length'], code='invalid_length')
+            return self.invalid(value, 'invalid_length')
 
         # The control/check digit is the last digit
         check_digit = int(value[-1])
@@ -144,7 +140,8 @@ class NOBankAccountNumber(CharField):
         checksum = 0 if remainder == 0 else 11 - remainder
 
         if checksum != check_digit:
-            raise ValidationError(self.error_messages['invalid_checksum'], code='invalid_checksum')
+            return self.invalid(value, 'invalid_checksum')
+        return CheckResult.valid(value)
 
     def to_python(self, value):
         value = super().to_python(value)
@@ -0,0 +1,104 @@
+"""
+Looking up formatted identifiers with or without their separators.
+
+Fields like :class:`~localflavor.br.models.BRCNPJField` store the numbers as they were entered, so the same number can
+be stored as ``'12.345.678/0001-95'`` or ``'12345678000195'`` and an ``exact`` lookup only finds one of them. The
+``normalized`` lookup compares the values without separators and in upper case instead:
+
+.. code-block:: python
+
+    Customer.objects.filter(cnpj__normalized='12345678000195')
+
+With ``db_normalized_index=True`` the field also adds an index on the same expression to the model, so the lookup
+doesn't have to scan the table:
+
+.. code-block:: python
+
+    class Customer(models.Model):
+        cnpj = BRCNPJField(db_normalized_index=True)
+
+The expression can be used for other indexes and queries with :class:`Normalized`.
+
+.. versionadded:: 5.1
+"""
+from django.db.backends.utils import names_digest
+from django.db.models import CharField, Func, Index, Lookup
+from django.db.models.lookups import Exact
+
+from localflavor.constraints import add_to_meta
+
+
+class Normalized(Func):
+    """
+    The value of ``expression``, a field name or an expression, in upper case and without the characters in
+    ``separators``.
+
+    The separators are written into the SQL instead of being passed as parameters, so the databases can match queries
+    to indexes on the same expression.
+    """
+
+    output_field = CharField()
+
+    def __init__(self, expression, separators, **extra):
+        super().__init__(expression, separators=separators, **extra)
+
+    def as_sql(self, compiler, connection, **extra_context):
+        sql, params = compiler.compile(self.source_expressions[0])
+        for separator in self.extra['separators']:
+            sql = "REPLACE(%s, '%s', '')" % (sql, separator.replace("'", "''").replace('%', '%%'))
+        return 'UPPER(%s)' % sql, params
+
+
+def normalize(value, separators):
+    """Returns the value in upper case and without the characters in ``separators``, like :class:`Normalized`."""
+    return str(value).translate({ord(separator): None for separator in separators}).upper()
+
+
+class NormalizedLookup(Lookup):
+    """The ``normalized`` lookup of fields with :class:`NormalizedLookupMixin`."""
+
+    lookup_name = 'normalized'
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        field = self.lhs.output_field
+        if getattr(field, 'db_integer_storage', False):
+            # The digits are stored without separators already.
+            return compiler.compile(Exact(self.lhs, self.rhs))
+        separators = field.normalize_separators
+        return compiler.compile(Exact(Normalized(self.lhs, separators), normalize(self.rhs, separators)))
+
+
+class NormalizedLookupMixin:
+    """
+    A mixin for model fields that adds the ``normalized`` lookup and the ``db_normalized_index`` option.
+
+    Subclasses set ``normalize_separators`` to the characters that are ignored by the lookup.
+    """
+
+    normalize_separators = ''
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.register_lookup(NormalizedLookup)
+
+    def __init__(self, *args, db_normalized_index=False, **kwargs):
+        self.db_normalized_index = db_normalized_index
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.db_normalized_index:
+            kwargs['db_normalized_index'] = True
+        return name, path, args, kwargs
+
+    def normalized_index(self, model):
+        """Returns the index for the ``normalized`` lookup of this field in ``model``."""
+        # Index names are limited to 30 characters.
+        name = '%s_%s_nrm' % (self.name[:17], names_digest(model._meta.db_table, self.name, length=8))
+        return Index(Normalized(self.name, self.normalize_separators), name=name)
+
+    def contribute_to_class(self, cls, name, *args, **kwargs):
+        super().contribute_to_class(cls, name, *args, **kwargs)
+        if self.db_normalized_index and not getattr(self, 'db_integer_storage', False):
+            add_to_meta(cls, 'indexes', self.normalized_index(cls))
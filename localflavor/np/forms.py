@@ -3,12 +3,14 @@
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .np_districts import DISTRICTS
 from .np_provinces import PROVINCES
 from .np_zones import ZONES
 
 
-class NPPostalCodeFormField(RegexField):
+class NPPostalCodeFormField(CheckFieldMixin, RegexField):
     """
         A form field that accepts Nepali postal code.
         Format : XXXXX
@@ -6,13 +6,15 @@ from django.core.validators import RegexValidator
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import RegexCheckMixin
+
 from .forms import NPPostalCodeFormField
 from .np_districts import DISTRICTS
 from .np_provinces import PROVINCES
 from .np_zones import ZONES
 
 
-class NPPostalCodeValidator(RegexValidator):
+class NPPostalCodeValidator(RegexCheckMixin, RegexValidator):
     """
     A validator for Nepali Postal Codes.
     """
@@ -1,10 +1,11 @@
 """New Zealand specific form helpers."""
 import re
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .nz_councils import NORTH_ISLAND_COUNCIL_CHOICES, SOUTH_ISLAND_COUNCIL_CHOICES
 from .nz_provinces import PROVINCE_CHOICES
 from .nz_regions import REGION_CHOICES
@@ -40,7 +41,7 @@ class NZSouthIslandCouncilSelect(Select):
         super().__init__(attrs, choices=SOUTH_ISLAND_COUNCIL_CHOICES)
 
 
-class NZPostCodeField(RegexField):
+class NZPostCodeField(CheckFieldMixin, RegexField):
     """A form field that validates its input as New Zealand postal code."""
 
     default_error_messages = {
@@ -51,7 +52,7 @@ class NZPostCodeField(RegexField):
         super().__init__(r'^\d{4}$', **kwargs)
 
 
-class NZBankAccountNumberField(CharField):
+class NZBankAccountNumberField(CheckFieldMixin, CharField):
     """
     A form field that validates its input as New Zealand bank account number.
 
@@ -78,16 +79,12 @@ class NZBankAccountNumberField(CharField):
         'invalid': _('Invalid bank account number.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         value = re.sub(r'(\s+|-)', '', value)
         match = BANK_ACCOUNT_NUMBER_RE.search(value)
         if match:
             # normalize the last part
             last = '0%s' % match.group(4) if len(match.group(4)) == 2 else match.group(4)
-            return '%s-%s-%s-%s' % (match.group(1),
-                                    match.group(2), match.group(3), last)
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return CheckResult.valid('%s-%s-%s-%s' % (match.group(1),
+                                                      match.group(2), match.group(3), last))
+        return self.invalid(value, 'invalid')
@@ -0,0 +1,106 @@
+"""
+The process wide cache of the options rendered by select widgets with
+:class:`~localflavor.widgets.CachedOptionsMixin`.
+
+This module is only imported by the first widget that is rendered with the ``LOCALFLAVOR_OPTION_CACHE_SIZE`` setting,
+so the flavors that use the mixin don't import it otherwise.
+
+.. versionadded:: 5.1
+"""
+import threading
+from collections import OrderedDict
+
+from django.forms.renderers import get_default_renderer
+from django.utils.functional import Promise
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from localflavor.choices import ChoiceTable
+from localflavor.widgets import CachedOptionsMixin
+
+
+class OptionCache:
+    """A thread safe LRU cache of rendered options."""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, is_valid):
+        """Returns the entry for the key if there is one and ``is_valid(entry)`` is true."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not is_valid(entry):
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, entry, max_size):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+#: The cache shared by all widgets.
+option_cache = OptionCache()
+
+
+def _split(shell, html):
+    """
+    Returns the options and the end of ``html``, the widget rendered with options, given ``shell``, the same widget
+    rendered without options. Returns ``None`` when the options can't be separated from the rest.
+    """
+    suffix = 0
+    limit = min(len(shell), len(html))
+    while suffix < limit and shell[-1 - suffix] == html[-1 - suffix]:
+        suffix += 1
+    head = shell[:len(shell) - suffix]
+    if not suffix or not html.startswith(head):
+        return None
+    return html[len(head):len(html) - suffix], shell[len(shell) - suffix:]
+
+
+def _choices_key(widget):
+    # Choice tables are immutable and lazy choices, like the US states sorted by their translated names, only change
+    # with the language, so both are compared by identity. Other choices are compared by their items.
+    choices = widget.choices
+    return choices if isinstance(choices, (ChoiceTable, Promise)) else tuple(choices)
+
+
+def render(widget, name, value, attrs, renderer, max_size):
+    """Renders a widget with :class:`~localflavor.widgets.CachedOptionsMixin` with the cached options if possible."""
+    render_uncached = super(CachedOptionsMixin, widget).render
+    renderer = renderer or get_default_renderer()
+    key = (type(widget), id(renderer), get_language(), frozenset(widget.format_value(value)))
+    choices = _choices_key(widget)
+
+    def is_valid(entry):
+        return entry[0] is renderer and (entry[1] is choices or entry[1] == choices)
+
+    entry = option_cache.get(key, is_valid)
+    if entry is not None:
+        options, end = entry[2:]
+        shell = widget._render_shell(name, value, attrs, renderer)
+        if shell.endswith(end):
+            return mark_safe(shell[:len(shell) - len(end)] + options + end)
+
+    html = render_uncached(name, value, attrs, renderer)
+    parts = _split(widget._render_shell(name, value, attrs, renderer), html)
+    if parts is not None:
+        # The renderer is kept in the entry so its id isn't reused by another renderer while it's cached.
+        option_cache.set(key, (renderer, choices) + parts, max_size)
+    return html
@@ -1,9 +1,10 @@
 """PE-specific Form helpers."""
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .pe_region import REGION_CHOICES
 
 
@@ -14,7 +15,7 @@ class PERegionSelect(Select):
         super().__init__(attrs, choices=REGION_CHOICES)
 
 
-class PEDNIField(CharField):
+class PEDNIField(CheckFieldMixin, CharField):
     """A field that validates Documento Nacional de Identidad (DNI) numbers."""
 
     default_error_messages = {
@@ -25,20 +26,17 @@ class PEDNIField(CharField):
     def __init__(self, max_length=8, min_length=8, **kwargs):
         super().__init__(max_length=max_length, min_length=min_length, **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """Value must be a string in the XXXXXXXX formats."""
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         if not value.isdigit():
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if len(value) != 8:
-            raise ValidationError(self.error_messages['max_digits'], code='max_digits')
+            return self.invalid(value, 'max_digits')
 
-        return value
+        return CheckResult.valid(value)
 
 
-class PERUCField(CharField):
+class PERUCField(CheckFieldMixin, CharField):
     """
     This field validates a RUC (Registro Unico de Contribuyentes).
 
@@ -53,13 +51,10 @@ class PERUCField(CharField):
     def __init__(self, max_length=11, min_length=11, **kwargs):
         super().__init__(max_length=max_length, min_length=min_length, **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """Value must be an 11-digit number."""
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         if not value.isdigit():
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         if len(value) != 11:
-            raise ValidationError(self.error_messages['max_digits'], code='max_digits')
-        return value
+            return self.invalid(value, 'max_digits')
+        return CheckResult.valid(value)
@@ -5,12 +5,14 @@ import re
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .pk_states import STATE_CHOICES
 
 POSTCODE_DIGITS_RE = re.compile(r'^(\d{5})$')
 
 
-class PKPostCodeField(RegexField):
+class PKPostCodeField(CheckFieldMixin, RegexField):
     """
     Pakistani post code field.
 
@@ -3,10 +3,11 @@
 import datetime
 import re
 
-from django.forms import ValidationError
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .pl_administrativeunits import ADMINISTRATIVE_UNIT_CHOICES
 from .pl_voivodeships import VOIVODESHIP_CHOICES
 
@@ -25,7 +26,7 @@ class PLCountySelect(Select):
         super().__init__(attrs, choices=ADMINISTRATIVE_UNIT_CHOICES)
 
 
-class PLPESELField(RegexField):
+class PLPESELField(CheckFieldMixin, RegexField):
     """
     A form field that validates as Polish Identification Number (PESEL).
 
@@ -48,15 +49,12 @@ class PLPESELField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^\d{11}$', **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         if not self.has_valid_checksum(value):
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
+            return self.invalid(value, 'checksum')
         if not self.has_valid_birth_date(value):
-            raise ValidationError(self.error_messages['birthdate'], code='birthdate')
-        return '%s' % value
+            return self.invalid(value, 'birthdate')
+        return CheckResult.valid('%s' % value)
 
     def has_valid_checksum(self, number):
         """Calculates a checksum with the provided algorithm."""
@@ -86,7 +84,7 @@ class PLPESELField(RegexField):
             return False
 
 
-class PLNationalIDCardNumberField(RegexField):
+class PLNationalIDCardNumberField(CheckFieldMixin, RegexField):
     """
     A form field that validates as Polish National ID Card Number.
 
@@ -105,16 +103,12 @@ class PLNationalIDCardNumberField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^[A-Za-z]{3}\d{6}$', **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         value = value.upper()
 
         if not self.has_valid_checksum(value):
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
-        return '%s' % value
+            return self.invalid(value, 'checksum')
+        return CheckResult.valid('%s' % value)
 
     def has_valid_checksum(self, number):
         """Calculates a checksum with the provided algorithm."""
@@ -138,7 +132,7 @@ class PLNationalIDCardNumberField(RegexField):
         return result % 10 == 0
 
 
-class PLNIPField(RegexField):
+class PLNIPField(CheckFieldMixin, RegexField):
     """
     A form field that validates as Polish Tax Number (NIP).
 
@@ -158,14 +152,11 @@ class PLNIPField(RegexField):
             **kwargs
         )
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         value = re.sub("[-]", "", value)
         if not self.has_valid_checksum(value):
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
-        return '%s' % value
+            return self.invalid(value, 'checksum')
+        return CheckResult.valid('%s' % value)
 
     def has_valid_checksum(self, number):
         """Calculates a checksum with the provided algorithm."""
@@ -178,7 +169,7 @@ class PLNIPField(RegexField):
         return result == int(number[-1])
 
 
-class PLREGONField(RegexField):
+class PLREGONField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input is a REGON number.
 
@@ -194,13 +185,10 @@ class PLREGONField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^(\d{9}|\d{14})$', **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         if not self.has_valid_checksum(value):
-            raise ValidationError(self.error_messages['checksum'], code='checksum')
-        return '%s' % value
+            return self.invalid(value, 'checksum')
+        return CheckResult.valid('%s' % value)
 
     def has_valid_checksum(self, number):
         """Calculates a checksum with the provided algorithm."""
@@ -227,7 +215,7 @@ class PLREGONField(RegexField):
         return bool(weights)
 
 
-class PLPostalCodeField(RegexField):
+class PLPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates as Polish postal code.
 
@@ -6,10 +6,11 @@ Contains PT-specific Django form helpers.
 
 from re import compile as regex_compile
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .pt_regions import REGION_CHOICES
 
 CITIZEN_CARD_NUMBER_REGEX = regex_compile(r'^(\d{8})-?(\d[A-Z0-9]{2}\d)$')
@@ -18,7 +19,7 @@ SOCIAL_SECURITY_NUMBER_REGEX = regex_compile(r'^[12]\d{10}$')
 ZIP_CODE_REGEX = regex_compile(r'^[1-9]\d{3}-\d{3}$')
 
 
-class PTCitizenCardNumberField(CharField):
+class PTCitizenCardNumberField(CheckFieldMixin, CharField):
     """
     A field which validates Portuguese Citizen Card numbers (locally CC - 'Cartão do Cidadão').
 
@@ -35,15 +36,11 @@ class PTCitizenCardNumberField(CharField):
                      '(where X is a digit and Y is an alphanumeric character).'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = CITIZEN_CARD_NUMBER_REGEX.match(value)
 
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         number, checkdigits = match.groups()
 
@@ -54,9 +51,9 @@ class PTCitizenCardNumberField(CharField):
                         for index, decoded_value in enumerate(decoded)])
 
         if not checksum % 10 == 0:
-            raise ValidationError(self.error_messages['badchecksum'], code='badchecksum')
+            return self.invalid(value, 'badchecksum')
 
-        return '{0}-{1}'.format(number, checkdigits)
+        return CheckResult.valid('{0}-{1}'.format(number, checkdigits))
 
     @staticmethod
     def compute(index, value):
@@ -78,7 +75,7 @@ class PTRegionSelect(Select):
         super().__init__(attrs, choices=REGION_CHOICES)
 
 
-class PTSocialSecurityNumberField(CharField):
+class PTSocialSecurityNumberField(CheckFieldMixin, CharField):
     """
     A field which validates Portuguese Social Security numbers.
 
@@ -92,15 +89,11 @@ class PTSocialSecurityNumberField(CharField):
                      '(where X is either 1 or 2 and Y is any other digit).'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = SOCIAL_SECURITY_NUMBER_REGEX.search(value)
 
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         digits = [int(digit) for digit in value]
 
@@ -111,12 +104,12 @@ class PTSocialSecurityNumberField(CharField):
         checkdigit = int(value[-1])
 
         if not checksum == checkdigit:
-            raise ValidationError(self.error_messages['badchecksum'], code='badchecksum')
+            return self.invalid(value, 'badchecksum')
 
-        return int(value)
+        return CheckResult.valid(int(value))
 
 
-class PTZipCodeField(RegexField):
+class PTZipCodeField(CheckFieldMixin, RegexField):
     """
     A field which validates Portuguese zip codes.
 
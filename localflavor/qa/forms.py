@@ -1,12 +1,13 @@
-from django.core.exceptions import ValidationError
 from django.forms.fields import CharField, ChoiceField
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .qa_municipalities import MUNICIPALITY_CHOICES, resolve_municipality
 from .validators import QANationalIDValidator
 
 
-class QANationalIDNumberField(CharField):
+class QANationalIDNumberField(CheckFieldMixin, CharField):
     """
     A form field for validating Qatari National ID numbers.
 
@@ -24,7 +25,7 @@ class QANationalIDNumberField(CharField):
         )  
 
 
-class QAMunicipalityField(ChoiceField):
+class QAMunicipalityField(CheckFieldMixin, ChoiceField):
     """
     A choice field for Qatar municipalities.
 
@@ -40,16 +41,12 @@ class QAMunicipalityField(ChoiceField):
         kwargs.setdefault('choices', MUNICIPALITY_CHOICES)
         super().__init__(**kwargs)
 
-    def clean(self, value):
+    def check(self, value):
         if value in self.empty_values:
-            return super().clean(value)
+            return super().check(value)
 
         normalized_value = resolve_municipality(str(value))
         if not normalized_value:
-            raise ValidationError(
-                self.error_messages['invalid_choice'],
-                code='invalid_choice',
-                params={'value': value},
-            )
+            return self.invalid(value, 'invalid_choice', {'value': value})
 
-        return super().clean(normalized_value)
+        return super().check(normalized_value)
@@ -1,15 +1,15 @@
 import re
 from datetime import date
 
-from django.core.exceptions import ValidationError
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
 
-from localflavor.generic.countries.iso_3166 import ISO_3166_1_NUMERIC_COUNTRY_CODES
+from localflavor.generic.countries.registry import countries
+from localflavor.results import CheckMixin, CheckResult
 
 
 @deconstructible
-class QANationalIDValidator:
+class QANationalIDValidator(CheckMixin):
     """
     Validate Qatari National ID numbers.
 
@@ -39,27 +39,28 @@ class QANationalIDValidator:
         if code is not None:
             self.code = code
 
-    def __call__(self, value):
+    def check(self, value):
         if not value:
-            return
+            return CheckResult.valid(value)
 
         clean_value = str(value).strip()
         if not re.match(r'^\d{11}$', clean_value):
-            raise ValidationError(self.message, code=self.code)
+            return CheckResult.invalid(value, self.code, self.message)
 
         century = clean_value[0]
         year = clean_value[1:3]
         nationality_code = clean_value[3:6]
 
         if century not in ('2', '3'):
-            raise ValidationError(self.message, code=self.code)
+            return CheckResult.invalid(value, self.code, self.message)
 
         full_year = (int(century) + 17) * 100 + int(year)
         if full_year > date.today().year:
-            raise ValidationError(self.message, code=self.code)
+            return CheckResult.invalid(value, self.code, self.message)
 
-        if nationality_code not in ISO_3166_1_NUMERIC_COUNTRY_CODES:
-            raise ValidationError(self.message, code=self.code)
+        if not countries.is_numeric(nationality_code):
+            return CheckResult.invalid(value, self.code, self.message)
+        return CheckResult.valid(clean_value)
 
     def __eq__(self, other):
         return (
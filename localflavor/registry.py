@@ -0,0 +1,263 @@
+"""
+Finding the form fields, model fields, validators and widgets of a country without importing every flavor.
+
+Importing ``localflavor.<country>.forms`` imports the data modules of the country, so importing all of them to find the
+fields of a few countries is slow and uses a lot of memory. The registry looks them up in a manifest of dotted paths
+instead and only imports the module of an entry when one of its classes is used.
+
+The entries of a country are named after their classes, without the country prefix and the ``Field``, ``Select`` or
+``Validator`` suffix, so :class:`~localflavor.br.forms.BRCPFField` is found as ``'cpf'``. Classes that are named
+differently for the same value, like :class:`~localflavor.br.forms.BRZipCodeField` and
+:class:`~localflavor.br.models.BRPostalCodeField`, are one entry that can be found by either name. Most entries also
+have a kind, one of :data:`KINDS`, which finds the entry of that kind when a country has only one. The kinds take
+precedence over the names:
+
+.. code-block:: python
+
+    from localflavor import registry
+
+    registry.get('br', 'cpf').form_field           # localflavor.br.forms.BRCPFField
+    registry.get('br', 'tax_id').model_field       # localflavor.br.models.BRCNPJField
+    registry.get('us', 'postal_code').form_field   # localflavor.us.forms.USZipCodeField
+    registry.get('br', 'postal_code').form_field   # localflavor.br.forms.BRZipCodeField
+    [entry.name for entry in registry.entries('us', kind='tax_id')]
+
+The manifest in ``localflavor/manifest.py`` is generated from the flavors with ``invoke update-registry``.
+
+.. versionadded:: 5.1
+"""
+import importlib
+import inspect
+import os
+import re
+
+from django.utils.module_loading import import_string
+
+from localflavor.manifest import MANIFEST
+
+#: The kinds of entries.
+KINDS = ('postal_code', 'region', 'national_id', 'tax_id', 'business_id', 'bank_account', 'license_plate')
+
+#: The roles of the classes of an entry.
+ROLES = ('form_field', 'model_field', 'validator', 'widget')
+
+
+class Entry:
+    """
+    The classes of a country for one kind of value.
+
+    The classes are available as the ``form_field``, ``model_field``, ``validator`` and ``widget`` attributes, which
+    import their module the first time they are used and are ``None`` when the country doesn't have one. Their dotted
+    paths are in :attr:`paths`. :attr:`aliases` are the other names of the entry.
+    """
+
+    def __init__(self, country, name, kind, paths, aliases=()):
+        self.country = country
+        self.name = name
+        self.kind = kind
+        self.paths = paths
+        self.aliases = aliases
+        self._classes = {}
+
+    def __repr__(self):
+        return '<Entry %s.%s>' % (self.country, self.name)
+
+    def __getattr__(self, role):
+        if role not in ROLES:
+            raise AttributeError(role)
+        if role not in self._classes:
+            path = self.paths.get(role)
+            self._classes[role] = import_string(path) if path else None
+        return self._classes[role]
+
+
+_entries = {}
+
+
+def _country_entries(country):
+    country = country.lower()
+    entries = _entries.get(country)
+    if entries is None:
+        try:
+            manifest = MANIFEST[country]
+        except KeyError:
+            raise LookupError('localflavor has no flavor for %r.' % country) from None
+        entries = _entries[country] = {
+            name: Entry(country, name, paths.get('kind'), {role: paths[role] for role in ROLES if role in paths},
+                        paths.get('aliases', ()))
+            for name, paths in manifest.items()
+        }
+    return entries
+
+
+def _aliases(country):
+    return {alias: entry for entry in _country_entries(country).values() for alias in entry.aliases}
+
+
+def countries():
+    """Returns the lower case ISO 3166-1 alpha-2 codes of the countries with a flavor."""
+    return sorted(MANIFEST)
+
+
+def entries(country, kind=None):
+    """Returns the :class:`Entry` objects of a country, only the ones of ``kind`` if it's given."""
+    return [entry for entry in _country_entries(country).values() if kind is None or entry.kind == kind]
+
+
+def get(country, name):
+    """
+    Returns the :class:`Entry` of a country with the kind or name ``name``.
+
+    A kind finds the only entry of that kind, or the one of them that is also named after the kind. Raises
+    ``LookupError`` when there is no such entry or when it's ambiguous.
+    """
+    country_entries = _country_entries(country)
+    if name not in KINDS:
+        try:
+            return country_entries.get(name) or _aliases(country)[name]
+        except KeyError:
+            raise LookupError('localflavor.%s has no %r.' % (country.lower(), name)) from None
+    candidates = [entry for entry in country_entries.values() if entry.kind == name]
+    if len(candidates) > 1:
+        candidates = [entry for entry in candidates if entry.name == name] or candidates
+    if len(candidates) == 1:
+        return candidates[0]
+    if not candidates:
+        raise LookupError('localflavor.%s has no %r.' % (country.lower(), name))
+    raise LookupError('localflavor.%s has several entries of the kind %r: %s.' % (
+        country.lower(), name, ', '.join(entry.name for entry in candidates)))
+
+
+# The rest of the module generates the manifest.
+
+#: The class name prefixes of countries whose prefix isn't their upper case code.
+_PREFIXES = {'ae': 'UAE', 'py': 'Py'}
+_SUFFIXES = ('FormField', 'ChoiceField', 'Field', 'Validator', 'Select')
+#: The kinds of entries with one of these sequences of words in their name, the first match wins.
+_KIND_WORDS = (
+    ('postal_code', ('zip_code', 'postal_code', 'post_code', 'postcode', 'eircode')),
+    ('bank_account', ('bank_account', 'cbu', 'clabe', 'ccc')),
+    ('license_plate', ('license_plate',)),
+    ('tax_id', ('tax', 'taxpayer', 'vat', 'nip', 'cnpj', 'cuit', 'nit', 'ruc', 'rut', 'oib', 'rfc', 'cif',
+                'pan_card')),
+    ('business_id', ('business_number', 'business_registry', 'company_number', 'organisation_number', 'regon',
+                     'siren', 'siret', 'rna', 'eik', 'idno', 'ic_number')),
+    ('national_id', ('cpf', 'social_security', 'social_insurance', 'identity', 'identification', 'id', 'dni',
+                     'pesel', 'bsn', 'curp', 'emso', 'jmbg', 'cnp', 'personal_code', 'birth_number', 'aadhaar',
+                     'nricfin', 'citizen_card', 'cin', 'ci', 'umcn', 'my_kad', 'egn', 'passport', 'pass')),
+    ('region', ('state', 'province', 'region', 'department', 'county', 'municipality', 'prefecture', 'district',
+                'governorate', 'emirate', 'zone', 'nation', 'council', 'administrative_division', 'area')),
+)
+#: Kinds that the names get wrong, USPostalCodeField is a field of the USPS abbreviations of the states.
+_KIND_OVERRIDES = {('us', 'postal_code'): 'region', ('us', 'ps'): 'region'}
+#: Names of classes for the same value as the entry of another name, which are merged into that entry when they are of
+#: the same kind and don't have the same roles.
+_ALIASES = {'zip_code': 'postal_code', 'national_id_number': 'national_id'}
+
+
+def _name(country, class_name):
+    prefix = _PREFIXES.get(country, country.upper())
+    if class_name.startswith(prefix) and class_name[len(prefix):len(prefix) + 1].isupper():
+        class_name = class_name[len(prefix):]
+    stripped = True
+    while stripped:
+        stripped = False
+        for suffix in _SUFFIXES:
+            if class_name.endswith(suffix) and class_name != suffix:
+                class_name = class_name[:-len(suffix)]
+                stripped = True
+    return re.sub(r'(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', '_', class_name).lower()
+
+
+def _kind(country, name):
+    if (country, name) in _KIND_OVERRIDES:
+        return _KIND_OVERRIDES[country, name]
+    words = re.sub(r'\d', '', name).split('_')
+    for kind, kind_words in _KIND_WORDS:
+        for kind_word in kind_words:
+            kind_word = kind_word.split('_')
+            if any(words[position:position + len(kind_word)] == kind_word for position in range(len(words))):
+                return kind
+    return None
+
+
+def _role(cls):
+    from django import forms
+    from django.db import models
+
+    if issubclass(cls, forms.Field):
+        return 'form_field'
+    if issubclass(cls, models.Field):
+        return 'model_field'
+    if issubclass(cls, forms.Widget):
+        return 'widget'
+    if cls.__name__.endswith('Validator') and callable(cls):
+        return 'validator'
+    return None
+
+
+def build_manifest():
+    """Imports every flavor and returns the manifest of their public classes."""
+    import localflavor
+
+    root = os.path.dirname(localflavor.__file__)
+    manifest = {}
+    for package in sorted(os.listdir(root)):
+        if package in ('generic', 'management') or not os.path.exists(os.path.join(root, package, '__init__.py')):
+            continue
+        country = package.rstrip('_')
+        country_manifest = {}
+        for module_name in ('forms', 'models', 'validators', 'widgets'):
+            if not os.path.exists(os.path.join(root, package, module_name + '.py')):
+                continue
+            module = importlib.import_module('localflavor.%s.%s' % (package, module_name))
+            for class_name, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ != module.__name__ or class_name.startswith(('_', 'Base')):
+                    continue
+                role = _role(cls)
+                if role is None:
+                    continue
+                name = _name(country, class_name)
+                entry = country_manifest.setdefault(name, {'kind': _kind(country, name)})
+                # Keep the first class of a role, the module of the role comes first.
+                entry.setdefault(role, '%s.%s' % (module.__name__, class_name))
+        for alias, name in _ALIASES.items():
+            entry, alias_entry = country_manifest.get(name), country_manifest.get(alias)
+            if (entry and alias_entry and entry['kind'] == alias_entry['kind']
+                    and entry.keys() & alias_entry.keys() == {'kind'}):
+                entry.update(country_manifest.pop(alias))
+                entry['aliases'] = entry.get('aliases', ()) + (alias,)
+        if country_manifest:
+            manifest[country] = country_manifest
+    return manifest
+
+
+def write_manifest(path=None):
+    """Writes the manifest of :func:`build_manifest` to ``localflavor/manifest.py``."""
+    lines = [
+        '"""The classes of every flavor for :mod:`localflavor.registry`."""',
+        '# Generated with `invoke update-registry`, don\'t edit.',
+        '',
+        'MANIFEST = {',
+    ]
+    for country, country_manifest in sorted(build_manifest().items()):
+        lines.append('    %r: {' % country)
+        for name, entry in sorted(country_manifest.items()):
+            lines.append('        %r: {' % name)
+            lines.extend('            %r: %r,' % (key, entry[key]) for key in ('kind',) + ROLES + ('aliases',)
+                         if key in entry)
+            lines.append('        },')
+        lines.append('    },')
+    lines.append('}')
+    path = path or os.path.join(os.path.dirname(__file__), 'manifest.py')
+    with open(path, 'w') as manifest_file:
+        manifest_file.write('\n'.join(lines) + '\n')
+
+
+if __name__ == '__main__':
+    import django
+    from django.conf import settings
+
+    settings.configure(USE_I18N=True)
+    django.setup()
+    write_manifest()
@@ -0,0 +1,337 @@
+"""
+Checking values without raising ``ValidationError``.
+
+Every validator in localflavor has a ``check()`` method that returns a :class:`CheckResult` instead of raising
+``ValidationError``, which is considerably cheaper when a large share of the values in a bulk job is invalid. Calling
+the validator is a thin wrapper that raises the error of the result.
+
+The form fields of every flavor use :class:`CheckFieldMixin` and have a ``check()`` method as well, which only raises
+for the checks of the base field, like ``required`` and ``max_length``. :func:`check` works with any validator or form
+field, including the ones that don't implement ``check()``, like the date fields of :mod:`localflavor.generic.forms`.
+
+Async code checks values with :func:`acheck` and :func:`aclean`. Validators that only compute, which are all of them
+except the ones that ask an online service like :class:`~localflavor.generic.vies.VIESValidator`, are run inline
+without a thread hop, and the ones that are ``io_bound`` are awaited. :func:`acheck_many` checks many values
+concurrently.
+
+Most flavors import this module for their validators, so it doesn't import ``django.forms`` or ``asyncio`` itself,
+only the functions that need them do.
+
+Example:
+
+.. code-block:: python
+
+    from localflavor.br.validators import BRCPFValidator
+    from localflavor.results import check
+
+    result = BRCPFValidator().check('663.256.017-26')
+    if not result:
+        print(result.code, result.message)
+
+    check(CNIDCardField(), '11010519491231002X').value
+
+    # In an async view.
+    result = await acheck(VIESValidator(), 'DE284754038')
+    cleaned = await aclean(BRCPFField(), '663.256.017-26')
+
+.. versionadded:: 5.1
+"""
+import copy
+
+from django.core.exceptions import ValidationError
+from django.core.validators import RegexValidator
+
+
+class CheckResult:
+    """
+    The outcome of checking a value.
+
+    ``value`` is the checked value for validators and the cleaned value for form fields. ``code`` and ``params`` are
+    the ones of the ``ValidationError`` that would have been raised and ``None`` for valid values. Validators that
+    raise a less specific code for compatibility, like :class:`~localflavor.generic.validators.IBANValidator`, set
+    ``error_code`` to it and report the detailed code in ``code``. The message is only translated and formatted when
+    :attr:`message` is accessed.
+    """
+
+    __slots__ = ('ok', 'value', 'code', 'params', '_message', '_error', '_error_code')
+
+    def __init__(self, ok, value, code=None, message=None, params=None, error=None, error_code=None):
+        self.ok = ok
+        self.value = value
+        self.code = code
+        self.params = params
+        self._message = message
+        self._error = error
+        self._error_code = error_code
+
+    @classmethod
+    def valid(cls, value):
+        return cls(True, value)
+
+    @classmethod
+    def invalid(cls, value, code, message, params=None, error_code=None):
+        return cls(False, value, code, message, params, error_code=error_code)
+
+    @classmethod
+    def from_error(cls, value, error):
+        """Returns the result for a ``ValidationError`` that was raised while checking a value."""
+        first = error.error_list[0]
+        return cls(False, value, first.code, first.message, first.params, error)
+
+    def __bool__(self):
+        return self.ok
+
+    def __repr__(self):
+        if self.ok:
+            return '<CheckResult ok value=%r>' % (self.value,)
+        return '<CheckResult invalid value=%r code=%r>' % (self.value, self.code)
+
+    @property
+    def message(self):
+        """The translated error message or ``None`` for valid values."""
+        if self.ok:
+            return None
+        message = str(self._message)
+        return message % self.params if self.params else message
+
+    @property
+    def error(self):
+        """The ``ValidationError`` for an invalid value or ``None`` for valid values."""
+        if self.ok:
+            return None
+        if self._error is None:
+            self._error = ValidationError(self._message, code=self._error_code or self.code, params=self.params)
+        return self._error
+
+    def raise_for_error(self):
+        """Raises the ``ValidationError`` of an invalid value."""
+        if not self.ok:
+            raise self.error
+
+
+class CheckMixin:
+    """
+    A mixin for validators that implements ``__call__`` and ``acheck()`` on top of ``check()``.
+
+    Validators that wait for I/O set ``io_bound`` and implement ``acheck()`` without blocking.
+    """
+
+    io_bound = False
+
+    def check(self, value):
+        raise NotImplementedError('subclasses of CheckMixin must provide a check() method')
+
+    async def acheck(self, value):
+        """Returns the :class:`CheckResult` of ``check()`` in a coroutine."""
+        return self.check(value)
+
+    def __call__(self, value):
+        self.check(value).raise_for_error()
+
+
+class RegexCheckMixin(CheckMixin):
+    """A mixin for subclasses of ``RegexValidator`` that checks the regular expression without raising."""
+
+    def check_regex(self, value):
+        """Returns the result of the regular expression check like ``RegexValidator.__call__`` does."""
+        matches = self.regex.search(str(value))
+        if matches if self.inverse_match else not matches:
+            return CheckResult.invalid(value, self.code, self.message, {'value': value})
+        return CheckResult.valid(value)
+
+    def check(self, value):
+        return self.check_regex(value)
+
+
+class RegexCheckValidator(RegexCheckMixin, RegexValidator):
+    """A ``RegexValidator`` with ``check()`` for the flavors that validate a format with a validator instance."""
+
+
+class CheckFieldMixin:
+    """
+    A mixin for form fields that implements ``clean()`` on top of ``check()``.
+
+    ``check()`` converts the value with ``to_python()`` and ``validate()`` of the base field, which raise
+    ``ValidationError`` for values that can't be converted or that are required. It then checks the value with the
+    validators of the field and with ``check_value()`` without raising. Validators are checked with their ``check()``
+    method and ``RegexValidator`` instances like :meth:`RegexCheckMixin.check_regex`. Subclasses override
+    ``check_value()`` for their own checks of values that aren't empty.
+    """
+
+    def check_value(self, value):
+        """Returns the :class:`CheckResult` of a value that isn't empty and passed the validators of the field."""
+        return CheckResult.valid(value)
+
+    def invalid(self, value, code, params=None):
+        """Returns the :class:`CheckResult` of an invalid value with the error message of ``code``."""
+        return CheckResult.invalid(value, code, self.error_messages[code], params)
+
+    def check_validators(self, value):
+        """
+        Checks a value with the validators of the field without raising, like ``run_validators()``.
+
+        Returns the :class:`CheckResult` of the failed validators or ``None`` if the value passed all of them, so
+        valid values don't allocate a result per validator.
+        """
+        failed = None
+        for validator in self.validators:
+            result = _check_validator(validator, value)
+            if result is None:
+                continue
+            # The field's own message replaces the one of the validator, like in run_validators().
+            error_code = result._error_code or result.code
+            if error_code in self.error_messages:
+                result = CheckResult.invalid(value, result.code, self.error_messages[error_code], result.params,
+                                             error_code=result._error_code)
+            if failed is None:
+                failed = []
+            failed.append(result)
+        if failed is None:
+            return None
+        if len(failed) == 1:
+            return failed[0]
+        first = failed[0]
+        errors = [item for result in failed for item in result.error.error_list]
+        return CheckResult(False, value, first.code, first._message, first.params, ValidationError(errors))
+
+    def check(self, value):
+        try:
+            value = self.to_python(value)
+            self.validate(value)
+        except ValidationError as e:
+            return CheckResult.from_error(value, e)
+        if value in self.empty_values:
+            return CheckResult.valid(value)
+        result = self.check_validators(value)
+        if result is not None:
+            return result
+        return self.check_value(value)
+
+    def clean(self, value):
+        result = self.check(value)
+        if not result.ok:
+            raise result.error
+        return result.value
+
+
+# How the validators of each class are checked, cached since most fields run the same few classes of validators.
+_CHECK, _REGEX, _CALL = range(3)
+_validator_kinds = {}
+
+
+def _validator_kind(cls):
+    if hasattr(cls, 'check'):
+        kind = _CHECK
+    elif cls.__call__ is RegexValidator.__call__:
+        kind = _REGEX
+    else:
+        kind = _CALL
+    _validator_kinds[cls] = kind
+    return kind
+
+
+def _check_validator(validator, value):
+    """Returns the :class:`CheckResult` of a validator that failed or ``None`` if the value passed it."""
+    kind = _validator_kinds.get(type(validator))
+    if kind is None:
+        kind = _validator_kind(type(validator))
+    if kind == _CHECK:
+        result = validator.check(value)
+        return None if result else result
+    if kind == _REGEX:
+        matches = validator.regex.search(str(value))
+        if matches if validator.inverse_match else not matches:
+            return CheckResult.invalid(value, validator.code, validator.message, {'value': value})
+        return None
+    try:
+        validator(value)
+    except ValidationError as e:
+        return CheckResult.from_error(value, e)
+    return None
+
+
+def _is_field(validator):
+    # django.forms is only needed for the checks of form fields, validators are imported without it.
+    from django import forms
+
+    return isinstance(validator, forms.Field)
+
+
+def check(validator, value):
+    """
+    Checks a value with a validator or form field and returns a :class:`CheckResult`.
+
+    Validators and form fields with a ``check()`` method are checked without raising ``ValidationError``. Other form
+    fields are checked with ``clean()`` and other validators are called, and the resulting ``ValidationError`` is
+    turned into a result.
+    """
+    if hasattr(validator, 'check'):
+        return validator.check(value)
+    try:
+        if _is_field(validator):
+            return CheckResult.valid(validator.clean(value))
+        validator(value)
+    except ValidationError as e:
+        return CheckResult.from_error(value, e)
+    return CheckResult.valid(value)
+
+
+def _is_io_bound(validator):
+    if _is_field(validator):
+        return any(getattr(item, 'io_bound', False) for item in validator.validators)
+    return getattr(validator, 'io_bound', False)
+
+
+async def aclean(field, value):
+    """
+    Cleans a value with a form field like ``field.clean()`` and returns the cleaned value or raises
+    ``ValidationError``.
+
+    Without ``io_bound`` validators the field is cleaned inline. Otherwise the field is cleaned without them first and
+    they are awaited for the cleaned value, so values that are invalid anyway don't cause any I/O.
+    """
+    io_bound = [validator for validator in field.validators if getattr(validator, 'io_bound', False)]
+    if not io_bound:
+        return field.clean(value)
+    cpu_field = copy.copy(field)
+    cpu_field.validators = [validator for validator in field.validators if not getattr(validator, 'io_bound', False)]
+    value = cpu_field.clean(value)
+    if value not in field.empty_values:
+        for validator in io_bound:
+            result = await validator.acheck(value)
+            result.raise_for_error()
+    return value
+
+
+async def acheck(validator, value):
+    """Checks a value with a validator or form field like :func:`check` in a coroutine."""
+    if _is_field(validator):
+        try:
+            return CheckResult.valid(await aclean(validator, value))
+        except ValidationError as e:
+            return CheckResult.from_error(value, e)
+    if hasattr(validator, 'acheck'):
+        return await validator.acheck(value)
+    return check(validator, value)
+
+
+async def acheck_many(validator, values, concurrency=None):
+    """
+    Checks the values with a validator or form field and returns the list of their :class:`CheckResult`.
+
+    Values are checked concurrently with ``asyncio.gather()`` when the validator is ``io_bound``, at most
+    ``concurrency`` at a time if it's given, and one after the other otherwise.
+    """
+    import asyncio
+
+    if not _is_io_bound(validator):
+        return [check(validator, value) for value in values]
+    if concurrency is None:
+        return await asyncio.gather(*(acheck(validator, value) for value in values))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(value):
+        async with semaphore:
+            return await acheck(validator, value)
+
+    return await asyncio.gather(*(limited(value) for value in values))
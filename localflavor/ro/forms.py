@@ -1,13 +1,15 @@
 """Romanian specific form helpers."""
 import datetime
 
-from django.forms import CharField, RegexField, Select, ValidationError
+from django.forms import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .ro_counties import COUNTIES_CHOICES
 
 
-class ROCIFField(RegexField):
+class ROCIFField(CheckFieldMixin, RegexField):
     """
     A Romanian fiscal identity code (CIF) field.
 
@@ -24,17 +26,13 @@ class ROCIFField(RegexField):
             **kwargs
         )
 
-    def clean(self, value):
+    def check_value(self, value):
         """
         CIF validation.
 
         Args:
             value: the CIF code
         """
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
         value = value.strip()
 
         # strip RO part
@@ -55,12 +53,12 @@ class ROCIFField(RegexField):
             checksum = 0
 
         if checksum != int(value[0]):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value[::-1]
+        return CheckResult.valid(value[::-1])
 
 
-class ROCNPField(RegexField):
+class ROCNPField(CheckFieldMixin, RegexField):
     """
     A Romanian personal identity code (CNP) field.
 
@@ -77,23 +75,19 @@ class ROCNPField(RegexField):
             **kwargs
         )
 
-    def clean(self, value):
+    def check_value(self, value):
         """
         CNP validations.
 
         Args:
             value: the CNP code
         """
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
         # check birthdate digits
         try:
             # parse using the format YYMMDD
             datetime.datetime.strptime(value[1:7], '%y%m%d')
         except ValueError:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # checksum
         key = '279146358279'
@@ -109,12 +103,12 @@ class ROCNPField(RegexField):
             checksum = 1
 
         if checksum != int(value[12]):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value
+        return CheckResult.valid(value)
 
 
-class ROCountyField(CharField):
+class ROCountyField(CheckFieldMixin, CharField):
     """
     A form field that validates its input is a Romanian county name or abbreviation.
 
@@ -137,18 +131,13 @@ class ROCountyField(CharField):
         'invalid': 'Enter a Romanian county code or name.',
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         value = value.upper()
 
         # search for county code
         for entry in COUNTIES_CHOICES:
             if value in entry:
-                return value
+                return CheckResult.valid(value)
 
         # search for county name
         normalized_cc = []
@@ -157,9 +146,9 @@ class ROCountyField(CharField):
 
         for entry in normalized_cc:
             if entry[1] == value:
-                return entry[0]
+                return CheckResult.valid(entry[0])
 
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+        return self.invalid(value, 'invalid')
 
 
 class ROCountySelect(Select):
@@ -169,7 +158,7 @@ class ROCountySelect(Select):
         super().__init__(attrs, choices=COUNTIES_CHOICES)
 
 
-class ROPostalCodeField(RegexField):
+class ROPostalCodeField(CheckFieldMixin, RegexField):
     """Romanian postal code field."""
 
     default_error_messages = {
@@ -2,6 +2,8 @@
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .ru_regions import RU_COUNTY_CHOICES, RU_REGIONS_CHOICES
 
 
@@ -19,7 +21,7 @@ class RURegionSelect(Select):
         super().__init__(attrs, choices=RU_REGIONS_CHOICES)
 
 
-class RUPostalCodeField(RegexField):
+class RUPostalCodeField(CheckFieldMixin, RegexField):
     """
     Russian Postal code field.
 
@@ -34,7 +36,7 @@ class RUPostalCodeField(RegexField):
         super().__init__(r'^\d{6}$', **kwargs)
 
 
-class RUPassportNumberField(RegexField):
+class RUPassportNumberField(CheckFieldMixin, RegexField):
     """
     Russian internal passport number format.
 
@@ -49,7 +51,7 @@ class RUPassportNumberField(RegexField):
         super().__init__(r'^\d{4} \d{6}$', **kwargs)
 
 
-class RUAlienPassportNumberField(RegexField):
+class RUAlienPassportNumberField(CheckFieldMixin, RegexField):
     """
     Russian alien's passport number format.
 
@@ -4,6 +4,8 @@ import re
 from django import forms
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .se_counties import COUNTY_CHOICES
 from .utils import (format_organisation_number, format_personal_id_number, id_number_checksum, valid_organisation,
                     validate_id_birthday)
@@ -28,7 +30,7 @@ class SECountySelect(forms.Select):
         super().__init__(attrs=attrs, choices=COUNTY_CHOICES)
 
 
-class SEOrganisationNumberField(forms.CharField):
+class SEOrganisationNumberField(CheckFieldMixin, forms.CharField):
     """
     A form field that validates input as a Swedish organisation number (organisationsnummer).
 
@@ -47,35 +49,30 @@ class SEOrganisationNumberField(forms.CharField):
         'invalid': _('Enter a valid Swedish organisation number.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = SWEDISH_ID_NUMBER.match(value)
         if not match:
-            raise forms.ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         gd = match.groupdict()
 
         # Compare the calculated value with the checksum
         if id_number_checksum(gd) != int(gd['checksum']):
-            raise forms.ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # First: check if this is a real organisation_number
         if valid_organisation(gd):
-            return format_organisation_number(gd)
+            return CheckResult.valid(format_organisation_number(gd))
 
         # Is this a single properitor (enskild firma)?
         try:
             birth_day = validate_id_birthday(gd, False)
-            return format_personal_id_number(birth_day, gd)
+            return CheckResult.valid(format_personal_id_number(birth_day, gd))
         except ValueError:
-            raise forms.ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
 
-class SEPersonalIdentityNumberField(forms.CharField):
+class SEPersonalIdentityNumberField(CheckFieldMixin, forms.CharField):
     """
     A form field that validates input as a Swedish personal identity number (personnummer).
 
@@ -112,15 +109,10 @@ class SEPersonalIdentityNumberField(forms.CharField):
         'coordination_number': _('Co-ordination numbers are not allowed.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         match = SWEDISH_ID_NUMBER.match(value)
         if match is None:
-            raise forms.ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         gd = match.groupdict()
         is_coordination_number = int(gd['day']) > 60
@@ -128,32 +120,32 @@ class SEPersonalIdentityNumberField(forms.CharField):
 
         # compare the calculated value with the checksum
         if id_number_checksum(gd) != int(gd['checksum']):
-            raise forms.ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # check for valid birthday
         try:
             birth_day = validate_id_birthday(gd)
         except ValueError:
-            raise forms.ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # make sure that co-ordination numbers do not pass if not allowed
         if not self.coordination_number and is_coordination_number:
-            raise forms.ValidationError(self.error_messages['coordination_number'], code='coordination_number')
+            return self.invalid(value, 'coordination_number')
 
         # make sure that interim numbers do not pass if not allowed. This is
         # reported as the number being plain invalid, as most people don't know
         # what an interim number is.
         if not self.interim_number and is_interim_number:
-            raise forms.ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         # Combining the concepts of coordination and interim numbers is invalid.
         if is_coordination_number and is_interim_number:
-            raise forms.ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return format_personal_id_number(birth_day, gd)
+        return CheckResult.valid(format_personal_id_number(birth_day, gd))
 
 
-class SEPostalCodeField(forms.RegexField):
+class SEPostalCodeField(CheckFieldMixin, forms.RegexField):
     """
     A form field that validates input as a Swedish postal code (postnummer).
 
@@ -170,8 +162,5 @@ class SEPostalCodeField(forms.RegexField):
     def __init__(self, **kwargs):
         super().__init__(SE_POSTAL_CODE, **kwargs)
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-        return value.replace(' ', '')
+    def check_value(self, value):
+        return CheckResult.valid(value.replace(' ', ''))
@@ -2,18 +2,19 @@
 
 import re
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField
 from django.utils.encoding import force_str
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 NRIC_FIN_RE = re.compile(r'^[SFTG](\d{7})[A-Z]$')
 NRIC_FIN_DIGIT_WEIGHT = [2, 7, 6, 5, 4, 3, 2]
 NRIC_FIN_CHECKSUM_ST = ['J', 'Z', 'I', 'H', 'G', 'F', 'E', 'D', 'C', 'B', 'A']
 NRIC_FIN_CHECKSUM_FG = ['X', 'W', 'U', 'T', 'R', 'Q', 'P', 'N', 'M', 'L', 'K']
 
 
-class SGPostCodeField(RegexField):
+class SGPostCodeField(CheckFieldMixin, RegexField):
     """
     Singapore post code field.
 
@@ -28,7 +29,7 @@ class SGPostCodeField(RegexField):
         super().__init__(r'^\d{6}$', **kwargs)
 
 
-class SGNRICFINField(CharField):
+class SGNRICFINField(CheckFieldMixin, CharField):
     """
     A form field that validates input as a Singapore National Registration.
 
@@ -51,19 +52,16 @@ class SGNRICFINField(CharField):
         'invalid': _('Invalid NRIC/FIN.')
     }
 
-    def clean(self, value):
+    def check_value(self, value):
         """
         Validate NRIC/FIN.
 
         Strips whitespace.
         """
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         value = re.sub(r'(\s+)', '', force_str(value.upper()))
         match = NRIC_FIN_RE.search(value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         value = match.group()
         digit_list = list(value[1:-1])
@@ -76,6 +74,6 @@ class SGNRICFINField(CharField):
             else NRIC_FIN_CHECKSUM_FG
         checksum = checksum_list[products_sum_remainder]
         if checksum == value[len(value) - 1]:
-            return value
+            return CheckResult.valid(value)
 
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+        return self.invalid(value, 'invalid')
@@ -7,10 +7,13 @@ from django.forms import ValidationError
 from django.forms.fields import CharField, ChoiceField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.choices import PostalCodeDirectory
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .si_postalcodes import SI_POSTALCODES_CHOICES
 
 
-class SIEMSOField(CharField):
+class SIEMSOField(CheckFieldMixin, CharField):
     """
     A form for validating Slovenian personal identification number.
 
@@ -24,23 +27,22 @@ class SIEMSOField(CharField):
     }
     emso_regex = re.compile(r'^(\d{2})(\d{2})(\d{3})(\d{2})(\d{3})(\d)$')
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
-        m = self._regex_match(value)
-        day, month, year, nationality, gender, checksum = [int(i) for i in m.groups()]
+    def check_value(self, value):
+        try:
+            m = self._regex_match(value)
+            day, month, year, nationality, gender, checksum = [int(i) for i in m.groups()]
 
-        self._validate_emso(checksum, value)
-        birthday = self._validate_birthday(day, month, year)
+            self._validate_emso(checksum, value)
+            birthday = self._validate_birthday(day, month, year)
+        except ValidationError as e:
+            return CheckResult.from_error(value, e)
 
         self.info = {
             'gender': gender < 500 and 'male' or 'female',
             'birthdate': birthday,
             'nationality': nationality,
         }
-        return value
+        return CheckResult.valid(value)
 
     def _regex_match(self, value):
         m = self.emso_regex.match(value)
@@ -75,7 +77,7 @@ class SIEMSOField(CharField):
             raise ValidationError(self.error_messages['checksum'], code='checksum')
 
 
-class SITaxNumberField(CharField):
+class SITaxNumberField(CheckFieldMixin, CharField):
     """
     Slovenian tax number field.
 
@@ -89,14 +91,10 @@ class SITaxNumberField(CharField):
     }
     sitax_regex = re.compile(r'^(?:SI)?([1-9]\d{7})$')
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         m = self.sitax_regex.match(value)
         if m is None:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         value = m.groups()[0]
 
         # Validate Tax number
@@ -109,18 +107,24 @@ class SITaxNumberField(CharField):
             chk = 0
 
         if int_values[-1] != chk:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value
+        return CheckResult.valid(value)
 
 
-class SIPostalCodeField(ChoiceField):
+class SIPostalCodeField(CheckFieldMixin, ChoiceField):
     """Slovenian post codes field."""
 
     def __init__(self, **kwargs):
         kwargs.setdefault('choices', SI_POSTALCODES_CHOICES)
         super().__init__(**kwargs)
 
+    def valid_value(self, value):
+        if isinstance(self.choices, PostalCodeDirectory):
+            # Look the code up in the index instead of scanning all choices.
+            return self.choices.has_code(value)
+        return super().valid_value(value)
+
 
 class SIPostalCodeSelect(Select):
     """A Select widget that uses Slovenian postal codes as its choices."""
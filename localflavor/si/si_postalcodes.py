@@ -1,5 +1,7 @@
+from localflavor.choices import PostalCodeDirectory
+
 #: A list of Slovenian postal codes
-SI_POSTALCODES = [
+SI_POSTALCODES = PostalCodeDirectory([
     (1000, 'Ljubljana'),
     (1001, 'Ljubljana - po\u0161tni predali'),
     (1002, 'Ljubljana - po\u0161tni center'),
@@ -478,6 +480,6 @@ SI_POSTALCODES = [
     (9263, 'Kuzma'),
     (9264, 'Grad'),
     (9265, 'Bodonci'),
-]
+], translate=False)
 
-SI_POSTALCODES_CHOICES = sorted(SI_POSTALCODES, key=lambda k: k[1])
+SI_POSTALCODES_CHOICES = PostalCodeDirectory(sorted(SI_POSTALCODES, key=lambda k: k[1]), translate=False)
@@ -3,6 +3,8 @@
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .sk_districts import DISTRICT_CHOICES
 from .sk_regions import REGION_CHOICES
 
@@ -21,7 +23,7 @@ class SKDistrictSelect(Select):
         super().__init__(attrs, choices=DISTRICT_CHOICES)
 
 
-class SKPostalCodeField(RegexField):
+class SKPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates its input as Slovak postal code.
 
@@ -35,13 +37,10 @@ class SKPostalCodeField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'^\d{5}$|^\d{3} \d{2}$', **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """
         Validates the input and returns a string that contains only numbers.
 
         Returns an empty string for empty values.
         """
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
-        return value.replace(' ', '')
+        return CheckResult.valid(value.replace(' ', ''))
@@ -0,0 +1,82 @@
+/*
+ * Turns the select elements rendered by localflavor.autocomplete.AutocompleteSelect into a search box. The options
+ * of the select are replaced by the matches returned by the autocomplete view for the text in the search box.
+ */
+(function() {
+    'use strict';
+
+    function init(select) {
+        if (select.dataset.autocompleteReady) {
+            return;
+        }
+        select.dataset.autocompleteReady = 'true';
+        var url = select.dataset.autocompleteUrl;
+        var limit = select.dataset.autocompleteLimit;
+        var minLength = parseInt(select.dataset.autocompleteMinLength, 10) || 1;
+        var search = document.createElement('input');
+        var timeout = null;
+        var request = 0;
+        search.type = 'search';
+        search.autocomplete = 'off';
+        search.className = 'localflavor-autocomplete-search';
+        if (select.labels && select.labels.length) {
+            search.setAttribute('aria-label', select.labels[0].textContent);
+        }
+        select.parentNode.insertBefore(search, select);
+
+        function update(results) {
+            var selected = Array.prototype.filter.call(select.options, function(option) {
+                return option.selected && option.value;
+            });
+            var values = selected.map(function(option) { return option.value; });
+            Array.prototype.slice.call(select.options).forEach(function(option) {
+                if (option.value && !option.selected) {
+                    select.removeChild(option);
+                }
+            });
+            results.forEach(function(result) {
+                var value = String(result.value);
+                if (values.indexOf(value) === -1) {
+                    select.appendChild(new Option(result.label, value));
+                }
+            });
+            if (!select.multiple && results.length) {
+                select.value = String(results[0].value);
+                select.dispatchEvent(new Event('change', {bubbles: true}));
+            }
+        }
+
+        search.addEventListener('input', function() {
+            clearTimeout(timeout);
+            var query = search.value.trim();
+            if (query.length < minLength) {
+                return;
+            }
+            timeout = setTimeout(function() {
+                var current = ++request;
+                var params = new URLSearchParams({q: query, limit: limit});
+                fetch(url + (url.indexOf('?') === -1 ? '?' : '&') + params.toString(), {
+                    headers: {'Accept': 'application/json'}
+                }).then(function(response) {
+                    return response.json();
+                }).then(function(data) {
+                    if (current === request) {
+                        update(data.results);
+                    }
+                });
+            }, 200);
+        });
+    }
+
+    function initAll(root) {
+        Array.prototype.forEach.call(root.querySelectorAll('select[data-autocomplete-url]'), init);
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', function() { initAll(document); });
+    } else {
+        initAll(document);
+    }
+    // Forms added to the page later, like formset rows, can be initialized with this.
+    window.localflavorAutocomplete = initAll;
+})();
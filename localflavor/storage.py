@@ -0,0 +1,125 @@
+"""
+Storing numeric identifiers as integers.
+
+Model fields for numeric identifiers, like :class:`~localflavor.br.models.BRCPFField`, store the formatted numbers in a
+``varchar`` column. With ``db_integer_storage=True`` they store the digits in a ``bigint`` column instead, which makes
+the column and its indexes less than half the size and comparisons cheaper. The field still returns the numbers as
+formatted strings, like ``'111.444.777-35'``:
+
+.. code-block:: python
+
+    class Customer(models.Model):
+        cpf = BRCPFField(db_integer_storage=True, unique=True)
+
+The digits are stored after a leading ``1``, so ``'012.345.678-90'`` is stored as ``101234567890``, which keeps the
+leading zeros and the number of digits of the value. Values are looked up with their digits, with or without the
+separators of the format, so only lookups of whole values like ``exact``, ``in`` and ``isnull`` are supported. Empty
+values are stored as ``NULL`` and read back as ``None``, so fields with ``blank=True`` need ``null=True`` as well,
+which the system checks enforce.
+
+Changing the option of an existing field creates a migration that alters the column. The databases can't convert the
+formatted strings to integers themselves, so the values have to be migrated with a data migration that stores them in
+a new field.
+
+.. versionadded:: 5.1
+"""
+from django.core import checks
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
+
+
+class IntegerStorageMixin:
+    """
+    A mixin for model fields of numeric identifiers that can store their digits as integers with
+    ``db_integer_storage=True``.
+
+    Subclasses set ``digits_format`` to the format in which the values are returned, with ``d`` for the digits and
+    other characters for the separators, like ``'ddd-dd-dddd'``.
+    """
+
+    digits_format = ''
+
+    default_error_messages = {
+        'invalid_digits': _('“%(value)s” can’t be stored as a number of up to 18 digits.'),
+    }
+
+    def __init__(self, *args, db_integer_storage=False, **kwargs):
+        self.db_integer_storage = db_integer_storage
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.db_integer_storage:
+            kwargs['db_integer_storage'] = True
+        return name, path, args, kwargs
+
+    def check(self, **kwargs):
+        return [*super().check(**kwargs), *self._check_integer_storage_null()]
+
+    def _check_integer_storage_null(self):
+        if self.db_integer_storage and self.blank and not self.null:
+            return [
+                checks.Error(
+                    'Fields with db_integer_storage=True store empty values as NULL, so blank=True requires '
+                    'null=True.',
+                    hint='Set null=True on the field.',
+                    obj=self,
+                    id='localflavor.E001',
+                )
+            ]
+        return []
+
+    def get_internal_type(self):
+        if self.db_integer_storage:
+            return 'BigIntegerField'
+        return super().get_internal_type()
+
+    def format_digits(self, digits):
+        """Returns the digits in ``digits_format``, or as they are if their number doesn't fit it."""
+        if len(digits) != self.digits_format.count('d'):
+            return digits
+        digits = iter(digits)
+        return ''.join(next(digits) if char == 'd' else char for char in self.digits_format)
+
+    def _from_integer(self, value):
+        return self.format_digits(str(value)[1:])
+
+    def _to_integer(self, value):
+        digits = ''.join(char for char in value if char not in self.digits_format.replace('d', ''))
+        # The leading 1 keeps the leading zeros, and a bigint holds 18 digits after it.
+        if not (digits.isascii() and digits.isdigit()) or len(digits) > 18:
+            raise ValueError("Field '%s' expected a number of up to 18 digits but got %r." % (self.name, value))
+        return int('1' + digits)
+
+    def to_python(self, value):
+        if self.db_integer_storage and isinstance(value, int):
+            return self._from_integer(value)
+        return super().to_python(value)
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if not self.db_integer_storage:
+            return value
+        if value in self.empty_values:
+            return None
+        return self._to_integer(value)
+
+    def _from_db_integer(self, value, expression, connection):
+        if value is None:
+            return value
+        return self._from_integer(value)
+
+    def get_db_converters(self, connection):
+        converters = super().get_db_converters(connection)
+        if self.db_integer_storage:
+            return [*converters, self._from_db_integer]
+        return converters
+
+    def run_validators(self, value):
+        if self.db_integer_storage and value not in self.empty_values:
+            try:
+                self._to_integer(value)
+            except ValueError:
+                raise ValidationError(self.error_messages['invalid_digits'], code='invalid_digits',
+                                      params={'value': value})
+        super().run_validators(value)
@@ -1,13 +1,15 @@
 import re
 
-from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.exceptions import ImproperlyConfigured
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .tr_provinces import PROVINCE_CHOICES
 
 
-class TRPostalCodeField(RegexField):
+class TRPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as a Turkish zip code.
 
@@ -24,19 +26,16 @@ class TRPostalCodeField(RegexField):
             **kwargs
         )
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         if len(value) != 5:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         province_code = int(value[:2])
         if province_code == 0 or province_code > 81:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
-        return value
+            return self.invalid(value, 'invalid')
+        return CheckResult.valid(value)
 
 
-class TRIdentificationNumberField(CharField):
+class TRIdentificationNumberField(CheckFieldMixin, CharField):
     """
     A Turkey Identification Number number.
 
@@ -56,20 +55,15 @@ class TRIdentificationNumberField(CharField):
         'not_11': _('Turkish Identification number must be 11 digits.'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         if len(value) != 11:
-            raise ValidationError(self.error_messages['not_11'], code='not_11')
+            return self.invalid(value, 'not_11')
 
         if not re.match(r'^\d{11}$', value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         if int(value[0]) == 0:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         chksum = (sum([int(value[i]) for i in range(0, 9, 2)]) * 7 -
                   sum([int(value[i]) for i in range(1, 9, 2)])) % 10
@@ -77,9 +71,9 @@ class TRIdentificationNumberField(CharField):
         if (chksum != int(value[9]) or
                 (sum([int(value[i])
                       for i in range(10)]) % 10) != int(value[10])):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value
+        return CheckResult.valid(value)
 
 
 class TRProvinceSelect(Select):
@@ -1,6 +1,8 @@
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin
+
 from .ua_regions import UA_REGION_CHOICES
 
 
@@ -16,7 +18,7 @@ class UARegionSelect(Select):
         super().__init__(*args, **kwargs)
 
 
-class UAVatNumberField(RegexField):
+class UAVatNumberField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as a Ukrainian analog of a VAT number.
 
@@ -42,7 +44,7 @@ class UAVatNumberField(RegexField):
         return value.strip()
 
 
-class UAPostalCodeField(RegexField):
+class UAPostalCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as a Ukrainian postal code.
 
@@ -1,7 +1,8 @@
-from django.core.validators import RegexValidator
 from django.db.models import CharField
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import RegexCheckValidator
+
 from .ua_regions import UA_REGION_CHOICES
 
 
@@ -39,7 +40,7 @@ class UAVatNumberField(CharField):
     """
 
     description = _('Ukrainian VAT number')
-    validators = [RegexValidator(r'^\d{10}$', 'Enter a valid VAT number.')]
+    validators = [RegexCheckValidator(r'^\d{10}$', 'Enter a valid VAT number.')]
 
     def __init__(self, *args, **kwargs):
         kwargs['max_length'] = 10
@@ -57,7 +58,7 @@ class UAPostalCodeField(CharField):
     """
 
     description = _('Ukrainian postal code')
-    validators = [RegexValidator(r'^(?!00)\d{5}$', 'Enter a valid postal code.')]
+    validators = [RegexCheckValidator(r'^(?!00)\d{5}$', 'Enter a valid postal code.')]
 
     def __init__(self, *args, **kwargs):
         kwargs['max_length'] = 5
@@ -2,10 +2,13 @@
 
 import re
 
-from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.core.exceptions import ImproperlyConfigured
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+from localflavor.widgets import CachedOptionsMixin
+
 ssn_re = re.compile(r"^(?P<area>\d{3})[-\ ]?(?P<group>\d{2})[-\ ]?(?P<serial>\d{4})$")
 
 _ITIN_GROUP_RANGES = (
@@ -19,7 +22,7 @@ def _is_itin_group(group_int):
     return any(group_int in r for r in _ITIN_GROUP_RANGES)
 
 
-class USZipCodeField(RegexField):
+class USZipCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as a U.S. ZIP code.
 
@@ -49,7 +52,7 @@ class USZipCodeField(RegexField):
         return value.strip()
 
 
-class _USFederalIDBaseField(CharField):
+class _USFederalIDBaseField(CheckFieldMixin, CharField):
     """
     Private base class for US federal identification numbers (SSN, ITIN, ATIN).
 
@@ -62,23 +65,20 @@ class _USFederalIDBaseField(CharField):
     Subclasses must implement ``_validate_components(area, group, serial) -> bool``.
     """
 
-    def clean(self, value):
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
+    def check_value(self, value):
         match = re.match(ssn_re, value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
         area, group, serial = match.group('area'), match.group('group'), match.group('serial')
 
         # No blocks of all zeroes.
         if area == '000' or group == '00' or serial == '0000':
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         if not self._validate_components(area, group, serial):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return '%s-%s-%s' % (area, group, serial)
+        return CheckResult.valid('%s-%s-%s' % (area, group, serial))
 
 
 class USSocialSecurityNumberField(_USFederalIDBaseField):
@@ -194,7 +194,7 @@ class USTaxpayerIdentificationNumberField(_USFederalIDBaseField):
         )
 
 
-class USStateField(CharField):
+class USStateField(CheckFieldMixin, CharField):
     """
     A form field that validates its input is a U.S. state, territory, or COFA territory.
     The input is validated against a dictionary which includes names and abbreviations.
@@ -207,19 +207,16 @@ class USStateField(CharField):
         'invalid': _('Enter a U.S. state or territory.'),
     }
 
-    def clean(self, value):
+    def check_value(self, value):
         from .us_states import STATES_NORMALIZED
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         try:
-            return STATES_NORMALIZED[value.lower()]
+            return CheckResult.valid(STATES_NORMALIZED[value.lower()])
         except KeyError:
             pass
-        raise ValidationError(self.error_messages['invalid'], code='invalid')
+        return self.invalid(value, 'invalid')
 
 
-class USStateSelect(Select):
+class USStateSelect(CachedOptionsMixin, Select):
     """A Select widget that uses a list of U.S. states/territories as its choices."""
 
     def __init__(self, attrs=None):
@@ -227,7 +224,7 @@ class USStateSelect(Select):
         super().__init__(attrs, choices=STATE_CHOICES)
 
 
-class USPSSelect(Select):
+class USPSSelect(CachedOptionsMixin, Select):
     """
     A Select widget that uses a list of US Postal Service codes as its choices.
 
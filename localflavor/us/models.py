@@ -1,6 +1,10 @@
 from django.db.models import CharField
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.constraints import FormatCheckMixin
+from localflavor.normalized import NormalizedLookupMixin
+from localflavor.storage import IntegerStorageMixin
+
 from .forms import USAdoptionTaxpayerIdentificationNumberField as USATINFormField
 from .forms import USIndividualTaxpayerIdentificationNumberField as USITINFormField
 from .forms import USSocialSecurityNumberField as USSocialSecurityNumberFieldFormField
@@ -54,7 +58,7 @@ class USPostalCodeField(CharField):
         return name, path, args, kwargs
 
 
-class USZipCodeField(CharField):
+class USZipCodeField(FormatCheckMixin, CharField):
     """
     A model field that stores the U.S. ZIP code in the database.
 
@@ -67,9 +71,14 @@ class USZipCodeField(CharField):
 
     .. versionadded:: 1.1
 
+    .. versionchanged:: 5.1
+
+        Added ``db_format_check``, see :mod:`localflavor.constraints`.
+
     """
 
     description = _("U.S. ZIP code")
+    format_patterns = ('[0-9]' * 5, '[0-9]' * 5 + '-' + '[0-9]' * 4)
 
     def __init__(self, *args, **kwargs):
         kwargs['max_length'] = 10
@@ -81,16 +90,22 @@ class USZipCodeField(CharField):
         return super().formfield(**defaults)
 
 
-class USSocialSecurityNumberField(CharField):
+class USSocialSecurityNumberField(IntegerStorageMixin, NormalizedLookupMixin, CharField):
     """
     A model field that stores  the security number in the format ``XXX-XX-XXXX``.
 
     Forms represent it as ``forms.USSocialSecurityNumberField`` field.
 
     .. versionadded:: 1.1
+    .. versionchanged:: 5.1
+
+        Added ``db_integer_storage``, see :mod:`localflavor.storage`.
+        Added ``db_normalized_index`` and the ``normalized`` lookup, see :mod:`localflavor.normalized`.
     """
 
     description = _("Social security number")
+    digits_format = 'ddd-dd-dddd'
+    normalize_separators = ' -'
 
     def __init__(self, *args, **kwargs):
         kwargs['max_length'] = 11
@@ -1,9 +1,10 @@
 """UY-specific form helpers."""
 
-from django.forms import ValidationError
 from django.forms.fields import RegexField, Select
 from django.utils.translation import gettext_lazy as _
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 from .util import get_validation_digit
 
 
@@ -15,7 +16,7 @@ class UYDepartmentSelect(Select):
         super().__init__(attrs, choices=DEPARTMENT_CHOICES)
 
 
-class UYCIField(RegexField):
+class UYCIField(CheckFieldMixin, RegexField):
     """A field that validates Uruguayan 'Cedula de identidad' (CI) numbers."""
 
     default_error_messages = {
@@ -27,7 +28,7 @@ class UYCIField(RegexField):
     def __init__(self, **kwargs):
         super().__init__(r'(?P<num>(\d{6,7}|(\d\.)?\d{3}\.\d{3}))-?(?P<val>\d)', **kwargs)
 
-    def clean(self, value):
+    def check_value(self, value):
         """
         Validates format and validation digit.
 
@@ -36,17 +37,14 @@ class UYCIField(RegexField):
         the correct place. The three typically used formats are supported:
         [X]XXXXXXX, [X]XXXXXX-X and [X.]XXX.XXX-X.
         """
-        value = super().clean(value)
-        if value in self.empty_values:
-            return value
         match = self.regex.match(value)
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         number = int(match.group('num').replace('.', ''))
         validation_digit = int(match.group('val'))
 
         if validation_digit != get_validation_digit(number):
-            raise ValidationError(self.error_messages['invalid_validation_digit'], code='invalid_validation_digit')
+            return self.invalid(value, 'invalid_validation_digit')
 
-        return value
+        return CheckResult.valid(value)
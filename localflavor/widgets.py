@@ -0,0 +1,49 @@
+"""
+Caching of the rendered options of select widgets.
+
+Rendering a select widget translates the label of every choice and renders every ``<option>`` with the template
+engine, although the options only change with the active language and the selected values. Select widgets with
+:class:`CachedOptionsMixin`, like :class:`~localflavor.us.forms.USStateSelect`, can cache the rendered options in a
+process wide LRU cache, :data:`localflavor.option_cache.option_cache`. The cache is enabled by setting the maximum
+number of cached renderings::
+
+    LOCALFLAVOR_OPTION_CACHE_SIZE = 512
+
+The cached renderings are keyed by the widget class, the form renderer, the active language and the selected values,
+and are only used when the widget still has the same choices. The output is the same as without the cache. The cache
+is only imported when a widget is rendered with the setting, so importing the flavors doesn't load it.
+
+.. versionadded:: 5.1
+"""
+from django.conf import settings
+
+
+class CachedOptionsMixin:
+    """
+    A mixin for select widgets that caches their rendered options when ``LOCALFLAVOR_OPTION_CACHE_SIZE`` is set.
+
+    The options must not depend on the name and the attributes of the widget, which is the case for Django's
+    ``Select`` and ``SelectMultiple`` widgets and their templates.
+    """
+
+    _render_options = True
+
+    def optgroups(self, name, value, attrs=None):
+        if not self._render_options:
+            return []
+        return super().optgroups(name, value, attrs)
+
+    def _render_shell(self, name, value, attrs, renderer):
+        self._render_options = False
+        try:
+            return super().render(name, value, attrs, renderer)
+        finally:
+            del self._render_options
+
+    def render(self, name, value, attrs=None, renderer=None):
+        max_size = getattr(settings, 'LOCALFLAVOR_OPTION_CACHE_SIZE', 0)
+        if not max_size or self.option_inherits_attrs:
+            return super().render(name, value, attrs, renderer)
+        from localflavor import option_cache
+
+        return option_cache.render(self, name, value, attrs, renderer, max_size)
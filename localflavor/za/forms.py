@@ -2,15 +2,16 @@
 import re
 from datetime import date
 
-from django.forms import ValidationError
 from django.forms.fields import CharField, RegexField, Select
 from django.utils.translation import gettext_lazy as _
 from stdnum import luhn
 
+from localflavor.results import CheckFieldMixin, CheckResult
+
 id_re = re.compile(r'^(?P<yy>\d\d)(?P<mm>\d\d)(?P<dd>\d\d)(?P<mid>\d{4})(?P<end>\d{3})')
 
 
-class ZAIDField(CharField):
+class ZAIDField(CheckFieldMixin, CharField):
     """
     A form field for South African ID numbers.
 
@@ -22,19 +23,14 @@ class ZAIDField(CharField):
         'invalid': _('Enter a valid South African ID number'),
     }
 
-    def clean(self, value):
-        value = super().clean(value)
-
-        if value in self.empty_values:
-            return value
-
+    def check_value(self, value):
         # strip spaces and dashes
         value = value.replace(' ', '').replace('-', '')
 
         match = re.match(id_re, value)
 
         if not match:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         g = match.groupdict()
 
@@ -44,15 +40,15 @@ class ZAIDField(CharField):
             # There is no way to guess the century of a ZA ID number
             date(int(g['yy']) + 2000, int(g['mm']), int(g['dd']))
         except ValueError:
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
         if not luhn.is_valid(value):
-            raise ValidationError(self.error_messages['invalid'], code='invalid')
+            return self.invalid(value, 'invalid')
 
-        return value
+        return CheckResult.valid(value)
 
 
-class ZAPostCodeField(RegexField):
+class ZAPostCodeField(CheckFieldMixin, RegexField):
     """
     A form field that validates input as a South African postcode.
 
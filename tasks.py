@@ -32,6 +32,32 @@ def test(c, country='all'):
         c.run('coverage report -m --include=localflavor/{0}/*'.format(country))
 
 
+@task(iterable=['match'])
+def bench(c, match=None, save=False, threshold=None):
+    """Runs the benchmarks and fails when a target got slower than its baseline in benchmarks/baseline.json."""
+    bench_cmd = 'python -m benchmarks.bench'
+    for pattern in match or ():
+        bench_cmd += ' --match {0}'.format(pattern)
+    if save:
+        bench_cmd += ' --save'
+    if threshold:
+        bench_cmd += ' --threshold {0}'.format(threshold)
+    c.run(bench_cmd)
+
+
+@task(iterable=['match'])
+def profile_imports(c, match=None, save=False, threshold=None, sort='name'):
+    """Measures the import time and memory of every flavor and compares them with benchmarks/imports_baseline.json."""
+    profile_cmd = 'python -m benchmarks.imports --sort {0}'.format(sort)
+    for pattern in match or ():
+        profile_cmd += ' --match {0}'.format(pattern)
+    if save:
+        profile_cmd += ' --save'
+    if threshold:
+        profile_cmd += ' --threshold {0}'.format(threshold)
+    c.run(profile_cmd)
+
+
 @task
 def compile_translations(c):
     c.run('cd localflavor; django-admin compilemessages; cd ..')
@@ -73,3 +99,9 @@ def prospector(c):
 def prospector_pylint(c):
     """ Outputs warnings in pylint format which is useful for getting clickable links to files in some IDEs. """
     c.run('prospector --profile .prospector.yaml --output pylint localflavor')
+
+
+@task
+def update_registry(c):
+    """Regenerates localflavor/manifest.py, the manifest of localflavor.registry, from the flavors."""
+    c.run('python -m localflavor.registry')
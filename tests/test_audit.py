@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test.testcases import TestCase
+
+from .test_us.models import USPlace
+
+
+class AuditCommandTests(TestCase):
+
+    def setUp(self):
+        USPlace.objects.bulk_create([
+            USPlace(state='CA', state_req='CA', zip_code='90210', name='valid'),
+            USPlace(state='XX', state_req='CA', zip_code='1234', name='invalid'),
+        ])
+        self.invalid_pk = USPlace.objects.get(name='invalid').pk
+
+    def audit(self, *args, **options):
+        stdout, stderr = StringIO(), StringIO()
+        call_command('localflavor_audit', 'test_us.USPlace', *args, stdout=stdout, stderr=stderr, **options)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_csv_report(self):
+        report, progress = self.audit(workers=0)
+        self.assertEqual(report.splitlines(), [
+            'model,field,pk,value,code,message',
+            'test_us.USPlace,state,%d,XX,invalid_choice,Value \'XX\' is not a valid choice.' % self.invalid_pk,
+            'test_us.USPlace,zip_code,%d,1234,invalid,Enter a zip code in the format XXXXX or XXXXX-XXXX.'
+            % self.invalid_pk,
+        ])
+        self.assertIn('test_us.USPlace: 2/2 rows audited, 2 invalid', progress)
+        self.assertIn('Found 2 invalid values.', progress)
+
+    def test_worker_processes(self):
+        report, progress = self.audit('--format', 'jsonl', workers=2, chunk_size=1)
+        offenders = [json.loads(line) for line in report.splitlines()]
+        self.assertEqual([offender['field'] for offender in offenders], ['state', 'zip_code'])
+        self.assertEqual(offenders[1]['pk'], self.invalid_pk)
+
+    def test_resume_from_checkpoint(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint = os.path.join(directory, 'checkpoint.json')
+            output = os.path.join(directory, 'report.jsonl')
+            self.audit(workers=0, checkpoint=checkpoint, output=output)
+            with open(checkpoint) as checkpoint_file:
+                self.assertEqual(json.load(checkpoint_file), {'test_us.USPlace': self.invalid_pk})
+            USPlace.objects.bulk_create([USPlace(state_req='CA', zip_code='1', name='new')])
+            progress, _ = self.audit(workers=0, checkpoint=checkpoint, output=output)
+            self.assertIn('1/1 rows audited, 1 invalid', progress)
+            with open(output) as report:
+                self.assertEqual([json.loads(line)['value'] for line in report], ['XX', '1234', '1'])
+
+    def test_unknown_model(self):
+        with self.assertRaisesMessage(CommandError, 'No models with localflavor fields match auth.User.'):
+            call_command('localflavor_audit', 'auth.User', stdout=StringIO())
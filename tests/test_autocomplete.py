@@ -0,0 +1,57 @@
+import json
+
+from django.test import RequestFactory
+from django.test.testcases import TestCase
+from django.utils import translation
+
+from localflavor.autocomplete import AutocompleteSelect, AutocompleteView, ChoiceIndex, fold
+from localflavor.dk.dk_municipalities import DK_MUNICIPALITIES
+from localflavor.kw.kw_areas import AREA_CHOICES
+from localflavor.si.si_postalcodes import SI_POSTALCODES
+
+
+class AutocompleteTests(TestCase):
+
+    def test_fold(self):
+        self.assertEqual(fold('København'), 'kobenhavn')
+        self.assertEqual(fold('Ærø'), 'aero')
+        self.assertEqual(fold('Šentvid'), 'sentvid')
+        self.assertEqual(fold('Straße'), 'strasse')
+
+    def test_search(self):
+        index = ChoiceIndex(DK_MUNICIPALITIES)
+        self.assertEqual(index.search('Kobenhavn'), [('koebenhavn', 'København')])
+        self.assertEqual(index.search('AERO'), [('aeroe', 'Ærø')])
+        self.assertEqual(index.search(''), [])
+        self.assertEqual(len(index.search('a', limit=3)), 3)
+
+    def test_search_ranking(self):
+        index = ChoiceIndex(SI_POSTALCODES)
+        results = index.search('ljubljana', limit=50)
+        self.assertEqual(results[0], (1000, 'Ljubljana'))
+        self.assertTrue(all(label.startswith('Ljubljana') for code, label in results))
+        # Words in the label and codes match as well.
+        self.assertIn((1210, 'Ljubljana - \u0160entvid'), index.search('sentvid'))
+        self.assertEqual(index.search('1001'), [(1001, 'Ljubljana - po\u0161tni predali')])
+
+    def test_search_translated(self):
+        index = ChoiceIndex(AREA_CHOICES)
+        with translation.override('en'):
+            self.assertEqual(index.search('abdullah al-s'), [('AS', 'Abdullah Al-Salem')])
+        self.assertEqual(set(index._indexes), {'en'})
+
+    def test_widget_renders_selected_options(self):
+        widget = AutocompleteSelect('/autocomplete/', choices=DK_MUNICIPALITIES)
+        html = widget.render('municipality', 'aeroe')
+        self.assertIn('data-autocomplete-url="/autocomplete/"', html)
+        self.assertIn('<option value="aeroe" selected>Ærø</option>', html)
+        self.assertNotIn('koebenhavn', html)
+        self.assertIn('localflavor/js/autocomplete.js', str(widget.media))
+
+    def test_view(self):
+        view = AutocompleteView.as_view(index=ChoiceIndex(DK_MUNICIPALITIES), max_limit=2)
+        response = view(RequestFactory().get('/', {'q': 'kobenhavn'}))
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertJSONEqual(response.content, {'results': [{'value': 'koebenhavn', 'label': 'København'}]})
+        response = view(RequestFactory().get('/', {'q': 'a', 'limit': '100'}))
+        self.assertEqual(len(json.loads(response.content)['results']), 2)
@@ -7,3 +7,12 @@ class BRPersonProfile(models.Model):
     cpf = BRCPFField()
     cnpj = BRCNPJField()
     postal_code = BRPostalCodeField()
+
+
+class BRCompany(models.Model):
+    cpf = BRCPFField(db_integer_storage=True, null=True, blank=True)
+    cnpj = BRCNPJField(db_integer_storage=True, unique=True)
+
+
+class BRSupplier(models.Model):
+    cnpj = BRCNPJField(db_normalized_index=True)
@@ -0,0 +1,121 @@
+import copy
+import pickle
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.test.testcases import TestCase
+from django.utils import translation
+from django.utils.functional import Promise
+
+from localflavor.choices import ChoiceTable
+from localflavor.dk.dk_postalcodes import DK_POSTALCODES
+from localflavor.is_.is_postalcodes import IS_POSTALCODES
+from localflavor.kw.kw_areas import AREA_CHOICES
+from localflavor.si.forms import SIPostalCodeField
+from localflavor.si.si_postalcodes import SI_POSTALCODES
+
+
+class ChoiceTableTests(TestCase):
+
+    def test_sequence(self):
+        table = ChoiceTable((('b', 'Bravo'), ('a', 'Alpha'), ('c', 'Charlie')), translate=False)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(table[0], ('b', 'Bravo'))
+        self.assertEqual(table[-1], ('c', 'Charlie'))
+        self.assertEqual(table[1:], (('a', 'Alpha'), ('c', 'Charlie')))
+        self.assertEqual(list(table.codes()), ['b', 'a', 'c'])
+        self.assertEqual(table, [('b', 'Bravo'), ('a', 'Alpha'), ('c', 'Charlie')])
+        self.assertIn(('a', 'Alpha'), table)
+        self.assertEqual(table.index(('c', 'Charlie')), 2)
+        self.assertEqual(dict(table)['a'], 'Alpha')
+        with self.assertRaises(IndexError):
+            table[3]
+
+    def test_integer_codes(self):
+        table = ChoiceTable(((1000, 'Ljubljana'), (2000, 'Maribor')), translate=False)
+        self.assertEqual(list(table), [(1000, 'Ljubljana'), (2000, 'Maribor')])
+        self.assertEqual(list(table.codes()), [1000, 2000])
+
+    def test_lazy_labels(self):
+        code, label = DK_POSTALCODES[0]
+        self.assertEqual(code, '0555')
+        self.assertIsInstance(label, Promise)
+        group_label, areas = AREA_CHOICES[0]
+        self.assertEqual(areas[0], ('AS', 'Abdullah Al-Salem'))
+        with translation.override('fr'):
+            self.assertEqual(str(group_label), 'Koweït')
+        self.assertEqual(list(AREA_CHOICES.untranslated())[0][0], 'Kuwait City')
+
+    def test_rows_are_not_kept(self):
+        self.assertIsNot(DK_POSTALCODES[0][1], next(iter(DK_POSTALCODES))[1])
+        self.assertEqual(str(DK_POSTALCODES[0][1]), 'Scanning')
+        self.assertEqual(list(DK_POSTALCODES)[-1], DK_POSTALCODES[-1])
+        self.assertEqual(list(ChoiceTable((), translate=False)), [])
+
+    def test_add(self):
+        table = ChoiceTable((('a', 'Alpha'),), translate=False)
+        self.assertEqual(table + [('b', 'Bravo')], [('a', 'Alpha'), ('b', 'Bravo')])
+        self.assertEqual([('b', 'Bravo')] + table, [('b', 'Bravo'), ('a', 'Alpha')])
+        self.assertEqual(table + (('b', 'Bravo'),), (('a', 'Alpha'), ('b', 'Bravo')))
+        self.assertEqual((('b', 'Bravo'),) + table, (('b', 'Bravo'), ('a', 'Alpha')))
+        self.assertEqual(table + table, (('a', 'Alpha'), ('a', 'Alpha')))
+        extended = DK_POSTALCODES + (('9999', 'Test'),)
+        self.assertIsInstance(extended, tuple)
+        self.assertEqual(extended[-1], ('9999', 'Test'))
+        with self.assertRaises(TypeError):
+            table + 'b'
+
+    def test_equal_option_groups(self):
+        choices = [('Group', [('a', 'Alpha'), ('b', 'Bravo')])]
+        self.assertEqual(ChoiceTable(choices, translate=False), choices)
+        self.assertEqual(ChoiceTable(choices, translate=False), (('Group', (('a', 'Alpha'), ('b', 'Bravo'))),))
+        self.assertNotEqual(ChoiceTable(choices, translate=False), [('Group', [('a', 'Alpha')])])
+
+    def test_option_groups_cannot_be_mixed(self):
+        with self.assertRaises(ValueError):
+            ChoiceTable((('a', 'Alpha'), ('Group', (('b', 'Bravo'),))))
+
+    def test_copy_and_pickle(self):
+        self.assertIs(copy.deepcopy(DK_POSTALCODES), DK_POSTALCODES)
+        unpickled = pickle.loads(pickle.dumps(AREA_CHOICES))
+        self.assertEqual(list(unpickled.untranslated()), list(AREA_CHOICES.untranslated()))
+        self.assertTrue(unpickled.translate)
+
+    def test_choices(self):
+        field = forms.ChoiceField(choices=AREA_CHOICES)
+        self.assertEqual(field.clean('AS'), 'AS')
+        self.assertIn('<optgroup label="Kuwait City">', forms.Select(choices=AREA_CHOICES).render('area', 'AS'))
+        self.assertEqual(models.CharField(choices=DK_POSTALCODES, max_length=4).check(), [])
+
+
+class PostalCodeDirectoryTests(TestCase):
+
+    def test_lookups(self):
+        self.assertTrue(DK_POSTALCODES.has_code('2100'))
+        self.assertFalse(DK_POSTALCODES.has_code('0000'))
+        self.assertEqual(DK_POSTALCODES.locality('2100'), 'København Ø')
+        self.assertIsNone(DK_POSTALCODES.locality('0000'))
+        self.assertEqual(IS_POSTALCODES.locality('900'), '900 Vestmannaeyjum')
+
+    def test_integer_codes(self):
+        self.assertTrue(SI_POSTALCODES.has_code('1000'))
+        self.assertTrue(SI_POSTALCODES.has_code(1000))
+        self.assertEqual(SI_POSTALCODES.locality('1000'), 'Ljubljana')
+        self.assertEqual(SIPostalCodeField().clean('1000'), '1000')
+        with self.assertRaises(ValidationError):
+            SIPostalCodeField().clean('1003')
+
+    def test_duplicate_codes(self):
+        rows = [row for row in DK_POSTALCODES if row[0] == '1055']
+        self.assertGreater(len(rows), 1)
+        self.assertEqual(DK_POSTALCODES.locality('1055'), rows[0][1])
+
+    def test_with_prefix(self):
+        self.assertEqual(IS_POSTALCODES.with_prefix('90'),
+                         [('900', '900 Vestmannaeyjum'), ('902', '902 Vestmannaeyjum')])
+        self.assertEqual([code for code, locality in SI_POSTALCODES.with_prefix('121')],
+                         [1210, 1211, 1215, 1216, 1217, 1218, 1219])
+        self.assertEqual(DK_POSTALCODES.with_prefix('994'), [('9940', 'Læsø')])
+        self.assertEqual(DK_POSTALCODES.with_prefix('X'), [])
+        self.assertEqual(len(IS_POSTALCODES.with_prefix('')), len(IS_POSTALCODES))
@@ -0,0 +1,55 @@
+import random
+import unittest
+from unittest import mock
+
+from django.test.testcases import TestCase
+
+from localflavor import columnar
+from localflavor.results import check
+
+
+@unittest.skipIf(columnar.np is None, 'NumPy is not installed')
+class ColumnarTests(TestCase):
+    CHECKERS = ('br_cpf', 'br_cnpj', 'au_abn', 'au_acn', 'au_tfn', 'nl_bsn', 'pl_pesel', 'pl_nip')
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        rng = random.Random(0)
+        cls.values = [
+            '', ' ', '111.444.777-35', '11144477735', '111.444.777-35 ', '00000000000', '11.222.333/0001-81',
+            '11-222-333/0001-81', '11222333000181', '53004085616', '004085616', '876 543 210', '111222333',
+            '44051401359', '02070803628', '123-456-32-18', '123-45-63-218', '1234563218', '\u0661\u0662\u0663',
+        ]
+        for _ in range(5000):
+            value = ''.join(rng.choice('0123456789') for _ in range(rng.choice((8, 9, 10, 11, 13, 14, 18))))
+            if rng.random() < 0.3:
+                position = rng.randrange(len(value))
+                value = value[:position] + rng.choice('.-/ x') + value[position:]
+            cls.values.append(value)
+
+    def test_parity_with_validators(self):
+        for name in self.CHECKERS:
+            checker = getattr(columnar, name)
+            with self.subTest(name):
+                result = checker.check_numpy(self.values)
+                expected = [check(checker.validator, value) for value in self.values]
+                self.assertEqual(list(result.valid), [bool(item) for item in expected])
+                self.assertEqual(list(result.codes), [item.code for item in expected])
+                self.assertEqual(checker.check_python(self.values), (list(result.valid), list(result.codes)))
+
+    def test_valid_values(self):
+        self.assertEqual(list(columnar.br_cpf(['111.444.777-35', '11144477735', '11144477734']).valid),
+                         [True, True, False])
+        self.assertEqual(list(columnar.pl_pesel(['44051401359', '44051401358', '44053201353']).codes),
+                         [None, 'checksum', 'birthdate'])
+
+    def test_missing_and_other_values(self):
+        result = columnar.br_cpf(columnar.np.array([None, float('nan'), 11144477735, '11144477735'], dtype=object))
+        self.assertEqual(list(result.valid), [False, False, True, True])
+        self.assertEqual(list(result.codes), ['required', 'required', None, None])
+
+    def test_without_numpy(self):
+        with mock.patch.object(columnar, 'np', None):
+            self.assertEqual(columnar.nl_bsn(['111222333', '111222334', None]),
+                             ([True, False, False], [None, 'invalid', 'required']))
@@ -0,0 +1,105 @@
+from django.apps.registry import Apps
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, models, transaction
+from django.db.migrations.autodetector import MigrationAutodetector
+from django.db.migrations.graph import MigrationGraph
+from django.db.migrations.operations import CreateModel
+from django.db.migrations.questioner import MigrationQuestioner
+from django.db.migrations.state import ModelState, ProjectState
+from django.db.migrations.writer import MigrationWriter
+from django.test.testcases import TestCase
+
+from localflavor.constraints import patterns_to_regex
+from localflavor.mx.models import MXZipCodeField
+from localflavor.us.models import USZipCodeField
+
+from .test_us.models import USAddress, USPlace
+
+
+class FormatConstraintTests(TestCase):
+
+    def test_constraint(self):
+        constraint, = USAddress._meta.constraints
+        self.assertEqual(constraint.name, 'test_us_usaddress_zip_code_format')
+        self.assertEqual(USAddress._meta.get_field('zip_code').deconstruct()[3]['db_format_check'], True)
+        self.assertEqual(USPlace._meta.constraints, [])
+
+    def test_database_rejects_other_formats(self):
+        USAddress.objects.bulk_create([USAddress(zip_code='12345'), USAddress(zip_code='12345-6789'),
+                                       USAddress(zip_code='')])
+        for value in ('1234', '12345-', 'abcde', '12345 6789'):
+            with self.subTest(value), self.assertRaises(IntegrityError), transaction.atomic():
+                USAddress.objects.create(zip_code=value)
+        self.assertEqual(USAddress.objects.filter(zip_code__matches_format=('[0-9]' * 5,)).count(), 1)
+
+    def test_full_clean(self):
+        with self.assertRaises(ValidationError):
+            USAddress(zip_code='1234').full_clean()
+
+    def test_migration_state(self):
+        state = ModelState.from_model(USAddress)
+        self.assertEqual([constraint.name for constraint in state.options['constraints']],
+                         ['test_us_usaddress_zip_code_format'])
+        project_state = ProjectState()
+        project_state.add_model(state)
+        model = project_state.apps.get_model('test_us', 'USAddress')
+        self.assertEqual(len(model._meta.constraints), 1)
+
+    def test_patterns_to_regex(self):
+        regex = patterns_to_regex(MXZipCodeField.format_patterns)
+        self.assertEqual(regex, '^(0[1-9][0-9][0-9][0-9]|1[0-6][0-9][0-9][0-9]|[2-9][0-9][0-9][0-9][0-9])$')
+        self.assertEqual(patterns_to_regex(('[0-9].x',)), r'^([0-9]\.x)$')
+
+
+class FormatConstraintMigrationTests(TestCase):
+    """The migrations add and remove the constraint exactly once, like ``makemigrations --check`` would see them."""
+
+    def model_state(self, db_format_check):
+        meta = type('Meta', (), {'app_label': 'test_us', 'apps': Apps()})
+        model = type('Parcel', (models.Model,), {
+            '__module__': __name__,
+            'Meta': meta,
+            'zip_code': USZipCodeField(blank=True, db_format_check=db_format_check),
+        })
+        state = ProjectState()
+        state.add_model(ModelState.from_model(model))
+        return state
+
+    def make_migrations(self, from_state, to_state):
+        """Returns the operations of the migrations for the changes and the state after applying them."""
+        autodetector = MigrationAutodetector(from_state, to_state, MigrationQuestioner(defaults={'ask_initial': True}))
+        migrations = autodetector.changes(graph=MigrationGraph()).get('test_us', [])
+        state = from_state.clone()
+        operations = []
+        for migration in migrations:
+            # The migration can be written to a file.
+            MigrationWriter(migration).as_string()
+            for operation in migration.operations:
+                operation.state_forwards('test_us', state)
+                operations.append(type(operation).__name__)
+                # Django 5.2 creates the constraints of a new model with the model.
+                if isinstance(operation, CreateModel):
+                    operations.extend('AddConstraint' for constraint in operation.options.get('constraints', []))
+        return operations, state
+
+    def test_switch_on_and_off(self):
+        operations, state = self.make_migrations(ProjectState(), self.model_state(True))
+        self.assertCountEqual(operations, ['CreateModel', 'AddConstraint'])
+        self.assertEqual(self.make_migrations(state, self.model_state(True))[0], [])
+
+        operations, state = self.make_migrations(state, self.model_state(False))
+        self.assertCountEqual(operations, ['AlterField', 'RemoveConstraint'])
+        self.assertEqual(state.models['test_us', 'parcel'].options['constraints'], [])
+        self.assertEqual(self.make_migrations(state, self.model_state(False))[0], [])
+
+        operations, state = self.make_migrations(state, self.model_state(True))
+        self.assertCountEqual(operations, ['AlterField', 'AddConstraint'])
+        self.assertEqual(self.make_migrations(state, self.model_state(True))[0], [])
+
+    def test_historical_models(self):
+        """The models rendered from the migrations get their constraint from the migrations only."""
+        state = self.make_migrations(ProjectState(), self.model_state(True))[1]
+        model = state.apps.get_model('test_us', 'Parcel')
+        self.assertEqual([constraint.name for constraint in model._meta.constraints],
+                         ['test_us_parcel_zip_code_format'])
+        self.assertEqual(self.make_migrations(ProjectState.from_apps(state.apps), self.model_state(True))[0], [])
@@ -6,6 +6,7 @@ from django.db import models
 from django.test.testcases import TestCase
 
 import localflavor
+from localflavor.results import CheckMixin
 
 
 class GeneralTests(TestCase):
@@ -67,3 +68,13 @@ class GeneralTests(TestCase):
                 failure_message = '{} does not handle does not properly handle values that are None.'.format(cls.__name__)
                 field = cls(required=False, empty_value=None)
                 self.assertIsNone(field.clean(None), failure_message)
+
+    def test_validators_implement_check(self):
+        validator_classes = [cls for cls in self._find_localflavor_subclasses(object)
+                             if cls.__name__.endswith('Validator')]
+        self.assertTrue(len(validator_classes) > 0, 'No localflavor validator classes were found.')
+
+        for cls in validator_classes:
+            with self.subTest(cls=cls):
+                self.assertTrue(issubclass(cls, CheckMixin),
+                                '{} does not implement the check() protocol.'.format(cls.__name__))
@@ -0,0 +1,136 @@
+import os
+import shutil
+import tempfile
+
+from django import forms
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+
+from localflavor.generic.bankdirectory import (BankDirectory, BankDirectoryEntry, compile_bank_directory,
+                                               get_bank_directory, validate_iban_bic)
+from localflavor.generic.forms import BICFormField, IBANFormField
+
+BANKS_CSV = """country_code,bank_code,bic,name,city
+DE,37040044,COBADEFFXXX,Commerzbank,Köln
+DE,10010010,PBNKDEFF,Postbank,Berlin
+NL,ABNA,ABNANL2A,ABN AMRO Bank,Amsterdam
+NL,INGB,INGBNL2A,ING Bank,Amsterdam
+GB,NWBK,NWBKGB2L,National Westminster Bank,London
+GB,NWBK,NWBKGB2LLON,National Westminster Bank London,London
+"""
+
+
+class BankDirectoryTests(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tmp_dir = tempfile.mkdtemp()
+        csv_path = os.path.join(cls.tmp_dir, 'banks.csv')
+        with open(csv_path, 'w', encoding='utf-8') as csv_file:
+            csv_file.write(BANKS_CSV)
+        cls.index_path = os.path.join(cls.tmp_dir, 'banks.idx')
+        cls.count = compile_bank_directory(csv_path, cls.index_path)
+        cls.directory = BankDirectory(cls.index_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.directory.close()
+        shutil.rmtree(cls.tmp_dir)
+        super().tearDownClass()
+
+    def test_lookup(self):
+        self.assertEqual(self.count, 6)
+        self.assertEqual(len(self.directory), 6)
+        self.assertEqual(self.directory.countries, {'DE', 'GB', 'NL'})
+        self.assertEqual(self.directory.lookup('DE', '37040044'),
+                         [BankDirectoryEntry('DE', '37040044', 'COBADEFFXXX', 'Commerzbank')])
+        self.assertEqual(self.directory.lookup('DE', '10010010')[0].bic, 'PBNKDEFFXXX')
+        self.assertEqual([entry.bic for entry in self.directory.lookup('GB', 'NWBK')],
+                         ['NWBKGB2LXXX', 'NWBKGB2LLON'])
+        self.assertEqual(self.directory.lookup('DE', '37040045'), [])
+        self.assertEqual(self.directory.lookup('FR', '37040044'), [])
+        self.assertEqual(self.directory.lookup('DE', '1234567890123'), [])
+
+    def test_lookup_bic(self):
+        self.assertEqual([entry.name for entry in self.directory.lookup_bic('INGBNL2AXXX')], ['ING Bank'])
+        self.assertEqual(len(self.directory.lookup_bic('NWBKGB2L')), 2)
+        self.assertEqual(self.directory.lookup_bic('RABONL2U'), [])
+
+    def test_bic_for_iban(self):
+        self.assertEqual(self.directory.bic_for_iban('DE89370400440532013000'), 'COBADEFFXXX')
+        self.assertEqual(self.directory.bic_for_iban('NL91ABNA0417164300'), 'ABNANL2AXXX')
+        self.assertIsNone(self.directory.bic_for_iban('NL44RABO0123456789'))
+
+    def test_get_bank_directory(self):
+        self.assertIs(get_bank_directory(self.index_path), get_bank_directory(self.index_path))
+        with self.assertRaises(ValueError):
+            BankDirectory(os.path.join(self.tmp_dir, 'banks.csv'))
+
+    def test_validate_iban_bic(self):
+        validate_iban_bic('DE89370400440532013000', 'COBADEFF', self.directory)
+        validate_iban_bic('GB29NWBK60161331926819', 'NWBKGB2LLON', self.directory)
+        # Countries that are not in the directory are not checked.
+        validate_iban_bic('BE31538007547055', 'GEBABEBB', self.directory)
+        self.assertRaisesMessage(ValidationError, 'The BIC does not match the bank of the IBAN.',
+                                 validate_iban_bic, 'NL91ABNA0417164300', 'INGBNL2A', self.directory)
+        self.assertRaisesMessage(ValidationError, 'The bank of this IBAN is unknown.',
+                                 validate_iban_bic, 'NL44RABO0123456789', 'RABONL2U', self.directory)
+
+    def test_form_fields(self):
+        self.assertFieldOutput(
+            IBANFormField,
+            field_kwargs={'bank_directory': self.directory},
+            valid={'NL91 ABNA 0417 1643 00': 'NL91ABNA0417164300', 'BE31538007547055': 'BE31538007547055'},
+            invalid={
+                'NL44RABO0123456789': ['The bank of this IBAN is unknown.'],
+                'NL44RABO012345678': ['NL IBANs must contain 18 characters.'],
+            },
+        )
+        self.assertFieldOutput(
+            BICFormField,
+            field_kwargs={'bank_directory': self.directory},
+            valid={'ingbnl2a': 'INGBNL2A', 'GEBABEBB': 'GEBABEBB'},
+            invalid={'RABONL2U': ['This BIC is unknown.']},
+        )
+
+    def test_form_cross_validation(self):
+        directory = self.directory
+
+        class PaymentForm(forms.Form):
+            iban = IBANFormField(bank_directory=directory)
+            bic = BICFormField(bank_directory=directory)
+
+            def clean(self):
+                cleaned_data = super().clean()
+                if 'iban' in cleaned_data and 'bic' in cleaned_data:
+                    try:
+                        validate_iban_bic(cleaned_data['iban'], cleaned_data['bic'], directory)
+                    except ValidationError as e:
+                        self.add_error('bic', e)
+                return cleaned_data
+
+        self.assertTrue(PaymentForm({'iban': 'NL91ABNA0417164300', 'bic': 'ABNANL2A'}).is_valid())
+        form = PaymentForm({'iban': 'NL91ABNA0417164300', 'bic': 'INGBNL2A'})
+        self.assertEqual(form.errors, {'bic': ['The BIC does not match the bank of the IBAN.']})
+
+    def test_compile_invalid_rows(self):
+        csv_path = os.path.join(self.tmp_dir, 'invalid.csv')
+        index_path = os.path.join(self.tmp_dir, 'invalid.idx')
+        header = 'country_code,bank_code,bic,name\nDE,37040044,COBADEFFXXX,Commerzbank\n'
+        rows = [
+            ('DE,10010010,PBNKDEFFXXXX,Postbank\n', 'Invalid BIC \'PBNKDEFFXXXX\' on line 3'),
+            ('DE,10010010,PBNKDÉFF,Postbank\n', 'Invalid BIC \'PBNKDÉFF\' on line 3'),
+            ('DE,1001001É,PBNKDEFF,Postbank\n', 'Invalid bank directory row on line 3'),
+        ]
+        for row, message in rows:
+            with self.subTest(row=row):
+                with open(csv_path, 'w', encoding='utf-8') as csv_file:
+                    csv_file.write(header + row)
+                with self.assertRaisesMessage(ValueError, message):
+                    compile_bank_directory(csv_path, index_path)
+        with open(csv_path, 'w', encoding='latin-1') as csv_file:
+            csv_file.write(header + 'DE,10010010,PBNKDEFF,Postbank Köln\n')
+        with self.assertRaisesMessage(ValueError, 'Line 3 of %s is not valid utf-8.' % csv_path):
+            compile_bank_directory(csv_path, index_path)
+        self.assertEqual(compile_bank_directory(csv_path, index_path, encoding='latin-1'), 2)
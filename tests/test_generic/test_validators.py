@@ -24,3 +24,34 @@ class TestVATINValidator(unittest.TestCase):
             self.validator('XX99999999')
         e = cm.exception
         self.assertIn("XX is not a valid country code.", e.messages)
+
+    def test_check_digits(self):
+        valid = [
+            'ATU92174218', 'BE0314559320', 'BE314559320', 'BG4276955093', 'CY02967054M', 'CZ6294223694',
+            'DE284754038', 'DK79020281', 'EE150843764', 'EL529466451', 'ESN8165738I', 'FI76565710', 'FR0T598808566',
+            'GB980780684', 'GBGD001', 'HR81985451053', 'HU78698909', 'IE2E37378SU', 'IT92672450910', 'LT238258117',
+            'LU01602404', 'LV40626798016', 'MT63175114', 'NL915838941B25', 'PL7641300024', 'PT837704839', 'RO73363',
+            'SE131609754001', 'SI75604175', 'SK6093555006', 'XI980780684',
+        ]
+        for vatin in valid:
+            with self.subTest(vatin=vatin):
+                self.validator(vatin)
+
+        invalid = [
+            'ATU92174219', 'BE0314559321', 'BG4276955094', 'CY02967054N', 'CZ6294223695', 'DE284754039',
+            'DK79020282', 'EE150843765', 'EL529466452', 'ESN8165738J', 'FI76565711', 'FR0T598808567', 'GB980780685',
+            'GBGD501', 'HR81985451054', 'HU78698900', 'IE2E37378TU', 'IT92672450911', 'LT238258118', 'LU01602405',
+            'LV40626798017', 'MT63175115', 'NL915838942B25', 'PL7641300025', 'PT837704830', 'RO73364',
+            'SE131609755001', 'SI75604176', 'SK6093555007', 'XI980780685',
+        ]
+        for vatin in invalid:
+            with self.subTest(vatin=vatin):
+                with self.assertRaises(ValidationError) as cm:
+                    self.validator(vatin)
+                self.assertEqual(cm.exception.code, 'vatin')
+
+    def test_validate_many(self):
+        self.assertEqual(
+            list(self.validator.validate_many(['DE284754038', 'DE99999999', 'DE284754039', 'XX99999999'])),
+            ['ok', 'vatin', 'checksum', 'country_code'],
+        )
@@ -0,0 +1,192 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django import forms
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase, override_settings
+
+from localflavor.generic.vies import TTLCache, VIESClient, VIESError, VIESResult, VIESValidator
+from localflavor.results import acheck_many, aclean
+
+REGISTERED = {'DE284754038': 'Example GmbH', 'NL004495445B01': 'Example B.V.'}
+
+
+class VIESStandInHandler(BaseHTTPRequestHandler):
+    """Answers like the VIES REST API for the numbers in ``REGISTERED``."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        vatin = body['countryCode'] + body['vatNumber']
+        with server.lock:
+            server.requests.append(vatin)
+            server.connections.add(self.client_address)
+        server.release.wait(5)
+        if body['countryCode'] == 'IT':
+            status, payload = 500, {'actionSucceed': False, 'errorWrappers': [{'error': 'MS_UNAVAILABLE'}]}
+        else:
+            status, payload = 200, {
+                'countryCode': body['countryCode'],
+                'vatNumber': body['vatNumber'],
+                'requestDate': '2024-01-01T00:00:00.000Z',
+                'valid': vatin in REGISTERED,
+                'name': REGISTERED.get(vatin, '---'),
+                'address': '---',
+            }
+        data = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        # Close the connection without telling the client, like servers do with idle keep-alive connections.
+        self.close_connection = server.drop_connections
+
+    def log_message(self, format, *args):
+        pass
+
+
+class VIESClientTests(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), VIESStandInHandler)
+        cls.server.daemon_threads = True
+        cls.server.lock = threading.Lock()
+        cls.server.release = threading.Event()
+        cls.url = 'http://127.0.0.1:%d/rest-api' % cls.server.server_address[1]
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.requests = []
+        self.server.connections = set()
+        self.server.release.set()
+        self.server.drop_connections = False
+        self.client = VIESClient(self.url)
+        self.addCleanup(self.client.close)
+
+    def test_check(self):
+        result = self.client.check('de 284 754 038')
+        self.assertEqual(result, VIESResult('DE284754038', True, 'Example GmbH', None, '2024-01-01T00:00:00.000Z'))
+        self.assertFalse(self.client.check('DE136695976').valid)
+        self.assertEqual(self.server.requests, ['DE284754038', 'DE136695976'])
+        # The second request reuses the connection of the first one.
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_stale_connection(self):
+        self.server.drop_connections = True
+        self.assertTrue(self.client.check('DE284754038').valid)
+        # The pooled connection was closed by the server, the request is sent again on a new connection.
+        self.assertFalse(self.client.check('DE136695976').valid)
+        self.assertEqual(len(self.server.connections), 2)
+
+    def test_cache(self):
+        self.assertTrue(self.client.check('DE284754038').valid)
+        self.assertTrue(self.client.check('DE 284754038').valid)
+        self.assertFalse(self.client.check('DE136695976').valid)
+        self.assertFalse(self.client.check('DE136695976').valid)
+        self.assertEqual(self.server.requests, ['DE284754038', 'DE136695976'])
+
+    def test_cache_timeout(self):
+        cache = TTLCache()
+        client = VIESClient(self.url, cache=cache, cache_timeout=-1)
+        self.addCleanup(client.close)
+        client.check('DE284754038')
+        client.check('DE284754038')
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_ttl_cache_max_entries(self):
+        cache = TTLCache(max_entries=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.set('c', 3)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('c'), 3)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_django_cache(self):
+        client = VIESClient(self.url, cache=caches['default'])
+        self.addCleanup(client.close)
+        self.assertTrue(client.check('NL004495445B01').valid)
+        self.assertEqual(caches['default'].get('localflavor.vies.NL004495445B01')[1], True)
+        self.assertTrue(VIESClient(self.url, cache=caches['default']).check('NL004495445B01').valid)
+        self.assertEqual(self.server.requests, ['NL004495445B01'])
+
+    def test_errors_are_not_cached(self):
+        with self.assertRaisesMessage(VIESError, 'MS_UNAVAILABLE'):
+            self.client.check('IT00743110157')
+        with self.assertRaises(VIESError):
+            self.client.check('IT00743110157')
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_unreachable(self):
+        self.server.release.set()
+        client = VIESClient('http://127.0.0.1:1/rest-api', timeout=1)
+        with self.assertRaisesMessage(VIESError, 'could not be reached'):
+            client.check('DE284754038')
+
+    def test_coalescing(self):
+        self.server.release.clear()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [executor.submit(self.client.check, 'DE284754038') for _ in range(8)]
+            threading.Timer(0.2, self.server.release.set).start()
+            results = [future.result() for future in futures]
+        self.assertEqual({result.name for result in results}, {'Example GmbH'})
+        self.assertEqual(self.server.requests, ['DE284754038'])
+
+    def test_acheck(self):
+        async def check():
+            self.server.release.clear()
+            asyncio.get_running_loop().call_later(0.2, self.server.release.set)
+            return await self.client.acheck_many(['DE284754038', 'DE284754038', 'DE136695976', 'DE284754038'])
+
+        results = asyncio.run(check())
+        self.assertEqual([result.valid for result in results], [True, True, False, True])
+        self.assertEqual(sorted(self.server.requests), ['DE136695976', 'DE284754038'])
+        self.assertTrue(asyncio.run(self.client.acheck('DE284754038')).valid)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_validator(self):
+        validator = VIESValidator(self.client)
+        validator('DE284754038')
+        self.assertRaisesMessage(ValidationError, 'DE136695976 is not a registered VAT identification number.',
+                                 validator, 'DE136695976')
+        self.assertRaisesMessage(ValidationError, 'The VAT identification number could not be verified',
+                                 validator, 'IT00743110157')
+        # Invalid numbers are rejected without asking the service.
+        self.assertRaises(ValidationError, validator, 'DE284754039')
+        self.assertEqual(self.server.requests, ['DE284754038', 'DE136695976', 'IT00743110157'])
+
+    def test_async_validator(self):
+        validator = VIESValidator(self.client)
+        values = ['DE284754038', 'DE136695976', 'IT00743110157', 'DE284754039', 'NL004495445B01']
+        results = asyncio.run(acheck_many(validator, values, concurrency=2))
+        self.assertEqual([result.code for result in results],
+                         [None, 'not_registered', 'unavailable', 'checksum', None])
+        self.assertEqual(sorted(self.server.requests),
+                         ['DE136695976', 'DE284754038', 'IT00743110157', 'NL004495445B01'])
+
+    def test_aclean(self):
+        field = forms.CharField(validators=[VIESValidator(self.client)])
+        self.assertEqual(asyncio.run(aclean(field, ' DE284754038 ')), 'DE284754038')
+        with self.assertRaisesMessage(ValidationError, 'DE136695976 is not a registered VAT identification number.'):
+            asyncio.run(aclean(field, 'DE136695976'))
+        # The service isn't asked for values that the other checks of the field reject.
+        with self.assertRaises(ValidationError):
+            asyncio.run(aclean(forms.CharField(max_length=5, validators=[VIESValidator(self.client)]),
+                               'DE136695976'))
+        self.assertEqual(self.server.requests, ['DE284754038', 'DE136695976'])
@@ -1,11 +1,20 @@
+import re
+
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.test import SimpleTestCase, TestCase
 from django.utils import formats
 
+from localflavor.generic.bban import BBAN_IDENTIFIERS, IBAN_BBAN_FORMATS, NORDEA_BBAN_FORMATS, is_valid_bban
+from localflavor.generic.checksums import iban_check_digits, iban_mod97, repair_iban_check_digits
+from localflavor.generic.countries.iso_3166 import ISO_3166_1_ALPHA2_COUNTRY_CODES, ISO_3166_1_NUMERIC_COUNTRY_CODES
+from localflavor.generic.countries.registry import Country, CountryRegistry, countries
 from localflavor.generic.countries.sepa import IBAN_SEPA_COUNTRIES
 from localflavor.generic.forms import BICFormField, DateField, DateTimeField, IBANFormField, SplitDateTimeField
+from localflavor.generic.gtin import (GS1_PREFIXES, GS1Prefix, gs1_prefix, gtin_check_digit, is_valid_gtin,
+                                      strip_nondigits)
 from localflavor.generic.models import BICField, IBANField
-from localflavor.generic.validators import BICValidator, EANValidator, IBANValidator
+from localflavor.generic.validators import (IBAN_COUNTRY_CODE_LENGTH, NORDEA_COUNTRY_CODE_LENGTH, BICValidator,
+                                            BICParts, EANValidator, IBANParts, IBANValidator)
 
 from .forms import UseIncludedCountriesForm, UseNordeaExtensionsForm
 
@@ -134,6 +143,113 @@ class IBANTests(TestCase):
             with self.subTest(iban=iban):
                 self.assertRaisesMessage(ValidationError, invalid[iban], IBANValidator(), iban)
 
+    def test_iban_validator_validate_many(self):
+        values = [
+            'GB82 WEST 1234 5698 7654 32',
+            None,
+            'CA34CIBC123425345',
+            'GB82WEST1234569876543',
+            'GB29ÉWBK60161331926819',
+            'SA0380000000608019167519',
+            'IT2813815463652787128285355',
+            'BJ11B00610100400271101192591',
+        ]
+        self.assertEqual(list(IBANValidator().validate_many(values)), [
+            'ok', 'ok', 'bad_country', 'bad_length', 'bad_character', 'bad_checksum', 'bad_bban', 'bad_country',
+        ])
+
+        iban_validator = IBANValidator(use_nordea_extensions=True, include_countries=('NL', 'BJ'))
+        self.assertEqual(
+            list(iban_validator.validate_many(iter(['NL91ABNA0417164300', 'GB29NWBK60161331926819',
+                                                    'BJ11B00610100400271101192591']))),
+            ['ok', 'not_allowed', 'ok'],
+        )
+
+    def test_iban_checksums(self):
+        self.assertEqual(iban_mod97('GB82WEST12345698765432'), 1)
+        self.assertEqual(iban_mod97('GB83WEST12345698765432'), 2)
+        self.assertEqual(iban_check_digits('GB00WEST12345698765432'), '82')
+        self.assertEqual(iban_check_digits('MU00BOMM0101101030300200000MUR'), '17')
+        self.assertEqual(repair_iban_check_digits('GB99WEST12345698765432'), 'GB82WEST12345698765432')
+        self.assertEqual(repair_iban_check_digits('NL02ABNA0123456789'), 'NL02ABNA0123456789')
+        with self.assertRaisesMessage(ValueError, 'É'):
+            iban_check_digits('GB29ÉWBK60161331926819')
+
+        # The check digits must match the ones computed by the big integer algorithm of the IBAN standard.
+        for value in ('NL91ABNA0417164300', 'BJ11B00610100400271101192591', 'LC55HEMM000100010012001200023015'):
+            with self.subTest(value=value):
+                rearranged = ''.join(str(int(char, 36)) for char in value[4:] + value[:2]) + '00'
+                self.assertEqual(iban_check_digits(value), '%02d' % (98 - int(rearranged) % 97))
+
+    def test_bban_formats(self):
+        """The BBAN formats must match the IBAN lengths of every country."""
+        registries = [
+            (IBAN_COUNTRY_CODE_LENGTH, IBAN_BBAN_FORMATS),
+            (NORDEA_COUNTRY_CODE_LENGTH, NORDEA_BBAN_FORMATS),
+        ]
+        for country_codes, bban_formats in registries:
+            self.assertEqual(set(country_codes), set(bban_formats))
+            for country_code, bban_format in bban_formats.items():
+                with self.subTest(country_code=country_code):
+                    length = sum(int(element) for element in re.findall(r'(\d+)!', bban_format))
+                    self.assertEqual(length + 4, country_codes[country_code])
+
+    def test_bban_validation(self):
+        valid = [
+            'ES9121000418450200051332',
+            'ME25505000012345678951',
+            'NO9386011117947',
+            'BJ11B00610100400271101192591',
+        ]
+        # These IBANs have correct check digits, but an invalid BBAN.
+        invalid = [
+            'ES9621000418450200051339',
+            'ME95505000012345678952',
+            'NO6686011117948',
+            'GB15W3ST12345698765432',
+            'BJ50B0061010040027110119259A',
+        ]
+        iban_validator = IBANValidator(use_nordea_extensions=True)
+        for iban in valid:
+            with self.subTest(iban=iban):
+                self.assertTrue(is_valid_bban(iban[:2], iban[4:]))
+                iban_validator(iban)
+        for iban in invalid:
+            with self.subTest(iban=iban):
+                self.assertFalse(is_valid_bban(iban[:2], iban[4:]))
+                self.assertRaisesMessage(ValidationError, 'Not a valid IBAN.', iban_validator, iban)
+        self.assertFalse(is_valid_bban('XX', '1234'))
+
+    def test_iban_parse(self):
+        iban_validator = IBANValidator(use_nordea_extensions=True)
+        self.assertEqual(iban_validator.parse('GB29 NWBK 6016 1331 9268 19'),
+                         IBANParts('GB', '29', 'NWBK', '601613', '31926819'))
+        self.assertEqual(iban_validator.parse('DE89370400440532013000'),
+                         IBANParts('DE', '89', '37040044', None, '0532013000'))
+        self.assertEqual(iban_validator.parse('IT60X0542811101000000123456'),
+                         IBANParts('IT', '60', '05428', '11101', '000000123456', 'X'))
+        self.assertEqual(iban_validator.parse('SM86U0322509800000000270100').national_check, 'U')
+        self.assertIsNone(iban_validator.parse('FR1420041010050500013M02606').national_check)
+        self.assertEqual(iban_validator.parse('DZ4000400174401001050486'),
+                         IBANParts('DZ', '40', None, None, '00400174401001050486'))
+        self.assertRaisesMessage(ValidationError, 'Not a valid IBAN.', iban_validator.parse, 'GB29NWBK60161331926818')
+
+        parts = list(iban_validator.parse_many(['nl91abna0417164300', None, 'NL91ABNB0417164300']))
+        self.assertEqual(parts, [
+            ('ok', IBANParts('NL', '91', 'ABNA', None, '0417164300')),
+            ('ok', None),
+            ('bad_checksum', None),
+        ])
+        self.assertEqual(parts[0][1].bank_code, 'ABNA')
+
+    def test_bban_identifiers(self):
+        """The bank and branch identifiers must fit in the BBAN of every country."""
+        iban_lengths = {**IBAN_COUNTRY_CODE_LENGTH, **NORDEA_COUNTRY_CODE_LENGTH}
+        for country_code, (bank_start, bank_length, branch_length) in BBAN_IDENTIFIERS.items():
+            with self.subTest(country_code=country_code):
+                self.assertGreater(bank_length, 0)
+                self.assertLess(bank_start + bank_length + branch_length, iban_lengths[country_code] - 4)
+
     def test_iban_validator_deconstruct(self):
         # Call to the required deconstruct method to see if it exists and
         # it doesn't throw an error.
@@ -364,6 +480,25 @@ class BICTests(TestCase):
         for bic in invalid:
             self.assertRaisesMessage(ValidationError,  invalid[bic], BICValidator(), bic)
 
+    def test_bic_validator_parse(self):
+        bic_validator = BICValidator()
+        parts = bic_validator.parse('deutdeff')
+        self.assertEqual(parts, BICParts('DEUT', 'DE', 'FF', None))
+        self.assertTrue(parts.is_primary_office)
+        self.assertFalse(parts.is_test)
+
+        parts = bic_validator.parse('NEDSZAJJXXX')
+        self.assertEqual(parts, BICParts('NEDS', 'ZA', 'JJ', 'XXX'))
+        self.assertTrue(parts.is_primary_office)
+
+        parts = bic_validator.parse('UNCRIT2B912')
+        self.assertEqual(parts.branch_code, '912')
+        self.assertFalse(parts.is_primary_office)
+
+        self.assertTrue(bic_validator.parse('DEUTDEF0').is_test)
+        self.assertRaisesMessage(ValidationError, '1A is not a valid location code.', bic_validator.parse, 'DEUTDE1A')
+        self.assertRaisesMessage(ValidationError, 'JJ is not a valid country code.', bic_validator.parse, 'DEUTJJ1A')
+
     def test_bic_validator_deconstruct(self):
         bic1 = BICValidator()
         bic2 = BICValidator()
@@ -416,6 +551,38 @@ class BICTests(TestCase):
         self.assertEqual(type(bic_model_field.formfield()), type(BICFormField()))
 
 
+class CountryRegistryTests(SimpleTestCase):
+    def test_registry(self):
+        self.assertEqual({country.alpha2 for country in countries}, set(ISO_3166_1_ALPHA2_COUNTRY_CODES))
+        self.assertEqual(set(countries.by_numeric), set(ISO_3166_1_NUMERIC_COUNTRY_CODES))
+        self.assertEqual(len(countries), len(countries.by_alpha3))
+        self.assertIn('NL', countries)
+        self.assertNotIn('NLD', countries)
+        self.assertNotIn('JJ', countries)
+
+    def test_lookups(self):
+        self.assertEqual(countries.get('NL'), Country('NL', 'NLD', '528'))
+        self.assertEqual(countries.get('NLD'), Country('NL', 'NLD', '528'))
+        self.assertEqual(countries.get('528'), Country('NL', 'NLD', '528'))
+        self.assertIsNone(countries.get('JJJ'))
+        self.assertEqual(countries.alpha2_to_alpha3('AX'), 'ALA')
+        self.assertEqual(countries.alpha2_to_numeric('XK'), None)
+        self.assertEqual(countries.alpha3_to_alpha2('GBR'), 'GB')
+        self.assertEqual(countries.numeric_to_alpha2('840'), 'US')
+        self.assertTrue(countries.is_alpha2('XK'))
+        self.assertTrue(countries.is_alpha3('XKX'))
+        self.assertTrue(countries.is_numeric('004'))
+        self.assertFalse(countries.is_numeric('4'))
+        with self.assertRaises(KeyError):
+            countries.alpha3_to_alpha2('NL')
+
+    def test_lazy_loading(self):
+        registry = CountryRegistry()
+        self.assertIsNone(registry._by_alpha2)
+        self.assertTrue(registry.is_numeric('528'))
+        self.assertIsNotNone(registry._by_alpha2)
+
+
 class EANTests(TestCase):
 
     def test_ean_validator(self):
@@ -496,3 +663,25 @@ class EANTests(TestCase):
         for value in invalid:
             with self.subTest(value=value):
                 self.assertRaisesMessage(ValidationError,  error_message, validator, value)
+
+    def test_gtin(self):
+        self.assertEqual(strip_nondigits('400.6381-3339 31'), '4006381333931')
+        self.assertEqual(gtin_check_digit('400638133393'), '1')
+        self.assertEqual(gtin_check_digit('7351353'), '7')
+        for value in ('73513537', '012345678905', '4006381333931', '10012345678902'):
+            with self.subTest(value=value):
+                self.assertTrue(is_valid_gtin(value))
+        for value in ('73513536', '0123456789', '4006381333931 ', '٤006381333931', ''):
+            with self.subTest(value=value):
+                self.assertFalse(is_valid_gtin(value))
+
+    def test_gs1_prefix(self):
+        self.assertEqual(gs1_prefix('4006381333931'), GS1Prefix('400', '440', 'DE', 'GS1 Germany'))
+        self.assertEqual(gs1_prefix('012345678905').country_code, 'US')
+        self.assertEqual(gs1_prefix('18712345678903').country_code, 'NL')
+        self.assertEqual(gs1_prefix('73513537').country_code, 'SE')
+        self.assertEqual(gs1_prefix('01234565').name, 'Restricted distribution')
+        self.assertEqual(gs1_prefix('9780306406157').name, 'Bookland (ISBN)')
+        self.assertIsNone(gs1_prefix('1400000000007'))
+        starts = [prefix.start for prefix in GS1_PREFIXES]
+        self.assertEqual(starts, sorted(starts))
@@ -0,0 +1,61 @@
+import unittest
+
+from django.core.exceptions import ValidationError
+from django.test import override_settings
+from django.test.testcases import TestCase
+
+from localflavor import instrumentation
+from localflavor.br.forms import BRCPFField
+from localflavor.br.validators import BRCPFValidator
+from localflavor.generic.validators import IBANValidator
+from localflavor.results import CheckMixin, check
+
+
+class InstrumentationTests(TestCase):
+
+    def test_disabled(self):
+        self.assertIsNone(instrumentation.backend)
+        self.assertNotIn('clean', BRCPFField.__dict__)
+
+    @override_settings(LOCALFLAVOR_INSTRUMENTATION='localflavor.instrumentation.InMemoryBackend')
+    def test_in_memory(self):
+        backend = instrumentation.backend
+        self.assertIsInstance(backend, instrumentation.InMemoryBackend)
+        field = BRCPFField()
+        self.assertEqual(field.clean('663.256.017-26'), '663.256.017-26')
+        with self.assertRaises(ValidationError):
+            field.clean('111.111.111-11')
+        self.assertFalse(field.check('111.111.111-11'))
+        self.assertFalse(check(BRCPFValidator(), '111.111.111-11'))
+        IBANValidator()('GB82WEST12345698765432')
+        # clean() calls check(), which is reported once.
+        self.assertEqual(backend.calls['localflavor.br.forms.BRCPFField'], 3)
+        # The validator of the field is reported as well.
+        self.assertEqual(backend.failures, {
+            ('localflavor.br.forms.BRCPFField', 'invalid'): 2,
+            ('localflavor.br.validators.BRCPFValidator', 'invalid'): 3,
+        })
+        # __call__() calls check(), which is reported once.
+        self.assertEqual(backend.calls['localflavor.generic.validators.IBANValidator'], 1)
+        self.assertEqual(len(backend.durations['localflavor.br.forms.BRCPFField']), 3)
+
+    def test_uninstall(self):
+        with override_settings(LOCALFLAVOR_INSTRUMENTATION='localflavor.instrumentation.InMemoryBackend'):
+            self.assertIn('clean', BRCPFField.__dict__)
+            self.assertIn('__call__', IBANValidator.__dict__)
+        self.assertIsNone(instrumentation.backend)
+        self.assertNotIn('clean', BRCPFField.__dict__)
+        self.assertIs(IBANValidator.__call__, CheckMixin.__call__)
+
+    @unittest.skipIf(instrumentation.prometheus_client is None, 'prometheus_client is not installed.')
+    def test_prometheus(self):
+        metrics = instrumentation.prometheus_client.CollectorRegistry()
+        instrumentation.install(instrumentation.PrometheusBackend(metrics))
+        self.addCleanup(instrumentation.uninstall)
+        BRCPFValidator()('663.256.017-26')
+        self.assertFalse(check(BRCPFValidator(), '111.111.111-11'))
+        labels = {'validator': 'localflavor.br.validators.BRCPFValidator'}
+        self.assertEqual(metrics.get_sample_value('localflavor_validator_calls_total', labels), 2)
+        self.assertEqual(metrics.get_sample_value('localflavor_validator_duration_seconds_count', labels), 2)
+        self.assertEqual(metrics.get_sample_value('localflavor_validator_failures_total',
+                                                  dict(labels, code='invalid')), 1)
@@ -0,0 +1,31 @@
+from django.db.migrations.state import ModelState
+from django.test.testcases import TestCase
+
+from .test_br.models import BRCompany, BRSupplier
+from .test_generic.models import UseIncludedCountriesModel
+
+
+class NormalizedLookupTests(TestCase):
+
+    def test_lookup(self):
+        BRSupplier.objects.bulk_create([BRSupplier(cnpj='11.222.333/0001-81'), BRSupplier(cnpj='11222333000181'),
+                                        BRSupplier(cnpj='00.000.000/0001-91')])
+        self.assertEqual(BRSupplier.objects.filter(cnpj='11222333000181').count(), 1)
+        self.assertEqual(BRSupplier.objects.filter(cnpj__normalized='11222333000181').count(), 2)
+        self.assertEqual(BRSupplier.objects.filter(cnpj__normalized='11.222.333/0001-81').count(), 2)
+
+    def test_lookup_ignores_case(self):
+        UseIncludedCountriesModel.objects.create(iban='NL02ABNA0123456789')
+        self.assertTrue(UseIncludedCountriesModel.objects.filter(iban__normalized='nl02 abna 0123 4567 89').exists())
+
+    def test_integer_storage(self):
+        BRCompany.objects.create(cnpj='11222333000181')
+        self.assertEqual(BRCompany.objects.filter(cnpj__normalized='11.222.333/0001-81').count(), 1)
+
+    def test_index(self):
+        index, = BRSupplier._meta.indexes
+        self.assertLessEqual(len(index.name), 30)
+        self.assertEqual(BRSupplier._meta.get_field('cnpj').deconstruct()[3]['db_normalized_index'], True)
+        self.assertEqual(ModelState.from_model(BRSupplier).options['indexes'][0].name, index.name)
+        self.assertEqual(BRCompany._meta.indexes, [])
+        self.assertIn(index.name, BRSupplier.objects.filter(cnpj__normalized='11222333000181').explain())
@@ -1,6 +1,7 @@
 from django.test import TransactionTestCase
 
 from localflavor.np.forms import NPDistrictSelect, NPPostalCodeFormField, NPProvinceSelect, NPZoneSelect
+from localflavor.np.np_districts import BAGMATI_DISTRICTS, DISTRICTS, JANAKPUR_DISTRICTS
 
 from .selectfields_html import districts_select, provinces_select, zones_select
 
@@ -62,5 +63,8 @@ class NepalDetails(TransactionTestCase):
         place.save()
         self.assertEqual(place.get_province_display(), 'Bagmati')
 
-
-
+    def test_district_lists(self):
+        districts = BAGMATI_DISTRICTS + JANAKPUR_DISTRICTS
+        districts.sort(reverse=True)
+        self.assertEqual(districts[0][0], 'sindhupalchok')
+        self.assertEqual(DISTRICTS, sorted(DISTRICTS))
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+from django.test.testcases import TestCase
+
+from localflavor import registry
+from localflavor.br.forms import BRCPFField, BRZipCodeField
+from localflavor.br.models import BRPostalCodeField
+from localflavor.nl.validators import NLBSNFieldValidator
+
+
+class RegistryTests(TestCase):
+
+    def test_manifest_is_up_to_date(self):
+        self.assertEqual(registry.build_manifest(), registry.MANIFEST, 'Run `invoke update-registry`.')
+
+    def test_get(self):
+        self.assertIs(registry.get('br', 'cpf').form_field, BRCPFField)
+        self.assertEqual(registry.get('BR', 'tax_id').model_field.__name__, 'BRCNPJField')
+        self.assertEqual(registry.get('us', 'postal_code').paths['form_field'], 'localflavor.us.forms.USZipCodeField')
+        self.assertIsNone(registry.get('br', 'cpf').widget)
+        self.assertIs(registry.get('nl', 'bsn').validator, NLBSNFieldValidator)
+        self.assertIn('id', registry.countries())
+
+    def test_aliases(self):
+        entry = registry.get('br', 'postal_code')
+        self.assertIs(entry.form_field, BRZipCodeField)
+        self.assertIs(entry.model_field, BRPostalCodeField)
+        self.assertIs(registry.get('br', 'zip_code'), entry)
+        self.assertEqual(entry.aliases, ('zip_code',))
+        self.assertEqual(registry.get('qa', 'national_id').form_field.__name__, 'QANationalIDNumberField')
+        # USPostalCodeField is a field of states, so it isn't merged with the ZIP codes.
+        self.assertEqual(registry.get('us', 'postal_code').name, 'zip_code')
+
+    def test_lookup_errors(self):
+        with self.assertRaisesMessage(LookupError, "localflavor.us has several entries of the kind 'tax_id'"):
+            registry.get('us', 'tax_id')
+        with self.assertRaisesMessage(LookupError, "localflavor.br has no 'license_plate'."):
+            registry.get('br', 'license_plate')
+        with self.assertRaisesMessage(LookupError, "localflavor has no flavor for 'xx'."):
+            registry.get('xx', 'postal_code')
+
+    def test_entries(self):
+        self.assertEqual({entry.name for entry in registry.entries('us', kind='tax_id')},
+                         {'taxpayer_identification_number', 'individual_taxpayer_identification_number',
+                          'adoption_taxpayer_identification_number'})
+
+    def test_lazy_import(self):
+        code = (
+            'import sys; from django.conf import settings; settings.configure(); import django; django.setup(); '
+            'from localflavor import registry; entry = registry.get("dk", "postal_code"); '
+            'print("localflavor.dk.forms" in sys.modules); entry.form_field; '
+            'print("localflavor.dk.forms" in sys.modules)'
+        )
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['False', 'True'])
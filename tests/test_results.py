@@ -0,0 +1,129 @@
+import asyncio
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.core.validators import RegexValidator
+from django.test.testcases import TestCase
+from django.utils import translation
+from django.utils.functional import Promise
+
+from localflavor import registry
+from localflavor.au.forms import AUBusinessNumberField
+from localflavor.br.forms import BRCPFField
+from localflavor.br.validators import BRCPFValidator
+from localflavor.by.validators import PASS_NUMBER_VALIDATOR
+from localflavor.cn.forms import CNIDCardField
+from localflavor.generic.validators import IBANValidator, VATINValidator
+from localflavor.nl.validators import NLBSNFieldValidator, NLZipCodeFieldValidator
+from localflavor.pl.forms import PLPESELField
+from localflavor.results import CheckFieldMixin, RegexCheckValidator, acheck, acheck_many, aclean, check
+from localflavor.ua.models import UAPostalCodeField
+
+
+class CheckResultTests(TestCase):
+
+    def test_check_result(self):
+        result = NLBSNFieldValidator().check('123456789')
+        self.assertFalse(result)
+        self.assertEqual(result.code, 'invalid')
+        self.assertEqual(result.message, 'Enter a valid BSN.')
+        self.assertEqual(result.error.messages, ['Enter a valid BSN.'])
+        with self.assertRaisesMessage(ValidationError, 'Enter a valid BSN.'):
+            result.raise_for_error()
+
+        result = NLBSNFieldValidator().check('123456782')
+        self.assertTrue(result)
+        self.assertEqual(result.value, '123456782')
+        self.assertIsNone(result.message)
+        self.assertIsNone(result.error)
+        result.raise_for_error()
+
+    def test_message_params(self):
+        result = IBANValidator().check('XX89 3704 0044 0532 0130 00')
+        self.assertEqual(result.code, 'bad_country')
+        self.assertEqual(result.error.code, 'invalid')
+        self.assertEqual(result.params, {'country_code': 'XX'})
+        self.assertEqual(result.message, 'XX is not a valid country code for IBAN.')
+        self.assertEqual(IBANValidator().check('DE89 3704 0044 0532 0130 01').code, 'bad_checksum')
+        result = VATINValidator().check('DE284754039')
+        self.assertEqual((result.code, result.error.code), ('checksum', 'vatin'))
+        self.assertEqual(VATINValidator().check('XX284754039').error.code, 'country_code')
+        self.assertEqual(IBANValidator().check('de89 3704 0044 0532 0130 00').value, 'DE89370400440532013000')
+        self.assertEqual(BRCPFValidator().check('663.256.017-26').value, '66325601726')
+
+    def test_message_is_resolved_on_demand(self):
+        result = NLZipCodeFieldValidator().check('0123 AB')
+        self.assertIsInstance(result._message, Promise)
+        with translation.override('nl'):
+            self.assertEqual(result.message, str(NLZipCodeFieldValidator.error_message))
+
+    def test_form_field_check(self):
+        field = CNIDCardField()
+        self.assertIsInstance(field, CheckFieldMixin)
+        with mock.patch.object(ValidationError, '__init__', side_effect=AssertionError('raised')):
+            result = field.check('110105194912310025')
+        self.assertEqual((result.ok, result.code), (False, 'checksum'))
+        self.assertEqual(result.message, 'Invalid ID Card Number: Wrong checksum')
+        self.assertEqual(field.check('11010519491231002x').value, '11010519491231002X')
+        self.assertEqual(field.check('').value, '')
+        self.assertEqual(check(field, '110105194913310021').code, 'birthday')
+        # The checks of the base field still raise.
+        self.assertEqual(CNIDCardField(required=True).check('').code, 'required')
+        with self.assertRaisesMessage(ValidationError, 'Invalid ID Card Number: Wrong location code'):
+            field.clean('990105194912310021')
+
+    def test_country_form_fields_check(self):
+        invalid = [
+            (BRCPFField(), '663.256.017-27', 'invalid'),
+            (PLPESELField(), '80071610610', 'checksum'),
+            (AUBusinessNumberField(), '53 004 085 617', 'invalid'),
+        ]
+        for field, value, code in invalid:
+            with self.subTest(field=type(field).__name__):
+                with mock.patch.object(ValidationError, '__init__', side_effect=AssertionError('raised')):
+                    result = field.check(value)
+                self.assertEqual((result.ok, result.code), (False, code))
+                with self.assertRaises(ValidationError) as cm:
+                    field.clean(value)
+                self.assertEqual(cm.exception.messages, [result.message])
+        self.assertEqual(PLPESELField().check('80071610614').value, PLPESELField().clean('80071610614'))
+        self.assertEqual(AUBusinessNumberField().check('53 004 085 616').value, '53004085616')
+
+    def test_registry_form_fields_check(self):
+        for country in registry.countries():
+            for entry in registry.entries(country):
+                if entry.form_field is not None:
+                    self.assertTrue(issubclass(entry.form_field, CheckFieldMixin), entry.form_field)
+
+    def test_regex_validator_instances(self):
+        self.assertIsInstance(PASS_NUMBER_VALIDATOR, RegexCheckValidator)
+        self.assertFalse(PASS_NUMBER_VALIDATOR.check('1234567'))
+        validator = UAPostalCodeField().validators[0]
+        self.assertTrue(validator.check('01001'))
+        self.assertEqual(validator.check('00100').code, 'invalid')
+
+    def test_check_function(self):
+        self.assertIs(check(NLBSNFieldValidator(), '123456782').ok, True)
+        result = check(BRCPFField(), '663.256.017-27')
+        self.assertFalse(result)
+        self.assertEqual(result.message, 'Invalid CPF number.')
+        self.assertEqual(check(BRCPFField(), '663.256.017-26').value, '663.256.017-26')
+        self.assertEqual(check(RegexValidator(r'^\d+$'), 'abc').code, 'invalid')
+
+
+class AsyncCheckTests(TestCase):
+
+    def test_acheck(self):
+        self.assertTrue(asyncio.run(acheck(BRCPFValidator(), '663.256.017-26')))
+        self.assertEqual(asyncio.run(acheck(BRCPFValidator(), '663.256.017-27')).code, 'invalid')
+        self.assertEqual(asyncio.run(acheck(BRCPFField(), '663.256.017-26')).value, '663.256.017-26')
+        self.assertEqual(asyncio.run(acheck(RegexValidator('^a$'), 'b')).code, 'invalid')
+
+    def test_aclean(self):
+        self.assertEqual(asyncio.run(aclean(BRCPFField(), '66325601726')), '66325601726')
+        with self.assertRaisesMessage(ValidationError, 'Invalid CPF number.'):
+            asyncio.run(aclean(BRCPFField(), '663.256.017-27'))
+
+    def test_acheck_many(self):
+        results = asyncio.run(acheck_many(NLBSNFieldValidator(), ['111222333', '111222334']))
+        self.assertEqual([result.ok for result in results], [True, False])
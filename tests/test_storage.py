@@ -0,0 +1,56 @@
+from django.core.exceptions import ValidationError
+from django.db import connection, models
+from django.test.testcases import TestCase
+from django.test.utils import isolate_apps
+
+from localflavor.br.models import BRCNPJField, BRCPFField
+
+from .test_br.models import BRCompany
+
+
+class IntegerStorageTests(TestCase):
+
+    def test_round_trip(self):
+        company = BRCompany.objects.create(cpf='01234567890', cnpj='11.222.333/0001-81')
+        company.refresh_from_db()
+        self.assertEqual(company.cpf, '012.345.678-90')
+        self.assertEqual(company.cnpj, '11.222.333/0001-81')
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT cpf, cnpj FROM test_br_brcompany')
+            self.assertEqual(cursor.fetchone(), (101234567890, 111222333000181))
+
+    def test_lookups(self):
+        BRCompany.objects.create(cnpj='11222333000181')
+        BRCompany.objects.create(cnpj='00.000.000/0001-91')
+        self.assertEqual(BRCompany.objects.get(cnpj='11.222.333/0001-81').cpf, None)
+        self.assertEqual(BRCompany.objects.filter(cnpj__in=['00000000000191', '1']).count(), 1)
+        self.assertEqual(list(BRCompany.objects.order_by('cnpj').values_list('cnpj', flat=True)),
+                         ['00.000.000/0001-91', '11.222.333/0001-81'])
+
+    def test_column_type(self):
+        field = BRCompany._meta.get_field('cnpj')
+        self.assertEqual(field.db_type(connection), connection.data_types['BigIntegerField'])
+        self.assertEqual(field.deconstruct()[3]['db_integer_storage'], True)
+        self.assertNotIn('db_integer_storage', BRCNPJField().deconstruct()[3])
+        self.assertEqual(BRCNPJField().get_prep_value('11.222.333/0001-81'), '11.222.333/0001-81')
+
+    def test_invalid_values(self):
+        with self.assertRaisesMessage(ValueError, "Field 'cnpj' expected a number of up to 18 digits but got 'x'."):
+            BRCompany.objects.filter(cnpj='x').exists()
+        with self.assertRaises(ValidationError) as cm:
+            BRCompany(cnpj='11.222.333/0001-8x').full_clean()
+        self.assertEqual(cm.exception.error_dict['cnpj'][0].code, 'invalid_digits')
+
+    @isolate_apps('tests.test_br')
+    def test_blank_requires_null(self):
+        class Customer(models.Model):
+            cpf = BRCPFField(db_integer_storage=True, blank=True)
+            cnpj = BRCNPJField(db_integer_storage=True, blank=True, null=True)
+            other_cnpj = BRCNPJField(blank=True)
+
+            class Meta:
+                app_label = 'test_br'
+
+        errors = [error for field in Customer._meta.fields for error in field.check()]
+        self.assertEqual([error.id for error in errors], ['localflavor.E001'])
+        self.assertEqual(errors[0].obj, Customer._meta.get_field('cpf'))
@@ -11,3 +11,7 @@ class USPlace(models.Model):
     name = models.CharField(max_length=20)
     ssn = USSocialSecurityNumberField(blank=True)
     zip_code = USZipCodeField(blank=True)
+
+
+class USAddress(models.Model):
+    zip_code = USZipCodeField(blank=True, db_format_check=True)
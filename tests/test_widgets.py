@@ -0,0 +1,78 @@
+import subprocess
+import sys
+
+from django.test import override_settings
+from django.test.testcases import TestCase
+from django.utils import translation
+
+from localflavor.fr.forms import FRDepartmentSelect
+from localflavor.us.forms import USStateSelect
+from localflavor.option_cache import option_cache
+
+
+class OptionCacheTests(TestCase):
+
+    def setUp(self):
+        option_cache.clear()
+        self.addCleanup(option_cache.clear)
+
+    def render(self, widget, *args, **kwargs):
+        uncached = widget.render(*args, **kwargs)
+        with override_settings(LOCALFLAVOR_OPTION_CACHE_SIZE=10):
+            cached = widget.render(*args, **kwargs)
+        self.assertEqual(cached, uncached)
+        return cached
+
+    def test_disabled_by_default(self):
+        USStateSelect().render('state', 'CA')
+        self.assertEqual(len(option_cache), 0)
+
+    def test_same_output(self):
+        widget = USStateSelect()
+        self.render(widget, 'state', 'CA')
+        self.render(widget, 'state', 'CA')
+        self.render(widget, 'other', 'CA', attrs={'id': 'id_other', 'class': 'wide'})
+        self.render(FRDepartmentSelect(), 'department', '75', attrs={'id': 'id_department'})
+        self.assertEqual(option_cache.hits, 2)
+        self.assertEqual(option_cache.misses, 2)
+
+    def test_selected_values_and_languages(self):
+        widget = FRDepartmentSelect()
+        self.render(widget, 'department', '75')
+        self.render(widget, 'department', '13')
+        self.render(widget, 'department', None)
+        with translation.override('fr'):
+            html = self.render(USStateSelect(), 'state', 'HI')
+        self.assertIn('<option value="HI" selected>Hawaï</option>', html)
+        self.assertEqual(option_cache.hits, 0)
+        self.assertEqual(len(option_cache), 4)
+
+    def test_changed_choices(self):
+        widget = FRDepartmentSelect()
+        self.render(widget, 'department', '75')
+        widget.choices = [('75', 'Paris')]
+        html = self.render(widget, 'department', '75')
+        self.assertNotIn('Bouches-du-Rh', html)
+        self.assertEqual(option_cache.hits, 0)
+
+    @override_settings(LOCALFLAVOR_OPTION_CACHE_SIZE=2)
+    def test_lru_eviction(self):
+        widget = FRDepartmentSelect()
+        for value in ('01', '02', '01', '03'):
+            widget.render('department', value)
+        self.assertEqual(len(option_cache), 2)
+        self.assertEqual(option_cache.hits, 1)
+        widget.render('department', '01')
+        self.assertEqual(option_cache.hits, 2)
+        widget.render('department', '02')
+        self.assertEqual(option_cache.hits, 2)
+
+    def test_lazy_import(self):
+        code = (
+            'import sys; from django.conf import settings; settings.configure(LOCALFLAVOR_OPTION_CACHE_SIZE=10); '
+            'import django; django.setup(); from localflavor.us.forms import USStateSelect; '
+            'print("localflavor.option_cache" in sys.modules); USStateSelect().render("state", "CA"); '
+            'print("localflavor.option_cache" in sys.modules)'
+        )
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.split(), ['False', 'True'])